@@ -310,6 +310,8 @@ Get an API key at `/api-keys/request`
 
     api_metrics = APIMetrics()
 
+    from src.core.performance import perf_monitor
+
     # Add request logging and metrics middleware
     @web_app.middleware("http")
     async def log_requests(request, call_next):
@@ -322,6 +324,12 @@ Get an API key at `/api-keys/request`
 
             # Record metrics
             api_metrics.record_request(request.url.path, response.status_code, process_time)
+            route = request.scope.get('route')
+            perf_monitor.record(
+                'api_request', process_time,
+                endpoint=getattr(route, 'path', 'unmatched'),
+                status=response.status_code // 100 * 100,
+            )
 
             # Log request details
             import logging
@@ -381,6 +389,17 @@ Get an API key at `/api-keys/request`
             logger = logging.getLogger("api")
             logger.warning(f"Startup optimization failed: {e}")
 
+        # Keep polled dashboard payloads materialized (reloads the volume each cycle)
+        read_models.start_refresher(interval=15, before_refresh=reload_volume)
+
+        # Tail scanner/job delta files for /stream subscribers
+        from src.sync.delta_stream import get_delta_hub
+        asyncio.get_running_loop().create_task(get_delta_hub().run_poller())
+
+        # Keep the options screener universe's chains fresh off the request path
+        from src.analysis.options_scanner import get_options_scanner
+        get_options_scanner().start_refresher(options_screener_universe)
+
     # =============================================================================
     # AUTHENTICATION SETUP
     # =============================================================================
@@ -474,26 +493,55 @@ Get an API key at `/api-keys/request`
         return response
 
     # Helper to load scan results
-    def load_scan_results():
-        try:
-            # Reload volume to get latest data
-            reload_volume()
-        except Exception:
-            pass  # Continue even if reload fails
-
+    def latest_scan_file():
         data_dir = Path(VOLUME_PATH)
         # Only match date-formatted scan files (scan_YYYYMMDD_HHMMSS.json)
-        scan_files = sorted([f for f in data_dir.glob("scan_*.json")
-                            if f.stem[5:13].isdigit()], reverse=True)
-        if scan_files:
+        return max((f for f in data_dir.glob("scan_*.json") if f.stem[5:13].isdigit()), default=None)
+
+    def load_scan_results(reload: bool = True):
+        if reload:
+            try:
+                # Reload volume to get latest data
+                reload_volume()
+            except Exception:
+                pass  # Continue even if reload fails
+
+        scan_file = latest_scan_file()
+        if scan_file:
             try:
-                with open(scan_files[0]) as f:
+                with open(scan_file) as f:
                     return json.load(f)
             except Exception as e:
-                print(f"Error loading scan file {scan_files[0]}: {e}")
+                print(f"Error loading scan file {scan_file}: {e}")
                 return None
         return None
 
+    def options_screener_universe(limit: int = 100):
+        """Top tickers of the latest scan (the options screener's universe)."""
+        results = load_scan_results(reload=False)
+        if not results or not results.get('results'):
+            return []
+        return [s['ticker'] for s in results['results'][:limit]]
+
+    # =============================================================================
+    # READ MODELS
+    # =============================================================================
+    # Dashboard endpoints polled every few seconds serve pre-encoded payloads
+    # with ETags (304 when unchanged). The refresher reloads the volume and
+    # rebuilds payloads in the background; polls never reload the volume.
+
+    from src.core.read_models import get_read_model_store
+    read_models = get_read_model_store()
+
+    def scan_version():
+        latest = latest_scan_file()
+        return (latest.name, latest.stat().st_mtime) if latest else None
+
+    def themes_config_version():
+        from src.themes.theme_manager import get_config_path
+        path = get_config_path()
+        return path.stat().st_mtime if path.exists() else None
+
     # =============================================================================
     # ROUTES - CORE
     # =============================================================================
@@ -605,22 +653,44 @@ Get an API key at `/api-keys/request`
         }
 
     @web_app.get("/admin/performance", tags=["Admin"])
-    def get_performance():
+    def get_performance(
+        day: str = Query(None, description="'today' or YYYY-MM-DD (UTC); default all retained days"),
+        metric: str = Query(None, description="Break one metric down by label set"),
+        format: str = Query("json", description="'json' or 'prometheus'"),
+    ):
         """
         View performance monitor statistics from scoring functions.
 
-        Shows detailed timing stats for all monitored operations.
+        Shows detailed timing stats for all monitored operations, plus the
+        per-stage summary of the most recent scan trace under ``last_scan``.
 
-        Example: GET /admin/performance
+        Examples:
+            GET /admin/performance
+            GET /admin/performance?day=today&metric=provider_request
+            GET /admin/performance?metric=scan_span
+            GET /admin/performance?format=prometheus
         """
         try:
             from src.core.performance import perf_monitor
-            stats = perf_monitor.get_all_stats()
-            return {
+
+            if format == "prometheus":
+                from fastapi.responses import PlainTextResponse
+                return PlainTextResponse(
+                    perf_monitor.to_prometheus(day=day),
+                    media_type="text/plain; version=0.0.4",
+                )
+
+            from src.core.tracing import get_last_scan_summary
+
+            result = {
                 "ok": True,
                 "timestamp": datetime.now().isoformat(),
-                "performance": stats
+                "performance": perf_monitor.get_all_stats(day=day),
+                "last_scan": get_last_scan_summary([VOLUME_PATH, Path.cwd()]),
             }
+            if metric:
+                result["labels"] = perf_monitor.get_labeled_stats(metric, day=day)
+            return result
         except ImportError:
             return {"ok": False, "error": "Performance monitoring not available"}
 
@@ -777,16 +847,46 @@ Get an API key at `/api-keys/request`
             "usage": "Authorization: Bearer <your-api-key>"
         }
 
-    @web_app.get("/scan", tags=["Scanning"])
-    def scan():
+    def build_scan():
         try:
-            results = load_scan_results()
+            results = load_scan_results(reload=False)
             if not results:
                 return {"ok": False, "status": "no_data", "message": "No scan results available", "results": []}
             return results
         except Exception as e:
             return {"ok": False, "status": "error", "message": str(e), "results": []}
 
+    read_models.register('scan', build_scan, ttl=300, version=scan_version)
+
+    @web_app.get("/scan", tags=["Scanning"])
+    def scan(request: Request):
+        return read_models.respond(request, 'scan')
+
+    @web_app.get("/stream", tags=["Scanning"])
+    async def stream(
+        request: Request,
+        topics: str = Query(None, description="Comma-separated: scan, signals, xray, alerts (default: all)"),
+        since: str = Query(None, description="Resume after this event id (Last-Event-ID header takes precedence)"),
+    ):
+        """
+        Server-sent event stream of incremental updates.
+
+        Events are named by topic: `scan` (per-ticker score changes, progress and
+        completion while a scan runs), `signals` (new paper signals), `xray`
+        (X-Ray refreshes) and `alerts` (alert triggers). Each event id is a
+        resume cursor; a `reset` event means the cursor could not be resumed
+        and the client should refetch full payloads once.
+        """
+        from src.sync.delta_stream import TOPICS, get_delta_hub
+
+        wanted = [t.strip() for t in topics.split(',') if t.strip()] if topics else None
+        unknown = [t for t in wanted or [] if t not in TOPICS]
+        if unknown:
+            return JSONResponse(status_code=400, content={
+                "ok": False, "error": f"Unknown topics: {', '.join(unknown)}", "topics": list(TOPICS),
+            })
+        return get_delta_hub().sse_response(request, wanted, since)
+
     @web_app.post("/scan/trigger")
     def scan_trigger(mode: str = Query("quick")):
         """
@@ -820,11 +920,10 @@ Get an API key at `/api-keys/request`
     # ROUTES - THEMES & INTELLIGENCE
     # =============================================================================
 
-    @web_app.get("/themes/list")
-    def themes_list():
+    def build_themes_list():
         try:
             # Extract themes from scan results
-            results = load_scan_results()
+            results = load_scan_results(reload=False)
             if not results or not results.get('results'):
                 return {"ok": True, "themes": []}
 
@@ -852,13 +951,17 @@ Get an API key at `/api-keys/request`
         except Exception as e:
             return {"ok": True, "themes": []}
 
+    read_models.register('themes_list', build_themes_list, ttl=300, version=scan_version)
+
+    @web_app.get("/themes/list")
+    def themes_list(request: Request):
+        return read_models.respond(request, 'themes_list')
+
     # =========================================================================
     # THEME MANAGEMENT API (for dashboard)
     # =========================================================================
 
-    @web_app.get("/themes/config", tags=["Themes"])
-    def get_themes_config():
-        """Get all themes from ThemeManager."""
+    def build_themes_config():
         try:
             from src.themes.theme_manager import get_theme_manager
             manager = get_theme_manager()
@@ -872,6 +975,13 @@ Get an API key at `/api-keys/request`
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
+    read_models.register('themes_config', build_themes_config, version=themes_config_version)
+
+    @web_app.get("/themes/config", tags=["Themes"])
+    def get_themes_config(request: Request):
+        """Get all themes from ThemeManager."""
+        return read_models.respond(request, 'themes_config')
+
     @web_app.post("/themes/add", tags=["Themes"])
     def add_theme(request: dict):
         """Add a new theme."""
@@ -890,6 +1000,8 @@ Get an API key at `/api-keys/request`
                 return {"ok": False, "error": "keywords list is required"}
 
             success = manager.add_theme(theme_id, name, keywords, tickers)
+            read_models.invalidate('themes_config')
+            read_models.invalidate('themes_stats')
             if success:
                 return {"ok": True, "message": f"Added theme: {theme_id}"}
             else:
@@ -919,6 +1031,8 @@ Get an API key at `/api-keys/request`
                 return {"ok": False, "error": "theme_id is required"}
 
             success = manager.update_theme(theme_id, **updates)
+            read_models.invalidate('themes_config')
+            read_models.invalidate('themes_stats')
             if success:
                 return {"ok": True, "message": f"Updated theme: {theme_id}"}
             else:
@@ -938,6 +1052,8 @@ Get an API key at `/api-keys/request`
                 return {"ok": False, "error": "theme_id is required"}
 
             success = manager.remove_theme(theme_id, archive=True)
+            read_models.invalidate('themes_config')
+            read_models.invalidate('themes_stats')
             if success:
                 return {"ok": True, "message": f"Archived theme: {theme_id}"}
             else:
@@ -957,6 +1073,8 @@ Get an API key at `/api-keys/request`
                 return {"ok": False, "error": "theme_id is required"}
 
             success = manager.restore_theme(theme_id)
+            read_models.invalidate('themes_config')
+            read_models.invalidate('themes_stats')
             if success:
                 return {"ok": True, "message": f"Restored theme: {theme_id}"}
             else:
@@ -964,9 +1082,7 @@ Get an API key at `/api-keys/request`
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    @web_app.get("/themes/stats", tags=["Themes"])
-    def get_theme_stats():
-        """Get theme statistics."""
+    def build_theme_stats():
         try:
             from src.themes.theme_manager import get_theme_manager
             manager = get_theme_manager()
@@ -975,6 +1091,13 @@ Get an API key at `/api-keys/request`
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
+    read_models.register('themes_stats', build_theme_stats, version=themes_config_version)
+
+    @web_app.get("/themes/stats", tags=["Themes"])
+    def get_theme_stats(request: Request):
+        """Get theme statistics."""
+        return read_models.respond(request, 'themes_stats')
+
     @web_app.post("/themes/discover", tags=["Themes"])
     def discover_themes():
         """Run AI theme discovery."""
@@ -1734,8 +1857,7 @@ Get an API key at `/api-keys/request`
 
         return result
 
-    @web_app.get("/market-health", tags=["Market Health"])
-    def market_health_dashboard():
+    def build_market_health():
         """
         Comprehensive Market Health Dashboard aggregating all data sources.
 
@@ -2088,6 +2210,19 @@ Get an API key at `/api-keys/request`
             import traceback
             return {"ok": False, "error": str(e), "traceback": traceback.format_exc()}
 
+    read_models.register('market_health', build_market_health, ttl=300)
+
+    @web_app.get("/market-health", tags=["Market Health"])
+    def market_health_dashboard(request: Request):
+        """
+        Comprehensive Market Health Dashboard aggregating all data sources.
+
+        Composite health score plus component data (volume profile, options
+        positioning, FRED, news sentiment, institutional signals) and 7-day
+        score history. Rebuilt every 5 minutes; supports If-None-Match.
+        """
+        return read_models.respond(request, 'market_health')
+
     @web_app.get("/market-health/ai-analysis", tags=["Market Health"])
     def market_health_ai_analysis():
         """
@@ -2100,8 +2235,8 @@ Get an API key at `/api-keys/request`
             # First get the market health data
             from datetime import datetime
 
-            # Get health data (reuse the endpoint logic)
-            health_response = market_health_dashboard()
+            # Get health data (the dashboard's materialized payload)
+            health_response = json.loads(read_models.get('market_health').body)
             if not health_response.get('ok'):
                 return health_response
 
@@ -2448,47 +2583,35 @@ Be specific with price levels and data points. Keep it actionable for traders.""
     # GEX HISTORY & BACKTEST (F5, F11)
     # =========================================================================
 
+    def _gex_store(ticker: str):
+        from src.data.column_store import get_gex_store, migrate_gex_json
+        store = get_gex_store()
+        migrate_gex_json(store, ticker)
+        return store
+
     @web_app.get("/options/gex-history/{ticker_symbol}", tags=["Options"])
-    async def options_gex_history(ticker_symbol: str):
-        """GEX History - returns stored daily GEX snapshots (last 30 days)."""
+    async def options_gex_history(ticker_symbol: str, days: int = Query(30)):
+        """GEX History - last stored GEX snapshot per day (last 30 days by default)."""
         try:
             ticker = ticker_symbol.upper()
-            safe_name = ticker.replace("/", "_")
-            history_path = Path(VOLUME_PATH) / "gex_history" / f"{safe_name}.json"
-            if not history_path.exists():
-                return {"ok": True, "data": []}
-            raw = json.loads(history_path.read_text())
-            # Return last 30 entries
-            return {"ok": True, "data": raw[-30:]}
+            return {"ok": True, "data": _gex_store(ticker).daily(ticker, last=days)}
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
     @web_app.get("/options/gex-history", tags=["Options"])
-    async def options_gex_history_query(ticker: str = Query(...)):
+    async def options_gex_history_query(ticker: str = Query(...), days: int = Query(30)):
         """GEX History (query param version for futures)."""
-        try:
-            safe_name = ticker.upper().replace("/", "_")
-            history_path = Path(VOLUME_PATH) / "gex_history" / f"{safe_name}.json"
-            if not history_path.exists():
-                return {"ok": True, "data": []}
-            raw = json.loads(history_path.read_text())
-            return {"ok": True, "data": raw[-30:]}
-        except Exception as e:
-            return {"ok": False, "error": str(e)}
+        return await options_gex_history(ticker, days)
 
     @web_app.get("/options/gex-backtest/{ticker_symbol}", tags=["Options"])
     async def options_gex_backtest(ticker_symbol: str):
         """GEX Signal Backtest - computes signal win rate from GEX history + price data."""
         try:
             ticker = ticker_symbol.upper()
-            safe_name = ticker.replace("/", "_")
-            history_path = Path(VOLUME_PATH) / "gex_history" / f"{safe_name}.json"
-            if not history_path.exists():
+            daily = _gex_store(ticker).daily(ticker)
+            if len(daily) < 5:
                 return {"ok": True, "data": None}
-            raw = json.loads(history_path.read_text())
-            if len(raw) < 5:
-                return {"ok": True, "data": None}
-            result = _compute_gex_backtest(raw)
+            result = _compute_gex_backtest(daily)
             return {"ok": True, "data": result}
         except Exception as e:
             return {"ok": False, "error": str(e)}
@@ -2496,18 +2619,7 @@ Be specific with price levels and data points. Keep it actionable for traders.""
     @web_app.get("/options/gex-backtest", tags=["Options"])
     async def options_gex_backtest_query(ticker: str = Query(...)):
         """GEX Signal Backtest (query param version for futures)."""
-        try:
-            safe_name = ticker.upper().replace("/", "_")
-            history_path = Path(VOLUME_PATH) / "gex_history" / f"{safe_name}.json"
-            if not history_path.exists():
-                return {"ok": True, "data": None}
-            raw = json.loads(history_path.read_text())
-            if len(raw) < 5:
-                return {"ok": True, "data": None}
-            result = _compute_gex_backtest(raw)
-            return {"ok": True, "data": result}
-        except Exception as e:
-            return {"ok": False, "error": str(e)}
+        return await options_gex_backtest(ticker)
 
     def _compute_gex_backtest(history: list) -> dict:
         """Compute win rate of GEX flip signals from stored history."""
@@ -2517,10 +2629,10 @@ Be specific with price levels and data points. Keep it actionable for traders.""
         total_days = 0
 
         for i in range(1, len(history)):
-            prev_gex = history[i - 1].get("gex", 0)
-            curr_gex = history[i].get("gex", 0)
-            prev_price = history[i - 1].get("price", 0)
-            curr_price = history[i].get("price", 0)
+            prev_gex = history[i - 1].get("gex") or 0
+            curr_gex = history[i].get("gex") or 0
+            prev_price = history[i - 1].get("price") or 0
+            curr_price = history[i].get("price") or 0
 
             if prev_price == 0 or curr_price == 0:
                 continue
@@ -2530,7 +2642,7 @@ Be specific with price levels and data points. Keep it actionable for traders.""
                 signals += 1
                 # Look ahead for move (next entry or end)
                 look_ahead_idx = min(i + 5, len(history) - 1)
-                future_price = history[look_ahead_idx].get("price", curr_price)
+                future_price = history[look_ahead_idx].get("price") or curr_price
                 move_pct = ((future_price - curr_price) / curr_price) * 100
 
                 # Negative GEX flip = expect downside; positive flip = expect upside
@@ -2905,26 +3017,26 @@ Be specific with price levels and data points. Keep it actionable for traders.""
             sentiment: Filter by sentiment (bullish/bearish)
         """
         try:
-            from src.analysis.options_flow import SmartMoneyTracker
-            from src.data.polygon_provider import get_unusual_options_sync
+            from src.analysis.options_scanner import get_options_scanner
 
             # Parse tickers
             if tickers:
                 ticker_list = [t.strip().upper() for t in tickers.split(',')]
             else:
                 ticker_list = ['SPY', 'QQQ', 'NVDA', 'AAPL', 'TSLA', 'META', 'AMZN', 'GOOGL', 'MSFT', 'AMD']
+            ticker_list = ticker_list[:15]  # Max 15 tickers
+
+            # Chains fetched concurrently, reused within the refresh window
+            scanner = get_options_scanner()
+            scanner.refresh(ticker_list)
 
             all_unusual = []
-            for ticker in ticker_list[:15]:  # Max 15 tickers
-                try:
-                    result = get_unusual_options_sync(ticker, volume_threshold=2.0)
-                    if result and result.get('unusual_contracts'):
-                        for contract in result['unusual_contracts']:
-                            contract['ticker'] = ticker
-                            if min_premium <= 0 or contract.get('premium', 0) >= min_premium:
-                                all_unusual.append(contract)
-                except Exception:
-                    continue
+            for ticker in ticker_list:
+                result = scanner.unusual_activity(ticker, threshold=2.0)
+                for contract in result.get('unusual_contracts', []):
+                    contract['ticker'] = ticker
+                    if min_premium <= 0 or contract.get('premium', 0) >= min_premium:
+                        all_unusual.append(contract)
 
             # Sort by vol/oi ratio descending
             all_unusual.sort(key=lambda x: x.get('vol_oi_ratio', 0), reverse=True)
@@ -3092,15 +3204,14 @@ Be specific with price levels and data points. Keep it actionable for traders.""
             limit: Max results (default 30)
         """
         try:
-            from src.analysis.options_flow import screen_options
-            results = load_scan_results()
-            if not results or not results.get('results'):
+            from src.analysis.options_scanner import get_options_scanner
+            tickers = options_screener_universe()
+            if not tickers:
                 return {"ok": False, "error": "No scan data available"}
 
-            # Get tickers from scan
-            tickers = [s['ticker'] for s in results['results'][:100]]
-
-            screened = screen_options(
+            # Query the last view only; the startup refresher fetches the chains
+            scanner = get_options_scanner()
+            screened = scanner.screen(
                 tickers,
                 min_iv_rank=min_iv_rank,
                 max_iv_rank=max_iv_rank,
@@ -3110,18 +3221,113 @@ Be specific with price levels and data points. Keep it actionable for traders.""
                 sentiment=sentiment,
                 limit=limit
             )
-            return {"ok": True, "results": screened, "count": len(screened)}
+            return {"ok": True, "results": screened, "count": len(screened), "as_of": scanner.as_of}
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    # In-memory candle cache: {cache_key: (timestamp, response_data)}
-    _candle_cache = {}
-    _CANDLE_CACHE_TTL = {
-        '1m': 30, '5m': 30, '15m': 60, '30m': 60,
-        '1h': 120, '4h': 300,
-        '1d': 300, '1w': 600, '1M': 600,
+    # Futures exchange suffixes for DXLink candle symbols
+    _FUTURES_EXCHANGE = {
+        '/ES': ':XCME', '/NQ': ':XCME', '/YM': ':XCME', '/RTY': ':XCME',
+        '/CL': ':XNYM', '/NG': ':XNYM',
+        '/GC': ':XCEC', '/SI': ':XCEC', '/HG': ':XCEC',
+        '/ZB': ':XCBT', '/ZN': ':XCBT', '/ZC': ':XCBT', '/ZS': ':XCBT', '/ZW': ':XCBT',
+    }
+    # Yahoo Finance futures symbols (fallback source)
+    _YAHOO_FUTURES = {
+        'ES': 'ES=F', 'MES': 'ES=F', 'NQ': 'NQ=F', 'MNQ': 'NQ=F',
+        'YM': 'YM=F', 'RTY': 'RTY=F',
+        'CL': 'CL=F', 'NG': 'NG=F',
+        'GC': 'GC=F', 'SI': 'SI=F', 'HG': 'HG=F',
+        'ZB': 'ZB=F', 'ZN': 'ZN=F', 'ZC': 'ZC=F', 'ZS': 'ZS=F', 'ZW': 'ZW=F',
     }
 
+    async def _fetch_futures_bars(symbol, resolution, start, end):
+        """
+        Futures bars for the candle store: Tastytrade DXLink Candle
+        streaming, Yahoo Finance fallback.
+
+        resolution is a candle store base resolution (1m, 5m, 1d), which
+        DXLink and Yahoo both accept as-is.
+        """
+        import time as time_module
+        import pandas as pd
+
+        rows = []
+        try:
+            from src.data.tastytrade_provider import get_tastytrade_session
+            from tastytrade import DXLinkStreamer
+            from tastytrade.dxfeed import Candle
+
+            session = get_tastytrade_session()
+            if session:
+                # Product symbol (no month code) = continuous front-month data across rolls
+                root_symbol = next((r for r in _FUTURES_EXCHANGE if symbol.startswith(r)), symbol)
+                streamer_symbol = root_symbol + _FUTURES_EXCHANGE.get(root_symbol, ':XCME')
+                logger.info(f"Subscribing to candle: {streamer_symbol} interval={resolution} from={start}")
+
+                end_epoch = end.timestamp()
+                timeout_sec = 60.0 if (end - start).days > 365 else 30.0
+                start_time = time_module.time()
+
+                async with DXLinkStreamer(session) as streamer:
+                    await streamer.subscribe_candle([streamer_symbol], resolution, start, extended_trading_hours=True)
+
+                    async for candle in streamer.listen(Candle):
+                        # Check for empty snapshot marker
+                        if getattr(candle, 'remove', False):
+                            if getattr(candle, 'snapshot_end', False) or getattr(candle, 'snapshot_snip', False):
+                                break
+                            continue
+
+                        candle_time = getattr(candle, 'time', None)
+                        if candle_time:
+                            if isinstance(candle_time, (int, float)):
+                                ts_epoch = int(candle_time / 1000) if candle_time > 10000000000 else int(candle_time)
+                            else:
+                                ts_epoch = int(candle_time.timestamp())
+
+                            o = float(getattr(candle, 'open', 0) or 0)
+                            h = float(getattr(candle, 'high', 0) or 0)
+                            l = float(getattr(candle, 'low', 0) or 0)
+                            c = float(getattr(candle, 'close', 0) or 0)
+                            if o > 0 and h > 0 and c > 0 and ts_epoch <= end_epoch:
+                                rows.append({
+                                    'Date': pd.Timestamp(ts_epoch, unit='s'),
+                                    'Open': o, 'High': h, 'Low': l, 'Close': c,
+                                    'Volume': int(getattr(candle, 'volume', 0) or 0),
+                                })
+
+                        # Break immediately when snapshot is complete
+                        if getattr(candle, 'snapshot_end', False) or getattr(candle, 'snapshot_snip', False):
+                            break
+                        # Hard timeout safety net
+                        if time_module.time() - start_time > timeout_sec:
+                            break
+        except Exception as e:
+            logger.error(f"Tastytrade candle error for {symbol}: {e}")
+
+        if rows:
+            df = pd.DataFrame(rows).set_index('Date')
+            df.attrs['source'] = 'tastytrade'
+            return df
+
+        # Fallback: Yahoo Finance for direct futures OHLC data
+        yf_symbol = _YAHOO_FUTURES.get(symbol.lstrip('/').upper())
+        if not yf_symbol:
+            return None
+        try:
+            import yfinance as yf
+            logger.info(f"Yahoo Finance fallback: {yf_symbol} interval={resolution} from={start}")
+            df = yf.Ticker(yf_symbol).history(start=start, end=end, interval=resolution)
+            if df is None or df.empty:
+                return None
+            df = df[(df['Open'] > 0) & (df['High'] > 0) & (df['Close'] > 0)]
+            df.attrs['source'] = 'yahoo_finance'
+            return df
+        except Exception as e:
+            logger.error(f"Yahoo Finance fallback error: {e}")
+            return None
+
     @web_app.get("/market/candles", tags=["Options"])
     async def market_candles(
         ticker: str = Query(..., description="Ticker symbol. For futures use /ES, /NQ, /CL, /GC"),
@@ -3134,6 +3340,10 @@ Be specific with price levels and data points. Keep it actionable for traders.""
         For stocks (SPY, AAPL, etc.): Uses Polygon API
         For futures (/ES, /NQ, /CL, /GC): Uses Tastytrade DXLink Candle streaming
 
+        Candles are served from the shared candle store, which fetches 1m,
+        5m or daily bars once and resamples them for every interval, so
+        switching chart intervals doesn't refetch.
+
         Returns data formatted for Lightweight Charts:
         - time: Unix timestamp in seconds
         - open, high, low, close: Price values
@@ -3146,332 +3356,52 @@ Be specific with price levels and data points. Keep it actionable for traders.""
         - 1w, 1M: Weekly/Monthly
         """
         try:
-            import time as _t
-            cache_key = f"{ticker}:{days}:{interval}"
-            ttl = _CANDLE_CACHE_TTL.get(interval, 300)
-            if cache_key in _candle_cache:
-                cached_ts, cached_data = _candle_cache[cache_key]
-                if _t.time() - cached_ts < ttl:
-                    return cached_data
-            from datetime import datetime, timedelta
-            import asyncio
-
-            is_futures = ticker.startswith('/')
-
-            # Map interval to Polygon timespan format
-            interval_map = {
-                '1m': ('minute', 1),
-                '5m': ('minute', 5),
-                '15m': ('minute', 15),
-                '30m': ('minute', 30),
-                '1h': ('hour', 1),
-                '4h': ('hour', 4),
-                '1d': ('day', 1),
-                '1w': ('week', 1),
-                '1M': ('month', 1),
-            }
-
-            timespan, multiplier = interval_map.get(interval, ('day', 1))
-
-            # ETF proxy mapping for futures price data fallback
-            FUTURES_TO_ETF = {
-                'ES': 'SPY', 'MES': 'SPY',
-                'NQ': 'QQQ', 'MNQ': 'QQQ',
-                'RTY': 'IWM', 'YM': 'DIA',
-                'CL': 'USO', 'GC': 'GLD',
-                'SI': 'SLV', 'ZB': 'TLT', 'ZN': 'IEF'
-            }
-
-            if is_futures:
-                # Use Tastytrade DXLink Candle streaming for ALL futures candle requests
-                # DXLink supports daily/weekly/monthly with "all available" history (up to 8000 candles)
-                try_dxlink = True
-                try:
-                    from src.data.tastytrade_provider import (
-                        get_tastytrade_session,
-                        get_futures_front_month_symbol,
-                        is_futures_ticker
-                    )
-                    from tastytrade import DXLinkStreamer
-                    from tastytrade.dxfeed import Candle
+            from src.data.candle_store import get_candle_store, fetch_polygon_bars
 
-                    session = get_tastytrade_session()
-                    if not session:
-                        return {
-                            "ok": False,
-                            "error": "Tastytrade session not available. Check credentials."
-                        }
+            store = get_candle_store()
 
-                    if not try_dxlink:
-                        logger.info(f"Skipping DXLink candles for {ticker}, using Yahoo Finance")
-                        raise Exception("Skip to Yahoo Finance")
-
-                    # Build streamer symbol: use product/continuous symbol for candles
-                    # /ES:XCME (no month code) = continuous front-month data across rolls
-                    # /ESH6:XCME (with month code) = specific contract only
-                    FUTURES_EXCHANGE = {
-                        '/ES': ':XCME', '/NQ': ':XCME', '/YM': ':XCME', '/RTY': ':XCME',
-                        '/CL': ':XNYM', '/NG': ':XNYM',
-                        '/GC': ':XCEC', '/SI': ':XCEC', '/HG': ':XCEC',
-                        '/ZB': ':XCBT', '/ZN': ':XCBT', '/ZC': ':XCBT', '/ZS': ':XCBT', '/ZW': ':XCBT',
-                    }
-                    t_upper = ticker.upper()
-                    # Extract the root symbol (e.g., /ES from /ESH6 or /ES)
-                    root_symbol = t_upper
-                    for root in FUTURES_EXCHANGE:
-                        if t_upper.startswith(root):
-                            root_symbol = root
-                            break
-                    suffix = FUTURES_EXCHANGE.get(root_symbol, ':XCME')
-                    # Use product symbol (continuous) for candle data
-                    streamer_symbol = root_symbol + suffix
-                    logger.info(f"Built candle streamer symbol: {streamer_symbol} (continuous) for {ticker}")
-
-                    # Map interval to DXLink candle period
-                    DXLINK_PERIOD_MAP = {
-                        '1m': '1m', '5m': '5m', '15m': '15m', '30m': '30m',
-                        '1h': '1h', '4h': '4h',
-                        '1d': '1d', '1w': '1w', '1M': '1mo',
-                    }
-                    dxlink_period = DXLINK_PERIOD_MAP.get(interval, '1d')
-                    # Only auto-switch to weekly if daily candles would exceed 8000 limit (~22 years)
-                    if days > 8000 and interval in ('1d', None):
-                        dxlink_period = '1w'
-
-                    # Calculate from_time as datetime object
-                    from_time = datetime.now() - timedelta(days=days)
-                    logger.info(f"Subscribing to candle: {streamer_symbol} interval={dxlink_period} from={from_time}")
-
-                    candles_data = []
-                    is_daily_or_longer = dxlink_period in ('1d', '1w', '1mo')
-
-                    try:
-                        async with DXLinkStreamer(session) as streamer:
-                            await streamer.subscribe_candle([streamer_symbol], dxlink_period, from_time, extended_trading_hours=True)
-
-                            import time as time_module
-                            start_time = time_module.time()
-                            timeout_sec = 60.0 if days > 365 else 30.0
-
-                            async for candle in streamer.listen(Candle):
-                                # Check for empty snapshot marker
-                                if getattr(candle, 'remove', False):
-                                    if getattr(candle, 'snapshot_end', False) or getattr(candle, 'snapshot_snip', False):
-                                        break
-                                    continue
-
-                                candle_time = getattr(candle, 'time', None)
-                                if candle_time:
-                                    if isinstance(candle_time, (int, float)):
-                                        ts_epoch = int(candle_time / 1000) if candle_time > 10000000000 else int(candle_time)
-                                    else:
-                                        ts_epoch = int(candle_time.timestamp())
-
-                                    if is_daily_or_longer:
-                                        dt = datetime.utcfromtimestamp(ts_epoch)
-                                        ts = dt.strftime('%Y-%m-%d')
-                                    else:
-                                        ts = ts_epoch
-
-                                    o = float(getattr(candle, 'open', 0) or 0)
-                                    h = float(getattr(candle, 'high', 0) or 0)
-                                    l = float(getattr(candle, 'low', 0) or 0)
-                                    c = float(getattr(candle, 'close', 0) or 0)
-                                    if o > 0 and h > 0 and c > 0:
-                                        candles_data.append({
-                                            'time': ts, 'open': o, 'high': h, 'low': l, 'close': c,
-                                            'volume': int(getattr(candle, 'volume', 0) or 0),
-                                        })
-
-                                # Break immediately when snapshot is complete (no 3s wait)
-                                if getattr(candle, 'snapshot_end', False) or getattr(candle, 'snapshot_snip', False):
-                                    break
-                                # Hard timeout safety net
-                                if time_module.time() - start_time > timeout_sec:
-                                    break
-
-                    except Exception as e:
-                        logger.error(f"Error streaming candles for {ticker}: {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-
-                    if candles_data:
-                        # Sort by time and remove duplicates
-                        candles_data.sort(key=lambda x: x['time'])
-                        seen_times = set()
-                        unique_candles = []
-                        for c in candles_data:
-                            if c['time'] not in seen_times:
-                                seen_times.add(c['time'])
-                                unique_candles.append(c)
-
-                        result = {
-                            "ok": True,
-                            "data": {
-                                "ticker": ticker,
-                                "interval": interval,
-                                "days": days,
-                                "source": "tastytrade",
-                                "candles": unique_candles
-                            }
+            if ticker.startswith('/'):
+                # Futures: dates for daily and longer candles, as the chart expects
+                candles, source = await store.get_candles(
+                    ticker.upper(), interval, days, _fetch_futures_bars, date_times=True
+                )
+                if not candles:
+                    return {
+                        "ok": True,
+                        "data": {
+                            "ticker": ticker, "candles": [], "interval": interval,
+                            "source": "none",
+                            "note": "No historical data available"
                         }
-                        _candle_cache[cache_key] = (_t.time(), result)
-                        return result
-                    else:
-                        logger.info(f"No DXLink candle data for {ticker}, falling back to ETF proxy")
-                        # Fall through to ETF proxy below
-
-                except Exception as e:
-                    logger.error(f"Tastytrade candle error for {ticker}: {e}")
-                    # Fall through to ETF proxy below
-
-                # Fallback: use Yahoo Finance for direct futures OHLC data
-                try:
-                    import yfinance as yf
-                    root = ticker.lstrip('/').upper()
-                    # Yahoo Finance futures symbols: ES=F, NQ=F, CL=F, GC=F
-                    YAHOO_FUTURES = {
-                        'ES': 'ES=F', 'MES': 'ES=F', 'NQ': 'NQ=F', 'MNQ': 'NQ=F',
-                        'YM': 'YM=F', 'RTY': 'RTY=F',
-                        'CL': 'CL=F', 'NG': 'NG=F',
-                        'GC': 'GC=F', 'SI': 'SI=F', 'HG': 'HG=F',
-                        'ZB': 'ZB=F', 'ZN': 'ZN=F', 'ZC': 'ZC=F', 'ZS': 'ZS=F', 'ZW': 'ZW=F',
                     }
-                    yf_symbol = YAHOO_FUTURES.get(root)
-                    if yf_symbol:
-                        # yfinance period: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, max
-                        if days <= 5:
-                            yf_period = '5d'
-                        elif days <= 30:
-                            yf_period = '1mo'
-                        elif days <= 90:
-                            yf_period = '3mo'
-                        elif days <= 180:
-                            yf_period = '6mo'
-                        elif days <= 365:
-                            yf_period = '1y'
-                        elif days <= 730:
-                            yf_period = '2y'
-                        elif days <= 1825:
-                            yf_period = '5y'
-                        else:
-                            yf_period = '10y'
-
-                        # Use weekly candles for periods > 1 year to keep chart readable
-                        if days > 365:
-                            yf_interval = '1wk'
-                        elif days > 90:
-                            yf_interval = '1d'
-                        elif timespan == 'hour':
-                            yf_interval = '1h'
-                        else:
-                            yf_interval = '1d'
-
-                        logger.info(f"Yahoo Finance fallback: {yf_symbol} period={yf_period} interval={yf_interval}")
-                        yf_ticker = yf.Ticker(yf_symbol)
-                        df = yf_ticker.history(period=yf_period, interval=yf_interval)
-
-                        if df is not None and not df.empty:
-                            candles = []
-                            for idx, row in df.iterrows():
-                                ts = idx.strftime('%Y-%m-%d') if interval in ('1d', '1w', '1M') else int(idx.timestamp())
-                                o = round(float(row['Open']), 2)
-                                h = round(float(row['High']), 2)
-                                l = round(float(row['Low']), 2)
-                                c = round(float(row['Close']), 2)
-                                v = int(row['Volume'])
-                                if o > 0 and h > 0 and c > 0:
-                                    candles.append({'time': ts, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v})
-
-                            if candles:
-                                result = {
-                                    "ok": True,
-                                    "data": {
-                                        "ticker": ticker, "interval": interval, "days": days,
-                                        "source": "yahoo_finance", "yahoo_symbol": yf_symbol,
-                                        "candles": candles
-                                    }
-                                }
-                                _candle_cache[cache_key] = (_t.time(), result)
-                                return result
-                except Exception as e:
-                    logger.error(f"Yahoo Finance fallback error: {e}")
-
                 return {
                     "ok": True,
                     "data": {
-                        "ticker": ticker, "candles": [], "interval": interval,
-                        "source": "none",
-                        "note": "No historical data available"
+                        "ticker": ticker,
+                        "interval": interval,
+                        "days": days,
+                        "source": source,
+                        "candles": candles
                     }
                 }
 
-            else:
-                # Use Polygon for stocks
-                try:
-                    from src.data.polygon_provider import PolygonProvider
-
-                    async def fetch_polygon_candles():
-                        provider = PolygonProvider()
-                        try:
-                            to_date = datetime.now().strftime('%Y-%m-%d')
-                            from_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-
-                            df = await provider.get_aggregates(
-                                ticker.upper(),
-                                multiplier=multiplier,
-                                timespan=timespan,
-                                from_date=from_date,
-                                to_date=to_date,
-                                limit=5000
-                            )
-                            return df
-                        finally:
-                            await provider.close()
-
-                    # Run async fetch
-                    df = await fetch_polygon_candles()
-
-                    if df is not None and not df.empty:
-                        candles = []
-                        for idx, row in df.iterrows():
-                            # Convert datetime index to Unix timestamp in seconds
-                            ts = int(idx.timestamp())
-                            candles.append({
-                                'time': ts,
-                                'open': float(row['Open']),
-                                'high': float(row['High']),
-                                'low': float(row['Low']),
-                                'close': float(row['Close']),
-                                'volume': int(row['Volume']),
-                            })
-
-                        result = {
-                            "ok": True,
-                            "data": {
-                                "ticker": ticker.upper(),
-                                "interval": interval,
-                                "days": days,
-                                "source": "polygon",
-                                "candles": candles
-                            }
-                        }
-                        _candle_cache[cache_key] = (_t.time(), result)
-                        return result
-                    else:
-                        return {
-                            "ok": False,
-                            "error": f"No candle data found for {ticker}"
-                        }
-
-                except Exception as e:
-                    logger.error(f"Polygon candle error for {ticker}: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-                    return {
-                        "ok": False,
-                        "error": f"Failed to fetch candles from Polygon: {str(e)}"
-                    }
+            # Use Polygon for stocks
+            candles, source = await store.get_candles(ticker.upper(), interval, days, fetch_polygon_bars)
+            if not candles:
+                return {
+                    "ok": False,
+                    "error": f"No candle data found for {ticker}"
+                }
+            return {
+                "ok": True,
+                "data": {
+                    "ticker": ticker.upper(),
+                    "interval": interval,
+                    "days": days,
+                    "source": source,
+                    "candles": candles
+                }
+            }
 
         except Exception as e:
             logger.error(f"Market candles error: {e}")
@@ -4266,10 +4196,14 @@ Be specific with price levels and data points. Keep it actionable for traders.""
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    @web_app.get("/paper/analytics", tags=["Paper Trading"])
-    def paper_analytics(strategy: str = None):
-        """Performance metrics: win rate, Sharpe, drawdown, signal attribution.
-        Optional strategy filter for per-strategy analytics."""
+    def paper_journal_version(strategy: str = None):
+        journal_dir = Path(VOLUME_PATH) / "paper_trading"
+        return tuple(
+            path.stat().st_mtime if path.exists() else None
+            for path in (journal_dir / "journal.json", journal_dir / "equity_curve.json")
+        )
+
+    def build_paper_analytics(strategy: str = None):
         try:
             engine = _get_paper_engine()
             from src.trading.paper.analytics import PerformanceAnalytics
@@ -4297,6 +4231,14 @@ Be specific with price levels and data points. Keep it actionable for traders.""
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
+    read_models.register('paper_analytics', build_paper_analytics, ttl=300, version=paper_journal_version)
+
+    @web_app.get("/paper/analytics", tags=["Paper Trading"])
+    def paper_analytics(request: Request, strategy: str = None):
+        """Performance metrics: win rate, Sharpe, drawdown, signal attribution.
+        Optional strategy filter for per-strategy analytics."""
+        return read_models.respond(request, 'paper_analytics', key=strategy)
+
     @web_app.get("/paper/strategies", tags=["Paper Trading"])
     def paper_strategies():
         """List all strategies and their performance metrics."""
@@ -5221,12 +5163,7 @@ Provide analysis as JSON:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    @web_app.get("/ai/digest", tags=["AI Intelligence"])
-    def ai_digest():
-        """
-        Generate AI-powered daily market digest.
-        Comprehensive morning briefing combining all data sources.
-        """
+    def build_ai_digest():
         try:
             from src.services.ai_service import get_ai_service
 
@@ -5250,7 +5187,7 @@ Provide analysis as JSON:
 
             # Top stocks
             try:
-                results = load_scan_results()
+                results = load_scan_results(reload=False)
                 if results:
                     digest_data['top_stocks'] = results.get('results', [])[:10]
             except:
@@ -5338,6 +5275,17 @@ Format your response as JSON:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
+    read_models.register('ai_digest', build_ai_digest, ttl=1800, version=scan_version)
+
+    @web_app.get("/ai/digest", tags=["AI Intelligence"])
+    def ai_digest(request: Request):
+        """
+        Generate AI-powered daily market digest.
+        Comprehensive morning briefing combining all data sources.
+        Regenerated every 30 minutes or when a new scan lands.
+        """
+        return read_models.respond(request, 'ai_digest')
+
     @web_app.get("/ai/matrix", tags=["AI Intelligence"])
     def ai_signal_matrix():
         """
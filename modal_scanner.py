@@ -30,6 +30,18 @@ compute_config = {
     "gpu": "T4",         # GPU for 10x speed boost (~$0.60/hour)
 }
 
+# Sharded daily scan: each container scans a chunk of the universe with one
+# HTTP session, one batched price fetch and full async concurrency
+# (set DAILY_SCAN_MODE=per_ticker to fall back to one container call per stock)
+DAILY_SCAN_MODE = "sharded"
+DEFAULT_SCAN_SHARDS = 10        # Matches max_containers below
+SHARD_MAX_CONCURRENT = 25       # Concurrent tickers inside one shard
+
+shard_compute_config = {
+    **compute_config,
+    "timeout": 1800,     # A shard covers ~50-200 stocks
+}
+
 # Create custom image with all dependencies
 image = (
     modal.Image.debian_slim(python_version="3.11")
@@ -114,18 +126,128 @@ def scan_stock_with_ai_brain(ticker: str) -> dict:
         return {'ticker': ticker, 'error': str(e)}
 
 
-def _run_daily_scan():
+@app.function(
+    image=image,
+    **shard_compute_config,
+    max_containers=10,
+    secrets=[modal.Secret.from_name("Stock_Story")],
+)
+def scan_shard_with_ai_brain(shard_id: int, tickers: list) -> dict:
+    """
+    Scan a chunk of the universe in one container.
+
+    One AsyncScanner (one HTTP session, one event loop) fetches the price
+    panel for the whole chunk plus SPY in a single batch, then scans every
+    ticker concurrently against it.
+
+    Args:
+        shard_id: Index of this shard (for logging/merging)
+        tickers: Tickers in this shard
+
+    Returns:
+        Shard output dict (results, failed tickers, stats, trace summary)
+    """
+    import sys
+    sys.path.insert(0, '/root')
+
+    try:
+        from src.core.async_scanner import scan_shard_sync
+
+        print(f"🔍 Shard {shard_id}: analyzing {len(tickers)} stocks...")
+        output = scan_shard_sync(tickers, shard_id=shard_id, max_concurrent=SHARD_MAX_CONCURRENT)
+        stats = output['stats']
+        print(f"✅ Shard {shard_id}: {stats['scanned']}/{stats['tickers']} in {stats['elapsed']}s")
+        return output
+
+    except Exception as e:
+        print(f"❌ Shard {shard_id} failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return {
+            'shard': shard_id, 'results': [], 'failed': list(tickers), 'error': str(e),
+            'stats': {'tickers': len(tickers), 'scanned': 0, 'errors': len(tickers)},
+        }
+
+
+def _load_previous_scan_scores() -> dict:
+    """Story scores from the latest scan file ({ticker: score}), for scan deltas."""
+    scan_files = sorted(f for f in Path(VOLUME_PATH).glob("scan_*.json") if f.stem[5:13].isdigit())
+    if not scan_files:
+        return {}
+    try:
+        with open(scan_files[-1]) as f:
+            results = json.load(f).get('results', [])
+        return {r['ticker']: r['story_score'] for r in results
+                if r.get('ticker') and r.get('story_score') is not None}
+    except Exception as e:
+        print(f"⚠️  Could not load previous scan scores: {e}")
+        return {}
+
+
+def _scan_universe_sharded(tickers: list, num_shards: int = None, deltas=None) -> list:
+    """
+    Fan the universe out over scan_shard_with_ai_brain and merge shard
+    results as each container finishes.
+
+    If a ScanDeltaPublisher is given, each shard's score changes are
+    published (and the volume committed) as the shard is merged.
+
+    Returns per-ticker dicts in the same shape as the per-ticker mode
+    (successful results plus {'ticker', 'error'} entries).
+    """
+    import os
+    from src.core.async_scanner import ShardMerger, split_into_shards
+
+    num_shards = num_shards or int(os.environ.get('DAILY_SCAN_SHARDS', DEFAULT_SCAN_SHARDS))
+    shards = split_into_shards(tickers, num_shards)
+    merger = ShardMerger(expected_shards=len(shards))
+
+    print(f"🔄 Scanning {len(tickers)} stocks in {len(shards)} shards "
+          f"(~{len(shards[0]) if shards else 0} stocks each, {SHARD_MAX_CONCURRENT} concurrent per shard)...")
+
+    outputs = scan_shard_with_ai_brain.starmap(
+        list(enumerate(shards)), order_outputs=False, return_exceptions=True,
+    )
+    for output in outputs:
+        if isinstance(output, Exception):
+            # Container-level failure (timeout, OOM); its tickers are
+            # reported as missing below
+            print(f"❌ Shard crashed: {output}")
+            continue
+        merger.add(output)
+        print(f"   📦 Shard {output.get('shard')} merged - {merger.progress()}")
+        if deltas is not None:
+            deltas.add(output.get('results', []))
+            deltas.progress(len(merger.results) + len(merger.failed), len(tickers))
+            volume.commit()  # Make the deltas visible to the API
+
+    for shard_id, shard in enumerate(shards):
+        missing = [t for t in shard if t not in merger.results and t not in merger.failed]
+        if missing:
+            merger.add_failed_shard(shard_id, missing, 'Shard did not return')
+
+    return merger.get_results() + merger.get_failures()
+
+
+def _run_daily_scan(mode: str = None):
     """
     Daily scan of all S&P 500 + NASDAQ stocks with AI brain.
 
     Runs automatically Mon-Fri at 6 AM PST when markets are open.
-    Scans in batches of 10 (GPU concurrency limit) - takes ~5 minutes for 500 stocks.
-    Each stock: ~6 seconds with GPU, 10 concurrent = 50 batches for 500 stocks.
+
+    Modes (argument or DAILY_SCAN_MODE env var):
+    - sharded (default): universe split into DAILY_SCAN_SHARDS chunks, one
+      container per chunk with a shared price panel and async concurrency
+    - per_ticker: one container call per stock (~6 seconds each with GPU,
+      10 concurrent)
     """
+    import os
     import pandas as pd
     import sys
     sys.path.insert(0, '/root')
 
+    mode = mode or os.environ.get('DAILY_SCAN_MODE', DAILY_SCAN_MODE)
+
     print("=" * 70)
     print("🚀 STARTING DAILY AI BRAIN SCAN")
     print("=" * 70)
@@ -206,15 +328,26 @@ def _run_daily_scan():
     print(f"⏰ Start time: {start_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
     print()
 
-    # Run stocks in parallel (batched by GPU concurrency limit)
-    print(f"🔄 Scanning {len(tickers)} stocks in batches of 10 (GPU limit)...")
-    print("   (Each stock gets: 2 CPU + 4GB RAM + T4 GPU)")
-    print(f"   Expected time: ~{(len(tickers) / 10 * 6):.0f} seconds")
-    print()
+    # Stream per-ticker score changes to dashboards as results arrive
+    from src.sync.delta_stream import ScanDeltaPublisher
+    deltas = ScanDeltaPublisher(_load_previous_scan_scores())
 
-    # Map function runs in parallel, respecting GPU concurrency limit
-    # Modal automatically batches: 10 concurrent GPU containers at a time
-    results = list(scan_stock_with_ai_brain.map(tickers))
+    if mode == 'per_ticker':
+        # Run stocks in parallel (batched by GPU concurrency limit)
+        print(f"🔄 Scanning {len(tickers)} stocks in batches of 10 (GPU limit)...")
+        print("   (Each stock gets: 2 CPU + 4GB RAM + T4 GPU)")
+        print(f"   Expected time: ~{(len(tickers) / 10 * 6):.0f} seconds")
+        print()
+
+        # Map function runs in parallel, respecting GPU concurrency limit
+        # Modal automatically batches: 10 concurrent GPU containers at a time
+        results = []
+        for result in scan_stock_with_ai_brain.map(tickers):
+            results.append(result)
+            if result:
+                deltas.add([result])
+    else:
+        results = _scan_universe_sharded(tickers, deltas=deltas)
 
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
@@ -292,6 +425,7 @@ def _run_daily_scan():
     with open(json_path, 'w') as f:
         json.dump(scan_data, f, indent=2, default=str)  # default=str as fallback
 
+    deltas.completed(scan_file=json_filename, successful=len(successful), failed=len(failed))
     volume.commit()  # Persist to volume
     print(f"💾 Saved to Modal Volume: {json_filename}")
 
@@ -403,6 +537,7 @@ def _run_daily_scan():
         'failed': len(failed),
         'duration_seconds': duration,
         'csv_file': csv_filename,
+        'mode': mode,
     }
 
 
@@ -1458,11 +1593,99 @@ def _run_batch_insider_transactions_update():
         return {'success': False, 'error': str(e)}
 
 
+def _run_earnings_calendar_ingest():
+    """
+    Earnings Calendar Ingestion.
+
+    Pulls the full-market earnings calendar from Finnhub in date-range
+    requests and stores it indexed by date and ticker, so the scan's
+    earnings scorer and the earnings alerts do dictionary reads instead of
+    per-ticker lookups. Runs at the start of the morning bundle.
+    """
+    import sys
+    sys.path.insert(0, '/root')
+
+    print("=" * 70)
+    print("📅 EARNINGS CALENDAR INGESTION")
+    print("=" * 70)
+
+    try:
+        from src.data.earnings_calendar import get_earnings_calendar
+
+        calendar = get_earnings_calendar()
+        if not calendar.configured:
+            print("⚠️  FINNHUB_API_KEY not set, skipping")
+            return {'success': False, 'error': 'Finnhub not configured'}
+
+        entries = calendar.refresh()
+
+        print(f"✅ Ingested {entries} entries ({len(calendar.by_ticker)} tickers indexed)")
+        print("=" * 70)
+
+        return {'success': entries > 0, 'entries': entries, 'tickers': len(calendar.by_ticker)}
+
+    except Exception as e:
+        print(f"❌ Earnings calendar ingestion failed: {e}")
+        return {'success': False, 'error': str(e)}
+
+
+def _run_sec_index_build():
+    """
+    SEC Submissions Index Build.
+
+    Loads recent filings for the scanned universe from SEC's nightly bulk
+    submissions.zip into the local index on the volume, so M&A and filing
+    checks read it instead of calling the submissions API per company.
+    Companies the archive misses are still fetched one at a time on demand.
+    """
+    import sys
+    sys.path.insert(0, '/root')
+
+    print("=" * 70)
+    print("🏛️  SEC SUBMISSIONS INDEX BUILD")
+    print("=" * 70)
+
+    try:
+        from src.data.sec_index import get_cik_map, get_submissions_index
+
+        # Universe from the latest scan
+        data_dir = Path(VOLUME_PATH)
+        scan_files = sorted(data_dir.glob("scan_*.json"), reverse=True)
+
+        tickers = []
+        if scan_files:
+            with open(scan_files[0]) as f:
+                scan_data = json.load(f)
+            tickers = [r.get('ticker') for r in scan_data.get('results', []) if r.get('ticker')]
+
+        if not tickers:
+            print("⚠️  No scan results, skipping")
+            return {'success': False, 'error': 'No scan results'}
+
+        ciks = set(get_cik_map().get_many(tickers).values())
+        print(f"📊 Indexing {len(ciks)} companies ({len(tickers)} tickers)")
+
+        companies = get_submissions_index().build_from_bulk(ciks=ciks)
+        volume.commit()
+
+        print(f"✅ Indexed {companies}/{len(ciks)} companies from bulk data")
+        print("=" * 70)
+
+        return {'success': True, 'companies': companies, 'ciks': len(ciks)}
+
+    except Exception as e:
+        print(f"❌ SEC index build failed: {e}")
+        return {'success': False, 'error': str(e)}
+
+
 def _run_batch_google_trends_prefetch():
     """
     Batch Google Trends Pre-fetch.
 
-    Pre-fetches Google Trends data for top stocks to speed up API responses.
+    Pre-fetches Google Trends data for every ticker in the latest scan to
+    speed up API responses. Tickers go out four per request (plus the
+    shared anchor term) within the trends service's hourly budget, in scan
+    rank order; cached tickers cost nothing, so later runs fill the rest.
     Runs Mon-Fri at 6:30 AM PST (during daily scan).
     """
     import sys
@@ -1473,7 +1696,7 @@ def _run_batch_google_trends_prefetch():
     print("=" * 70)
 
     try:
-        # Get top stocks from latest scan
+        # Get the scanned universe from the latest scan (ranked order)
         data_dir = Path(VOLUME_PATH)
         scan_files = sorted(data_dir.glob("scan_*.json"), reverse=True)
 
@@ -1481,27 +1704,18 @@ def _run_batch_google_trends_prefetch():
         if scan_files:
             with open(scan_files[0]) as f:
                 scan_data = json.load(f)
-            results = scan_data.get('results', [])[:50]  # Top 50 stocks
+            results = scan_data.get('results', [])
             tickers = [r.get('ticker') for r in results if r.get('ticker')]
 
         print(f"📊 Pre-fetching trends for {len(tickers)} stocks")
 
-        from src.intelligence.google_trends import get_trend_score
-        successful = 0
-        failed = 0
+        from src.intelligence.google_trends import prefetch_trends
+        stats = prefetch_trends(tickers)
 
-        for ticker in tickers:
-            try:
-                score = get_trend_score(ticker)
-                if score is not None:
-                    successful += 1
-            except Exception as e:
-                failed += 1
-
-        print(f"✅ Fetched: {successful}, Failed: {failed}")
+        print(f"✅ Fetched: {stats['fetched']}, Missing: {stats['missing']}, Requests: {stats['requests']}")
         print("=" * 70)
 
-        return {'success': True, 'fetched': successful, 'failed': failed}
+        return {'success': True, **stats}
 
     except Exception as e:
         print(f"❌ Batch prefetch failed: {e}")
@@ -2122,12 +2336,12 @@ def _run_daily_correlation_analysis():
     volumes={VOLUME_PATH: volume},
     secrets=[modal.Secret.from_name("Stock_Story")],
 )
-def daily_scan():
+def daily_scan(mode: str = None):
     """
     Daily scan of all S&P 500 + NASDAQ stocks with AI brain.
     (No schedule - for testing only. Use daily_scan_bundle for scheduled runs.)
     """
-    return _run_daily_scan()
+    return _run_daily_scan(mode)
 
 
 @app.function(
@@ -2329,6 +2543,34 @@ def daily_correlation_analysis():
 # BUNDLED SCHEDULED FUNCTIONS (5 total to stay within Modal's limit)
 # ============================================================================
 
+def _run_bundle(runner, title: str) -> dict:
+    """Run a bundle's job graph and print its timing report."""
+    from src.core.job_runner import format_timing_report
+
+    print("=" * 70)
+    print(f"📦 {title}")
+    print(f"   {len(runner.jobs)} jobs, up to {runner.max_workers} in parallel")
+    print("=" * 70)
+
+    outcome = runner.run()
+    timing = outcome['timing']
+
+    print()
+    print(format_timing_report(timing))
+    print("=" * 70)
+    print(f"✅ {title} COMPLETE in {timing['wall_seconds']:.1f}s "
+          f"({timing['statuses']['ok']} ok, {timing['statuses']['error']} failed, "
+          f"{timing['statuses']['timeout']} timed out, {timing['statuses']['skipped']} skipped)")
+    print("=" * 70)
+
+    return {
+        'bundle': runner.name,
+        'results': outcome['results'],
+        'timing': timing,
+        'success': True
+    }
+
+
 @app.function(
     image=image,
     timeout=3600,  # 1 hour max
@@ -2341,105 +2583,34 @@ def morning_mega_bundle():
     Bundle 1: Morning Mega Bundle (Daily Scan + All Alerts)
     Runs Mon-Fri at 6:00 AM PST (14:00 UTC)
 
-    Executes in sequence:
-    1. daily_scan (main stock scanning)
-    2. automated_theme_discovery
-    3. conviction_alerts
-    4. unusual_options_alerts
-    5. sector_rotation_alerts
-    6. institutional_flow_alerts
-    7. executive_commentary_alerts
-    8. daily_executive_briefing
-    """
-    print("=" * 70)
-    print("📦 BUNDLE 1: MORNING MEGA BUNDLE (SCAN + ALERTS)")
-    print("=" * 70)
-
-    results = {}
-
-    # 1. Daily Scan (MUST run first - all alerts depend on this)
-    print("\n[1/8] Running daily_scan...")
-    try:
-        results['daily_scan'] = _run_daily_scan()
-    except Exception as e:
-        print(f"❌ Daily scan failed: {e}")
-        results['daily_scan'] = {'success': False, 'error': str(e)}
-        # If scan fails, still try alerts but they may have limited data
-        print("⚠️  Daily scan failed, but continuing with alerts using previous data...")
-
-    # 2. Theme Discovery
-    print("\n[2/8] Running automated_theme_discovery...")
-    try:
-        results['theme_discovery'] = _run_automated_theme_discovery()
-    except Exception as e:
-        print(f"❌ Theme discovery failed: {e}")
-        results['theme_discovery'] = {'success': False, 'error': str(e)}
+    Job graph (independent jobs run concurrently):
+    - earnings_calendar -> daily_scan
+    - sec_index (bulk filings for the previous scan's universe): no inputs
+    - daily_scan -> conviction_alerts, unusual_options_alerts,
+      automated_theme_discovery (reads the scan CSV)
+    - daily_scan + automated_theme_discovery -> daily_executive_briefing
+    - sector_rotation_alerts, institutional_flow_alerts,
+      executive_commentary_alerts, exit_signal_check: no inputs
 
-    # 3. Conviction Alerts
-    print("\n[3/8] Running conviction_alerts...")
-    try:
-        results['conviction'] = _run_conviction_alerts()
-    except Exception as e:
-        print(f"❌ Conviction alerts failed: {e}")
-        results['conviction'] = {'success': False, 'error': str(e)}
-
-    # 4. Unusual Options Alerts
-    print("\n[4/8] Running unusual_options_alerts...")
-    try:
-        results['unusual_options'] = _run_unusual_options_alerts()
-    except Exception as e:
-        print(f"❌ Unusual options failed: {e}")
-        results['unusual_options'] = {'success': False, 'error': str(e)}
-
-    # 5. Sector Rotation Alerts
-    print("\n[5/8] Running sector_rotation_alerts...")
-    try:
-        results['sector_rotation'] = _run_sector_rotation_alerts()
-    except Exception as e:
-        print(f"❌ Sector rotation failed: {e}")
-        results['sector_rotation'] = {'success': False, 'error': str(e)}
-
-    # 6. Institutional Flow Alerts
-    print("\n[6/8] Running institutional_flow_alerts...")
-    try:
-        results['institutional_flow'] = _run_institutional_flow_alerts()
-    except Exception as e:
-        print(f"❌ Institutional flow failed: {e}")
-        results['institutional_flow'] = {'success': False, 'error': str(e)}
-
-    # 7. Executive Commentary Alerts
-    print("\n[7/8] Running executive_commentary_alerts...")
-    try:
-        results['executive_commentary'] = _run_executive_commentary_alerts()
-    except Exception as e:
-        print(f"❌ Executive commentary failed: {e}")
-        results['executive_commentary'] = {'success': False, 'error': str(e)}
-
-    # 8. Daily Executive Briefing
-    print("\n[8/9] Running daily_executive_briefing...")
-    try:
-        results['briefing'] = _run_daily_executive_briefing()
-    except Exception as e:
-        print(f"❌ Daily briefing failed: {e}")
-        results['briefing'] = {'success': False, 'error': str(e)}
-
-    # 9. Exit Signal Detection (TIER 3)
-    print("\n[9/9] Running exit_signal_check...")
-    try:
-        results['exit_signals'] = _run_exit_signal_check()
-    except Exception as e:
-        print(f"❌ Exit signal check failed: {e}")
-        results['exit_signals'] = {'success': False, 'error': str(e)}
+    Alerts still run if the scan fails (they use the previous scan file).
+    """
+    from src.core.job_runner import JobRunner
 
-    print("=" * 70)
-    print("✅ BUNDLE 1 COMPLETE (9/9 functions)")
-    print("=" * 70)
+    runner = JobRunner('morning_mega')
+    runner.add('earnings_calendar', _run_earnings_calendar_ingest, timeout=600)
+    runner.add('daily_scan', _run_daily_scan, depends_on=['earnings_calendar'], timeout=2700)
+    runner.add('theme_discovery', _run_automated_theme_discovery, depends_on=['daily_scan'], timeout=900)
+    runner.add('sec_index', _run_sec_index_build, timeout=1800)
+    runner.add('conviction', _run_conviction_alerts, depends_on=['daily_scan'], timeout=600)
+    runner.add('unusual_options', _run_unusual_options_alerts, depends_on=['daily_scan'], timeout=600)
+    runner.add('sector_rotation', _run_sector_rotation_alerts, timeout=600)
+    runner.add('institutional_flow', _run_institutional_flow_alerts, timeout=600)
+    runner.add('executive_commentary', _run_executive_commentary_alerts, timeout=600)
+    runner.add('briefing', _run_daily_executive_briefing,
+               depends_on=['daily_scan', 'theme_discovery'], timeout=600)
+    runner.add('exit_signals', _run_exit_signal_check, timeout=600)
 
-    return {
-        'bundle': 'morning_mega',
-        'results': results,
-        'success': True
-    }
+    return _run_bundle(runner, "BUNDLE 1: MORNING MEGA BUNDLE (SCAN + ALERTS)")
 
 
 @app.function(
@@ -2454,41 +2625,17 @@ def afternoon_analysis_bundle():
     Bundle 2: Afternoon Analysis
     Runs Mon-Fri at 1:00 PM PST (21:00 UTC)
 
-    Executes in sequence:
-    1. daily_correlation_analysis
-    2. batch_insider_transactions_update
+    Runs concurrently (both read the latest scan file):
+    - daily_correlation_analysis
+    - batch_insider_transactions_update
     """
-    print("=" * 70)
-    print("📦 BUNDLE 2: AFTERNOON ANALYSIS")
-    print("=" * 70)
-
-    results = {}
-
-    # 1. Daily Correlation Analysis
-    print("\n[1/2] Running daily_correlation_analysis...")
-    try:
-        results['correlation'] = _run_daily_correlation_analysis()
-    except Exception as e:
-        print(f"❌ Correlation analysis failed: {e}")
-        results['correlation'] = {'success': False, 'error': str(e)}
+    from src.core.job_runner import JobRunner
 
-    # 2. Batch Insider Transactions Update
-    print("\n[2/2] Running batch_insider_transactions_update...")
-    try:
-        results['insider_transactions'] = _run_batch_insider_transactions_update()
-    except Exception as e:
-        print(f"❌ Insider transactions failed: {e}")
-        results['insider_transactions'] = {'success': False, 'error': str(e)}
+    runner = JobRunner('afternoon_analysis')
+    runner.add('correlation', _run_daily_correlation_analysis, timeout=900)
+    runner.add('insider_transactions', _run_batch_insider_transactions_update, timeout=1800)
 
-    print("=" * 70)
-    print("✅ BUNDLE 3 COMPLETE")
-    print("=" * 70)
-
-    return {
-        'bundle': 'afternoon_analysis',
-        'results': results,
-        'success': True
-    }
+    return _run_bundle(runner, "BUNDLE 2: AFTERNOON ANALYSIS")
 
 
 @app.function(
@@ -2503,67 +2650,23 @@ def weekly_reports_bundle():
     Bundle 3: Weekly Reports
     Runs Mondays at 2:00 AM UTC (Sunday 6:00 PM PST)
 
-    Executes in sequence:
-    1. weekly_summary_report
-    2. parameter_learning_health_check
-    3. batch_contracts_update
-    4. batch_patent_data_update (conditional: only if first Monday of month)
+    Runs concurrently:
+    - weekly_summary_report
+    - parameter_learning_health_check
+    - batch_contracts_update
+    - batch_patent_data_update (conditional: only if first Monday of month)
     """
-    print("=" * 70)
-    print("📦 BUNDLE 3: WEEKLY REPORTS")
-    print("=" * 70)
-
-    results = {}
-
-    # 1. Weekly Summary Report
-    print("\n[1/4] Running weekly_summary_report...")
-    try:
-        results['weekly_summary'] = _run_weekly_summary_report()
-    except Exception as e:
-        print(f"❌ Weekly summary failed: {e}")
-        results['weekly_summary'] = {'success': False, 'error': str(e)}
-
-    # 2. Parameter Learning Health Check
-    print("\n[2/4] Running parameter_learning_health_check...")
-    try:
-        results['health_check'] = _run_parameter_learning_health_check()
-    except Exception as e:
-        print(f"❌ Health check failed: {e}")
-        results['health_check'] = {'success': False, 'error': str(e)}
-
-    # 3. Batch Contracts Update
-    print("\n[3/4] Running batch_contracts_update...")
-    try:
-        results['contracts'] = _run_batch_contracts_update()
-    except Exception as e:
-        print(f"❌ Contracts update failed: {e}")
-        results['contracts'] = {'success': False, 'error': str(e)}
-
-    # 4. Batch Patent Data Update (only first Monday of month)
     from datetime import datetime
-    now = datetime.now()
-    is_first_monday = now.day <= 7
+    from src.core.job_runner import JobRunner
 
-    if is_first_monday:
-        print("\n[4/4] Running batch_patent_data_update (first Monday of month)...")
-        try:
-            results['patents'] = _run_batch_patent_data_update()
-        except Exception as e:
-            print(f"❌ Patent update failed: {e}")
-            results['patents'] = {'success': False, 'error': str(e)}
-    else:
-        print("\n[4/4] Skipping batch_patent_data_update (not first Monday of month)")
-        results['patents'] = {'success': True, 'skipped': True}
-
-    print("=" * 70)
-    print("✅ BUNDLE 4 COMPLETE")
-    print("=" * 70)
+    runner = JobRunner('weekly_reports')
+    runner.add('weekly_summary', _run_weekly_summary_report, timeout=900)
+    runner.add('health_check', _run_parameter_learning_health_check, timeout=900)
+    runner.add('contracts', _run_batch_contracts_update, timeout=1800)
+    runner.add('patents', _run_batch_patent_data_update, timeout=1800,
+               condition=lambda: datetime.now().day <= 7)
 
-    return {
-        'bundle': 'weekly_reports',
-        'results': results,
-        'success': True
-    }
+    return _run_bundle(runner, "BUNDLE 3: WEEKLY REPORTS")
 
 
 @app.function(
@@ -2578,51 +2681,22 @@ def monitoring_cycle_bundle():
     Bundle 4: Monitoring Cycle
     Runs every 6 hours
 
-    Executes in sequence:
-    1. data_staleness_monitor
-    2. batch_google_trends_prefetch (conditional: only during market hours 14-22 UTC)
+    Runs concurrently:
+    - data_staleness_monitor
+    - batch_google_trends_prefetch (conditional: only during market hours 14-22 UTC)
     """
-    print("=" * 70)
-    print("📦 BUNDLE 4: MONITORING CYCLE")
-    print("=" * 70)
-
-    results = {}
-
-    # 1. Data Staleness Monitor
-    print("\n[1/2] Running data_staleness_monitor...")
-    try:
-        results['staleness'] = _run_data_staleness_monitor()
-    except Exception as e:
-        print(f"❌ Staleness monitor failed: {e}")
-        results['staleness'] = {'success': False, 'error': str(e)}
-
-    # 2. Batch Google Trends Prefetch (only during market hours)
     from datetime import datetime
-    now = datetime.now()
-    current_hour = now.hour
-    is_market_hours = 14 <= current_hour <= 22  # 6 AM - 2 PM PST in UTC
-    is_weekday = now.weekday() < 5  # Monday = 0, Friday = 4
+    from src.core.job_runner import JobRunner
 
-    if is_market_hours and is_weekday:
-        print("\n[2/2] Running batch_google_trends_prefetch (market hours)...")
-        try:
-            results['trends'] = _run_batch_google_trends_prefetch()
-        except Exception as e:
-            print(f"❌ Trends prefetch failed: {e}")
-            results['trends'] = {'success': False, 'error': str(e)}
-    else:
-        print("\n[2/2] Skipping batch_google_trends_prefetch (outside market hours)")
-        results['trends'] = {'success': True, 'skipped': True}
+    def is_market_hours():
+        now = datetime.now()
+        return 14 <= now.hour <= 22 and now.weekday() < 5  # 6 AM - 2 PM PST in UTC, Mon-Fri
 
-    print("=" * 70)
-    print("✅ BUNDLE 4 COMPLETE")
-    print("=" * 70)
+    runner = JobRunner('monitoring_cycle')
+    runner.add('staleness', _run_data_staleness_monitor, timeout=600)
+    runner.add('trends', _run_batch_google_trends_prefetch, timeout=1200, condition=is_market_hours)
 
-    return {
-        'bundle': 'monitoring_cycle',
-        'results': results,
-        'success': True
-    }
+    return _run_bundle(runner, "BUNDLE 4: MONITORING CYCLE")
 
 
 @app.function(
@@ -4,13 +4,32 @@ AI Intelligence Layer
 DeepSeek integration, AI-assisted learning, and ecosystem generation.
 """
 
-from src.ai.deepseek_intelligence import (
-    DeepSeekIntelligence,
-    get_deepseek_intelligence,
-)
+import importlib
+
+# Submodules are imported on first attribute access so `import src.ai`
+# (and any `src.ai.<module>` import) stays cheap.
+_LAZY_ATTRS = {
+    'DeepSeekIntelligence': ('src.ai.deepseek_intelligence', 'DeepSeekIntelligence'),
+    'get_deepseek_intelligence': ('src.ai.deepseek_intelligence', 'get_deepseek_intelligence'),
+    # Alias for backward compatibility
+    'get_deepseek': ('src.ai.deepseek_intelligence', 'get_deepseek_intelligence'),
+}
+
+
+def __getattr__(name):
+    """Lazy loading of submodule attributes."""
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Alias for backward compatibility
-get_deepseek = get_deepseek_intelligence
 
 __all__ = [
     'DeepSeekIntelligence',
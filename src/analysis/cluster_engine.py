@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Cluster Engine - Correlation Clustering Over the Full Universe
+
+Finds groups of stocks moving together (candidate unknown themes) from a
+whole-universe returns matrix:
+
+1. Correlation matrix from standardized returns (one matrix product)
+2. Sparse graph: each stock keeps its k most-correlated peers, and only
+   edges at or above the correlation threshold
+3. Communities by weighted label propagation, warm-started from the
+   previous run's clusters. Oversized communities are split by
+   re-running on their subgraph with a stricter threshold.
+4. Identity tracking: today's clusters are matched to the previous run's
+   by member overlap (Jaccard), so a cluster keeps its id, first_seen
+   date and day count while it persists
+
+State is kept per engine name in data/clusters/<name>.json.
+
+Usage:
+    engine = get_cluster_engine('scan')
+    clusters = engine.run(returns_df)   # DataFrame: dates x tickers
+    for c in clusters:
+        print(c.cluster_id, c.tickers, c.days_seen)
+"""
+
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass, asdict, field
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utils.file_utils import ensure_data_dir
+from utils import get_logger
+
+logger = get_logger(__name__)
+
+# Graph settings
+DEFAULT_K = 10  # Nearest neighbors kept per stock
+MIN_CORRELATION = 0.7
+MIN_OBSERVATIONS = 15  # Minimum non-missing returns per stock
+
+# Community settings
+MIN_CLUSTER_SIZE = 3
+MAX_CLUSTER_SIZE = 30
+SPLIT_STEP = 0.05  # Threshold increase when splitting an oversized cluster
+MAX_ITERATIONS = 20
+
+# Identity tracking
+MATCH_JACCARD = 0.3  # Minimum overlap to treat a cluster as the same as yesterday's
+
+
+@dataclass
+class Cluster:
+    """A group of co-moving stocks, tracked across runs."""
+    cluster_id: str
+    tickers: List[str]
+    avg_correlation: float
+    first_seen: str
+    last_seen: str
+    days_seen: int = 1
+    is_new: bool = True
+    previous_tickers: List[str] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return len(self.tickers)
+
+    @property
+    def joined(self) -> List[str]:
+        """Tickers that joined since the previous run."""
+        previous = set(self.previous_tickers)
+        return [t for t in self.tickers if t not in previous] if previous else []
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data['size'] = self.size
+        data['joined'] = self.joined
+        return data
+
+
+# =============================================================================
+# GRAPH CONSTRUCTION
+# =============================================================================
+
+def correlation_matrix(
+    returns: pd.DataFrame,
+    min_observations: int = MIN_OBSERVATIONS,
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Correlation matrix for every stock with enough history.
+
+    Missing returns count as zero after demeaning, so the whole matrix is
+    a single product of standardized returns.
+
+    Returns:
+        (tickers, correlation matrix)
+    """
+    returns = returns.replace([np.inf, -np.inf], np.nan)
+    returns = returns.loc[:, returns.notna().sum() >= min_observations]
+    if returns.empty:
+        return [], np.zeros((0, 0))
+
+    values = returns.to_numpy(dtype=float)
+    values = values - np.nanmean(values, axis=0)
+    values = np.nan_to_num(values, nan=0.0)
+    std = values.std(axis=0)
+    keep = std > 0
+
+    tickers = [t for t, k in zip(returns.columns, keep) if k]
+    z = values[:, keep] / std[keep]
+    corr = (z.T @ z) / len(z)
+    return tickers, np.clip(corr, -1.0, 1.0)
+
+
+def knn_graph(corr: np.ndarray, k: int = DEFAULT_K, min_correlation: float = MIN_CORRELATION) -> List[Dict[int, float]]:
+    """
+    Sparse symmetric graph: i-j is an edge if j is among i's k most
+    correlated peers (or vice versa) and their correlation >= threshold.
+    """
+    n = len(corr)
+    adjacency = [dict() for _ in range(n)]
+    if n < 2:
+        return adjacency
+
+    k = min(k, n - 1)
+    masked = corr.copy()
+    np.fill_diagonal(masked, -np.inf)
+    nearest = np.argpartition(-masked, k - 1, axis=1)[:, :k]
+
+    rows = np.repeat(np.arange(n), k)
+    cols = nearest.ravel()
+    weights = masked[rows, cols]
+    strong = weights >= min_correlation
+
+    for i, j, w in zip(rows[strong], cols[strong], weights[strong]):
+        adjacency[i][j] = w
+        adjacency[j][i] = w
+    return adjacency
+
+
+def label_propagation(adjacency: List[Dict[int, float]], labels: np.ndarray,
+                      max_iterations: int = MAX_ITERATIONS) -> np.ndarray:
+    """
+    Weighted label propagation.
+
+    Each node takes the label with the largest summed edge weight among
+    its neighbors, keeping its current label on ties. Nodes are visited
+    in descending degree order, so results are deterministic.
+    """
+    labels = labels.copy()
+    order = sorted(range(len(adjacency)), key=lambda i: -len(adjacency[i]))
+
+    for _ in range(max_iterations):
+        changed = 0
+        for i in order:
+            neighbors = adjacency[i]
+            if not neighbors:
+                continue
+            scores = defaultdict(float)
+            for j, w in neighbors.items():
+                scores[labels[j]] += w
+            current = labels[i]
+            best = max(scores, key=lambda label: (scores[label], label == current, -label))
+            if scores[best] > scores.get(current, 0.0):
+                labels[i] = best
+                changed += 1
+        if not changed:
+            break
+
+    return labels
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class ClusterEngine:
+    """
+    Whole-universe correlation clustering with warm start and
+    cross-day identity tracking.
+    """
+
+    def __init__(
+        self,
+        name: str = 'universe',
+        state_path: Optional[Path] = None,
+        k: int = DEFAULT_K,
+        min_correlation: float = MIN_CORRELATION,
+        min_size: int = MIN_CLUSTER_SIZE,
+        max_size: int = MAX_CLUSTER_SIZE,
+    ):
+        self.name = name
+        self.state_path = Path(state_path) if state_path else Path(ensure_data_dir('clusters')) / f"{name}.json"
+        self.k = k
+        self.min_correlation = min_correlation
+        self.min_size = min_size
+        self.max_size = max_size
+        self.previous = self._load_state()
+
+    def _load_state(self) -> List[Cluster]:
+        if not self.state_path.exists():
+            return []
+        try:
+            with open(self.state_path) as f:
+                data = json.load(f)
+            fields = Cluster.__dataclass_fields__
+            return [Cluster(**{k: v for k, v in c.items() if k in fields}) for c in data.get('clusters', [])]
+        except Exception as e:
+            logger.warning(f"Could not load cluster state {self.state_path}: {e}")
+            return []
+
+    def _save_state(self, clusters: List[Cluster]):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({
+                'updated_at': date.today().isoformat(),
+                'clusters': [asdict(c) for c in clusters],
+            }, f, indent=2)
+        os.replace(tmp, self.state_path)
+
+    def _initial_labels(self, tickers: List[str]) -> np.ndarray:
+        """Each stock starts in yesterday's cluster if it had one, else alone."""
+        n = len(tickers)
+        labels = np.arange(n)
+        position = {t: i for i, t in enumerate(tickers)}
+        for offset, cluster in enumerate(self.previous):
+            for ticker in cluster.tickers:
+                i = position.get(ticker)
+                if i is not None:
+                    labels[i] = n + offset
+        return labels
+
+    def _communities(self, members: np.ndarray, corr: np.ndarray, labels: Optional[np.ndarray],
+                     threshold: float) -> List[np.ndarray]:
+        """
+        Communities within a node subset (connected, same label).
+
+        Oversized communities are split by re-running on their subgraph
+        with a stricter threshold and fresh labels.
+        """
+        sub_corr = corr[np.ix_(members, members)]
+        adjacency = knn_graph(sub_corr, self.k, threshold)
+        if labels is None:
+            labels = np.arange(len(members))
+        sub_labels = label_propagation(adjacency, labels)
+
+        communities = []
+        seen = set()
+        for start in range(len(members)):
+            if start in seen or not adjacency[start]:
+                continue
+            # Connected component of same-label nodes
+            group, stack = [], [start]
+            seen.add(start)
+            while stack:
+                i = stack.pop()
+                group.append(i)
+                for j in adjacency[i]:
+                    if j not in seen and sub_labels[j] == sub_labels[i]:
+                        seen.add(j)
+                        stack.append(j)
+
+            group = members[np.array(group)]
+            if len(group) > self.max_size and threshold + SPLIT_STEP < 1.0:
+                communities.extend(self._communities(group, corr, None, threshold + SPLIT_STEP))
+            elif len(group) >= self.min_size:
+                communities.append(group)
+        return communities
+
+    def _track(self, groups: List[List[str]], avg_corrs: List[float]) -> List[Cluster]:
+        """Match today's groups to the previous run's clusters by Jaccard overlap."""
+        today = date.today().isoformat()
+        candidates = []
+        for g, group in enumerate(groups):
+            members = set(group)
+            for p, prev in enumerate(self.previous):
+                prev_members = set(prev.tickers)
+                overlap = len(members & prev_members) / len(members | prev_members)
+                if overlap >= MATCH_JACCARD:
+                    candidates.append((overlap, g, p))
+
+        matched = {}
+        used = set()
+        for overlap, g, p in sorted(candidates, reverse=True):
+            if g not in matched and p not in used:
+                matched[g] = p
+                used.add(p)
+
+        existing_ids = {c.cluster_id for c in self.previous}
+        clusters = []
+        counter = 0
+        for g, group in enumerate(groups):
+            if g in matched:
+                prev = self.previous[matched[g]]
+                clusters.append(Cluster(
+                    cluster_id=prev.cluster_id,
+                    tickers=group,
+                    avg_correlation=avg_corrs[g],
+                    first_seen=prev.first_seen,
+                    last_seen=today,
+                    days_seen=prev.days_seen + (prev.last_seen != today),
+                    is_new=False,
+                    previous_tickers=prev.tickers,
+                ))
+                continue
+
+            counter += 1
+            cluster_id = f"{self.name}_{today.replace('-', '')}_{counter}"
+            while cluster_id in existing_ids:
+                counter += 1
+                cluster_id = f"{self.name}_{today.replace('-', '')}_{counter}"
+            clusters.append(Cluster(
+                cluster_id=cluster_id,
+                tickers=group,
+                avg_correlation=avg_corrs[g],
+                first_seen=today,
+                last_seen=today,
+            ))
+        return clusters
+
+    def run(self, returns: pd.DataFrame, warm_start: bool = True, persist: bool = True) -> List[Cluster]:
+        """
+        Cluster a returns matrix (rows: dates, columns: tickers).
+
+        Args:
+            returns: Daily returns
+            warm_start: Seed communities with the previous run's clusters
+            persist: Save the result as the state for the next run
+
+        Returns:
+            Clusters sorted by average correlation (strongest first)
+        """
+        tickers, corr = correlation_matrix(returns)
+        if len(tickers) < self.min_size:
+            return []
+
+        labels = self._initial_labels(tickers) if warm_start else None
+        communities = self._communities(np.arange(len(tickers)), corr, labels, self.min_correlation)
+
+        groups, avg_corrs = [], []
+        for members in communities:
+            sub = corr[np.ix_(members, members)]
+            avg_corr = (sub.sum() - len(members)) / (len(members) * (len(members) - 1))
+            # Most connected members first
+            ranked = members[np.argsort(-sub.sum(axis=1))]
+            groups.append([tickers[i] for i in ranked])
+            avg_corrs.append(round(float(avg_corr), 4))
+
+        clusters = sorted(self._track(groups, avg_corrs), key=lambda c: -c.avg_correlation)
+
+        if persist:
+            self._save_state(clusters)
+            self.previous = clusters
+
+        logger.info(f"Cluster engine '{self.name}': {len(clusters)} clusters from {len(tickers)} stocks "
+                    f"({sum(not c.is_new for c in clusters)} carried over)")
+        return clusters
+
+
+# Engine instances by name
+_engines: Dict[str, ClusterEngine] = {}
+
+
+def get_cluster_engine(name: str = 'universe') -> ClusterEngine:
+    """Get the shared engine for a named universe (each keeps its own state)."""
+    if name not in _engines:
+        _engines[name] = ClusterEngine(name)
+    return _engines[name]
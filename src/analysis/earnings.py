@@ -223,9 +223,32 @@ def get_earnings_info(ticker):
     return result
 
 
+def _calendar():
+    """The ingested earnings calendar, or None if none is available."""
+    try:
+        from src.data.earnings_calendar import get_earnings_calendar
+
+        calendar = get_earnings_calendar()
+        return calendar if calendar.available else None
+    except Exception as e:
+        logger.debug(f"Earnings calendar unavailable: {e}")
+        return None
+
+
+def lookup_earnings(ticker):
+    """
+    Earnings info for a ticker from the ingested calendar (a dictionary
+    read), falling back to get_earnings_info if no calendar is available.
+    """
+    calendar = _calendar()
+    if calendar is not None:
+        return calendar.get_info(ticker)
+    return get_earnings_info(ticker)
+
+
 def get_earnings_date(ticker):
     """Get next earnings date for a ticker (simple version for compatibility)."""
-    info = get_earnings_info(ticker)
+    info = lookup_earnings(ticker)
     return info.get('next_date')
 
 
@@ -241,6 +264,10 @@ def get_upcoming_earnings(tickers=None, days_ahead=14, include_estimates=True):
     today = datetime.now().date()
     cutoff = today + timedelta(days=days_ahead)
 
+    calendar = _calendar()
+    if calendar is not None:
+        return calendar.between(today, cutoff, tickers)
+
     earnings = []
 
     with ThreadPoolExecutor(max_workers=20) as executor:
@@ -322,6 +349,14 @@ def check_earnings_soon(tickers, days=3):
     """
     earnings_soon = {}
 
+    calendar = _calendar()
+    if calendar is not None:
+        for ticker in tickers:
+            info = calendar.get_info(ticker)
+            if info['days_until'] is not None and 0 <= info['days_until'] <= days:
+                earnings_soon[ticker] = info
+        return earnings_soon
+
     for ticker in tickers:
         try:
             info = get_earnings_info(ticker)
@@ -4,8 +4,18 @@ Multi-Timeframe Analysis Module
 
 Analyzes stocks across daily, weekly, and monthly timeframes.
 Confluence across timeframes = stronger signals.
+
+Weekly and monthly bars are derived by resampling one stored daily
+history per ticker (see MTFEngine), so a ticker costs at most one
+download and a whole scan can be analyzed in batch.
 """
 
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
 import yfinance as yf
 import warnings
 warnings.filterwarnings('ignore')
@@ -16,6 +26,36 @@ from utils import (
 
 logger = get_logger(__name__)
 
+# Daily history depth needed for 50 monthly bars
+MTF_HISTORY_PERIOD = '5y'
+MTF_MIN_DAILY_BARS = 50 * 21
+
+# Stored histories older than this get their recent bars refetched
+MTF_CACHE_TTL = 6 * 3600
+
+# Overlap (days) re-downloaded before the last stored bar on a tail refresh
+MTF_TAIL_OVERLAP_DAYS = 5
+
+TIMEFRAMES = ('daily', 'weekly', 'monthly')
+
+# Resample rules per timeframe (None = native daily bars)
+_RESAMPLE_RULES = {
+    'daily': None,
+    'weekly': 'W-FRI',
+    'monthly': 'ME',
+}
+
+_OHLCV_AGG = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum',
+}
+
+# Bars needed by analyze_timeframe: sma_50 evaluated 10 bars back
+_FEATURE_WINDOW = 59
+
 
 def analyze_timeframe(df, timeframe_name):
     """Analyze a single timeframe."""
@@ -76,45 +116,331 @@ def get_monthly_data(ticker, period='5y'):
     return df
 
 
-def multi_timeframe_analysis(ticker):
+def _resample(obj, rule):
+    """Resample a daily frame/panel, tolerating pandas' month alias change."""
+    try:
+        return obj.resample(rule)
+    except ValueError:
+        # pandas < 2.2 only knows 'M' for month end
+        return obj.resample('M' if rule == 'ME' else rule)
+
+
+def resample_ohlcv(daily, timeframe):
     """
-    Perform multi-timeframe analysis on a ticker.
+    Derive bars for a timeframe from daily OHLCV bars.
 
-    Returns analysis for daily, weekly, and monthly timeframes.
+    Args:
+        daily: Daily OHLCV DataFrame with a DatetimeIndex
+        timeframe: 'daily', 'weekly' or 'monthly'
+
+    Returns:
+        OHLCV DataFrame at the requested resolution
     """
-    results = {}
+    rule = _RESAMPLE_RULES[timeframe]
+    daily = normalize_dataframe_columns(daily)
+    if rule is None or daily is None or daily.empty:
+        return daily
 
-    # Daily
-    try:
-        daily = yf.download(ticker, period='1y', progress=False)
-        results['daily'] = analyze_timeframe(daily, 'DAILY')
-    except Exception as e:
-        logger.error(f"Error analyzing daily timeframe for {ticker}: {e}")
-        results['daily'] = None
+    agg = {col: how for col, how in _OHLCV_AGG.items() if col in daily.columns}
+    return _resample(daily, rule).agg(agg).dropna(subset=['Close'])
 
-    # Weekly
-    try:
-        weekly = get_weekly_data(ticker)
-        results['weekly'] = analyze_timeframe(weekly, 'WEEKLY')
-    except Exception as e:
-        logger.error(f"Error analyzing weekly timeframe for {ticker}: {e}")
-        results['weekly'] = None
 
-    # Monthly
-    try:
-        monthly = get_monthly_data(ticker)
-        results['monthly'] = analyze_timeframe(monthly, 'MONTHLY')
-    except Exception as e:
-        logger.error(f"Error analyzing monthly timeframe for {ticker}: {e}")
-        results['monthly'] = None
+def _tail_matrix(panel, width):
+    """
+    Right-align the last `width` valid values of every panel column.
+
+    Returns:
+        (matrix of shape [n_tickers, width] left-padded with NaN,
+         array of valid bar counts per ticker)
+    """
+    values = panel.to_numpy(dtype=float)
+    out = np.full((values.shape[1], width), np.nan)
+    counts = np.zeros(values.shape[1], dtype=int)
+
+    for j in range(values.shape[1]):
+        col = values[:, j]
+        col = col[~np.isnan(col)]
+        counts[j] = len(col)
+        tail = col[-width:]
+        if len(tail):
+            out[j, width - len(tail):] = tail
+
+    return out, counts
+
+
+def analyze_close_panel(close_panel, timeframe_name):
+    """
+    Vectorized analyze_timeframe over a panel of closes.
+
+    Args:
+        close_panel: DataFrame of closes (index = bar dates, columns = tickers)
+        timeframe_name: Label stored in each result (e.g. 'WEEKLY')
 
-    # Calculate confluence score
-    confluence = calculate_confluence(results)
-    results['confluence'] = confluence
+    Returns:
+        Dict mapping ticker -> analyze_timeframe-style dict (or None when
+        the ticker has fewer than 50 bars)
+    """
+    if close_panel is None or close_panel.empty:
+        return {}
+
+    w = _FEATURE_WINDOW
+    closes, counts = _tail_matrix(close_panel, w)
+
+    def sma(length, bars_back):
+        end = w - bars_back
+        return closes[:, end - length:end].mean(axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        current = closes[:, -1]
+        sma_20_now, sma_20_prev = sma(20, 0), sma(20, 4)
+        sma_50_now, sma_50_prev = sma(50, 0), sma(50, 9)
+
+        ma_20_slope = (sma_20_now - sma_20_prev) / sma_20_prev * 100
+        ma_50_slope = (sma_50_now - sma_50_prev) / sma_50_prev * 100
+        roc_10 = (current / closes[:, -10] - 1) * 100
+        distance = (current - sma_20_now) / sma_20_now * 100
+
+    results = {}
+    for j, ticker in enumerate(close_panel.columns):
+        if counts[j] < 50:
+            results[ticker] = None
+            continue
+
+        slope = float(ma_20_slope[j])
+        if slope > 0.5:
+            trend = 'UPTREND'
+        elif slope < -0.5:
+            trend = 'DOWNTREND'
+        else:
+            trend = 'SIDEWAYS'
+
+        results[ticker] = {
+            'timeframe': timeframe_name,
+            'trend': trend,
+            'above_20ma': bool(current[j] > sma_20_now[j]),
+            'above_50ma': bool(current[j] > sma_50_now[j]),
+            'ma_20_slope': round(slope, 2),
+            'ma_50_slope': round(float(ma_50_slope[j]), 2),
+            'roc_10': round(float(roc_10[j]), 2),
+            'distance_from_ma': round(float(distance[j]), 2),
+        }
 
     return results
 
 
+class MTFEngine:
+    """
+    Multi-timeframe engine over a single stored daily history per ticker.
+
+    Daily OHLCV is stored once per ticker; weekly and monthly bars are
+    resampled from it, and features for all tickers and timeframes are
+    computed in one vectorized pass. Histories can be seeded from a scan's
+    price panel so confluence over scan output needs no per-ticker calls.
+    """
+
+    def __init__(self, period: str = MTF_HISTORY_PERIOD, ttl: int = MTF_CACHE_TTL):
+        self.period = period
+        self.ttl = ttl
+        self._daily: Dict[str, pd.DataFrame] = {}
+        self._loaded_at: Dict[str, float] = {}
+        # Tickers whose full `period` history has been downloaded; a listing
+        # shorter than MTF_MIN_DAILY_BARS is still complete once fetched
+        self._full_history: set = set()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Daily history storage
+    # ------------------------------------------------------------------
+
+    def add_daily(self, ticker: str, df: pd.DataFrame) -> None:
+        """Store daily OHLCV bars for a ticker (keeps the deeper history)."""
+        df = normalize_dataframe_columns(df)
+        if df is None or df.empty or 'Close' not in df.columns:
+            return
+        df = df.dropna(subset=['Close'])
+        if df.empty:
+            return
+
+        df.index = pd.to_datetime(df.index)
+        if getattr(df.index, 'tz', None) is not None:
+            df.index = df.index.tz_localize(None)
+
+        with self._lock:
+            existing = self._daily.get(ticker)
+            if existing is not None and len(existing) > len(df):
+                # Splice newer bars onto the deeper stored history
+                df = pd.concat([existing[existing.index < df.index[0]], df])
+            self._daily[ticker] = df.sort_index()
+            self._loaded_at[ticker] = time.time()
+
+    def seed_from_price_data(self, price_data, tickers: Optional[List[str]] = None) -> int:
+        """
+        Seed stored histories from scan price data.
+
+        Accepts either a dict of ticker -> DataFrame (async scanner) or a
+        yf.download(group_by='ticker') MultiIndex panel (sync scanner).
+
+        Returns:
+            Number of tickers seeded
+        """
+        if price_data is None:
+            return 0
+
+        if isinstance(price_data, pd.DataFrame):
+            if not isinstance(price_data.columns, pd.MultiIndex):
+                return 0
+            available = set(price_data.columns.get_level_values(0))
+            frames = {t: price_data[t] for t in (tickers or available) if t in available}
+        else:
+            frames = {t: price_data.get(t) for t in (tickers or price_data.keys())}
+
+        seeded = 0
+        for ticker, df in frames.items():
+            if df is not None and len(df):
+                self.add_daily(ticker, df)
+                seeded += 1
+        return seeded
+
+    def _has_full_history(self, ticker: str) -> bool:
+        if ticker in self._full_history:
+            return True
+        df = self._daily.get(ticker)
+        return df is not None and len(df) >= MTF_MIN_DAILY_BARS
+
+    def _is_stale(self, ticker: str) -> bool:
+        return time.time() - self._loaded_at.get(ticker, 0) > self.ttl
+
+    def load(self, tickers: List[str]) -> None:
+        """
+        Make sure full daily history is stored for every ticker.
+
+        Tickers never fully fetched are downloaded over the whole period in
+        one multi-ticker call; tickers with complete but stale history only
+        refetch bars since their last stored bar.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        full = [t for t in tickers if not self._has_full_history(t)]
+        tail = [t for t in tickers if t not in full and self._is_stale(t)]
+
+        if full:
+            logger.info(f"MTF engine: downloading {self.period} daily history for {len(full)} tickers")
+            if self._download(full, period=self.period):
+                self._full_history.update(t for t in full if t in self._daily)
+
+        if tail:
+            last_bar = min(self._daily[t].index[-1] for t in tail)
+            start = (last_bar - pd.Timedelta(days=MTF_TAIL_OVERLAP_DAYS)).strftime('%Y-%m-%d')
+            logger.info(f"MTF engine: refreshing daily bars since {start} for {len(tail)} tickers")
+            self._download(tail, start=start)
+
+    def _download(self, tickers: List[str], **kwargs) -> bool:
+        """Download daily bars for tickers and store them; True on success."""
+        try:
+            data = yf.download(
+                tickers, group_by='ticker', progress=False, threads=True, **kwargs,
+            )
+        except Exception as e:
+            logger.error(f"MTF engine download failed: {e}")
+            return False
+
+        if data is None or data.empty:
+            return False
+
+        if isinstance(data.columns, pd.MultiIndex):
+            self.seed_from_price_data(data, tickers)
+        else:
+            self.add_daily(tickers[0], data)
+        return True
+
+    def get_bars(self, ticker: str, timeframe: str = 'daily') -> Optional[pd.DataFrame]:
+        """Get stored bars for a ticker, resampled to the timeframe."""
+        df = self._daily.get(ticker)
+        if df is None:
+            return None
+        return resample_ohlcv(df, timeframe)
+
+    def close_panel(self, tickers: List[str], timeframe: str = 'daily') -> pd.DataFrame:
+        """Closes for many tickers at one resolution (columns = tickers)."""
+        series = {t: self._daily[t]['Close'] for t in tickers if t in self._daily}
+        if not series:
+            return pd.DataFrame()
+
+        panel = pd.DataFrame(series)
+        rule = _RESAMPLE_RULES[timeframe]
+        if rule is not None:
+            # last() skips NaN, so each ticker keeps its own final close
+            panel = _resample(panel, rule).last()
+        return panel
+
+    # ------------------------------------------------------------------
+    # Batch analysis
+    # ------------------------------------------------------------------
+
+    def analyze_all(self, tickers: Optional[List[str]] = None, fetch: bool = True) -> Dict[str, Dict]:
+        """
+        Analyze every ticker on every timeframe in batch.
+
+        Args:
+            tickers: Tickers to analyze (default: all stored)
+            fetch: Download missing/shallow histories first (one bulk call)
+
+        Returns:
+            Dict mapping ticker -> multi_timeframe_analysis-style result
+        """
+        if tickers is None:
+            tickers = list(self._daily.keys())
+        if fetch:
+            self.load(tickers)
+
+        by_timeframe = {
+            tf: analyze_close_panel(self.close_panel(tickers, tf), tf.upper())
+            for tf in TIMEFRAMES
+        }
+
+        results = {}
+        for ticker in tickers:
+            result = {tf: by_timeframe[tf].get(ticker) for tf in TIMEFRAMES}
+            result['confluence'] = calculate_confluence(result)
+            results[ticker] = result
+        return results
+
+    def analyze(self, ticker: str, fetch: bool = True) -> Dict:
+        """Multi-timeframe analysis for one ticker."""
+        return self.analyze_all([ticker], fetch=fetch)[ticker]
+
+    def clear(self) -> None:
+        """Drop all stored histories."""
+        with self._lock:
+            self._daily.clear()
+            self._loaded_at.clear()
+
+
+_mtf_engine = None
+
+
+def get_mtf_engine() -> MTFEngine:
+    """Get singleton MTF engine instance."""
+    global _mtf_engine
+    if _mtf_engine is None:
+        _mtf_engine = MTFEngine()
+    return _mtf_engine
+
+
+def multi_timeframe_analysis(ticker):
+    """
+    Perform multi-timeframe analysis on a ticker.
+
+    Returns analysis for daily, weekly, and monthly timeframes.
+    """
+    try:
+        return get_mtf_engine().analyze(ticker)
+    except Exception as e:
+        logger.error(f"Error in multi-timeframe analysis for {ticker}: {e}")
+        results = {tf: None for tf in TIMEFRAMES}
+        results['confluence'] = calculate_confluence(results)
+        return results
+
+
 def calculate_confluence(mtf_results):
     """
     Calculate confluence score across timeframes.
@@ -198,17 +524,32 @@ def format_mtf_analysis(ticker, results):
     return msg
 
 
-def scan_mtf_confluence(tickers, min_score=6):
+def scan_mtf_confluence(tickers, min_score=6, price_data=None):
     """
     Scan multiple tickers for MTF confluence.
 
+    Args:
+        tickers: Tickers to scan
+        min_score: Minimum confluence score to report
+        price_data: Optional scan price data used to seed stored histories
+
     Returns tickers with strong multi-timeframe alignment.
     """
     strong_confluence = []
 
+    engine = get_mtf_engine()
+    if price_data is not None:
+        engine.seed_from_price_data(price_data, tickers)
+
+    try:
+        all_results = engine.analyze_all(list(tickers))
+    except Exception as e:
+        logger.error(f"Error in batch MTF analysis: {e}")
+        return []
+
     for ticker in tickers:
         try:
-            results = multi_timeframe_analysis(ticker)
+            results = all_results.get(ticker, {})
             conf = results.get('confluence', {})
 
             if conf.get('score', 0) >= min_score:
@@ -216,9 +557,9 @@ def scan_mtf_confluence(tickers, min_score=6):
                     'ticker': ticker,
                     'score': conf['score'],
                     'bias': conf['bias'],
-                    'daily': results.get('daily', {}).get('trend', 'N/A'),
-                    'weekly': results.get('weekly', {}).get('trend', 'N/A'),
-                    'monthly': results.get('monthly', {}).get('trend', 'N/A'),
+                    'daily': (results.get('daily') or {}).get('trend', 'N/A'),
+                    'weekly': (results.get('weekly') or {}).get('trend', 'N/A'),
+                    'monthly': (results.get('monthly') or {}).get('trend', 'N/A'),
                 })
         except Exception as e:
             logger.error(f"Error scanning MTF confluence for {ticker}: {e}")
@@ -17,7 +17,6 @@ import os
 import requests
 import re
 import yfinance as yf
-from datetime import datetime
 from collections import Counter
 import json
 import xml.etree.ElementTree as ET
@@ -26,11 +25,11 @@ warnings.filterwarnings('ignore')
 
 from config import config
 from utils import get_logger
+from src.data.news_service import get_news_service
 from utils.data_providers import (
     FinnhubProvider,
     TiingoProvider,
     UnifiedDataFetcher,
-    check_provider_status,
 )
 
 logger = get_logger(__name__)
@@ -530,92 +529,13 @@ def fetch_tiingo_news(ticker):
 
 def aggregate_news_sources(ticker):
     """
-    Aggregate news from all sources with priority ordering.
+    Aggregate news from all sources via the shared news service.
 
-    Priority (high-accuracy first):
-    1. Polygon.io (PRIMARY - structured API, fast, reliable)
-    2. Finnhub (professional feed)
-    3. Tiingo (curated news)
-    4. Yahoo Finance (fallback - API-based)
-
-    Web scrapers (Finviz, Google News, MarketWatch) have been deprecated
-    in favor of reliable API-based sources.
-
-    Deduplicates and sorts by recency.
+    Polygon.io, Finnhub, Tiingo, Yahoo Finance and Finviz are fetched
+    concurrently. Headlines are deduplicated by normalized title (the
+    higher-priority source wins), sorted by recency and cached per ticker.
     """
-    all_headlines = []
-
-    # Check which premium providers are available
-    provider_status = check_provider_status()
-    polygon_available = bool(os.environ.get('POLYGON_API_KEY', ''))
-    logger.debug(f"Provider status: {provider_status}, Polygon: {polygon_available}")
-
-    # Priority 1: Polygon.io (PRIMARY - best reliability, structured data)
-    if polygon_available:
-        polygon_news = fetch_polygon_news(ticker)
-        all_headlines.extend(polygon_news)
-        if len(polygon_news) >= 5:
-            logger.info(f"Polygon provided sufficient news for {ticker}")
-
-    # Priority 2: Finnhub (professional accuracy)
-    if provider_status.get('finnhub') and len(all_headlines) < 10:
-        finnhub_news = fetch_finnhub_news(ticker)
-        all_headlines.extend(finnhub_news)
-
-    # Priority 3: Tiingo (curated news)
-    if provider_status.get('tiingo') and len(all_headlines) < 10:
-        tiingo_news = fetch_tiingo_news(ticker)
-        all_headlines.extend(tiingo_news)
-
-    # Priority 4: Yahoo Finance API (fallback - still API-based, not scraping)
-    if len(all_headlines) < 5:
-        logger.info(f"Using Yahoo fallback for {ticker} (API sources returned {len(all_headlines)} items)")
-        try:
-            yahoo_news = scrape_yahoo_news(ticker)
-            for h in yahoo_news:
-                if h.get('title'):
-                    h['provider'] = 'yahoo_finance'
-                    all_headlines.append(h)
-        except Exception as e:
-            logger.error(f"Error fetching from Yahoo Finance: {e}")
-
-    # Deduplicate by similarity
-    unique_headlines = []
-    seen_titles = set()
-
-    for h in all_headlines:
-        title = h.get('title', '')
-        if not title:
-            continue
-
-        title_lower = title.lower()
-        # Simple dedup - check if key words match
-        title_words = set(title_lower.split()[:5])
-
-        is_dupe = False
-        for seen in seen_titles:
-            seen_words = set(seen.split()[:5])
-            if len(title_words & seen_words) >= 3:
-                is_dupe = True
-                break
-
-        if not is_dupe:
-            seen_titles.add(title_lower)
-            unique_headlines.append(h)
-
-    # Sort by timestamp if available (most recent first)
-    def get_timestamp(h):
-        ts = h.get('timestamp', 0)
-        if isinstance(ts, str):
-            try:
-                return datetime.fromisoformat(ts.replace('Z', '+00:00')).timestamp()
-            except (ValueError, AttributeError):
-                return 0
-        return ts or 0
-
-    unique_headlines.sort(key=get_timestamp, reverse=True)
-
-    return unique_headlines[:15]  # Limit to 15 headlines
+    return get_news_service().get_news(ticker)[:15]  # Limit to 15 headlines
 
 
 def aggregate_social_sentiment(ticker):
@@ -1048,6 +968,13 @@ def scan_news_sentiment(tickers):
     """Scan multiple tickers for news sentiment."""
     results = []
 
+    # Fetch every ticker's news concurrently up front; analyze_ticker_news
+    # then reads it from the cache
+    try:
+        get_news_service().fetch_news(tickers)
+    except Exception as e:
+        logger.error(f"News prefetch failed: {e}")
+
     for ticker in tickers:
         try:
             analysis = analyze_ticker_news(ticker)
@@ -115,6 +115,16 @@ class UnusualActivityFeed:
         self._feed_cache.append(activity)
         self._save_cache()
 
+    def add_activities(self, activities: List[Dict]) -> None:
+        """Add a batch of unusual activities to the feed (one cache write)."""
+        now = datetime.now()
+        for activity in activities:
+            activity['timestamp'] = now.isoformat()
+            activity['id'] = f"{activity.get('ticker', 'UNK')}_{now.strftime('%Y%m%d%H%M%S')}"
+            self._feed_cache.append(activity)
+        if activities:
+            self._save_cache()
+
     def get_feed(self,
                  limit: int = 50,
                  min_premium: float = 0,
@@ -147,35 +157,38 @@ class UnusualActivityFeed:
         """
         Scan multiple tickers for unusual activity.
 
+        Chains come from the shared options scanner (fetched concurrently,
+        reused within its refresh window).
+
         Returns list of unusual activities found.
         """
-        unusual_activities = []
+        from src.analysis.options_scanner import get_options_scanner
 
-        for ticker in tickers:
-            try:
-                if HAS_POLYGON:
-                    result = get_unusual_options_sync(ticker, threshold=2.0)
-                    if result and result.get('unusual_activity'):
-                        for contract in result.get('unusual_contracts', [])[:5]:
-                            premium = contract.get('premium', 0)
-                            if premium >= min_premium:
-                                activity = {
-                                    'ticker': ticker,
-                                    'strike': contract.get('strike'),
-                                    'expiry': contract.get('expiry'),
-                                    'type': contract.get('type', 'unknown'),
-                                    'premium': premium,
-                                    'volume': contract.get('volume', 0),
-                                    'open_interest': contract.get('open_interest', 0),
-                                    'vol_oi_ratio': contract.get('vol_oi_ratio', 0),
-                                    'sentiment': 'bullish' if contract.get('type') == 'call' else 'bearish',
-                                    'category': self._categorize_premium(premium),
-                                }
-                                unusual_activities.append(activity)
-                                self.add_activity(activity)
-            except Exception as e:
-                logger.debug(f"Error scanning {ticker}: {e}")
+        scanner = get_options_scanner()
+        scanner.refresh(tickers)
+
+        unusual_activities = []
+        for ticker in dict.fromkeys(t.upper() for t in tickers):
+            row = scanner.get_row(ticker)
+            if not row or not row.get('unusual_activity'):
                 continue
+            for contract in row.get('unusual_contracts', [])[:5]:
+                premium = contract.get('premium', 0)
+                if premium >= min_premium:
+                    unusual_activities.append({
+                        'ticker': ticker,
+                        'strike': contract.get('strike'),
+                        'expiry': contract.get('expiration'),
+                        'type': contract.get('type', 'unknown'),
+                        'premium': premium,
+                        'volume': contract.get('volume', 0),
+                        'open_interest': contract.get('open_interest', 0),
+                        'vol_oi_ratio': contract.get('vol_oi_ratio', 0),
+                        'sentiment': 'bullish' if contract.get('type') == 'call' else 'bearish',
+                        'category': self._categorize_premium(premium),
+                    })
+
+        self.add_activities(unusual_activities)
 
         # Sort by premium descending
         unusual_activities.sort(key=lambda x: x.get('premium', 0), reverse=True)
@@ -348,6 +361,54 @@ class SmartMoneyTracker:
 # OPTIONS SENTIMENT ANALYZER
 # =============================================================================
 
+def iv_rank_from_closes(current_iv: float, closes) -> Tuple[float, float]:
+    """
+    IV Rank and Percentile from current IV (percent) and a year of daily closes.
+
+    The 52-week IV range is estimated from rolling 20-day historical
+    volatility: low ~1.0x minimum HV, high ~1.5x maximum HV.
+    """
+    if len(closes) < 20:
+        # Fallback to simple estimation
+        iv_rank = max(0, min(100, ((current_iv - 20) / 50) * 100))
+        return round(iv_rank, 1), round(iv_rank, 1)
+
+    # Calculate historical volatility to estimate IV range
+    returns = closes.pct_change().dropna()
+
+    # Calculate HV range over past year (20-day rolling)
+    rolling_hv = returns.rolling(20).std() * (252 ** 0.5) * 100
+    rolling_hv = rolling_hv.dropna()
+
+    if len(rolling_hv) == 0:
+        return 50, 50
+
+    hv_min = rolling_hv.min()
+    hv_max = rolling_hv.max()
+
+    # Estimate IV range based on HV:
+    # - IV low: ~1.0x minimum HV (IV rarely drops below realized vol)
+    # - IV high: ~1.5x maximum HV (IV spikes during fear/uncertainty)
+    estimated_iv_low = max(10, hv_min * 1.0)
+    estimated_iv_high = max(estimated_iv_low + 20, hv_max * 1.5)
+
+    # Calculate IV Rank using actual current IV from options
+    if estimated_iv_high > estimated_iv_low:
+        iv_rank = ((current_iv - estimated_iv_low) / (estimated_iv_high - estimated_iv_low)) * 100
+    else:
+        iv_rank = 50
+
+    # Clamp to 0-100
+    iv_rank = max(0, min(100, iv_rank))
+
+    # IV Percentile: estimate what % of time IV was lower
+    # Use HV as proxy (scaled by typical IV/HV ratio of ~1.1)
+    scaled_hv = rolling_hv * 1.1
+    iv_percentile = (scaled_hv < current_iv).sum() / len(scaled_hv) * 100
+
+    return round(float(iv_rank), 1), round(float(iv_percentile), 1)
+
+
 class OptionsSentimentAnalyzer:
     """Comprehensive options sentiment analysis."""
 
@@ -374,6 +435,41 @@ class OptionsSentimentAnalyzer:
                 'key_levels': List[float]
             }
         """
+        chain, flow, current_price = None, None, None
+        try:
+            # Get options chain for analysis
+            if HAS_POLYGON:
+                chain = get_options_chain_sync(ticker)
+                flow = get_options_flow_sync(ticker)
+
+            # Get current price for max pain
+            if HAS_YFINANCE:
+                try:
+                    stock = yf.Ticker(ticker)
+                    hist = stock.history(period='1d')
+                    if len(hist) > 0:
+                        current_price = hist['Close'].iloc[-1]
+                except:
+                    pass
+        except Exception as e:
+            logger.error(f"Error getting sentiment dashboard for {ticker}: {e}")
+
+        return self.dashboard_from_chain(ticker, chain, flow, current_price=current_price)
+
+    def dashboard_from_chain(self,
+                             ticker: str,
+                             chain: Optional[Dict],
+                             flow: Optional[Dict],
+                             closes=None,
+                             current_price: float = None) -> Dict:
+        """
+        Build the sentiment dashboard from an already-fetched chain and flow.
+
+        Args:
+            closes: Daily closes for the IV rank estimate (fetched from
+                yfinance when not given)
+            current_price: Underlying price, if known
+        """
         result = {
             'ticker': ticker.upper(),
             'put_call_ratio': 1.0,
@@ -390,39 +486,26 @@ class OptionsSentimentAnalyzer:
         }
 
         try:
-            # Get options chain for analysis
-            if HAS_POLYGON:
-                chain = get_options_chain_sync(ticker)
-                flow = get_options_flow_sync(ticker)
-
-                if chain and not chain.get('error'):
-                    result.update(self._analyze_chain(chain))
+            if chain and not chain.get('error'):
+                result.update(self._analyze_chain(chain))
 
-                if flow and not flow.get('error'):
-                    result['put_call_ratio'] = flow.get('put_call_ratio', 1.0)
+            if flow and not flow.get('error'):
+                result['put_call_ratio'] = flow.get('put_call_ratio', 1.0)
 
-                    # Determine PC ratio trend
-                    if result['put_call_ratio'] < 0.7:
-                        result['put_call_trend'] = 'bullish'
-                    elif result['put_call_ratio'] > 1.3:
-                        result['put_call_trend'] = 'bearish'
-                    else:
-                        result['put_call_trend'] = 'neutral'
+                # Determine PC ratio trend
+                if result['put_call_ratio'] < 0.7:
+                    result['put_call_trend'] = 'bullish'
+                elif result['put_call_ratio'] > 1.3:
+                    result['put_call_trend'] = 'bearish'
+                else:
+                    result['put_call_trend'] = 'neutral'
 
-            # Get current price for max pain
-            if HAS_YFINANCE:
-                try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(period='1d')
-                    if len(hist) > 0:
-                        current_price = hist['Close'].iloc[-1]
-                        result['current_price'] = round(current_price, 2)
-                except:
-                    pass
+            if current_price:
+                result['current_price'] = round(float(current_price), 2)
 
             # Calculate IV Rank using actual IV from options chain
             result['iv_rank'], result['iv_percentile'] = self._calculate_iv_rank(
-                ticker, result.get('current_iv')
+                ticker, result.get('current_iv'), closes
             )
 
             # Calculate overall sentiment score
@@ -495,7 +578,7 @@ class OptionsSentimentAnalyzer:
 
         return result
 
-    def _calculate_iv_rank(self, ticker: str, current_iv: float = None) -> Tuple[float, float]:
+    def _calculate_iv_rank(self, ticker: str, current_iv: float = None, closes=None) -> Tuple[float, float]:
         """
         Calculate IV Rank and Percentile using actual IV from options.
 
@@ -503,62 +586,26 @@ class OptionsSentimentAnalyzer:
 
         Since Polygon doesn't provide historical IV, we estimate the 52-week range
         using historical volatility as a baseline (IV typically trades at 1.0-1.5x HV).
+        Uses the given daily closes, or a year of yfinance history.
         """
         try:
             # If no current IV provided, can't calculate proper IV rank
             if current_iv is None or current_iv <= 0:
                 return 50, 50
 
-            if not HAS_YFINANCE:
-                # Without HV data, use typical IV ranges for estimation
-                # Most liquid stocks have IV between 15% and 80%
-                estimated_low = 20
-                estimated_high = 70
-                iv_rank = max(0, min(100, ((current_iv - estimated_low) / (estimated_high - estimated_low)) * 100))
-                return round(iv_rank, 1), round(iv_rank, 1)
-
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='1y')
-
-            if len(hist) < 20:
-                # Fallback to simple estimation
-                iv_rank = max(0, min(100, ((current_iv - 20) / 50) * 100))
-                return round(iv_rank, 1), round(iv_rank, 1)
-
-            # Calculate historical volatility to estimate IV range
-            returns = hist['Close'].pct_change().dropna()
-
-            # Calculate HV range over past year (20-day rolling)
-            rolling_hv = returns.rolling(20).std() * (252 ** 0.5) * 100
-            rolling_hv = rolling_hv.dropna()
-
-            if len(rolling_hv) == 0:
-                return 50, 50
-
-            hv_min = rolling_hv.min()
-            hv_max = rolling_hv.max()
+            if closes is None:
+                if not HAS_YFINANCE:
+                    # Without HV data, use typical IV ranges for estimation
+                    # Most liquid stocks have IV between 15% and 80%
+                    estimated_low = 20
+                    estimated_high = 70
+                    iv_rank = max(0, min(100, ((current_iv - estimated_low) / (estimated_high - estimated_low)) * 100))
+                    return round(iv_rank, 1), round(iv_rank, 1)
 
-            # Estimate IV range based on HV:
-            # - IV low: ~1.0x minimum HV (IV rarely drops below realized vol)
-            # - IV high: ~1.5x maximum HV (IV spikes during fear/uncertainty)
-            estimated_iv_low = max(10, hv_min * 1.0)
-            estimated_iv_high = max(estimated_iv_low + 20, hv_max * 1.5)
+                stock = yf.Ticker(ticker)
+                closes = stock.history(period='1y')['Close']
 
-            # Calculate IV Rank using actual current IV from options
-            if estimated_iv_high > estimated_iv_low:
-                iv_rank = ((current_iv - estimated_iv_low) / (estimated_iv_high - estimated_iv_low)) * 100
-            else:
-                iv_rank = 50
-
-            # Clamp to 0-100
-            iv_rank = max(0, min(100, iv_rank))
-
-            # IV Percentile: estimate what % of time IV was lower
-            # Use HV as proxy (scaled by typical IV/HV ratio of ~1.1)
-            scaled_hv = rolling_hv * 1.1
-            iv_percentile = (scaled_hv < current_iv).sum() / len(scaled_hv) * 100
-
-            return round(iv_rank, 1), round(iv_percentile, 1)
+            return iv_rank_from_closes(current_iv, closes)
 
         except Exception as e:
             logger.debug(f"Error calculating IV rank for {ticker}: {e}")
@@ -631,6 +678,12 @@ class OptionsScreener:
         """
         Screen tickers based on options criteria.
 
+        Reads the shared OptionsUniverseScanner. In the API process its
+        background refresher keeps the screener universe fresh; requested
+        tickers that are missing from that view or older than its refresh
+        window (any ticker, in processes without the refresher) are fetched
+        here first, so the call can block on chain downloads.
+
         Args:
             tickers: List of tickers to screen
             min_iv_rank: Minimum IV Rank (0-100)
@@ -644,62 +697,20 @@ class OptionsScreener:
         Returns:
             List of matching tickers with data
         """
-        results = []
-        sentiment_analyzer = OptionsSentimentAnalyzer()
-
-        for ticker in tickers:
-            try:
-                # Get sentiment data
-                sentiment_data = sentiment_analyzer.get_sentiment_dashboard(ticker)
-
-                # Apply filters
-                if min_iv_rank and sentiment_data.get('iv_rank', 0) < min_iv_rank:
-                    continue
-                if max_iv_rank and sentiment_data.get('iv_rank', 100) > max_iv_rank:
-                    continue
-
-                # Get flow data for additional filters
-                if HAS_POLYGON:
-                    flow = get_options_flow_sync(ticker)
-                    unusual = get_unusual_options_sync(ticker)
-
-                    if min_volume and flow:
-                        total_vol = flow.get('total_call_volume', 0) + flow.get('total_put_volume', 0)
-                        if total_vol < min_volume:
-                            continue
-
-                    if min_vol_oi_ratio and unusual:
-                        max_ratio = max([c.get('vol_oi_ratio', 0) for c in unusual.get('unusual_contracts', [])] or [0])
-                        if max_ratio < min_vol_oi_ratio:
-                            continue
-
-                    if min_premium and unusual:
-                        max_premium = max([c.get('premium', 0) for c in unusual.get('unusual_contracts', [])] or [0])
-                        if max_premium < min_premium:
-                            continue
-
-                # Sentiment filter
-                if sentiment:
-                    flow_sentiment = sentiment_data.get('put_call_trend', 'neutral')
-                    if sentiment == 'bullish' and flow_sentiment not in ['bullish', 'very_bullish']:
-                        continue
-                    if sentiment == 'bearish' and flow_sentiment not in ['bearish', 'very_bearish']:
-                        continue
-
-                # Add to results
-                results.append({
-                    'ticker': ticker,
-                    **sentiment_data
-                })
-
-            except Exception as e:
-                logger.debug(f"Error screening {ticker}: {e}")
-                continue
-
-        # Sort by sentiment score descending
-        results.sort(key=lambda x: x.get('sentiment_score', 0), reverse=True)
-
-        return results[:limit]
+        from src.analysis.options_scanner import get_options_scanner
+
+        scanner = get_options_scanner()
+        scanner.refresh(tickers)
+        return scanner.screen(
+            tickers,
+            min_iv_rank=min_iv_rank,
+            max_iv_rank=max_iv_rank,
+            min_premium=min_premium,
+            min_volume=min_volume,
+            min_vol_oi_ratio=min_vol_oi_ratio,
+            sentiment=sentiment,
+            limit=limit,
+        )
 
 
 # =============================================================================
@@ -710,65 +721,44 @@ class HistoricalFlowTracker:
     """Track and analyze historical options flow."""
 
     def __init__(self, cache_dir: str = "/data"):
+        from src.data.column_store import ColumnStore, FLOW_FIELDS
+
         self.cache_dir = Path(cache_dir)
         self.history_file = self.cache_dir / "options_flow_history.json"
-        self._history = {}
-        self._load_history()
+        self.store = ColumnStore(self.cache_dir / "options_flow_history", FLOW_FIELDS)
+        self._migrate_history()
 
-    def _load_history(self):
-        """Load historical flow data."""
+    def _migrate_history(self):
+        """Import the older JSON history file into the columnar store (once)."""
+        if not self.history_file.exists():
+            return
         try:
-            if self.history_file.exists():
-                with open(self.history_file, 'r') as f:
-                    self._history = json.load(f)
+            with open(self.history_file, 'r') as f:
+                history = json.load(f)
+            for ticker, entries in history.items():
+                self.store.import_records(ticker, entries, 'timestamp')
+            self.history_file.rename(self.history_file.with_suffix('.json.migrated'))
         except Exception as e:
-            logger.error(f"Error loading flow history: {e}")
-            self._history = {}
+            logger.error(f"Error migrating flow history: {e}")
 
-    def _save_history(self):
-        """Save historical flow data."""
+    def record_flow(self, ticker: str, flow_data: Dict) -> None:
+        """Record flow data point for a ticker."""
         try:
-            self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.history_file, 'w') as f:
-                json.dump(self._history, f)
+            self.store.append(ticker, {
+                'sentiment': flow_data.get('sentiment'),
+                'put_call_ratio': flow_data.get('put_call_ratio'),
+                'premium': flow_data.get('total_premium', 0),
+                'smart_money_score': flow_data.get('smart_money_score', 50),
+            })
         except Exception as e:
             logger.error(f"Error saving flow history: {e}")
 
-    def record_flow(self, ticker: str, flow_data: Dict) -> None:
-        """Record flow data point for a ticker."""
-        if ticker not in self._history:
-            self._history[ticker] = []
-
-        entry = {
-            'timestamp': datetime.now().isoformat(),
-            'sentiment': flow_data.get('sentiment'),
-            'put_call_ratio': flow_data.get('put_call_ratio'),
-            'premium': flow_data.get('total_premium', 0),
-            'smart_money_score': flow_data.get('smart_money_score', 50),
-        }
-
-        self._history[ticker].append(entry)
-
-        # Keep last 100 entries per ticker
-        self._history[ticker] = self._history[ticker][-100:]
-        self._save_history()
-
     def get_history(self, ticker: str, days: int = 30) -> List[Dict]:
         """Get historical flow data for a ticker."""
-        if ticker not in self._history:
-            return []
-
         cutoff = datetime.now() - timedelta(days=days)
-        history = []
-
-        for entry in self._history.get(ticker, []):
-            try:
-                entry_time = datetime.fromisoformat(entry['timestamp'])
-                if entry_time >= cutoff:
-                    history.append(entry)
-            except:
-                continue
-
+        history = self.store.records(ticker, start=cutoff.timestamp())
+        for entry in history:
+            entry['timestamp'] = datetime.fromtimestamp(entry.pop('ts')).isoformat()
         return history
 
     def get_flow_accuracy(self, ticker: str) -> Dict:
@@ -877,7 +867,7 @@ def get_options_sentiment(ticker: str) -> Dict:
 
 
 def screen_options(tickers: List[str], **filters) -> List[Dict]:
-    """Screen options based on filters."""
+    """Screen options based on filters (fetches chains missing from the shared view)."""
     screener = get_screener()
     return screener.screen(tickers, **filters)
 
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Options Universe Scanner
+
+One concurrent pass over a ticker list feeds every universe-wide options
+screen (unusual activity feed, universe scan, screener):
+
+1. Chains are fetched from Polygon concurrently on one session, with at
+   most MAX_CONCURRENT requests in flight
+2. Each chain is fetched once per refresh window and reused; unusual
+   activity, flow sentiment, GEX / max pain / skew and IV rank are all
+   derived from that one chain
+3. Results are kept as a table (one row per ticker) that screens query
+   without refetching. The screener view is sorted once per refresh.
+4. A background refresher (start_refresher) keeps the screener universe
+   fresh, so screener requests only query the last view.
+
+Daily closes for the IV rank estimate change slowly and are refetched
+once a day.
+
+Usage:
+    scanner = get_options_scanner()
+    scanner.start_refresher(lambda: universe_tickers)  # On the API's event loop
+    rows = scanner.screen(tickers, min_iv_rank=60, sentiment='bullish')
+    unusual = scanner.unusual_activity('NVDA', threshold=3.0)
+    table = scanner.table   # DataFrame indexed by ticker
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from src.analysis.options_flow import OptionsSentimentAnalyzer, UNUSUAL_THRESHOLDS
+from src.data.polygon_provider import (
+    PolygonProvider,
+    summarize_options_flow,
+    summarize_unusual_options,
+)
+from utils import get_logger
+
+logger = get_logger(__name__)
+
+REFRESH_WINDOW = 300  # Seconds a fetched chain is reused
+HISTORY_MAX_AGE = 86400  # Refetch daily closes for IV rank once a day
+HISTORY_DAYS = 365
+MAX_CONCURRENT = 10  # Polygon requests in flight
+
+# Scalar columns of the queryable table (rows also carry contract lists)
+TABLE_COLUMNS = [
+    'fetched_at', 'has_options', 'current_price',
+    'put_call_ratio', 'put_call_trend', 'flow_sentiment',
+    'total_call_volume', 'total_put_volume', 'total_volume',
+    'total_call_oi', 'total_put_oi',
+    'unusual_activity', 'unusual_count', 'max_vol_oi_ratio', 'max_premium', 'unusual_premium',
+    'current_iv', 'iv_rank', 'iv_percentile', 'gex', 'max_pain',
+    'sentiment_score', 'sentiment_label',
+]
+
+
+class OptionsUniverseScanner:
+    """Concurrent chain fetch with per-ticker reuse and a queryable results table."""
+
+    def __init__(
+        self,
+        provider_factory: Callable[[], PolygonProvider] = PolygonProvider,
+        refresh_window: int = REFRESH_WINDOW,
+        max_concurrent: int = MAX_CONCURRENT,
+        unusual_threshold: float = UNUSUAL_THRESHOLDS['volume_oi_ratio'],
+    ):
+        self.provider_factory = provider_factory
+        self.refresh_window = refresh_window
+        self.max_concurrent = max_concurrent
+        self.unusual_threshold = unusual_threshold
+        self._analyzer = OptionsSentimentAnalyzer()
+        self._chains: Dict[str, Tuple[float, Dict]] = {}
+        self._closes: Dict[str, Tuple[float, pd.Series]] = {}
+        self._rows: Dict[str, Dict] = {}
+        self._table: Optional[pd.DataFrame] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresher: Optional[asyncio.Task] = None
+
+    # =========================================================================
+    # FETCH
+    # =========================================================================
+
+    def is_fresh(self, ticker: str, now: float = None) -> bool:
+        """Whether the ticker's chain was fetched within the refresh window."""
+        cached = self._chains.get(ticker.upper())
+        return cached is not None and (now or time.time()) - cached[0] <= self.refresh_window
+
+    def _cached_closes(self, ticker: str, now: float) -> Optional[pd.Series]:
+        cached = self._closes.get(ticker)
+        if cached is not None and now - cached[0] <= HISTORY_MAX_AGE:
+            return cached[1]
+        return None
+
+    async def refresh_async(self, tickers: Iterable[str], force: bool = False) -> int:
+        """
+        Fetch chains for tickers that are missing or older than the refresh
+        window, and rebuild their rows.
+
+        Returns:
+            Number of tickers fetched
+        """
+        now = time.time()
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        stale = [t for t in tickers if force or not self.is_fresh(t, now)]
+        if not stale:
+            return 0
+
+        provider = self.provider_factory()
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def fetch(ticker: str):
+            try:
+                async with semaphore:
+                    chain = await provider.get_options_chain(ticker)
+                closes = self._cached_closes(ticker, now)
+                if closes is None:
+                    async with semaphore:
+                        bars = await provider.get_daily_bars(ticker, HISTORY_DAYS)
+                    if bars is not None and not bars.empty:
+                        closes = bars['Close']
+                return ticker, chain, closes
+            except Exception as e:
+                logger.debug(f"Options chain fetch failed for {ticker}: {e}")
+                return None
+
+        try:
+            results = await asyncio.gather(*(fetch(t) for t in stale))
+        finally:
+            await provider.close()
+
+        fetched = 0
+        with self._lock:
+            for result in results:
+                if result is None:
+                    continue
+                ticker, chain, closes = result
+                self._chains[ticker] = (now, chain)
+                if closes is not None:
+                    self._closes[ticker] = (now, closes)
+                self._rows[ticker] = self._build_row(ticker, chain, closes, now)
+                fetched += 1
+            self._table = None
+
+        logger.info(f"Options scanner: fetched {fetched}/{len(stale)} chains "
+                    f"({len(tickers) - len(stale)} reused)")
+        return fetched
+
+    def refresh(self, tickers: Iterable[str], force: bool = False) -> int:
+        """Synchronous wrapper around refresh_async (one refresh at a time)."""
+        with self._refresh_lock:
+            coro = self.refresh_async(tickers, force)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # Private loop: asyncio.run() would clear the caller's current loop
+                loop = asyncio.new_event_loop()
+                try:
+                    return loop.run_until_complete(coro)
+                finally:
+                    loop.close()
+
+            # Already inside an event loop: run on a separate thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, coro).result()
+
+    async def run_refresher(self, tickers: Callable[[], Iterable[str]], interval: float = REFRESH_WINDOW):
+        """
+        Refresh loop for the API's event loop (fetches run on a worker thread).
+
+        Args:
+            tickers: Called each cycle for the universe to keep fresh
+        """
+        while True:
+            try:
+                universe = await asyncio.to_thread(tickers)
+                if universe:
+                    await asyncio.to_thread(self.refresh, universe)
+            except Exception as e:
+                logger.warning(f"Options scanner refresh failed: {e}")
+            await asyncio.sleep(interval)
+
+    def start_refresher(self, tickers: Callable[[], Iterable[str]], interval: float = REFRESH_WINDOW):
+        """Start run_refresher on the running event loop (once)."""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.get_running_loop().create_task(self.run_refresher(tickers, interval))
+
+    # =========================================================================
+    # ANALYSIS
+    # =========================================================================
+
+    def _build_row(self, ticker: str, chain: Dict, closes: Optional[pd.Series], fetched_at: float) -> Dict:
+        """Every screen's inputs for one ticker, from its chain."""
+        contracts = chain.get('calls', []) + chain.get('puts', [])
+        flow = summarize_options_flow(chain, ticker)
+        unusual = summarize_unusual_options(chain, ticker, self.unusual_threshold)
+        current_price = next((c['underlying_price'] for c in contracts if c.get('underlying_price')), None)
+
+        # An empty series falls back to the typical IV range instead of fetching history
+        row = self._analyzer.dashboard_from_chain(
+            ticker, chain, flow,
+            closes=closes if closes is not None else pd.Series(dtype=float),
+            current_price=current_price,
+        )
+
+        unusual_contracts = unusual.get('unusual_contracts', [])
+        row.update({
+            'fetched_at': fetched_at,
+            'has_options': bool(contracts),
+            'current_price': row.get('current_price'),
+            'flow_sentiment': flow['sentiment'],
+            'total_call_volume': flow['total_call_volume'],
+            'total_put_volume': flow['total_put_volume'],
+            'total_volume': flow['total_call_volume'] + flow['total_put_volume'],
+            'total_call_oi': flow['total_call_oi'],
+            'total_put_oi': flow['total_put_oi'],
+            'unusual_activity': unusual.get('unusual_activity', False),
+            'unusual_count': unusual.get('total_unusual_contracts', 0),
+            'max_vol_oi_ratio': max([c.get('vol_oi_ratio', 0) for c in unusual_contracts] or [0]),
+            'max_premium': max([c.get('premium', 0) for c in unusual_contracts] or [0]),
+            'unusual_premium': sum(c.get('premium', 0) for c in unusual_contracts),
+            'unusual_contracts': unusual_contracts,
+            'signals': unusual.get('signals', []),
+        })
+        return row
+
+    def get_chain(self, ticker: str) -> Optional[Dict]:
+        """Last fetched chain for a ticker (None if never fetched)."""
+        cached = self._chains.get(ticker.upper())
+        return cached[1] if cached else None
+
+    def get_row(self, ticker: str) -> Optional[Dict]:
+        row = self._rows.get(ticker.upper())
+        return dict(row) if row else None
+
+    def unusual_activity(self, ticker: str, threshold: float = None) -> Dict:
+        """Unusual activity from the cached chain, at any vol/OI threshold."""
+        ticker = ticker.upper()
+        chain = self.get_chain(ticker)
+        if chain is None:
+            return {'unusual_activity': False, 'signals': []}
+        return summarize_unusual_options(chain, ticker, threshold or self.unusual_threshold)
+
+    # =========================================================================
+    # TABLE
+    # =========================================================================
+
+    @property
+    def as_of(self) -> Optional[float]:
+        """When the view was last refreshed (None before the first refresh)."""
+        with self._lock:
+            return max((row['fetched_at'] for row in self._rows.values()), default=None)
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """All rows as a DataFrame indexed by ticker, sorted by sentiment score."""
+        with self._lock:
+            if self._table is None:
+                table = pd.DataFrame.from_dict(self._rows, orient='index')
+                table = table.reindex(columns=TABLE_COLUMNS)
+                table.index.name = 'ticker'
+                self._table = table.sort_values('sentiment_score', ascending=False, kind='stable')
+            return self._table
+
+    def query(self,
+              tickers: Iterable[str] = None,
+              min_iv_rank: float = None,
+              max_iv_rank: float = None,
+              min_premium: float = None,
+              min_volume: int = None,
+              min_vol_oi_ratio: float = None,
+              sentiment: str = None,
+              unusual_only: bool = False,
+              sort_by: str = 'sentiment_score',
+              limit: int = 50) -> List[Dict]:
+        """
+        Filter the table. Same filters as OptionsScreener.screen.
+
+        Returns:
+            Matching rows, best first by sort_by
+        """
+        view = self.table
+        if tickers is not None:
+            view = view[view.index.isin([t.upper() for t in tickers])]
+
+        if min_iv_rank:
+            view = view[view['iv_rank'] >= min_iv_rank]
+        if max_iv_rank:
+            view = view[view['iv_rank'] <= max_iv_rank]
+        if min_volume:
+            view = view[view['total_volume'] >= min_volume]
+        if min_vol_oi_ratio:
+            view = view[view['max_vol_oi_ratio'] >= min_vol_oi_ratio]
+        if min_premium:
+            view = view[view['max_premium'] >= min_premium]
+        if sentiment == 'bullish':
+            view = view[view['put_call_trend'].isin(['bullish', 'very_bullish'])]
+        elif sentiment == 'bearish':
+            view = view[view['put_call_trend'].isin(['bearish', 'very_bearish'])]
+        if unusual_only:
+            view = view[view['unusual_activity'].astype(bool)]
+
+        if sort_by != 'sentiment_score':
+            view = view.sort_values(sort_by, ascending=False, kind='stable')
+
+        return [dict(self._rows[t]) for t in view.index[:limit]]
+
+    def screen(self, tickers: List[str], limit: int = 50, **filters) -> List[Dict]:
+        """Query the last refreshed view for the tickers (never fetches; see start_refresher)."""
+        return self.query(tickers, limit=limit, **filters)
+
+
+# Singleton instance
+_options_scanner = None
+
+
+def get_options_scanner() -> OptionsUniverseScanner:
+    """Get the shared options universe scanner."""
+    global _options_scanner
+    if _options_scanner is None:
+        _options_scanner = OptionsUniverseScanner()
+    return _options_scanner
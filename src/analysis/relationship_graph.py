@@ -6,7 +6,17 @@ A graph-based data structure for managing stock relationships:
 - Nodes represent stocks with metadata
 - Edges represent relationships (supplier, customer, competitor, adjacent, infrastructure)
 - Supports freshness decay and confidence scoring
-- Persistent storage in JSON format
+- Persistent storage as a JSON snapshot plus an append-only change log
+
+Storage layout (sized for tens of thousands of edges):
+- Tickers are interned to integer ids
+- Edge attributes live in parallel arrays indexed by edge id
+- A per-node, per-type adjacency index (outgoing and incoming) makes
+  neighbor, subgraph and path queries touch only matching edges
+- Freshness is computed on read from the time since the edge was last
+  refreshed, so decay never rewrites edges
+- save() appends only what changed since the last save to
+  <graph>.log.jsonl; the snapshot is rewritten when the log outgrows it
 
 Usage:
     graph = RelationshipGraph()
@@ -18,10 +28,14 @@ Usage:
 """
 
 import json
+import os
+import sys
+import time
+from array import array
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict, deque
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from utils import get_logger
 
@@ -30,6 +44,23 @@ logger = get_logger(__name__)
 # Storage path
 ECOSYSTEM_GRAPH_PATH = Path('learning_data/ecosystem_graph.json')
 
+# Rewrite the snapshot once the change log holds this many entries per node + edge
+LOG_COMPACT_RATIO = 1.0
+MIN_FRESHNESS = 0.1
+SECONDS_PER_DAY = 86400
+
+
+def _log_path(path: Path) -> Path:
+    """Change log that sits next to a graph snapshot."""
+    return path.with_suffix('.log.jsonl')
+
+
+def _to_timestamp(value: Optional[str]) -> float:
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
+
 
 class RelationshipGraph:
     """
@@ -58,15 +89,216 @@ class RelationshipGraph:
     def __init__(self):
         """Initialize empty graph."""
         self.nodes = {}  # ticker -> metadata
-        self.edges = defaultdict(list)  # source -> list of edges
-        self.reverse_edges = defaultdict(list)  # target -> list of edges (for reverse lookup)
         self.metadata = {
             'created_at': datetime.now().isoformat(),
             'last_updated': datetime.now().isoformat(),
-            'version': '1.0',
+            'version': '2.0',
+            'decay_offset_days': 0.0,
             'stats': {},
         }
 
+        self._type_names = list(self.RELATIONSHIP_TYPES)
+        self._type_ids = {name: i for i, name in enumerate(self._type_names)}
+        self._decay_rates = [t['decay_rate'] for t in self.RELATIONSHIP_TYPES.values()]
+
+        # Interned tickers
+        self._ids: Dict[str, int] = {}
+        self._tickers: List[str] = []
+
+        # Edge attributes, one slot per edge id
+        self._src = array('i')
+        self._dst = array('i')
+        self._type = array('b')
+        self._strength = array('d')
+        self._fresh_base = array('d')   # Freshness when last refreshed
+        self._fresh_clock = array('d')  # Decay clock (days) when last refreshed
+        self._sub_theme: List[Optional[str]] = []
+        self._sources: List[List[str]] = []
+        self._created_at: List[str] = []
+        self._updated_at: List[str] = []
+        self._extra: List[Optional[dict]] = []
+
+        # Indexes: node id -> type id -> [edge ids]
+        self._out: Dict[int, Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self._in: Dict[int, Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self._edge_index: Dict[Tuple[int, int, int], int] = {}
+        self._by_sub_theme: Dict[str, set] = defaultdict(set)
+
+        # Persistence
+        self._path: Optional[Path] = None
+        self._pending: List[dict] = []
+        self._log_entries = 0
+
+    # =========================================================================
+    # Internal storage
+    # =========================================================================
+
+    def _intern(self, ticker: str) -> int:
+        node_id = self._ids.get(ticker)
+        if node_id is None:
+            node_id = len(self._tickers)
+            self._ids[ticker] = node_id
+            self._tickers.append(sys.intern(ticker))
+        return node_id
+
+    def _clock(self) -> float:
+        """Decay clock in days: wall time plus any manual decay_freshness."""
+        return time.time() / SECONDS_PER_DAY + self.metadata.get('decay_offset_days', 0.0)
+
+    def _freshness(self, i: int, clock: float) -> float:
+        elapsed = max(0.0, clock - self._fresh_clock[i])
+        decayed = self._fresh_base[i] * self._decay_rates[self._type[i]] ** elapsed
+        return max(MIN_FRESHNESS, min(self._fresh_base[i], decayed))
+
+    def _edge_dict(self, i: int, clock: Optional[float] = None) -> dict:
+        edge = {
+            'source': self._tickers[self._src[i]],
+            'target': self._tickers[self._dst[i]],
+            'type': self._type_names[self._type[i]],
+            'strength': self._strength[i],
+            'freshness': self._freshness(i, self._clock() if clock is None else clock),
+            'sub_theme': self._sub_theme[i],
+            'sources': list(self._sources[i]),
+            'created_at': self._created_at[i],
+            'updated_at': self._updated_at[i],
+        }
+        if self._extra[i]:
+            edge.update(self._extra[i])
+        return edge
+
+    def _edge_record(self, i: int) -> dict:
+        """Stored form of an edge (snapshot and change log)."""
+        return {
+            'source': self._tickers[self._src[i]],
+            'target': self._tickers[self._dst[i]],
+            'type': self._type_names[self._type[i]],
+            'strength': self._strength[i],
+            'fresh_base': self._fresh_base[i],
+            'fresh_clock': self._fresh_clock[i],
+            'sub_theme': self._sub_theme[i],
+            'sources': self._sources[i],
+            'created_at': self._created_at[i],
+            'updated_at': self._updated_at[i],
+            'extra': self._extra[i],
+        }
+
+    def _set_sub_theme(self, i: int, sub_theme: Optional[str]):
+        old = self._sub_theme[i]
+        if old == sub_theme:
+            return
+        if old is not None:
+            self._by_sub_theme[old].discard(i)
+        if sub_theme is not None:
+            sub_theme = sys.intern(sub_theme)
+            self._by_sub_theme[sub_theme].add(i)
+        self._sub_theme[i] = sub_theme
+
+    def _put_edge(self, record: dict) -> int:
+        """Insert or overwrite an edge from its stored form."""
+        src = self._intern(record['source'])
+        dst = self._intern(record['target'])
+        type_id = self._type_ids.get(record['type'], self._type_ids['adjacent'])
+        key = (src, dst, type_id)
+
+        i = self._edge_index.get(key)
+        if i is None:
+            i = len(self._src)
+            self._edge_index[key] = i
+            self._src.append(src)
+            self._dst.append(dst)
+            self._type.append(type_id)
+            self._strength.append(0.0)
+            self._fresh_base.append(1.0)
+            self._fresh_clock.append(0.0)
+            self._sub_theme.append(None)
+            self._sources.append([])
+            self._created_at.append('')
+            self._updated_at.append('')
+            self._extra.append(None)
+            self._out[src][type_id].append(i)
+            self._in[dst][type_id].append(i)
+
+        self._strength[i] = record['strength']
+        self._fresh_base[i] = record['fresh_base']
+        self._fresh_clock[i] = record['fresh_clock']
+        self._set_sub_theme(i, record.get('sub_theme'))
+        self._sources[i] = list(record.get('sources') or [])
+        self._created_at[i] = record['created_at']
+        self._updated_at[i] = record['updated_at']
+        self._extra[i] = record.get('extra') or None
+        return i
+
+    def _find_edge(self, source: str, target: str, rel_type: Optional[str] = None) -> Optional[int]:
+        src = self._ids.get(source)
+        dst = self._ids.get(target)
+        if src is None or dst is None:
+            return None
+        if rel_type is not None:
+            type_id = self._type_ids.get(rel_type)
+            return self._edge_index.get((src, dst, type_id))
+        for type_id in self._out.get(src, {}):
+            i = self._edge_index.get((src, dst, type_id))
+            if i is not None:
+                return i
+        return None
+
+    def _adjacent(
+        self,
+        node_id: int,
+        direction: str = 'both',
+        type_ids: Optional[set] = None,
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield (neighbor id, edge id) using the per-type adjacency index."""
+        sides = []
+        if direction in ('outgoing', 'both'):
+            sides.append((self._out, self._dst))
+        if direction in ('incoming', 'both'):
+            sides.append((self._in, self._src))
+
+        for index, other in sides:
+            by_type = index.get(node_id)
+            if not by_type:
+                continue
+            for type_id, edge_ids in by_type.items():
+                if type_ids is not None and type_id not in type_ids:
+                    continue
+                for i in edge_ids:
+                    yield other[i], i
+
+    def _type_filter(self, rel_types: Optional[list]) -> Optional[set]:
+        if not rel_types:
+            return None
+        return {self._type_ids[t] for t in rel_types if t in self._type_ids}
+
+    def _iter_edge_ids(self) -> range:
+        return range(len(self._src))
+
+    # =========================================================================
+    # Nodes and edges
+    # =========================================================================
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._src)
+
+    @property
+    def edges(self) -> Dict[str, List[dict]]:
+        """Read-only view: source ticker -> list of edge dicts."""
+        clock = self._clock()
+        view = defaultdict(list)
+        for i in self._iter_edge_ids():
+            view[self._tickers[self._src[i]]].append(self._edge_dict(i, clock))
+        return view
+
+    @property
+    def reverse_edges(self) -> Dict[str, List[dict]]:
+        """Read-only view: target ticker -> list of edge dicts."""
+        clock = self._clock()
+        view = defaultdict(list)
+        for i in self._iter_edge_ids():
+            view[self._tickers[self._dst[i]]].append(self._edge_dict(i, clock))
+        return view
+
     def add_node(self, ticker: str, metadata: Optional[dict] = None) -> dict:
         """
         Add or update a stock node.
@@ -87,6 +319,7 @@ class RelationshipGraph:
             self.nodes[ticker]['updated_at'] = datetime.now().isoformat()
         else:
             # Create new node
+            self._intern(ticker)
             self.nodes[ticker] = {
                 'ticker': ticker,
                 'themes': [],
@@ -97,6 +330,7 @@ class RelationshipGraph:
             if metadata:
                 self.nodes[ticker].update(metadata)
 
+        self._pending.append({'op': 'node', 'ticker': ticker, 'data': self.nodes[ticker]})
         return self.nodes[ticker]
 
     def add_edge(
@@ -138,49 +372,31 @@ class RelationshipGraph:
         if target not in self.nodes:
             self.add_node(target)
 
-        # Create edge data
-        edge = {
+        now = datetime.now().isoformat()
+        record = {
             'source': source,
             'target': target,
             'type': rel_type,
             'strength': min(1.0, max(0.0, strength)),
-            'freshness': 1.0,
+            'fresh_base': 1.0,
+            'fresh_clock': self._clock(),
             'sub_theme': sub_theme,
             'sources': sources or ['manual'],
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
+            'created_at': now,
+            'updated_at': now,
+            'extra': metadata,
         }
-        if metadata:
-            edge.update(metadata)
-
-        # Check for existing edge
-        existing_idx = None
-        for i, e in enumerate(self.edges[source]):
-            if e['target'] == target and e['type'] == rel_type:
-                existing_idx = i
-                break
-
-        if existing_idx is not None:
-            # Update existing edge
-            old_edge = self.edges[source][existing_idx]
-            edge['created_at'] = old_edge['created_at']
-            # Merge sources
-            edge['sources'] = list(set(old_edge.get('sources', []) + edge['sources']))
-            # Keep higher strength
-            edge['strength'] = max(old_edge['strength'], edge['strength'])
-            self.edges[source][existing_idx] = edge
-
-            # Update reverse edge
-            for i, e in enumerate(self.reverse_edges[target]):
-                if e['source'] == source and e['type'] == rel_type:
-                    self.reverse_edges[target][i] = edge
-                    break
-        else:
-            # Add new edge
-            self.edges[source].append(edge)
-            self.reverse_edges[target].append(edge)
 
-        return edge
+        existing = self._find_edge(source, target, rel_type)
+        if existing is not None:
+            # Keep creation time, merge sources, keep higher strength
+            record['created_at'] = self._created_at[existing]
+            record['sources'] = list(set(self._sources[existing] + record['sources']))
+            record['strength'] = max(self._strength[existing], record['strength'])
+
+        i = self._put_edge(record)
+        self._pending.append({'op': 'edge', **record})
+        return self._edge_dict(i)
 
     def get_node(self, ticker: str) -> Optional[dict]:
         """Get node metadata for a ticker."""
@@ -188,14 +404,8 @@ class RelationshipGraph:
 
     def get_edge(self, source: str, target: str, rel_type: Optional[str] = None) -> Optional[dict]:
         """Get edge between two nodes."""
-        source = source.upper()
-        target = target.upper()
-
-        for edge in self.edges.get(source, []):
-            if edge['target'] == target:
-                if rel_type is None or edge['type'] == rel_type:
-                    return edge
-        return None
+        i = self._find_edge(source.upper(), target.upper(), rel_type)
+        return self._edge_dict(i) if i is not None else None
 
     def get_neighbors(
         self,
@@ -218,30 +428,22 @@ class RelationshipGraph:
         Returns:
             List of (ticker, edge_data) tuples
         """
-        ticker = ticker.upper()
+        node_id = self._ids.get(ticker.upper())
+        if node_id is None:
+            return []
+        if rel_type is not None and rel_type not in self._type_ids:
+            return []
+
+        type_ids = {self._type_ids[rel_type]} if rel_type else None
+        clock = self._clock()
         neighbors = []
 
-        # Outgoing edges (this ticker is source)
-        if direction in ['outgoing', 'both']:
-            for edge in self.edges.get(ticker, []):
-                if rel_type and edge['type'] != rel_type:
-                    continue
-                if edge['strength'] < min_strength:
-                    continue
-                if edge['freshness'] < min_freshness:
-                    continue
-                neighbors.append((edge['target'], edge))
-
-        # Incoming edges (this ticker is target)
-        if direction in ['incoming', 'both']:
-            for edge in self.reverse_edges.get(ticker, []):
-                if rel_type and edge['type'] != rel_type:
-                    continue
-                if edge['strength'] < min_strength:
-                    continue
-                if edge['freshness'] < min_freshness:
-                    continue
-                neighbors.append((edge['source'], edge))
+        for other, i in self._adjacent(node_id, direction, type_ids):
+            if self._strength[i] < min_strength:
+                continue
+            if min_freshness and self._freshness(i, clock) < min_freshness:
+                continue
+            neighbors.append((self._tickers[other], self._edge_dict(i, clock)))
 
         return neighbors
 
@@ -266,6 +468,10 @@ class RelationshipGraph:
         )
         return [{'ticker': t, **e} for t, e in neighbors]
 
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
     def get_subgraph(
         self,
         ticker: str,
@@ -283,43 +489,37 @@ class RelationshipGraph:
             min_strength: Minimum edge strength to include
 
         Returns:
-            Dict with nodes, edges, and summary
+            Dict with nodes, edges (each listed once), and summary
         """
         ticker = ticker.upper()
 
         if ticker not in self.nodes:
             return {'nodes': [], 'edges': [], 'center': ticker, 'summary': {}}
 
-        visited = set()
-        nodes = {}
-        edges = []
-        queue = deque([(ticker, 0)])
-
-        while queue:
-            current, current_depth = queue.popleft()
-
-            if current in visited:
-                continue
-            visited.add(current)
-
-            # Add node
-            if current in self.nodes:
-                nodes[current] = self.nodes[current]
-
-            if current_depth >= depth:
-                continue
-
-            # Traverse edges
-            for target, edge in self.get_neighbors(
-                current, direction='both', min_strength=min_strength
-            ):
-                if rel_types and edge['type'] not in rel_types:
-                    continue
-
-                edges.append(edge)
-
-                if target not in visited:
-                    queue.append((target, current_depth + 1))
+        type_ids = self._type_filter(rel_types)
+        center = self._ids[ticker]
+        visited = {center}
+        edge_ids = []
+        seen_edges = set()
+        frontier = [center]
+
+        for _ in range(depth):
+            next_frontier = []
+            for node_id in frontier:
+                for other, i in self._adjacent(node_id, 'both', type_ids):
+                    if self._strength[i] < min_strength:
+                        continue
+                    if i not in seen_edges:
+                        seen_edges.add(i)
+                        edge_ids.append(i)
+                    if other not in visited:
+                        visited.add(other)
+                        next_frontier.append(other)
+            frontier = next_frontier
+
+        clock = self._clock()
+        edges = [self._edge_dict(i, clock) for i in edge_ids]
+        nodes = [self.nodes[self._tickers[n]] for n in visited if self._tickers[n] in self.nodes]
 
         # Create summary
         summary = {
@@ -337,7 +537,7 @@ class RelationshipGraph:
                 summary['by_sub_theme'][edge['sub_theme']].append(edge['target'])
 
         return {
-            'nodes': list(nodes.values()),
+            'nodes': nodes,
             'edges': edges,
             'center': ticker,
             'summary': dict(summary),
@@ -356,7 +556,7 @@ class RelationshipGraph:
         Args:
             source: Starting ticker
             target: Destination ticker
-            max_depth: Maximum path length
+            max_depth: Maximum path length (edges)
             rel_types: Optional relationship type filter
 
         Returns:
@@ -371,165 +571,294 @@ class RelationshipGraph:
         if source == target:
             return [(source, None)]
 
-        visited = set()
-        queue = deque([(source, [(source, None)])])
+        type_ids = self._type_filter(rel_types)
+        start = self._ids[source]
+        goal = self._ids[target]
+        parent = {start: None}  # node id -> (previous node id, edge id)
+        queue = deque([(start, 0)])
 
         while queue:
-            current, path = queue.popleft()
-
-            if len(path) > max_depth:
-                continue
-
-            if current in visited:
+            current, dist = queue.popleft()
+            if dist >= max_depth:
                 continue
-            visited.add(current)
 
-            for neighbor, edge in self.get_neighbors(current, direction='both'):
-                if rel_types and edge['type'] not in rel_types:
+            for other, i in self._adjacent(current, 'both', type_ids):
+                if other in parent:
                     continue
+                parent[other] = (current, i)
 
-                new_path = path + [(neighbor, edge)]
-
-                if neighbor == target:
-                    return new_path
+                if other == goal:
+                    clock = self._clock()
+                    path = []
+                    node = goal
+                    while parent[node] is not None:
+                        prev, edge_id = parent[node]
+                        path.append((self._tickers[node], self._edge_dict(edge_id, clock)))
+                        node = prev
+                    path.append((source, None))
+                    return path[::-1]
 
-                if neighbor not in visited:
-                    queue.append((neighbor, new_path))
+                queue.append((other, dist + 1))
 
         return None
 
+    # =========================================================================
+    # Freshness
+    # =========================================================================
+
     def decay_freshness(self, rate: Optional[float] = None, days: int = 1):
         """
         Apply freshness decay to all edges.
 
+        Freshness already decays with time on read; this advances the decay
+        clock by ``days`` for existing edges. A custom ``rate`` is applied
+        to every edge's stored freshness instead.
+
         Args:
             rate: Override decay rate (0-1)
             days: Number of days of decay to apply
         """
-        for source in self.edges:
-            for edge in self.edges[source]:
-                edge_type = edge['type']
-                decay = rate or self.RELATIONSHIP_TYPES.get(
-                    edge_type, {}
-                ).get('decay_rate', 0.98)
-
-                # Apply decay for each day
-                edge['freshness'] = edge['freshness'] * (decay ** days)
-
-                # Minimum freshness
-                edge['freshness'] = max(0.1, edge['freshness'])
+        if rate is None:
+            self.metadata['decay_offset_days'] = self.metadata.get('decay_offset_days', 0.0) + days
+            self._pending.append({'op': 'decay', 'days': days})
+        else:
+            clock = self._clock()
+            factor = rate ** days
+            for i in self._iter_edge_ids():
+                self._fresh_base[i] = max(MIN_FRESHNESS, self._freshness(i, clock) * factor)
+                self._fresh_clock[i] = clock
+                self._pending.append({'op': 'edge', **self._edge_record(i)})
 
         self.metadata['last_decay'] = datetime.now().isoformat()
 
     def refresh_edge(self, source: str, target: str, rel_type: Optional[str] = None):
         """Reset freshness for an edge (e.g., after verification)."""
-        edge = self.get_edge(source, target, rel_type)
-        if edge:
-            edge['freshness'] = 1.0
-            edge['updated_at'] = datetime.now().isoformat()
+        i = self._find_edge(source.upper(), target.upper(), rel_type)
+        if i is not None:
+            self._fresh_base[i] = 1.0
+            self._fresh_clock[i] = self._clock()
+            self._updated_at[i] = datetime.now().isoformat()
+            self._pending.append({'op': 'edge', **self._edge_record(i)})
 
     def get_stale_edges(self, threshold: float = 0.5) -> list:
         """Get edges with freshness below threshold."""
-        stale = []
-        for source in self.edges:
-            for edge in self.edges[source]:
-                if edge['freshness'] < threshold:
-                    stale.append(edge)
+        clock = self._clock()
+        stale = [
+            self._edge_dict(i, clock) for i in self._iter_edge_ids()
+            if self._freshness(i, clock) < threshold
+        ]
         return sorted(stale, key=lambda e: e['freshness'])
 
     def get_strong_edges(self, min_strength: float = 0.8) -> list:
         """Get high-confidence edges."""
-        strong = []
-        for source in self.edges:
-            for edge in self.edges[source]:
-                if edge['strength'] >= min_strength:
-                    strong.append(edge)
+        clock = self._clock()
+        strong = [
+            self._edge_dict(i, clock) for i in self._iter_edge_ids()
+            if self._strength[i] >= min_strength
+        ]
         return sorted(strong, key=lambda e: -e['strength'])
 
     def get_by_sub_theme(self, sub_theme: str) -> list:
         """Get all tickers in a sub-theme."""
         tickers = set()
-        for source in self.edges:
-            for edge in self.edges[source]:
-                if edge.get('sub_theme') == sub_theme:
-                    tickers.add(edge['source'])
-                    tickers.add(edge['target'])
+        for i in self._by_sub_theme.get(sub_theme, ()):
+            tickers.add(self._tickers[self._src[i]])
+            tickers.add(self._tickers[self._dst[i]])
         return list(tickers)
 
     def get_stats(self) -> dict:
         """Get graph statistics."""
-        edge_count = sum(len(edges) for edges in self.edges.values())
-
         type_counts = defaultdict(int)
-        subtheme_counts = defaultdict(int)
-        avg_strength = []
-        avg_freshness = []
-
-        for source in self.edges:
-            for edge in self.edges[source]:
-                type_counts[edge['type']] += 1
-                if edge.get('sub_theme'):
-                    subtheme_counts[edge['sub_theme']] += 1
-                avg_strength.append(edge['strength'])
-                avg_freshness.append(edge['freshness'])
+        for type_id in self._type:
+            type_counts[self._type_names[type_id]] += 1
+
+        subtheme_counts = {
+            name: len(edge_ids) for name, edge_ids in self._by_sub_theme.items() if edge_ids
+        }
+
+        edge_count = self.edge_count
+        clock = self._clock()
+        total_freshness = sum(self._freshness(i, clock) for i in self._iter_edge_ids())
 
         return {
             'node_count': len(self.nodes),
             'edge_count': edge_count,
             'by_type': dict(type_counts),
-            'by_sub_theme': dict(subtheme_counts),
-            'avg_strength': sum(avg_strength) / len(avg_strength) if avg_strength else 0,
-            'avg_freshness': sum(avg_freshness) / len(avg_freshness) if avg_freshness else 0,
+            'by_sub_theme': subtheme_counts,
+            'avg_strength': sum(self._strength) / edge_count if edge_count else 0,
+            'avg_freshness': total_freshness / edge_count if edge_count else 0,
             'last_updated': self.metadata.get('last_updated'),
         }
 
+    # =========================================================================
+    # Serialization
+    # =========================================================================
+
     def to_dict(self) -> dict:
-        """Convert graph to dictionary for serialization."""
+        """Convert graph to dictionary (legacy edge-list format)."""
+        return {
+            'nodes': self.nodes,
+            'edges': dict(self.edges),
+            'metadata': self.metadata,
+        }
+
+    def to_compact_dict(self) -> dict:
+        """Snapshot form: interned tickers and per-attribute edge columns."""
         return {
+            'format': 'compact',
             'nodes': self.nodes,
-            'edges': {k: v for k, v in self.edges.items()},
             'metadata': self.metadata,
+            'tickers': self._tickers,
+            'edges': {
+                'src': self._src.tolist(),
+                'dst': self._dst.tolist(),
+                'type': [self._type_names[t] for t in self._type],
+                'strength': self._strength.tolist(),
+                'fresh_base': self._fresh_base.tolist(),
+                'fresh_clock': self._fresh_clock.tolist(),
+                'sub_theme': self._sub_theme,
+                'sources': self._sources,
+                'created_at': self._created_at,
+                'updated_at': self._updated_at,
+                'extra': self._extra,
+            },
         }
 
+    def _reset(self):
+        path = self._path
+        self.__init__()
+        self._path = path
+
     def from_dict(self, data: dict):
-        """Load graph from dictionary."""
+        """Load graph from dictionary (compact or legacy format)."""
+        self._reset()
         self.nodes = data.get('nodes', {})
-        self.edges = defaultdict(list, data.get('edges', {}))
         self.metadata = data.get('metadata', self.metadata)
-
-        # Rebuild reverse edges
-        self.reverse_edges = defaultdict(list)
-        for source in self.edges:
-            for edge in self.edges[source]:
-                self.reverse_edges[edge['target']].append(edge)
+        self.metadata.setdefault('decay_offset_days', 0.0)
+        for ticker in self.nodes:
+            self._intern(ticker)
+
+        if data.get('format') == 'compact':
+            tickers = data.get('tickers', [])
+            columns = data.get('edges', {})
+            for i in range(len(columns.get('src', []))):
+                self._put_edge({
+                    'source': tickers[columns['src'][i]],
+                    'target': tickers[columns['dst'][i]],
+                    **{name: values[i] for name, values in columns.items() if name not in ('src', 'dst')},
+                })
+            return
+
+        # Legacy format: lists of edge dicts keyed by source; freshness
+        # decays from the edge's last update
+        core = {'source', 'target', 'type', 'strength', 'freshness', 'sub_theme',
+                'sources', 'created_at', 'updated_at'}
+        offset = self.metadata['decay_offset_days']
+        for edge_list in data.get('edges', {}).values():
+            for edge in edge_list:
+                self._put_edge({
+                    'source': edge['source'],
+                    'target': edge['target'],
+                    'type': edge['type'],
+                    'strength': edge['strength'],
+                    'fresh_base': edge.get('freshness', 1.0),
+                    'fresh_clock': _to_timestamp(edge.get('updated_at')) / SECONDS_PER_DAY + offset,
+                    'sub_theme': edge.get('sub_theme'),
+                    'sources': edge.get('sources', []),
+                    'created_at': edge.get('created_at', ''),
+                    'updated_at': edge.get('updated_at', ''),
+                    'extra': {k: v for k, v in edge.items() if k not in core} or None,
+                })
+
+    def _apply_log_entry(self, entry: dict):
+        op = entry.pop('op')
+        if op == 'edge':
+            self._put_edge(entry)
+        elif op == 'node':
+            self._intern(entry['ticker'])
+            self.nodes[entry['ticker']] = entry['data']
+        elif op == 'decay':
+            self.metadata['decay_offset_days'] = self.metadata.get('decay_offset_days', 0.0) + entry['days']
 
     def save(self, path: Optional[Path] = None):
-        """Save graph to JSON file."""
+        """
+        Persist changes since the last save.
+
+        Appends pending changes to the change log next to the snapshot.
+        The snapshot is rewritten (and the log truncated) when saving to
+        a new path or once the log outgrows the graph.
+        """
         path = path or ECOSYSTEM_GRAPH_PATH
         path.parent.mkdir(parents=True, exist_ok=True)
-
         self.metadata['last_updated'] = datetime.now().isoformat()
+
+        if path != self._path or not path.exists():
+            self.compact(path)
+            return
+
+        pending, self._pending = self._pending, []
+        if pending:
+            with open(_log_path(path), 'a') as f:
+                f.writelines(json.dumps(entry, default=str) + '\n' for entry in pending)
+            self._log_entries += len(pending)
+
+        if self._log_entries > LOG_COMPACT_RATIO * (len(self.nodes) + self.edge_count):
+            self.compact(path)
+            return
+
+        logger.info(f"Saved ecosystem graph changes: {len(pending)} log entries ({self._log_entries} since snapshot)")
+
+    def compact(self, path: Optional[Path] = None):
+        """Rewrite the full snapshot and truncate the change log."""
+        path = path or self._path or ECOSYSTEM_GRAPH_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
         self.metadata['stats'] = self.get_stats()
 
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2, default=str)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.to_compact_dict(), f, default=str)
+        os.replace(tmp, path)
+
+        log = _log_path(path)
+        if log.exists():
+            log.unlink()
+
+        self._path = path
+        self._pending = []
+        self._log_entries = 0
 
         logger.info(f"Saved ecosystem graph: {self.metadata['stats']['node_count']} nodes, {self.metadata['stats']['edge_count']} edges")
 
     def load(self, path: Optional[Path] = None) -> bool:
-        """Load graph from JSON file."""
+        """Load graph from its snapshot and replay the change log."""
         path = path or ECOSYSTEM_GRAPH_PATH
+        log = _log_path(path)
 
-        if not path.exists():
+        if not path.exists() and not log.exists():
             logger.info(f"No existing graph at {path}, starting fresh")
             return False
 
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-
-            self.from_dict(data)
-            logger.info(f"Loaded ecosystem graph: {len(self.nodes)} nodes, {sum(len(e) for e in self.edges.values())} edges")
+            self._reset()
+            if path.exists():
+                with open(path, 'r') as f:
+                    self.from_dict(json.load(f))
+
+            replayed = 0
+            if log.exists():
+                with open(log) as f:
+                    for line in f:
+                        try:
+                            self._apply_log_entry(json.loads(line))
+                            replayed += 1
+                        except (ValueError, KeyError, IndexError):
+                            # Torn write at the tail of the log
+                            continue
+
+            self._path = path if path.exists() else None
+            self._pending = []
+            self._log_entries = replayed
+            logger.info(f"Loaded ecosystem graph: {len(self.nodes)} nodes, {self.edge_count} edges ({replayed} log entries)")
             return True
         except Exception as e:
             logger.error(f"Failed to load ecosystem graph: {e}")
@@ -546,17 +875,19 @@ class RelationshipGraph:
         # Merge nodes
         for ticker, node in other.nodes.items():
             if ticker not in self.nodes or overwrite:
+                self._intern(ticker)
                 self.nodes[ticker] = node
             else:
                 # Update with newer data
                 if node.get('updated_at', '') > self.nodes[ticker].get('updated_at', ''):
                     self.nodes[ticker].update(node)
+            self._pending.append({'op': 'node', 'ticker': ticker, 'data': self.nodes[ticker]})
 
         # Merge edges
-        for source in other.edges:
-            for edge in other.edges[source]:
-                existing = self.get_edge(edge['source'], edge['target'], edge['type'])
-                if not existing or overwrite:
+        for edge_list in other.edges.values():
+            for edge in edge_list:
+                existing = self._find_edge(edge['source'], edge['target'], edge['type'])
+                if existing is None or overwrite:
                     self.add_edge(
                         edge['source'],
                         edge['target'],
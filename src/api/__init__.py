@@ -4,6 +4,15 @@ Web API
 Flask application for REST API and webhooks.
 """
 
-from src.api.app import app
-
 __all__ = ['app']
+
+
+def __getattr__(name):
+    """Lazy loading of the Flask app (building it registers every route)."""
+    if name == 'app':
+        from src.api.app import app
+        # Importing the submodule binds src.api.app to the module; keep the
+        # package attribute pointing at the Flask app as before.
+        globals()['app'] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
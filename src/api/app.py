@@ -17,8 +17,6 @@ import requests
 from flask import Flask, request, jsonify
 from datetime import datetime
 from pathlib import Path
-import yfinance as yf
-import pandas as pd
 import threading
 import time
 
@@ -315,6 +313,8 @@ def handle_help(chat_id):
 
 def handle_ticker(chat_id, ticker):
     """Handle ticker analysis with candlestick chart."""
+    import pandas as pd
+    import yfinance as yf
     ticker = ticker.upper().strip()
     send_message(chat_id, f"⏳ Analyzing {ticker}...")
 
@@ -848,6 +848,7 @@ def handle_health(chat_id):
 
 def handle_top(chat_id):
     """Handle /top command."""
+    import pandas as pd
     send_message(chat_id, "⏳ Fetching top stocks...")
     try:
         import glob
@@ -916,6 +917,7 @@ def handle_briefing(chat_id):
 
 def handle_predict(chat_id, ticker):
     """Handle /predict command."""
+    import yfinance as yf
     ticker = ticker.upper().strip()
     send_message(chat_id, f"🤖 Predicting {ticker}...")
 
@@ -1882,6 +1884,7 @@ def api_stories():
 @app.route('/api/scan')
 def api_scan():
     """Get scan results from cached CSV file (fast, no timeout)."""
+    import pandas as pd
     cache_key = 'scan'
 
     # Check cache first
@@ -2183,6 +2186,7 @@ def api_scan_trigger():
 @app.route('/api/ticker/<ticker>')
 def api_ticker(ticker):
     """Get ticker analysis using Polygon.io."""
+    import pandas as pd
     try:
         ticker = ticker.upper()
 
@@ -2302,6 +2306,7 @@ def api_ticker(ticker):
 
 def _get_simple_news_sentiment(tickers):
     """Simple news sentiment using yfinance only."""
+    import yfinance as yf
     results = []
     for ticker in tickers:
         try:
@@ -2495,6 +2500,7 @@ def api_briefing():
 
 def _get_real_market_health_data():
     """Fetch real market data for health indicators with parallel processing."""
+    import yfinance as yf
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     def safe_download(ticker, period='6mo', timeout=10):
@@ -2873,6 +2879,7 @@ def api_data_providers():
 @app.route('/api/predict/<ticker>')
 def api_predict(ticker):
     """Get AI prediction for ticker."""
+    import yfinance as yf
     try:
         from ai_learning import predict_trade_outcome
 
@@ -2934,6 +2941,7 @@ def api_ecosystem(ticker):
 @app.route('/api/ecosystem/opportunities')
 def api_ecosystem_opportunities():
     """Get ecosystem opportunities (lagging plays)."""
+    import pandas as pd
     try:
         from ecosystem_intelligence import generate_ecosystem_alerts, get_stocks_in_play
 
@@ -2980,6 +2988,7 @@ def api_ecosystem_opportunities():
 @app.route('/api/ecosystem/wave/<ticker>')
 def api_ecosystem_wave(ticker):
     """Get wave propagation tracking for a driver."""
+    import pandas as pd
     try:
         from ecosystem_intelligence import calculate_wave_propagation, get_active_waves
 
@@ -3019,6 +3028,7 @@ def api_ecosystem_wave(ticker):
 @app.route('/api/themes/lifecycle')
 def api_themes_lifecycle():
     """Get theme lifecycle status."""
+    import pandas as pd
     try:
         from ecosystem_intelligence import (
             detect_emerging_subthemes, detect_rotation_signals
@@ -3082,6 +3092,7 @@ def api_themes_lifecycle():
 @app.route('/api/watchlist/in-play')
 def api_watchlist_in_play():
     """Get stocks currently in play."""
+    import pandas as pd
     try:
         from ecosystem_intelligence import get_stocks_in_play, calculate_ecosystem_score
 
@@ -3124,6 +3135,7 @@ def api_watchlist_in_play():
 @app.route('/api/ecosystem/refresh', methods=['POST'])
 def api_ecosystem_refresh():
     """Trigger ecosystem refresh (internal)."""
+    import pandas as pd
     try:
         from ai_ecosystem_generator import refresh_single_ticker, refresh_hot_stocks
 
@@ -5322,7 +5334,7 @@ def api_sec_deals_add():
 def api_sec_ma_radar():
     """Scan watchlist for M&A activity - used by dashboard."""
     try:
-        from src.data.sec_edgar import detect_ma_activity
+        from src.data.sec_edgar import detect_ma_activity_batch
 
         # Get tickers from scan results or use defaults
         tickers = []
@@ -5340,19 +5352,13 @@ def api_sec_ma_radar():
         if not tickers:
             tickers = ['NVDA', 'AMD', 'AAPL', 'MSFT', 'GOOGL', 'META', 'TSLA', 'AMZN']
 
-        results = []
-        for ticker in tickers[:15]:
-            try:
-                result = detect_ma_activity(ticker)
-                results.append({
-                    'ticker': ticker,
-                    'score': result.get('ma_score', 0),
-                    'has_activity': result.get('has_activity', False),
-                    'signals': result.get('signals', [])[:2]  # Limit signals
-                })
-            except Exception as ticker_error:
-                logger.debug(f"M&A detection failed for {ticker}: {ticker_error}")
-                continue
+        # Load filings for the whole list once; each check is then local
+        results = [{
+            'ticker': result['ticker'],
+            'score': result.get('ma_score', 0),
+            'has_activity': result.get('has_activity', False),
+            'signals': result.get('signals', [])[:2]  # Limit signals
+        } for result in detect_ma_activity_batch(tickers[:15])]
 
         # Sort by score
         results.sort(key=lambda x: x['score'], reverse=True)
@@ -6741,6 +6747,7 @@ def api_trades():
 @app.route('/api/trades/positions')
 def api_trades_positions():
     """Get open positions only."""
+    import yfinance as yf
     try:
         from src.trading import TradeManager
         tm = TradeManager()
@@ -6962,6 +6969,7 @@ def api_trades_close(trade_id):
 @app.route('/api/trades/<trade_id>')
 def api_trades_get(trade_id):
     """Get single trade details."""
+    import yfinance as yf
     try:
         from src.trading import TradeManager
         tm = TradeManager()
@@ -7054,6 +7062,7 @@ def api_trades_scan_ticker(ticker):
 @app.route('/api/trades/risk')
 def api_trades_risk():
     """Get portfolio risk assessment."""
+    import yfinance as yf
     try:
         from src.trading import TradeManager, RiskAdvisor
 
@@ -21,6 +21,7 @@ from src.data.cache_manager import (
     sector_cache_key, news_cache_key,
 )
 from src.scoring import param_helper as params
+from src.core.tracing import ScanTrace, set_span_attributes, span, trace_path_for, traced
 
 logger = logging.getLogger(__name__)
 
@@ -226,6 +227,7 @@ class AsyncDataFetcher:
         self.client = client or AsyncHTTPClient()
         self.cache = cache or CacheManager()
 
+    @traced('fetch.stocktwits', provider='stocktwits', cache='miss')
     async def fetch_stocktwits_async(self, ticker: str) -> Dict:
         """
         Async fetch from StockTwits API.
@@ -236,6 +238,7 @@ class AsyncDataFetcher:
         cache_key = stocktwits_cache_key(ticker)
         cached = self.cache.get(cache_key)
         if cached is not None:
+            set_span_attributes(cache='hit')
             return cached
 
         # Rate limit
@@ -279,6 +282,7 @@ class AsyncDataFetcher:
         self.cache.set(cache_key, result, ttl=CacheConfig.TTL_SOCIAL)
         return result
 
+    @traced('fetch.reddit_subreddit', provider='reddit')
     async def fetch_reddit_subreddit_async(self, ticker: str, subreddit: str) -> List[Dict]:
         """Fetch mentions from a single subreddit."""
         url = f"https://www.reddit.com/r/{subreddit}/search.json"
@@ -323,6 +327,7 @@ class AsyncDataFetcher:
 
         return mentions
 
+    @traced('fetch.reddit', provider='reddit', cache='miss')
     async def fetch_reddit_async(self, ticker: str) -> Dict:
         """
         Async fetch from Reddit - all subreddits concurrently.
@@ -333,6 +338,7 @@ class AsyncDataFetcher:
         cache_key = reddit_cache_key(ticker)
         cached = self.cache.get(cache_key)
         if cached is not None:
+            set_span_attributes(cache='hit')
             return cached
 
         subreddits = ['wallstreetbets', 'stocks', 'investing', 'options']
@@ -376,6 +382,7 @@ class AsyncDataFetcher:
         self.cache.set(cache_key, result, ttl=CacheConfig.TTL_SOCIAL)
         return result
 
+    @traced('fetch.sec', provider='sec_edgar', cache='miss')
     async def fetch_sec_async(self, ticker: str) -> Dict:
         """
         Async fetch SEC filings from EDGAR.
@@ -384,6 +391,7 @@ class AsyncDataFetcher:
         cache_key = sec_cache_key(ticker)
         cached = self.cache.get(cache_key)
         if cached is not None:
+            set_span_attributes(cache='hit')
             return cached
 
         # Rate limit
@@ -430,6 +438,7 @@ class AsyncDataFetcher:
         self.cache.set(cache_key, result, ttl=CacheConfig.TTL_SEC)
         return result
 
+    @traced('fetch.sector', provider='polygon', cache='miss')
     async def fetch_sector_async(self, ticker: str) -> str:
         """
         Async fetch sector for ticker using Polygon.io.
@@ -438,6 +447,7 @@ class AsyncDataFetcher:
         cache_key = sector_cache_key(ticker)
         cached = self.cache.get(cache_key)
         if cached is not None:
+            set_span_attributes(cache='hit')
             return cached
 
         sector = 'Unknown'
@@ -462,6 +472,7 @@ class AsyncDataFetcher:
         self.cache.set(cache_key, sector, ttl=CacheConfig.TTL_SECTOR)
         return sector
 
+    @traced('fetch.news', provider='polygon', cache='miss')
     async def fetch_news_async(self, ticker: str, days: int = 7) -> List[Dict]:
         """
         Async fetch news for ticker using Polygon.io.
@@ -470,6 +481,7 @@ class AsyncDataFetcher:
         cache_key = news_cache_key(ticker, days)
         cached = self.cache.get(cache_key)
         if cached is not None:
+            set_span_attributes(cache='hit')
             return cached
 
         news = []
@@ -504,6 +516,7 @@ class AsyncDataFetcher:
         self.cache.set(cache_key, news, ttl=CacheConfig.TTL_NEWS)
         return news
 
+    @traced('fetch.options_flow', provider='polygon', cache='miss')
     async def fetch_options_flow_async(self, ticker: str) -> Dict:
         """
         Async fetch options flow data for ticker.
@@ -514,6 +527,7 @@ class AsyncDataFetcher:
         cache_key = f"options:{ticker}"
         cached = self.cache.get(cache_key)
         if cached is not None:
+            set_span_attributes(cache='hit')
             return cached
 
         # Try Polygon for options data
@@ -552,6 +566,7 @@ class AsyncDataFetcher:
             'source': 'none',
         }
 
+    @traced('fetch.unusual_options', provider='polygon')
     async def fetch_unusual_options_async(self, ticker: str) -> Dict:
         """
         Async fetch unusual options activity for ticker.
@@ -608,7 +623,8 @@ class AsyncStoryScorer:
         google_trends = {'score': 50, 'status': 'unknown', 'is_breakout': False}
         try:
             from src.intelligence.google_trends import get_trend_data
-            gt_data = get_trend_data(ticker)
+            with span('fetch.google_trends', provider='google_trends'):
+                gt_data = get_trend_data(ticker)
             google_trends = {
                 'score': gt_data.get('search_interest', 50),
                 'status': gt_data.get('trend_direction', 'stable'),
@@ -622,7 +638,8 @@ class AsyncStoryScorer:
         if os.environ.get('XAI_API_KEY'):
             try:
                 from src.intelligence.x_intelligence import get_x_sentiment
-                x_data = get_x_sentiment(ticker)
+                with span('fetch.x_sentiment', provider='xai'):
+                    x_data = get_x_sentiment(ticker)
                 x_sentiment = {
                     'sentiment': x_data.get('sentiment', 'neutral'),
                     'sentiment_score': x_data.get('sentiment_score', 0.5),
@@ -737,7 +754,8 @@ class AsyncStoryScorer:
         theme_data = []
         try:
             from src.themes.theme_registry import get_theme_membership_for_scoring
-            theme_data = get_theme_membership_for_scoring(ticker) or []
+            with span('theme_lookup', provider='theme_registry'):
+                theme_data = get_theme_membership_for_scoring(ticker) or []
         except ImportError as e:
             logger.debug(f"Theme registry not available: {e}")
         except Exception as e:
@@ -749,7 +767,8 @@ class AsyncStoryScorer:
                 polygon_key = os.environ.get('POLYGON_API_KEY', '')
                 if polygon_key:
                     from src.data.polygon_provider import get_aggregates_sync
-                    price_data = get_aggregates_sync(ticker, days=250)
+                    with span('fetch.price', provider='polygon'):
+                        price_data = get_aggregates_sync(ticker, days=250)
                     if price_data is not None and not price_data.empty:
                         # Validate data has actual values
                         close_col = 'Close' if 'Close' in price_data.columns else 'close'
@@ -865,14 +884,15 @@ class AsyncStoryScorer:
         }
 
         # Calculate story-first score
-        story_result = calculate_story_score(
-            ticker=ticker,
-            news=news,
-            sec_data=sec_data,
-            theme_data=theme_data,
-            price_data=price_dict,
-            social_buzz=social_buzz_for_scoring,
-        )
+        with span('score'):
+            story_result = calculate_story_score(
+                ticker=ticker,
+                news=news,
+                sec_data=sec_data,
+                theme_data=theme_data,
+                price_data=price_dict,
+                social_buzz=social_buzz_for_scoring,
+            )
 
         # Determine sentiment label from news
         bullish_words = ['beat', 'surge', 'gain', 'rise', 'jump', 'high', 'record', 'growth', 'strong', 'upgrade', 'buy']
@@ -1011,6 +1031,7 @@ class AsyncScanner:
                 await provider.close()
 
                 logger.info(f"Polygon fetched {len(price_data_dict)} tickers")
+                set_span_attributes(provider='polygon', fetched=len(price_data_dict))
 
                 if len(price_data_dict) >= len(tickers) * 0.5:
                     return price_data_dict
@@ -1022,6 +1043,7 @@ class AsyncScanner:
 
         # Fallback to yfinance
         logger.info("Using yfinance for price data...")
+        set_span_attributes(provider='yfinance')
         try:
             import yfinance as yf
 
@@ -1060,6 +1082,7 @@ class AsyncScanner:
                         logger.warning(f"yfinance parse error for {ticker}: {type(e).__name__}: {e}")
 
                 logger.info(f"yfinance fetched {len(price_data_dict)} tickers")
+                set_span_attributes(fetched=len(price_data_dict))
 
         except Exception as e:
             logger.error(f"yfinance price data error: {type(e).__name__}: {e}", exc_info=True)
@@ -1075,14 +1098,18 @@ class AsyncScanner:
         Scan a single ticker with semaphore for concurrency control.
         """
         async with self._semaphore:
-            try:
-                result = await self.scorer.calculate_story_score_async(ticker, price_data)
-                self._stats['scanned'] += 1
-                return result
-            except Exception as e:
-                logger.error(f"Error scanning {ticker}: {type(e).__name__}: {e}", exc_info=True)
-                self._stats['errors'] += 1
-                return None
+            with span('scan_ticker', ticker=ticker) as ticker_span:
+                try:
+                    result = await self.scorer.calculate_story_score_async(ticker, price_data)
+                    self._stats['scanned'] += 1
+                    return result
+                except Exception as e:
+                    logger.error(f"Error scanning {ticker}: {type(e).__name__}: {e}", exc_info=True)
+                    self._stats['errors'] += 1
+                    if ticker_span is not None:
+                        ticker_span.status = 'error'
+                        ticker_span.attributes['error'] = type(e).__name__
+                    return None
 
     async def run_scan_async(
         self,
@@ -1094,6 +1121,10 @@ class AsyncScanner:
         """
         Run async scan on all tickers.
 
+        Every stage and per-ticker source fetch is traced; the trace is
+        written next to the CSV as scan_YYYYMMDD_trace.jsonl (also when
+        the scan fails part-way).
+
         Args:
             tickers: List of tickers to scan (default: from universe_manager)
             use_story_first: Whether to use story-first scoring
@@ -1103,143 +1134,171 @@ class AsyncScanner:
         Returns:
             Tuple of (results DataFrame, price_data dict)
         """
+        from datetime import datetime
+        csv_filename = f"scan_{datetime.now().strftime('%Y%m%d')}.csv"
+
+        trace = ScanTrace(name='async_scan')
+        try:
+            with trace.activate(), params.pinned_snapshot():
+                return await self._run_scan(
+                    tickers, use_story_first, price_data_dict, learning_brain, trace, csv_filename,
+                )
+        finally:
+            self._write_trace(trace, csv_filename)
+
+    async def _run_scan(
+        self,
+        tickers: Optional[List[str]],
+        use_story_first: bool,
+        price_data_dict: Optional[Dict[str, pd.DataFrame]],
+        learning_brain,
+        trace: ScanTrace,
+        csv_filename: str,
+    ) -> Tuple[pd.DataFrame, Dict]:
+        """Scan stages for run_scan_async, each recorded as a span of ``trace``."""
         self._stats['start_time'] = time.time()
 
         # Get tickers if not provided
-        if tickers is None:
-            try:
-                from scanner_automation import get_scan_universe
-                tickers = get_scan_universe()
-            except ImportError:
-                logger.error("No tickers provided and scanner_automation not available")
-                return pd.DataFrame(), {}
+        with span('universe_load', provided=tickers is not None):
+            if tickers is None:
+                try:
+                    from scanner_automation import get_scan_universe
+                    tickers = get_scan_universe()
+                except ImportError:
+                    logger.error("No tickers provided and scanner_automation not available")
+                    return pd.DataFrame(), {}
 
         logger.info(f"Async scanning {len(tickers)} tickers with max_concurrent={self.max_concurrent}")
 
         # Get sector rotation forecast for score adjustments
-        rotation_adjustments = {}
-        try:
-            from src.intelligence.rotation_predictor import get_rotation_forecast
-            rotation_forecast = get_rotation_forecast()
-
-            if rotation_forecast.get('ok'):
-                # Hot themes (rotating in) get boost
-                for theme in rotation_forecast.get('rotating_in', []):
-                    prob = theme.get('rotation_probability', 0)
-                    if prob > 0.6:
-                        rotation_adjustments[theme['theme_id']] = 1.2  # 20% boost
-                    elif prob > 0.4:
-                        rotation_adjustments[theme['theme_id']] = 1.1  # 10% boost
-
-                # Cold themes (rotating out) get penalty
-                for theme in rotation_forecast.get('rotating_out', []):
-                    prob = theme.get('rotation_probability', 0)
-                    if prob > 0.6:
-                        rotation_adjustments[theme['theme_id']] = 0.8  # 20% penalty
-                    elif prob > 0.4:
-                        rotation_adjustments[theme['theme_id']] = 0.9  # 10% penalty
-
-                if rotation_adjustments:
-                    logger.info(f"Sector rotation: {len([a for a in rotation_adjustments.values() if a > 1])} hot, "
-                               f"{len([a for a in rotation_adjustments.values() if a < 1])} cold themes")
-        except Exception as e:
-            logger.debug(f"Rotation forecast error: {e}")
+        with span('rotation_forecast', provider='rotation_predictor'):
+            rotation_adjustments = {}
+            try:
+                from src.intelligence.rotation_predictor import get_rotation_forecast
+                rotation_forecast = get_rotation_forecast()
+
+                if rotation_forecast.get('ok'):
+                    # Hot themes (rotating in) get boost
+                    for theme in rotation_forecast.get('rotating_in', []):
+                        prob = theme.get('rotation_probability', 0)
+                        if prob > 0.6:
+                            rotation_adjustments[theme['theme_id']] = 1.2  # 20% boost
+                        elif prob > 0.4:
+                            rotation_adjustments[theme['theme_id']] = 1.1  # 10% boost
+
+                    # Cold themes (rotating out) get penalty
+                    for theme in rotation_forecast.get('rotating_out', []):
+                        prob = theme.get('rotation_probability', 0)
+                        if prob > 0.6:
+                            rotation_adjustments[theme['theme_id']] = 0.8  # 20% penalty
+                        elif prob > 0.4:
+                            rotation_adjustments[theme['theme_id']] = 0.9  # 10% penalty
+
+                    if rotation_adjustments:
+                        logger.info(f"Sector rotation: {len([a for a in rotation_adjustments.values() if a > 1])} hot, "
+                                   f"{len([a for a in rotation_adjustments.values() if a < 1])} cold themes")
+            except Exception as e:
+                logger.debug(f"Rotation forecast error: {e}")
 
         # Fetch price data if not provided
-        if price_data_dict is None:
-            logger.info("Fetching price data...")
-            price_data_dict = await self._fetch_price_data(tickers)
+        with span('price_fetch', tickers=len(tickers), prefetched=price_data_dict is not None):
+            if price_data_dict is None:
+                logger.info("Fetching price data...")
+                price_data_dict = await self._fetch_price_data(tickers)
 
         # Create scan tasks
-        tasks = []
-        for ticker in tickers:
-            ticker_price_data = price_data_dict.get(ticker)
-            tasks.append(self.scan_ticker(ticker, ticker_price_data))
-
-        # Run all scans concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        valid_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, dict):
-                valid_results.append(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Scan error for {tickers[i]}: {type(result).__name__}: {result}")
+        with span('ticker_scans', tickers=len(tickers), max_concurrent=self.max_concurrent):
+            tasks = []
+            for ticker in tickers:
+                ticker_price_data = price_data_dict.get(ticker)
+                tasks.append(self.scan_ticker(ticker, ticker_price_data))
+
+            # Run all scans concurrently
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Process results
+            valid_results = []
+            for i, result in enumerate(results):
+                if isinstance(result, dict):
+                    valid_results.append(result)
+                elif isinstance(result, Exception):
+                    logger.error(f"Scan error for {tickers[i]}: {type(result).__name__}: {result}")
 
         # Create DataFrame
-        if valid_results:
-            df_results = pd.DataFrame(valid_results)
-
-            # Apply sector rotation adjustments
-            if rotation_adjustments and 'hottest_theme' in df_results.columns:
-                adjusted_count = 0
-                for idx, row in df_results.iterrows():
-                    theme = row.get('hottest_theme', '')
-                    if theme in rotation_adjustments:
-                        original_score = row['story_score']
-                        adjustment = rotation_adjustments[theme]
-                        df_results.at[idx, 'story_score'] = original_score * adjustment
-                        df_results.at[idx, 'rotation_adjusted'] = True
-                        df_results.at[idx, 'rotation_multiplier'] = adjustment
-                        adjusted_count += 1
-
-                if adjusted_count > 0:
-                    logger.info(f"Applied rotation adjustments to {adjusted_count} tickers")
-
-            df_results['rank'] = df_results['story_score'].rank(ascending=False).astype(int)
-            df_results = df_results.sort_values('story_score', ascending=False)
-        else:
-            df_results = pd.DataFrame()
+        with span('results_frame', results=len(valid_results)):
+            if valid_results:
+                df_results = pd.DataFrame(valid_results)
+
+                # Apply sector rotation adjustments
+                if rotation_adjustments and 'hottest_theme' in df_results.columns:
+                    adjusted_count = 0
+                    for idx, row in df_results.iterrows():
+                        theme = row.get('hottest_theme', '')
+                        if theme in rotation_adjustments:
+                            original_score = row['story_score']
+                            adjustment = rotation_adjustments[theme]
+                            df_results.at[idx, 'story_score'] = original_score * adjustment
+                            df_results.at[idx, 'rotation_adjusted'] = True
+                            df_results.at[idx, 'rotation_multiplier'] = adjustment
+                            adjusted_count += 1
+
+                    if adjusted_count > 0:
+                        logger.info(f"Applied rotation adjustments to {adjusted_count} tickers")
+
+                df_results['rank'] = df_results['story_score'].rank(ascending=False).astype(int)
+                df_results = df_results.sort_values('story_score', ascending=False)
+            else:
+                df_results = pd.DataFrame()
 
         # Optional AI brain ranking for high-scoring tickers
         ai_brain_enabled = os.environ.get('USE_AI_BRAIN_RANKING', '').lower() in ['true', '1', 'yes']
 
         if ai_brain_enabled and not df_results.empty:
-            try:
-                from src.ai.evolutionary_agentic_brain import analyze_opportunity_evolutionary
-
-                logger.info("Running AI brain analysis on top scorers...")
-
-                # Only analyze top 50 tickers to limit AI cost
-                top_tickers = df_results.head(50)
-
-                for idx, row in top_tickers.iterrows():
-                    try:
-                        ticker = row.get('ticker', '')
-                        if not ticker:
+            with span('ai_brain', tickers=min(50, len(df_results))):
+                try:
+                    from src.ai.evolutionary_agentic_brain import analyze_opportunity_evolutionary
+
+                    logger.info("Running AI brain analysis on top scorers...")
+
+                    # Only analyze top 50 tickers to limit AI cost
+                    top_tickers = df_results.head(50)
+
+                    for idx, row in top_tickers.iterrows():
+                        try:
+                            ticker = row.get('ticker', '')
+                            if not ticker:
+                                continue
+
+                            # Analyze with AI brain
+                            decision = analyze_opportunity_evolutionary(
+                                ticker=ticker,
+                                signal_type='story_scan',
+                                signal_data={
+                                    'story_score': row.get('story_score', 0),
+                                    'theme': row.get('hottest_theme', ''),
+                                    'catalyst': row.get('next_catalyst', ''),
+                                    'sentiment': row.get('sentiment_label', 'neutral'),
+                                    'rs_composite': row.get('rs_composite', 0),
+                                    'vol_ratio': row.get('vol_ratio', 1.0),
+                                    'above_20': row.get('above_20', False),
+                                    'price': row.get('price', 0),
+                                }
+                            )
+
+                            # Add AI decision to dataframe
+                            df_results.at[idx, 'ai_decision'] = decision.decision.value
+                            df_results.at[idx, 'ai_confidence'] = decision.confidence
+                            df_results.at[idx, 'ai_reasoning'] = decision.reasoning[:200] if decision.reasoning else ''
+                            df_results.at[idx, 'ai_decision_id'] = decision.decision_id
+
+                        except Exception as e:
+                            logger.debug(f"AI brain analysis failed for {ticker}: {e}")
                             continue
 
-                        # Analyze with AI brain
-                        decision = analyze_opportunity_evolutionary(
-                            ticker=ticker,
-                            signal_type='story_scan',
-                            signal_data={
-                                'story_score': row.get('story_score', 0),
-                                'theme': row.get('hottest_theme', ''),
-                                'catalyst': row.get('next_catalyst', ''),
-                                'sentiment': row.get('sentiment_label', 'neutral'),
-                                'rs_composite': row.get('rs_composite', 0),
-                                'vol_ratio': row.get('vol_ratio', 1.0),
-                                'above_20': row.get('above_20', False),
-                                'price': row.get('price', 0),
-                            }
-                        )
-
-                        # Add AI decision to dataframe
-                        df_results.at[idx, 'ai_decision'] = decision.decision.value
-                        df_results.at[idx, 'ai_confidence'] = decision.confidence
-                        df_results.at[idx, 'ai_reasoning'] = decision.reasoning[:200] if decision.reasoning else ''
-                        df_results.at[idx, 'ai_decision_id'] = decision.decision_id
+                    logger.info(f"✓ AI brain analyzed {len(top_tickers)} tickers")
 
-                    except Exception as e:
-                        logger.debug(f"AI brain analysis failed for {ticker}: {e}")
-                        continue
-
-                logger.info(f"✓ AI brain analyzed {len(top_tickers)} tickers")
-
-            except Exception as e:
-                logger.warning(f"AI brain ranking disabled: {e}")
+                except Exception as e:
+                    logger.warning(f"AI brain ranking disabled: {e}")
 
         # Log stats
         elapsed = time.time() - self._stats['start_time']
@@ -1251,119 +1310,193 @@ class AsyncScanner:
 
         # Record opportunities to learning system
         if learning_brain and not df_results.empty:
-            try:
-                from src.learning.rl_models import ComponentScores, MarketContext
-                from src.scoring.earnings_scorer import get_earnings_scorer
-
-                earnings_scorer = get_earnings_scorer()
-                opportunities_recorded = 0
-
-                # Get market context from SPY
-                spy_data = price_data_dict.get('SPY')
-                spy_change_pct = 0.0
-                if spy_data is not None and len(spy_data) > 1:
-                    try:
-                        spy_close = spy_data['Close'] if 'Close' in spy_data.columns else spy_data.get('close')
-                        if spy_close is not None and len(spy_close) >= 2:
-                            spy_change_pct = ((float(spy_close.iloc[-1]) - float(spy_close.iloc[-2])) /
-                                             float(spy_close.iloc[-2]) * 100)
-                    except (ValueError, TypeError, KeyError) as e:
-                        logger.debug(f"Could not calculate SPY change: {e}")
-
-                market_context = MarketContext(
-                    spy_change_pct=spy_change_pct,
-                    vix_level=15.0  # Default, could fetch real VIX
-                )
-
-                # Initialize X Intelligence (if API key available)
-                x_intel = None
-                try:
-                    from src.intelligence.x_intelligence import get_x_intelligence
-                    if os.environ.get('XAI_API_KEY'):
-                        x_intel = get_x_intelligence()
-                        logger.info("✓ X Intelligence initialized (xAI)")
-                except Exception as e:
-                    logger.debug(f"X Intelligence not available: {e}")
-
-                # Initialize Institutional Flow Tracker
-                inst_flow = None
+            with span('learning_record'):
                 try:
-                    from src.intelligence.institutional_flow import get_flow_tracker
-                    inst_flow = get_flow_tracker()
-                    logger.info("✓ Institutional Flow Tracker initialized")
-                except Exception as e:
-                    logger.debug(f"Institutional Flow Tracker not available: {e}")
+                    from src.learning.rl_models import ComponentScores, MarketContext
+                    from src.scoring.earnings_scorer import get_earnings_scorer
+
+                    earnings_scorer = get_earnings_scorer()
+                    opportunities_recorded = 0
+
+                    # Get market context from SPY
+                    spy_data = price_data_dict.get('SPY')
+                    spy_change_pct = 0.0
+                    if spy_data is not None and len(spy_data) > 1:
+                        try:
+                            spy_close = spy_data['Close'] if 'Close' in spy_data.columns else spy_data.get('close')
+                            if spy_close is not None and len(spy_close) >= 2:
+                                spy_change_pct = ((float(spy_close.iloc[-1]) - float(spy_close.iloc[-2])) /
+                                                 float(spy_close.iloc[-2]) * 100)
+                        except (ValueError, TypeError, KeyError) as e:
+                            logger.debug(f"Could not calculate SPY change: {e}")
+
+                    market_context = MarketContext(
+                        spy_change_pct=spy_change_pct,
+                        vix_level=15.0  # Default, could fetch real VIX
+                    )
+
+                    # Initialize X Intelligence (if API key available)
+                    x_intel = None
+                    try:
+                        from src.intelligence.x_intelligence import get_x_intelligence
+                        if os.environ.get('XAI_API_KEY'):
+                            x_intel = get_x_intelligence()
+                            logger.info("✓ X Intelligence initialized (xAI)")
+                    except Exception as e:
+                        logger.debug(f"X Intelligence not available: {e}")
 
-                # Record top opportunities (limit to top 50 to avoid overwhelming the system)
-                for _, row in df_results.head(50).iterrows():
+                    # Initialize Institutional Flow Tracker
+                    inst_flow = None
                     try:
-                        ticker = row.get('ticker', '')
-                        if not ticker:
+                        from src.intelligence.institutional_flow import get_flow_tracker
+                        inst_flow = get_flow_tracker()
+                        logger.info("✓ Institutional Flow Tracker initialized")
+                    except Exception as e:
+                        logger.debug(f"Institutional Flow Tracker not available: {e}")
+
+                    # Record top opportunities (limit to top 50 to avoid overwhelming the system)
+                    for _, row in df_results.head(50).iterrows():
+                        try:
+                            ticker = row.get('ticker', '')
+                            if not ticker:
+                                continue
+
+                            # Get earnings score
+                            earnings_confidence = earnings_scorer.score(ticker)
+
+                            # Get X sentiment (if available)
+                            x_sentiment_score = 0.5  # Default neutral
+                            if x_intel:
+                                try:
+                                    x_sentiment = x_intel.get_ticker_sentiment(ticker)
+                                    x_sentiment_score = x_sentiment.sentiment_score
+                                    logger.debug(f"{ticker}: X sentiment = {x_sentiment.sentiment} ({x_sentiment_score:.2f})")
+                                except Exception as e:
+                                    logger.debug(f"Failed to get X sentiment for {ticker}: {e}")
+
+                            # Get institutional flow (if available)
+                            institutional_score = 0.5  # Default neutral
+                            if inst_flow:
+                                try:
+                                    inst_signals = inst_flow.get_institutional_signals(ticker)
+                                    if inst_signals:
+                                        # Average strength across all institutional signals
+                                        total_strength = sum(s.strength for s in inst_signals)
+                                        avg_strength = total_strength / len(inst_signals)
+                                        institutional_score = avg_strength / 100  # Normalize to 0-1
+                                        logger.debug(f"{ticker}: Institutional flow = {institutional_score:.2f} ({len(inst_signals)} signals)")
+                                except Exception as e:
+                                    logger.debug(f"Failed to get institutional flow for {ticker}: {e}")
+
+                            # Create component scores from scan results
+                            scores = ComponentScores(
+                                theme_score=row.get('story_quality', {}).get('theme_strength', 0) if isinstance(row.get('story_quality'), dict) else 0,
+                                technical_score=row.get('confirmation', {}).get('score', 0) if isinstance(row.get('confirmation'), dict) else 0,
+                                ai_confidence=0.5,  # Default, could integrate AI brain later
+                                x_sentiment_score=x_sentiment_score,  # Now using real X Intelligence!
+                                earnings_confidence=earnings_confidence,
+                                institutional_flow_score=institutional_score  # Component #40: Smart money tracking
+                            )
+
+                            learning_brain.record_opportunity(
+                                ticker=ticker,
+                                scores=scores,
+                                market_context=market_context
+                            )
+                            opportunities_recorded += 1
+
+                        except (ValueError, TypeError, KeyError) as e:
+                            logger.debug(f"Could not record opportunity for {ticker}: {e}")
                             continue
 
-                        # Get earnings score
-                        earnings_confidence = earnings_scorer.score(ticker)
-
-                        # Get X sentiment (if available)
-                        x_sentiment_score = 0.5  # Default neutral
-                        if x_intel:
-                            try:
-                                x_sentiment = x_intel.get_ticker_sentiment(ticker)
-                                x_sentiment_score = x_sentiment.sentiment_score
-                                logger.debug(f"{ticker}: X sentiment = {x_sentiment.sentiment} ({x_sentiment_score:.2f})")
-                            except Exception as e:
-                                logger.debug(f"Failed to get X sentiment for {ticker}: {e}")
-
-                        # Get institutional flow (if available)
-                        institutional_score = 0.5  # Default neutral
-                        if inst_flow:
-                            try:
-                                inst_signals = inst_flow.get_institutional_signals(ticker)
-                                if inst_signals:
-                                    # Average strength across all institutional signals
-                                    total_strength = sum(s.strength for s in inst_signals)
-                                    avg_strength = total_strength / len(inst_signals)
-                                    institutional_score = avg_strength / 100  # Normalize to 0-1
-                                    logger.debug(f"{ticker}: Institutional flow = {institutional_score:.2f} ({len(inst_signals)} signals)")
-                            except Exception as e:
-                                logger.debug(f"Failed to get institutional flow for {ticker}: {e}")
-
-                        # Create component scores from scan results
-                        scores = ComponentScores(
-                            theme_score=row.get('story_quality', {}).get('theme_strength', 0) if isinstance(row.get('story_quality'), dict) else 0,
-                            technical_score=row.get('confirmation', {}).get('score', 0) if isinstance(row.get('confirmation'), dict) else 0,
-                            ai_confidence=0.5,  # Default, could integrate AI brain later
-                            x_sentiment_score=x_sentiment_score,  # Now using real X Intelligence!
-                            earnings_confidence=earnings_confidence,
-                            institutional_flow_score=institutional_score  # Component #40: Smart money tracking
-                        )
-
-                        learning_brain.record_opportunity(
-                            ticker=ticker,
-                            scores=scores,
-                            market_context=market_context
-                        )
-                        opportunities_recorded += 1
-
-                    except (ValueError, TypeError, KeyError) as e:
-                        logger.debug(f"Could not record opportunity for {ticker}: {e}")
-                        continue
-
-                logger.info(f"✓ Recorded {opportunities_recorded} opportunities to learning system")
+                    logger.info(f"✓ Recorded {opportunities_recorded} opportunities to learning system")
 
-            except Exception as e:
-                logger.warning(f"Failed to record opportunities to learning system: {e}")
+                except Exception as e:
+                    logger.warning(f"Failed to record opportunities to learning system: {e}")
 
         # Save results to CSV for dashboard
         if not df_results.empty:
-            from datetime import datetime
-            timestamp = datetime.now().strftime('%Y%m%d')
-            csv_filename = f'scan_{timestamp}.csv'
-            df_results.to_csv(csv_filename, index=False)
-            logger.info(f"Saved scan results to {csv_filename}")
+            with span('csv_write', rows=len(df_results)):
+                df_results.to_csv(csv_filename, index=False)
+                logger.info(f"Saved scan results to {csv_filename}")
+
+        trace.attributes.update({
+            'tickers': len(tickers),
+            'results': len(df_results),
+            'scanned': self._stats['scanned'],
+            'errors': self._stats['errors'],
+        })
 
         return df_results, price_data_dict
 
+    async def scan_shard(
+        self,
+        tickers: List[str],
+        price_data_dict: Dict[str, pd.DataFrame] = None,
+        shard_id: int = 0,
+    ) -> Dict:
+        """
+        Scan one shard of a distributed scan.
+
+        The shard's price panel (its tickers plus SPY) is fetched in one
+        batch and shared by every ticker, and tickers run concurrently up
+        to max_concurrent. Ranking, rotation adjustments and output files
+        are left to whoever merges the shards.
+
+        Returns:
+            Dict with shard id, raw ticker results, failed tickers, stats
+            and the shard's trace summary
+        """
+        self._stats['start_time'] = time.time()
+        trace = ScanTrace(name=f'scan_shard_{shard_id}')
+        trace.attributes.update(shard=shard_id, tickers=len(tickers))
+
+        with trace.activate(), params.pinned_snapshot():
+            with span('price_fetch', tickers=len(tickers), prefetched=price_data_dict is not None):
+                if price_data_dict is None:
+                    price_data_dict = await self._fetch_price_data(tickers)
+
+            with span('ticker_scans', tickers=len(tickers), max_concurrent=self.max_concurrent):
+                outcomes = await asyncio.gather(
+                    *(self.scan_ticker(ticker, price_data_dict.get(ticker)) for ticker in tickers),
+                    return_exceptions=True,
+                )
+
+        trace.end()
+        results = [r for r in outcomes if isinstance(r, dict)]
+        failed = [ticker for ticker, r in zip(tickers, outcomes) if not isinstance(r, dict)]
+
+        return {
+            'shard': shard_id,
+            'results': results,
+            'failed': failed,
+            'stats': {
+                'tickers': len(tickers),
+                'scanned': len(results),
+                'errors': len(failed),
+                'price_panel': len(price_data_dict),
+                'elapsed': round(time.time() - self._stats['start_time'], 1),
+            },
+            'trace': trace.summary(),
+        }
+
+    def _write_trace(self, trace: ScanTrace, csv_filename: str) -> None:
+        """Write the scan trace next to the CSV output."""
+        trace.end()
+        try:
+            path = trace.write(trace_path_for(csv_filename))
+            summary = trace.summary()['spans']
+            slowest = sorted(
+                (name for name in summary if not name.startswith('fetch.') and name != 'scan_ticker'),
+                key=lambda name: summary[name]['total_seconds'], reverse=True,
+            )[:3]
+            logger.info(
+                f"Scan trace written to {path} ({len(trace.spans)} spans); slowest stages: "
+                + ", ".join(f"{name} {summary[name]['total_seconds']:.1f}s" for name in slowest)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write scan trace: {e}")
+
     async def close(self) -> None:
         """Clean up resources."""
         await self.client.close()
@@ -1419,6 +1552,106 @@ def run_async_scan_sync(
     return asyncio.run(run_async_scan(tickers, max_concurrent, learning_brain))
 
 
+# =============================================================================
+# SHARDED SCANS
+# =============================================================================
+
+def split_into_shards(tickers: List[str], num_shards: int) -> List[List[str]]:
+    """
+    Split tickers into up to num_shards contiguous chunks of near-equal size.
+
+    Duplicates are dropped (first occurrence wins); empty shards are not
+    returned.
+    """
+    unique = list(dict.fromkeys(tickers))
+    num_shards = max(1, min(num_shards, len(unique)))
+    size, extra = divmod(len(unique), num_shards)
+
+    shards = []
+    start = 0
+    for i in range(num_shards):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            shards.append(unique[start:end])
+        start = end
+    return shards
+
+
+async def scan_shard_async(
+    tickers: List[str],
+    shard_id: int = 0,
+    max_concurrent: int = 50,
+) -> Dict:
+    """Scan one shard with a fresh AsyncScanner (one HTTP session per shard)."""
+    scanner = AsyncScanner(max_concurrent=max_concurrent)
+    try:
+        return await scanner.scan_shard(tickers, shard_id=shard_id)
+    finally:
+        await scanner.close()
+
+
+def scan_shard_sync(
+    tickers: List[str],
+    shard_id: int = 0,
+    max_concurrent: int = 50,
+) -> Dict:
+    """
+    Synchronous wrapper for scan_shard_async (entry point for shard workers).
+
+    Usage:
+        for shard_id, shard in enumerate(split_into_shards(tickers, 10)):
+            output = scan_shard_sync(shard, shard_id)
+    """
+    return asyncio.run(scan_shard_async(tickers, shard_id, max_concurrent))
+
+
+class ShardMerger:
+    """
+    Merges shard outputs as they arrive.
+
+    Shards may complete in any order; results are kept per ticker so a
+    retried shard does not produce duplicates.
+    """
+
+    def __init__(self, expected_shards: int = 0):
+        self.expected_shards = expected_shards
+        self.shards_done = 0
+        self.results: Dict[str, Dict] = {}
+        self.failed: Dict[str, str] = {}
+        self.shard_stats: List[Dict] = []
+
+    def add(self, output: Dict) -> None:
+        """Merge one shard output (see AsyncScanner.scan_shard)."""
+        self.shards_done += 1
+        for result in output.get('results', []):
+            ticker = result.get('ticker')
+            if ticker:
+                self.results[ticker] = result
+                self.failed.pop(ticker, None)
+        for ticker in output.get('failed', []):
+            if ticker not in self.results:
+                self.failed[ticker] = output.get('error', 'Scan failed')
+        self.shard_stats.append({'shard': output.get('shard'), **output.get('stats', {})})
+
+    def add_failed_shard(self, shard_id: int, tickers: List[str], error: str) -> None:
+        """Record a shard that crashed before returning any results."""
+        self.add({
+            'shard': shard_id, 'results': [], 'failed': tickers, 'error': error,
+            'stats': {'tickers': len(tickers), 'scanned': 0, 'errors': len(tickers)},
+        })
+
+    def progress(self) -> str:
+        total = f"/{self.expected_shards}" if self.expected_shards else ""
+        return f"{self.shards_done}{total} shards, {len(self.results)} scanned, {len(self.failed)} failed"
+
+    def get_results(self) -> List[Dict]:
+        """Successful results, highest story score first."""
+        return sorted(self.results.values(), key=lambda r: r.get('story_score') or 0, reverse=True)
+
+    def get_failures(self) -> List[Dict]:
+        return [{'ticker': ticker, 'error': error} for ticker, error in self.failed.items()]
+
+
 # =============================================================================
 # QUICK TEST
 # =============================================================================
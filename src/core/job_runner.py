@@ -0,0 +1,250 @@
+"""
+Dependency-Aware Job Runner
+
+Runs a small DAG of jobs (the cron bundles' _run_* steps) on a thread
+pool. Each job declares the jobs it depends on; a job starts as soon as
+all of them have finished, so independent jobs overlap and a bundle's
+wall time is bounded by its longest dependency chain.
+
+Dependencies order jobs but do not gate them: as in the sequential
+bundles, a job still runs when an upstream job failed (alerts fall back
+to the previous scan) and its result notes the failed upstreams.
+
+Jobs run in threads, so a per-job timeout cannot stop the job itself; a
+timed-out job is reported as 'timeout', its dependents are released and
+the runner stops waiting on it.
+
+Usage:
+    runner = JobRunner('morning_mega')
+    runner.add('daily_scan', _run_daily_scan, timeout=2400)
+    runner.add('conviction', _run_conviction_alerts, depends_on=['daily_scan'])
+    report = runner.run()
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_TIMEOUT = 'timeout'
+STATUS_SKIPPED = 'skipped'
+
+
+@dataclass
+class Job:
+    """A named step with its dependencies."""
+    name: str
+    func: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+    condition: Optional[Callable[[], bool]] = None  # Skipped when this returns False
+
+
+@dataclass
+class JobResult:
+    """Outcome and timing of one job."""
+    name: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
+    upstream_failed: List[str] = field(default_factory=list)
+    start_offset: float = 0.0
+    duration: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'status': self.status,
+            'error': self.error,
+            'depends_on': self.depends_on,
+            'upstream_failed': self.upstream_failed,
+            'start_offset_seconds': round(self.start_offset, 3),
+            'duration_seconds': round(self.duration, 3),
+        }
+
+
+class JobRunner:
+    """
+    Runs jobs in dependency order with bounded parallelism.
+    """
+
+    def __init__(self, name: str, max_workers: int = 8, default_timeout: Optional[float] = None):
+        self.name = name
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.jobs: Dict[str, Job] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        depends_on: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        condition: Optional[Callable[[], bool]] = None,
+    ) -> 'JobRunner':
+        """Register a job. Dependencies must be added before the job."""
+        if name in self.jobs:
+            raise ValueError(f"Duplicate job: {name}")
+        depends_on = list(depends_on or [])
+        unknown = [d for d in depends_on if d not in self.jobs]
+        if unknown:
+            raise ValueError(f"Job {name} depends on unknown jobs: {unknown}")
+        self.jobs[name] = Job(name, func, depends_on, timeout, condition)
+        return self
+
+    def _run_job(self, job: Job, t0: float, upstream_failed: List[str]) -> JobResult:
+        started = time.perf_counter()
+        result = JobResult(
+            name=job.name, status=STATUS_OK, depends_on=job.depends_on,
+            upstream_failed=upstream_failed, start_offset=started - t0,
+        )
+        try:
+            if job.condition is not None and not job.condition():
+                result.status = STATUS_SKIPPED
+                result.result = {'success': True, 'skipped': True}
+            else:
+                result.result = job.func()
+        except Exception as e:
+            logger.error(f"[{self.name}] {job.name} failed: {e}", exc_info=True)
+            result.status = STATUS_ERROR
+            result.error = str(e)
+            result.result = {'success': False, 'error': str(e)}
+        result.duration = time.perf_counter() - started
+        return result
+
+    def run(self) -> Dict:
+        """
+        Run all jobs and return the timing report.
+
+        Returns:
+            Dict with per-job results and a timing report (wall time, the
+            serial sum of job durations and the critical path)
+        """
+        t0 = time.perf_counter()
+        started_at = datetime.now(timezone.utc)
+        finished: Dict[str, JobResult] = {}
+        running: Dict[Future, Job] = {}
+        deadlines: Dict[Future, float] = {}
+        pending = dict(self.jobs)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"job-{self.name}")
+        try:
+            while pending or running:
+                # Start every job whose dependencies are done
+                for name, job in list(pending.items()):
+                    if all(dep in finished for dep in job.depends_on):
+                        del pending[name]
+                        upstream_failed = [d for d in job.depends_on if finished[d].status in (STATUS_ERROR, STATUS_TIMEOUT)]
+                        logger.info(f"[{self.name}] starting {name}")
+                        future = executor.submit(self._run_job, job, t0, upstream_failed)
+                        running[future] = job
+                        timeout = job.timeout if job.timeout is not None else self.default_timeout
+                        if timeout is not None:
+                            deadlines[future] = time.perf_counter() + timeout
+
+                if not running:
+                    break
+
+                wait_for = None
+                if deadlines:
+                    wait_for = max(0.0, min(deadlines.values()) - time.perf_counter())
+                done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    job = running.pop(future)
+                    deadlines.pop(future, None)
+                    finished[job.name] = future.result()
+                    logger.info(f"[{self.name}] {job.name} {finished[job.name].status} "
+                                f"in {finished[job.name].duration:.1f}s")
+
+                now = time.perf_counter()
+                for future, deadline in list(deadlines.items()):
+                    if now >= deadline and not future.done():
+                        job = running.pop(future)
+                        del deadlines[future]
+                        elapsed = job.timeout if job.timeout is not None else self.default_timeout
+                        logger.warning(f"[{self.name}] {job.name} timed out after {elapsed}s")
+                        finished[job.name] = JobResult(
+                            name=job.name, status=STATUS_TIMEOUT, depends_on=job.depends_on,
+                            error=f"Timed out after {elapsed}s",
+                            result={'success': False, 'error': f"Timed out after {elapsed}s"},
+                            start_offset=deadline - elapsed - t0, duration=elapsed,
+                        )
+        finally:
+            # Do not block on timed-out jobs still running in their threads
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        wall = time.perf_counter() - t0
+        report = self._timing_report(finished, wall, started_at)
+        self._record_metrics(finished)
+        return {
+            'results': {name: finished[name].result for name in self.jobs if name in finished},
+            'timing': report,
+        }
+
+    def _critical_path(self, finished: Dict[str, JobResult]) -> List[str]:
+        """Longest chain of job durations through the dependency graph."""
+        best: Dict[str, float] = {}
+        prev: Dict[str, Optional[str]] = {}
+        for name, job in self.jobs.items():  # Insertion order is topological
+            duration = finished[name].duration if name in finished else 0.0
+            parent = max(job.depends_on, key=lambda d: best[d], default=None)
+            best[name] = duration + (best[parent] if parent else 0.0)
+            prev[name] = parent
+
+        if not best:
+            return []
+        node = max(best, key=best.get)
+        path = []
+        while node is not None:
+            path.append(node)
+            node = prev[node]
+        return list(reversed(path))
+
+    def _timing_report(self, finished: Dict[str, JobResult], wall: float, started_at: datetime) -> Dict:
+        critical_path = self._critical_path(finished)
+        serial = sum(r.duration for r in finished.values())
+        return {
+            'bundle': self.name,
+            'started_at': started_at.isoformat(),
+            'wall_seconds': round(wall, 3),
+            'serial_seconds': round(serial, 3),
+            'critical_path': critical_path,
+            'critical_path_seconds': round(sum(finished[n].duration for n in critical_path if n in finished), 3),
+            'statuses': {
+                status: sum(1 for r in finished.values() if r.status == status)
+                for status in (STATUS_OK, STATUS_ERROR, STATUS_TIMEOUT, STATUS_SKIPPED)
+            },
+            'jobs': {name: finished[name].to_dict() for name in self.jobs if name in finished},
+        }
+
+    def _record_metrics(self, finished: Dict[str, JobResult]) -> None:
+        try:
+            from src.core.performance import perf_monitor
+            for result in finished.values():
+                perf_monitor.record('cron_job', result.duration, bundle=self.name, job=result.name, status=result.status)
+        except Exception as e:
+            logger.debug(f"Failed to record job metrics: {e}")
+
+
+def format_timing_report(report: Dict) -> str:
+    """Human-readable timing table for bundle logs."""
+    lines = [
+        f"{'job':32s} {'status':8s} {'start':>8s} {'dur':>8s}",
+        "-" * 60,
+    ]
+    jobs = sorted(report['jobs'].items(), key=lambda item: item[1]['start_offset_seconds'])
+    for name, job in jobs:
+        lines.append(f"{name:32s} {job['status']:8s} {job['start_offset_seconds']:7.1f}s {job['duration_seconds']:7.1f}s")
+    lines.append("-" * 60)
+    lines.append(
+        f"wall {report['wall_seconds']:.1f}s vs serial {report['serial_seconds']:.1f}s; "
+        f"critical path: {' -> '.join(report['critical_path'])} ({report['critical_path_seconds']:.1f}s)"
+    )
+    return "\n".join(lines)
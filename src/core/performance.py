@@ -9,9 +9,13 @@ Date: February 1, 2026
 """
 
 import asyncio
+import math
+import re
+import threading
 import time
+from datetime import datetime, timezone
 from functools import wraps, lru_cache
-from typing import Callable, Any, List, Dict
+from typing import Callable, Any, List, Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -114,57 +118,302 @@ async def parallel_fetch(fetchers: List[Callable], *args, **kwargs) -> List[Any]
 # PERFORMANCE MONITORING
 # =============================================================================
 
-class PerformanceMonitor:
-    """Monitor function execution times and track metrics"""
+class LatencyHistogram:
+    """
+    Fixed-memory streaming latency histogram (HDR-style, log-linear buckets).
+
+    Each power-of-two range of durations is split into SUB_BUCKETS linear
+    sub-buckets, so quantiles carry a relative error below 1/SUB_BUCKETS
+    (~1.6%) regardless of how many samples are recorded. Histograms with
+    the same layout merge by adding counts, which makes combining stats
+    from several workers cheap.
+    """
+
+    SUB_BUCKETS = 64
+    MIN_EXPONENT = -20   # 2^-21 s ~ 0.5 microseconds
+    MAX_EXPONENT = 13    # 2^13 s ~ 2.3 hours
+    NUM_BUCKETS = (MAX_EXPONENT - MIN_EXPONENT + 1) * SUB_BUCKETS
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
 
     def __init__(self):
-        self.metrics = {}
-        self.call_counts = {}
+        self.counts = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    @classmethod
+    def _bucket_index(cls, value: float) -> int:
+        """Map a duration (seconds) to its bucket index."""
+        if value <= 0:
+            return 0
+        mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent
+        if exponent < cls.MIN_EXPONENT:
+            return 0
+        if exponent > cls.MAX_EXPONENT:
+            return cls.NUM_BUCKETS - 1
+        sub = int((mantissa * 2 - 1) * cls.SUB_BUCKETS)
+        return (exponent - cls.MIN_EXPONENT) * cls.SUB_BUCKETS + sub
+
+    @classmethod
+    def _bucket_value(cls, index: int) -> float:
+        """Representative (midpoint) duration for a bucket index."""
+        exponent, sub = divmod(index, cls.SUB_BUCKETS)
+        exponent += cls.MIN_EXPONENT
+        return math.ldexp(0.5 * (1 + (sub + 0.5) / cls.SUB_BUCKETS), exponent)
+
+    def record(self, value: float):
+        """Record one duration in seconds."""
+        self.counts[self._bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        """Add another histogram's samples into this one."""
+        if other.count == 0:
+            return self
+        counts = self.counts
+        for i, c in enumerate(other.counts):
+            if c:
+                counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile q (0-1)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c:
+                seen += c
+                if seen >= rank:
+                    if i == self.NUM_BUCKETS - 1:
+                        return self.max  # overflow bucket
+                    return min(max(self._bucket_value(i), self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Sparse serializable form for shipping between workers."""
+        return {
+            'buckets': {i: c for i, c in enumerate(self.counts) if c},
+            'count': self.count,
+            'total': self.total,
+            'min': self.min if self.count else None,
+            'max': self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        """Rebuild a histogram from to_dict() output."""
+        hist = cls()
+        for i, c in data.get('buckets', {}).items():
+            hist.counts[int(i)] = c
+        hist.count = data.get('count', 0)
+        hist.total = data.get('total', 0.0)
+        hist.min = data['min'] if data.get('min') is not None else float('inf')
+        hist.max = data.get('max', 0.0)
+        return hist
 
-    def record(self, name: str, duration: float):
-        """Record a performance metric"""
-        if name not in self.metrics:
-            self.metrics[name] = []
-            self.call_counts[name] = 0
 
-        self.metrics[name].append(duration)
-        self.call_counts[name] += 1
+def _label_key(labels: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """Canonical hashable form of a label set."""
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
 
-        # Keep only last 1000 measurements
-        if len(self.metrics[name]) > 1000:
-            self.metrics[name] = self.metrics[name][-1000:]
 
-    def get_stats(self, name: str) -> Dict[str, float]:
-        """Get statistics for a metric"""
-        if name not in self.metrics or not self.metrics[name]:
+class PerformanceMonitor:
+    """
+    Monitor function execution times and track metrics.
+
+    Every (metric, labels) series keeps one LatencyHistogram per UTC day,
+    so memory is fixed per series and questions like "p99 of Polygon
+    latency today" are answered without storing raw samples.
+
+    Example:
+        perf_monitor.record('provider_request', 0.12, provider='polygon')
+        perf_monitor.get_stats('provider_request', day='today', provider='polygon')
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, retention_days: int = 7):
+        self.retention_days = retention_days
+        # name -> label key -> day -> histogram
+        self.metrics: Dict[str, Dict[Tuple, Dict[str, LatencyHistogram]]] = {}
+        self.call_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+    def record(self, name: str, duration: float, **labels):
+        """Record a performance metric, optionally tagged with labels."""
+        key = _label_key(labels)
+        day = self._today()
+
+        with self._lock:
+            series = self.metrics.get(name)
+            if series is None:
+                series = self.metrics[name] = {}
+                self.call_counts[name] = 0
+
+            days = series.get(key)
+            if days is None:
+                days = series[key] = {}
+
+            hist = days.get(day)
+            if hist is None:
+                hist = days[day] = LatencyHistogram()
+                self._expire(days)
+
+            hist.record(duration)
+            self.call_counts[name] += 1
+
+    def _expire(self, days: Dict[str, LatencyHistogram]):
+        """Drop day histograms past the retention window."""
+        if len(days) > self.retention_days:
+            for old in sorted(days)[:-self.retention_days]:
+                del days[old]
+
+    def _select(self, name: str, day: str = None, labels: Dict[str, Any] = None) -> LatencyHistogram:
+        """Merge every histogram of a metric matching the day and label filter."""
+        if day == 'today':
+            day = self._today()
+        wanted = set(_label_key(labels or {}))
+
+        merged = LatencyHistogram()
+        with self._lock:
+            for key, days in self.metrics.get(name, {}).items():
+                if not wanted.issubset(key):
+                    continue
+                for d, hist in days.items():
+                    if day is None or d == day:
+                        merged.merge(hist)
+        return merged
+
+    def get_histogram(self, name: str, day: str = None, **labels) -> LatencyHistogram:
+        """
+        Get a merged histogram for a metric.
+
+        Args:
+            name: Metric name
+            day: 'today', a 'YYYY-MM-DD' UTC date, or None for all retained days
+            **labels: Only include series carrying these label values
+        """
+        return self._select(name, day, labels)
+
+    def get_stats(self, name: str, day: str = None, **labels) -> Dict[str, float]:
+        """Get statistics for a metric (see get_histogram for filters)"""
+        hist = self._select(name, day, labels)
+        if hist.count == 0:
             return {}
 
-        measurements = self.metrics[name]
         return {
-            'count': len(measurements),
+            'count': hist.count,
             'total_calls': self.call_counts.get(name, 0),
-            'avg': sum(measurements) / len(measurements),
-            'min': min(measurements),
-            'max': max(measurements),
-            'p50': sorted(measurements)[len(measurements) // 2],
-            'p95': sorted(measurements)[int(len(measurements) * 0.95)],
-            'p99': sorted(measurements)[int(len(measurements) * 0.99)]
+            'avg': hist.total / hist.count,
+            'min': hist.min,
+            'max': hist.max,
+            'p50': hist.quantile(0.5),
+            'p95': hist.quantile(0.95),
+            'p99': hist.quantile(0.99)
         }
 
-    def get_all_stats(self) -> Dict[str, Dict[str, float]]:
+    def get_all_stats(self, day: str = None) -> Dict[str, Dict[str, float]]:
         """Get statistics for all metrics"""
-        return {name: self.get_stats(name) for name in self.metrics.keys()}
+        return {name: self.get_stats(name, day=day) for name in list(self.metrics.keys())}
+
+    def get_labeled_stats(self, name: str, day: str = None) -> List[Dict[str, Any]]:
+        """Get statistics for each label set of a metric."""
+        with self._lock:
+            keys = list(self.metrics.get(name, {}).keys())
+        return [
+            {'labels': dict(key), **self.get_stats(name, day, **dict(key))}
+            for key in keys
+        ]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Serializable copy of all histograms (for merging across workers)."""
+        with self._lock:
+            return {
+                'call_counts': dict(self.call_counts),
+                'series': [
+                    {'name': name, 'labels': dict(key), 'day': day, 'histogram': hist.to_dict()}
+                    for name, series in self.metrics.items()
+                    for key, days in series.items()
+                    for day, hist in days.items()
+                ],
+            }
+
+    def merge_snapshot(self, snapshot: Dict[str, Any]):
+        """Merge another worker's snapshot() into this monitor."""
+        with self._lock:
+            for entry in snapshot.get('series', []):
+                name = entry['name']
+                series = self.metrics.setdefault(name, {})
+                self.call_counts.setdefault(name, 0)
+                days = series.setdefault(_label_key(entry['labels']), {})
+                hist = days.setdefault(entry['day'], LatencyHistogram())
+                hist.merge(LatencyHistogram.from_dict(entry['histogram']))
+                self._expire(days)
+            for name, calls in snapshot.get('call_counts', {}).items():
+                self.call_counts[name] = self.call_counts.get(name, 0) + calls
+
+    def to_prometheus(self, day: str = None, prefix: str = 'stockstory') -> str:
+        """
+        Export all metrics in Prometheus text format (summary type).
+
+        Each label set becomes one series with p50/p95/p99 quantiles plus
+        _sum and _count, in seconds.
+        """
+        lines = []
+        for name in sorted(self.metrics.keys()):
+            metric = re.sub(r'[^a-zA-Z0-9_]', '_', f"{prefix}_{name}_seconds")
+            lines.append(f"# TYPE {metric} summary")
+
+            with self._lock:
+                keys = sorted(self.metrics[name].keys())
+            for key in keys:
+                hist = self._select(name, day, dict(key))
+                if hist.count == 0:
+                    continue
+                base = [f'{k}="{_escape_label(v)}"' for k, v in key]
+                for q in self.QUANTILES:
+                    label_str = ','.join(base + [f'quantile="{q}"'])
+                    lines.append(f"{metric}{{{label_str}}} {hist.quantile(q):.6g}")
+                suffix = '{' + ','.join(base) + '}' if base else ''
+                lines.append(f"{metric}_sum{suffix} {hist.total:.6g}")
+                lines.append(f"{metric}_count{suffix} {hist.count}")
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
 
 # Global monitor instance
 perf_monitor = PerformanceMonitor()
 
 
-def monitor_performance(name: str = None):
+def monitor_performance(name: str = None, **labels):
     """
     Decorator to monitor function performance
 
     Args:
         name: Metric name (defaults to function name)
+        **labels: Static labels attached to every sample
 
     Example:
         @monitor_performance()
@@ -182,7 +431,7 @@ def monitor_performance(name: str = None):
                 return result
             finally:
                 duration = time.time() - start_time
-                perf_monitor.record(metric_name, duration)
+                perf_monitor.record(metric_name, duration, **labels)
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -192,7 +441,7 @@ def monitor_performance(name: str = None):
                 return result
             finally:
                 duration = time.time() - start_time
-                perf_monitor.record(metric_name, duration)
+                perf_monitor.record(metric_name, duration, **labels)
 
         return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
 
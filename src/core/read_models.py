@@ -0,0 +1,280 @@
+"""
+API Read Models
+===============
+
+Precomputed, serialized payloads for dashboard endpoints that are polled
+every few seconds from many tabs.
+
+A read model is a builder function plus a freshness rule (a TTL and/or a
+cheap version check, e.g. the latest scan file's mtime). The store keeps
+the encoded JSON body and a content hash per model (and per query key),
+rebuilds it only when stale, and serves it with an ETag so unchanged
+polls get a 304 with no body. A background refresher rebuilds models that
+are being read before they go stale, so polls rarely pay for a build.
+
+Usage:
+    store = get_read_model_store()
+    store.register('scan', build_scan, ttl=300, version=latest_scan_version)
+
+    @web_app.get("/scan")
+    def scan(request: Request):
+        return store.respond(request, 'scan')
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 60  # Seconds before a snapshot is rebuilt
+MAX_KEYS = 32  # Snapshots kept per model (one per distinct query key)
+IDLE_SECONDS = 600  # Background refresh stops for snapshots nobody reads
+ERROR_TTL = 30  # Error payloads ({"ok": False, ...}) are retried sooner
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def _default(obj):
+    """Fallback for types neither encoder handles (numpy scalars, sets, dates)."""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def encode_json(payload: Any) -> bytes:
+    """Serialize a payload to JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_default, separators=(',', ':')).encode()
+
+
+def content_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches the ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+# =============================================================================
+# READ MODELS
+# =============================================================================
+
+@dataclass
+class Snapshot:
+    """One materialized payload."""
+    body: bytes
+    etag: str
+    built_at: float
+    version: Hashable = None
+    read_at: float = 0.0
+    ttl: Optional[float] = None  # Overrides the model's TTL (error payloads)
+
+
+@dataclass
+class ReadModel:
+    name: str
+    builder: Callable[..., Any]  # builder() or builder(key) -> JSON-serializable payload
+    ttl: float = DEFAULT_TTL
+    version: Optional[Callable[..., Hashable]] = None  # version() or version(key)
+
+
+class ReadModelStore:
+    """Registered read models and their materialized snapshots."""
+
+    def __init__(self):
+        self._models: Dict[str, ReadModel] = {}
+        self._snapshots: Dict[str, OrderedDict] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._refresher: Optional[asyncio.Task] = None
+
+    def register(self, name: str, builder: Callable[..., Any], ttl: float = DEFAULT_TTL,
+                 version: Callable[..., Hashable] = None):
+        """
+        Register a read model.
+
+        Args:
+            builder: Builds the payload; called with the query key when
+                the model is read with one
+            ttl: Seconds a snapshot is served before it's rebuilt
+            version: Cheap check (e.g. source file mtime); a snapshot is
+                rebuilt as soon as it changes
+        """
+        with self._lock:
+            self._models[name] = ReadModel(name, builder, ttl, version)
+            self._snapshots[name] = OrderedDict()
+            self._locks[name] = threading.Lock()
+
+    @staticmethod
+    def _call(func: Callable, key: Hashable):
+        return func() if key is None else func(key)
+
+    def _is_fresh(self, model: ReadModel, snapshot: Optional[Snapshot], key: Hashable, now: float) -> bool:
+        ttl = model.ttl if snapshot is None or snapshot.ttl is None else snapshot.ttl
+        if snapshot is None or now - snapshot.built_at > ttl:
+            return False
+        if model.version is not None:
+            try:
+                return self._call(model.version, key) == snapshot.version
+            except Exception as e:
+                logger.debug(f"Read model {model.name} version check failed: {e}")
+        return True
+
+    def _build(self, model: ReadModel, key: Hashable) -> Snapshot:
+        version = self._call(model.version, key) if model.version is not None else None
+        payload = self._call(model.builder, key)
+        body = encode_json(payload)
+        ttl = min(model.ttl, ERROR_TTL) if isinstance(payload, dict) and payload.get('ok') is False else None
+        previous = self._snapshots[model.name].get(key)
+        if previous is not None and previous.body == body:
+            # Same content: keep the ETag, just mark it rebuilt
+            previous.built_at, previous.version, previous.ttl = time.time(), version, ttl
+            return previous
+        return Snapshot(body, content_etag(body), time.time(), version, ttl=ttl)
+
+    def get(self, name: str, key: Hashable = None, force: bool = False, touch: bool = True) -> Snapshot:
+        """
+        Current snapshot for a model, rebuilding it if stale (or forced).
+
+        Concurrent readers of a stale model wait for one build. If a
+        rebuild fails, the previous snapshot keeps being served.
+        """
+        model = self._models[name]
+        snapshots = self._snapshots[name]
+        now = time.time()
+
+        snapshot = snapshots.get(key)
+        if force or not self._is_fresh(model, snapshot, key, now):
+            with self._locks[name]:
+                current = snapshots.get(key)
+                rebuilt = current is not snapshot or (not force and self._is_fresh(model, current, key, time.time()))
+                if current is not None and rebuilt:
+                    # Rebuilt by another reader while we waited
+                    snapshot = current
+                else:
+                    try:
+                        snapshot = self._build(model, key)
+                    except Exception:
+                        if snapshot is None:
+                            raise
+                        logger.warning(f"Read model {name} rebuild failed, serving previous", exc_info=True)
+                        snapshot.built_at = time.time()  # Retry after the TTL, not on every read
+                    snapshots[key] = snapshot
+                    while len(snapshots) > MAX_KEYS:
+                        snapshots.popitem(last=False)
+
+        if touch:
+            if key in snapshots:
+                snapshots.move_to_end(key)
+            snapshot.read_at = now
+        return snapshot
+
+    def invalidate(self, name: str = None):
+        """Drop snapshots so the next read rebuilds (all models if name is None)."""
+        for model_name in ([name] if name else list(self._snapshots)):
+            with self._locks[model_name]:
+                self._snapshots[model_name].clear()
+
+    # =========================================================================
+    # BACKGROUND REFRESH
+    # =========================================================================
+
+    def refresh(self, ahead: float = 0) -> int:
+        """
+        Rebuild snapshots that were read within IDLE_SECONDS and will be
+        stale within `ahead` seconds.
+
+        Returns:
+            Number of snapshots rebuilt
+        """
+        rebuilt = 0
+        now = time.time()
+        for name, model in list(self._models.items()):
+            for key, snapshot in list(self._snapshots[name].items()):
+                if now - snapshot.read_at > IDLE_SECONDS or self._is_fresh(model, snapshot, key, now + ahead):
+                    continue
+                try:
+                    self.get(name, key, force=True, touch=False)
+                    rebuilt += 1
+                except Exception as e:
+                    logger.debug(f"Read model {name} refresh failed: {e}")
+        return rebuilt
+
+    async def run_refresher(self, interval: float = 15, before_refresh: Callable[[], None] = None):
+        """
+        Refresh loop for the API's event loop (builds run on a worker thread).
+
+        Args:
+            before_refresh: Called first each cycle (e.g. reload the data volume)
+        """
+        while True:
+            try:
+                if before_refresh is not None:
+                    await asyncio.to_thread(before_refresh)
+                # Rebuild one interval early so polls hit a fresh snapshot
+                await asyncio.to_thread(self.refresh, interval)
+            except Exception as e:
+                logger.warning(f"Read model refresh failed: {e}")
+            await asyncio.sleep(interval)
+
+    def start_refresher(self, interval: float = 15, before_refresh: Callable[[], None] = None):
+        """Start run_refresher on the running event loop (once)."""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.get_running_loop().create_task(
+                self.run_refresher(interval, before_refresh))
+
+    # =========================================================================
+    # HTTP
+    # =========================================================================
+
+    def respond(self, request, name: str, key: Hashable = None):
+        """
+        Response for a read model: 304 if the client's If-None-Match
+        matches the current ETag, else the pre-encoded JSON body.
+        """
+        from starlette.responses import Response
+
+        snapshot = self.get(name, key)
+        headers = {'ETag': snapshot.etag, 'Cache-Control': 'no-cache'}
+        if etag_matches(request.headers.get('if-none-match'), snapshot.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=snapshot.body, media_type='application/json', headers=headers)
+
+
+# Singleton instance
+_read_model_store = None
+
+
+def get_read_model_store() -> ReadModelStore:
+    """Get the shared read model store."""
+    global _read_model_store
+    if _read_model_store is None:
+        _read_model_store = ReadModelStore()
+    return _read_model_store
@@ -896,56 +896,51 @@ def analyze_themes(df_results):
     return sorted(theme_scores, key=lambda x: x['opportunity'], reverse=True)
 
 
-def detect_unknown_clusters(price_data, df_results, min_size=3, corr_threshold=0.7):
-    """Auto-detect unknown themes via correlation clustering."""
-    try:
-        strong_tickers = df_results[df_results['composite_score'] >= 50]['ticker'].tolist()[:80]
+def detect_unknown_clusters(price_data, df_results, min_size=3, corr_threshold=0.7, lookback=20):
+    """
+    Auto-detect unknown themes via correlation clustering.
 
-        returns_data = {}
-        for ticker in strong_tickers:
-            try:
-                if isinstance(price_data.columns, pd.MultiIndex):
-                    df = price_data[ticker]['Close']
-                else:
-                    df = price_data['Close']
-                if len(df) >= 20:
-                    returns_data[ticker] = df.pct_change().iloc[-20:]
-            except Exception as e:
-                logger.debug(f"Failed to get returns for {ticker}: {e}")
-                continue
+    Clusters the whole scanned universe with the shared cluster engine
+    (tracked across runs), then keeps clusters that are not a known niche
+    theme and contain at least two strong (score >= 50) names.
+    """
+    try:
+        from src.analysis.cluster_engine import get_cluster_engine
 
-        if len(returns_data) < 5:
+        if not isinstance(price_data.columns, pd.MultiIndex):
             return []
 
-        returns_df = pd.DataFrame(returns_data).dropna()
-        if len(returns_df) < 10:
-            return []
+        closes = price_data.xs('Close', axis=1, level=1)
+        returns = closes.pct_change().iloc[-lookback:]
+
+        engine = get_cluster_engine('scan')
+        engine.min_correlation = corr_threshold
+        engine.min_size = min_size
+
+        scores = df_results.set_index('ticker')
+        known_themes = [set(t.get('tickers', [])) for t in NICHE_THEMES.values()]
 
-        corr_matrix = returns_df.corr()
         clusters = []
-        used = set()
+        for cluster in engine.run(returns):
+            members = [t for t in cluster.tickers if t in scores.index]
+            strong = [t for t in members if scores.at[t, 'composite_score'] >= 50]
+            if len(strong) < 2:
+                continue
 
-        for ticker in corr_matrix.columns:
-            if ticker in used:
+            # Skip clusters that are mostly a known theme
+            if any(len(set(members) & known) >= len(members) * 0.5 for known in known_themes):
                 continue
-            correlated = corr_matrix[ticker][corr_matrix[ticker] >= corr_threshold].index.tolist()
-
-            if len(correlated) >= min_size:
-                # Check if NOT a known theme
-                is_known = False
-                for theme_data in NICHE_THEMES.values():
-                    if len(set(correlated) & set(theme_data.get('tickers', []))) >= len(correlated) * 0.5:
-                        is_known = True
-                        break
-
-                if not is_known:
-                    cluster_data = df_results[df_results['ticker'].isin(correlated)]
-                    clusters.append({
-                        'tickers': correlated[:6],
-                        'avg_rs': cluster_data['rs_composite'].mean(),
-                        'breakouts': int(cluster_data['breakout_up'].sum()),
-                    })
-                    used.update(correlated)
+
+            cluster_data = scores.loc[members]
+            ranked = sorted(members, key=lambda t: -scores.at[t, 'composite_score'])
+            clusters.append({
+                'tickers': ranked[:6],
+                'avg_rs': cluster_data['rs_composite'].mean(),
+                'breakouts': int(cluster_data['breakout_up'].sum()),
+                'cluster_id': cluster.cluster_id,
+                'days_seen': cluster.days_seen,
+                'is_new': cluster.is_new,
+            })
 
         return sorted(clusters, key=lambda x: x['breakouts'], reverse=True)[:3]
     except Exception as e:
@@ -977,7 +972,8 @@ def format_theme_alert(themes, supply_plays, unknown_clusters):
     if unknown_clusters:
         msg += "\n*⚠️ Unknown Themes Detected:*\n"
         for c in unknown_clusters:
-            msg += f"• {', '.join(c['tickers'][:4])} (RS: {c['avg_rs']:+.1f}%)\n"
+            persisting = f" | day {c['days_seen']}" if c.get('days_seen', 1) > 1 else ""
+            msg += f"• {', '.join(c['tickers'][:4])} (RS: {c['avg_rs']:+.1f}%{persisting})\n"
 
     return msg
 
@@ -2089,13 +2085,13 @@ def _run_sector_rotation():
         logger.error(f"Sector rotation error: {e}")
 
 
-def _run_mtf_analysis(df_results):
+def _run_mtf_analysis(df_results, price_data=None):
     """Run multi-timeframe confluence analysis."""
     logger.info("Running multi-timeframe analysis...")
     try:
-        from multi_timeframe import scan_mtf_confluence, format_mtf_scan_results
+        from src.analysis.multi_timeframe import scan_mtf_confluence, format_mtf_scan_results
         top_tickers = df_results.head(20)['ticker'].tolist()
-        mtf_results = scan_mtf_confluence(top_tickers, min_score=6)
+        mtf_results = scan_mtf_confluence(top_tickers, min_score=6, price_data=price_data)
         if mtf_results:
             mtf_msg = format_mtf_scan_results(mtf_results)
             send_telegram_message(mtf_msg)
@@ -2271,7 +2267,7 @@ def main():
 
     # Advanced analysis (using helper functions)
     _run_sector_rotation()
-    _run_mtf_analysis(df_results)
+    _run_mtf_analysis(df_results, price_data)
     _run_news_scan(df_results)
     _run_comprehensive_learning(df_results, price_data, themes)
     _run_ai_analysis(df_results, themes)
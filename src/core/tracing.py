@@ -0,0 +1,332 @@
+"""
+Scan Tracing
+============
+
+Lightweight span tracing for the scan pipeline.
+
+A ScanTrace collects timed spans (stage, per-ticker source fetch, ...)
+with attributes such as provider and cache hit/miss. The active trace and
+parent span live in context variables, so spans opened inside
+asyncio.gather() tasks attach to the right parent without threading a
+tracer through every call. When no trace is active, span() is a no-op.
+
+Every finished span is also recorded into perf_monitor as ``scan_span``
+(labelled by span name, provider and cache) so stage timings show up on
+/admin/performance alongside the request metrics.
+
+Usage:
+    trace = ScanTrace()
+    with trace.activate():
+        with span('price_fetch', provider='polygon'):
+            ...
+    trace.write('scan_20260201_trace.jsonl')
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILE_SUFFIX = '_trace.jsonl'
+
+# Attributes copied onto perf_monitor labels (bounded cardinality - never ticker)
+METRIC_LABELS = ('provider', 'cache')
+
+_current_trace: contextvars.ContextVar[Optional['ScanTrace']] = contextvars.ContextVar(
+    'scan_trace', default=None
+)
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar(
+    'scan_span', default=None
+)
+
+_last_summary: Optional[Dict] = None
+
+
+# =============================================================================
+# SPANS
+# =============================================================================
+
+@dataclass
+class Span:
+    """A single timed operation within a trace."""
+    span_id: int
+    name: str
+    start: float                      # seconds since trace start
+    duration: float = 0.0
+    parent_id: Optional[int] = None
+    status: str = 'ok'
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            'type': 'span',
+            'id': self.span_id,
+            'parent': self.parent_id,
+            'name': self.name,
+            'start': round(self.start, 6),
+            'duration': round(self.duration, 6),
+            'status': self.status,
+            'attributes': self.attributes,
+        }
+
+
+class ScanTrace:
+    """Collects spans for one scan run."""
+
+    def __init__(self, name: str = 'scan', record_metrics: bool = True):
+        self.name = name
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.started_at = datetime.now(timezone.utc)
+        self.record_metrics = record_metrics
+        self.spans: List[Span] = []
+        self.attributes: Dict[str, Any] = {}
+        self._t0 = time.perf_counter()
+        self._next_id = 1
+        self._ended: Optional[float] = None
+
+    @contextmanager
+    def activate(self):
+        """Make this the current trace for the enclosed code (and tasks it spawns)."""
+        token = _current_trace.set(self)
+        try:
+            yield self
+        finally:
+            _current_trace.reset(token)
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes) -> Span:
+        span_obj = Span(
+            span_id=self._next_id,
+            name=name,
+            start=time.perf_counter() - self._t0,
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+        )
+        self._next_id += 1
+        return span_obj
+
+    def end_span(self, span_obj: Span) -> None:
+        span_obj.duration = (time.perf_counter() - self._t0) - span_obj.start
+        self.spans.append(span_obj)
+
+        if self.record_metrics:
+            try:
+                from src.core.performance import perf_monitor
+                labels = {k: str(span_obj.attributes[k]) for k in METRIC_LABELS if k in span_obj.attributes}
+                perf_monitor.record('scan_span', span_obj.duration, span=span_obj.name, **labels)
+            except Exception as e:
+                logger.debug(f"Failed to record span metric: {e}")
+
+    def end(self) -> float:
+        """Mark the trace finished; returns total duration in seconds."""
+        if self._ended is None:
+            self._ended = time.perf_counter() - self._t0
+        return self._ended
+
+    @property
+    def duration(self) -> float:
+        return self._ended if self._ended is not None else time.perf_counter() - self._t0
+
+    def summary(self) -> Dict:
+        """Per-span-name aggregates: count, total, p50/p95/max, errors and cache hit rate."""
+        from src.core.performance import LatencyHistogram
+
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for s in self.spans:
+            entry = grouped.get(s.name)
+            if entry is None:
+                entry = grouped[s.name] = {
+                    'hist': LatencyHistogram(), 'errors': 0, 'cache_hits': 0, 'cache_misses': 0,
+                    'providers': set(),
+                }
+            entry['hist'].record(s.duration)
+            if s.status != 'ok':
+                entry['errors'] += 1
+            cache = s.attributes.get('cache')
+            if cache == 'hit':
+                entry['cache_hits'] += 1
+            elif cache == 'miss':
+                entry['cache_misses'] += 1
+            if 'provider' in s.attributes:
+                entry['providers'].add(str(s.attributes['provider']))
+
+        spans = {}
+        for name, entry in grouped.items():
+            hist = entry['hist']
+            stats = {
+                'count': hist.count,
+                'total_seconds': round(hist.total, 4),
+                'p50_ms': round(hist.quantile(0.50) * 1000, 2),
+                'p95_ms': round(hist.quantile(0.95) * 1000, 2),
+                'max_ms': round(hist.max * 1000, 2),
+                'errors': entry['errors'],
+            }
+            lookups = entry['cache_hits'] + entry['cache_misses']
+            if lookups:
+                stats['cache_hit_rate'] = round(entry['cache_hits'] / lookups, 3)
+            if entry['providers']:
+                stats['providers'] = sorted(entry['providers'])
+            spans[name] = stats
+
+        return {
+            'type': 'trace',
+            'trace_id': self.trace_id,
+            'name': self.name,
+            'started_at': self.started_at.isoformat(),
+            'duration_seconds': round(self.duration, 4),
+            'span_count': len(self.spans),
+            'attributes': self.attributes,
+            'spans': spans,
+        }
+
+    def write(self, path) -> Path:
+        """
+        Write the trace as JSON lines: the summary first, then one line per
+        span in start order. Returns the path written.
+        """
+        global _last_summary
+        path = Path(path)
+        summary = self.summary()
+        summary['file'] = str(path)
+        with open(path, 'w') as f:
+            f.write(json.dumps(summary, default=str) + '\n')
+            for s in sorted(self.spans, key=lambda s: s.start):
+                f.write(json.dumps(s.to_dict(), default=str) + '\n')
+        _last_summary = summary
+        return path
+
+
+# =============================================================================
+# CONTEXT API
+# =============================================================================
+
+def get_current_trace() -> Optional[ScanTrace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Time the enclosed block as a span of the current trace.
+
+    Yields the Span (or None when no trace is active). Exceptions mark the
+    span as an error and propagate.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    span_obj = trace.start_span(name, parent=_current_span.get(), **attributes)
+    token = _current_span.set(span_obj)
+    try:
+        yield span_obj
+    except BaseException as e:
+        span_obj.status = 'error'
+        span_obj.attributes.setdefault('error', type(e).__name__)
+        raise
+    finally:
+        _current_span.reset(token)
+        trace.end_span(span_obj)
+
+
+def set_span_attributes(**attributes) -> None:
+    """Attach attributes (e.g. cache='hit') to the innermost active span."""
+    span_obj = _current_span.get()
+    if span_obj is not None:
+        span_obj.attributes.update(attributes)
+
+
+def traced(name: str, **attributes) -> Callable:
+    """
+    Decorator form of span() for sync and async functions.
+
+    A ``ticker`` argument, if the function has one, is added to the span
+    attributes.
+    """
+    def decorator(func: Callable) -> Callable:
+        try:
+            has_ticker = 'ticker' in inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            has_ticker = False
+        sig = inspect.signature(func) if has_ticker else None
+
+        def span_attributes(args, kwargs) -> Dict[str, Any]:
+            attrs = dict(attributes)
+            if has_ticker:
+                try:
+                    attrs['ticker'] = sig.bind_partial(*args, **kwargs).arguments.get('ticker')
+                except TypeError:
+                    pass
+            return attrs
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    return await func(*args, **kwargs)
+                with span(name, **span_attributes(args, kwargs)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with span(name, **span_attributes(args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# =============================================================================
+# TRACE FILES
+# =============================================================================
+
+def trace_path_for(output_path) -> Path:
+    """Trace file that sits next to a scan output file (scan_X.csv -> scan_X_trace.jsonl)."""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.stem + TRACE_FILE_SUFFIX)
+
+
+def read_trace_summary(path) -> Optional[Dict]:
+    """Read just the summary line of a trace file."""
+    try:
+        with open(path) as f:
+            return json.loads(f.readline())
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not read trace summary {path}: {e}")
+        return None
+
+
+def get_last_scan_summary(search_dirs: Iterable = ()) -> Optional[Dict]:
+    """
+    Summary of the most recent scan trace.
+
+    Prefers the trace written by this process; otherwise reads the newest
+    ``scan_*_trace.jsonl`` in ``search_dirs`` (e.g. the shared volume).
+    """
+    if _last_summary is not None:
+        return _last_summary
+
+    candidates = []
+    for directory in search_dirs:
+        directory = Path(directory)
+        if directory.is_dir():
+            candidates.extend(directory.glob(f'scan_*{TRACE_FILE_SUFFIX}'))
+    if not candidates:
+        return None
+
+    latest = max(candidates, key=lambda p: p.stat().st_mtime)
+    return read_trace_summary(latest)
@@ -4,19 +4,34 @@ Data Management
 Universe management, caching, and data storage.
 """
 
-from src.data.universe_manager import (
-    UniverseManager,
-    get_universe_manager,
-)
-from src.data.cache_manager import (
-    CacheManager,
-    CacheConfig,
-    BackgroundPrefetcher,
-)
-from src.data.watchlist_manager import (
-    WatchlistManager,
-    get_watchlist_manager,
-)
+import importlib
+
+# Submodules are imported on first attribute access so `import src.data`
+# (and any `src.data.<module>` import) stays cheap.
+_LAZY_ATTRS = {
+    'UniverseManager': 'src.data.universe_manager',
+    'get_universe_manager': 'src.data.universe_manager',
+    'CacheManager': 'src.data.cache_manager',
+    'CacheConfig': 'src.data.cache_manager',
+    'BackgroundPrefetcher': 'src.data.cache_manager',
+    'WatchlistManager': 'src.data.watchlist_manager',
+    'get_watchlist_manager': 'src.data.watchlist_manager',
+}
+
+
+def __getattr__(name):
+    """Lazy loading of submodule attributes."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     'UniverseManager',
@@ -0,0 +1,339 @@
+"""
+Candle Store
+============
+In-memory OHLCV store behind /market/candles.
+
+- Bars are fetched upstream only at a few base resolutions (1m, 5m, 1d)
+  and kept per symbol in numpy arrays (time, open, high, low, close,
+  volume).
+- Every chart interval is resampled from the finest stored series that
+  covers the requested range: 5m/15m/30m/1h/4h from 5m (or 1m) bars,
+  1d/1w/1M from daily bars. Switching chart intervals doesn't refetch.
+- Series are extended incrementally: older ranges are fetched only for
+  the missing span, and after the refresh interval only bars from the
+  last stored bar onwards are fetched and merged.
+- Total stored bars are bounded; least recently used series are evicted.
+
+Usage:
+    from src.data.candle_store import get_candle_store, fetch_polygon_bars
+
+    store = get_candle_store()
+    candles = await store.get_candles('NVDA', '1h', days=30, fetch=fetch_polygon_bars)
+    # [{'time': 1718200800, 'open': ..., 'high': ..., 'low': ..., 'close': ..., 'volume': ...}, ...]
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400
+WEEK = 7 * DAY
+WEEK_OFFSET = 4 * DAY  # The epoch fell on a Thursday; week buckets start Monday
+
+# Chart interval -> bucket size in seconds (months are calendar buckets)
+INTERVAL_SECONDS = {
+    '1m': 60, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '4h': 14400,
+    '1d': DAY, '1w': WEEK, '1M': 31 * DAY,
+}
+
+# Resolution fetched upstream for each chart interval
+BASE_RESOLUTION = {
+    '1m': '1m',
+    '5m': '5m', '15m': '5m', '30m': '5m', '1h': '5m', '4h': '5m',
+    '1d': '1d', '1w': '1d', '1M': '1d',
+}
+
+REFRESH_SECONDS = {'1m': 30, '5m': 30, '1d': 300}  # Check for newer bars after
+MAX_DAYS = {'1m': 30, '5m': 365, '1d': 365 * 30}  # Longest range kept per resolution
+FETCH_CHUNK_DAYS = {'1m': 30, '5m': 150, '1d': 365 * 30}  # Range per upstream request
+
+MAX_TOTAL_BARS = 1_000_000  # ~48MB across all series
+MAX_SERIES_BARS = 150_000
+
+# fetch(symbol, resolution, start, end) -> DataFrame with Open/High/Low/Close/Volume
+# and a DatetimeIndex; df.attrs['source'] names the upstream
+BarFetcher = Callable[[str, str, datetime, datetime], Awaitable[Optional[pd.DataFrame]]]
+
+_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _utc(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def bucket_starts(times: np.ndarray, interval: str) -> np.ndarray:
+    """Start (epoch seconds, UTC) of the interval bucket containing each time."""
+    if interval == '1M':
+        months = times.astype('datetime64[s]').astype('datetime64[M]')
+        return months.astype('datetime64[s]').astype(np.int64)
+    if interval == '1w':
+        return (times - WEEK_OFFSET) // WEEK * WEEK + WEEK_OFFSET
+    step = INTERVAL_SECONDS[interval]
+    return times // step * step
+
+
+# =============================================================================
+# SERIES
+# =============================================================================
+
+class CandleSeries:
+    """Bars for one symbol at one resolution, sorted by time."""
+
+    def __init__(self, resolution: str):
+        self.resolution = resolution
+        self.time = np.empty(0, dtype=np.int64)
+        self.open = np.empty(0)
+        self.high = np.empty(0)
+        self.low = np.empty(0)
+        self.close = np.empty(0)
+        self.volume = np.empty(0)
+        self.covered_from = 0  # Earliest time fetched (bars may start later)
+        self.fetched_at = 0.0
+        self.source = None
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    @staticmethod
+    def arrays_from_frame(df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """(time, open, high, low, close, volume) from an OHLCV DataFrame."""
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+        times = index.values.astype('datetime64[s]').astype(np.int64)
+        return (times,) + tuple(
+            df[col].to_numpy(dtype=float) for col in ('Open', 'High', 'Low', 'Close', 'Volume')
+        )
+
+    def merge(self, times: np.ndarray, *values: np.ndarray):
+        """Merge bars in; where times overlap, the new bar wins."""
+        if len(times) == 0:
+            return
+        columns = [self.time] + [getattr(self, f) for f in _FIELDS]
+        in_order = len(self.time) == 0 or times[0] > self.time[-1]
+        merged = [np.concatenate([old, new]) for old, new in zip(columns, (times,) + values)]
+
+        if not in_order:
+            order = np.argsort(merged[0], kind='stable')
+            merged = [col[order] for col in merged]
+            # Keep the last (newest) of each run of equal times
+            keep = np.append(merged[0][1:] != merged[0][:-1], True)
+            merged = [col[keep] for col in merged]
+
+        self.time = merged[0].astype(np.int64)
+        for field, col in zip(_FIELDS, merged[1:]):
+            setattr(self, field, col)
+
+    def trim(self, max_bars: int):
+        """Drop the oldest bars beyond max_bars."""
+        if len(self.time) > max_bars:
+            cut = len(self.time) - max_bars
+            self.time = self.time[cut:]
+            for field in _FIELDS:
+                setattr(self, field, getattr(self, field)[cut:])
+            self.covered_from = int(self.time[0])
+
+    def resample(self, interval: str, start: float = 0) -> Dict[str, np.ndarray]:
+        """Bars from start onwards aggregated into interval buckets."""
+        i0 = int(np.searchsorted(self.time, start))
+        times = self.time[i0:]
+        columns = {f: getattr(self, f)[i0:] for f in _FIELDS}
+        if len(times) == 0 or interval == self.resolution:
+            return dict(time=times, **columns)
+
+        buckets = bucket_starts(times, interval)
+        first = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        last = np.r_[first[1:] - 1, len(times) - 1]
+        return {
+            'time': buckets[first],
+            'open': columns['open'][first],
+            'high': np.maximum.reduceat(columns['high'], first),
+            'low': np.minimum.reduceat(columns['low'], first),
+            'close': columns['close'][last],
+            'volume': np.add.reduceat(columns['volume'], first),
+        }
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class CandleStore:
+    """Multi-resolution candle store with incremental fetch and LRU eviction."""
+
+    def __init__(self, max_bars: int = MAX_TOTAL_BARS, max_series_bars: int = MAX_SERIES_BARS):
+        self.max_bars = max_bars
+        self.max_series_bars = max_series_bars
+        self._series: 'OrderedDict[Tuple[str, str], CandleSeries]' = OrderedDict()
+
+    @property
+    def total_bars(self) -> int:
+        return sum(len(s) for s in self._series.values())
+
+    def _base_for(self, symbol: str, interval: str, start: float) -> str:
+        """Finest stored series that covers start and divides the interval."""
+        step = INTERVAL_SECONDS[interval]
+        covering = [
+            resolution for (sym, resolution), series in self._series.items()
+            if sym == symbol and series.covered_from <= start
+            and step % INTERVAL_SECONDS[resolution] == 0
+            # Daily and longer candles always come from daily bars
+            and (INTERVAL_SECONDS[resolution] >= DAY) == (step >= DAY)
+        ]
+        if covering:
+            return min(covering, key=INTERVAL_SECONDS.get)
+        return BASE_RESOLUTION[interval]
+
+    async def _fetch_range(self, fetch: BarFetcher, symbol: str, resolution: str,
+                           start: float, end: float) -> List[pd.DataFrame]:
+        chunk = FETCH_CHUNK_DAYS[resolution] * DAY
+        ranges = []
+        while start < end:
+            ranges.append((start, min(start + chunk, end)))
+            start += chunk
+
+        async def fetch_one(chunk_start: float, chunk_end: float):
+            try:
+                return await fetch(symbol, resolution, _utc(chunk_start), _utc(chunk_end))
+            except Exception as e:
+                logger.warning(f"Candle fetch failed for {symbol} {resolution}: {e}")
+                return None
+
+        frames = await asyncio.gather(*(fetch_one(s, e) for s, e in ranges))
+        return [df for df in frames if df is not None and not df.empty]
+
+    def _merge_frames(self, series: CandleSeries, frames: List[pd.DataFrame]):
+        for df in frames:
+            series.merge(*CandleSeries.arrays_from_frame(df))
+            series.source = df.attrs.get('source', series.source)
+
+    async def ensure(self, symbol: str, resolution: str, start: float, fetch: BarFetcher) -> Optional[CandleSeries]:
+        """
+        Make sure the series covers [start, now], fetching only what's missing.
+
+        Returns:
+            The series, or None if nothing could be fetched
+        """
+        now = time.time()
+        key = (symbol, resolution)
+        series = self._series.get(key)
+
+        if series is None:
+            frames = await self._fetch_range(fetch, symbol, resolution, start, now)
+            if not frames:
+                return None
+            series = CandleSeries(resolution)
+            self._merge_frames(series, frames)
+            series.covered_from = int(start)
+            series.fetched_at = now
+            self._series[key] = series
+        else:
+            if start < series.covered_from:
+                self._merge_frames(series, await self._fetch_range(
+                    fetch, symbol, resolution, start, series.covered_from))
+                series.covered_from = int(start)
+            if now - series.fetched_at > REFRESH_SECONDS[resolution]:
+                # Refetch from the last stored bar: it may have been partial
+                since = float(series.time[-1]) if len(series) else series.covered_from
+                self._merge_frames(series, await self._fetch_range(fetch, symbol, resolution, since, now))
+                series.fetched_at = now
+
+        series.trim(self.max_series_bars)
+        self._series.move_to_end(key)
+        self._evict()
+        return series
+
+    def _evict(self):
+        total = self.total_bars
+        while total > self.max_bars and len(self._series) > 1:
+            key, series = self._series.popitem(last=False)
+            total -= len(series)
+            logger.debug(f"Candle store evicted {key[0]} {key[1]} ({len(series)} bars)")
+
+    async def get_candles(self, symbol: str, interval: str, days: int, fetch: BarFetcher,
+                          date_times: bool = False) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Candles for a chart, resampled from the stored base series.
+
+        Args:
+            symbol: Ticker or futures root
+            interval: One of INTERVAL_SECONDS (unknown intervals fall back to 1d)
+            days: Days of history
+            fetch: Upstream bar fetcher for missing ranges
+            date_times: Emit 'YYYY-MM-DD' times for daily and longer intervals
+
+        Returns:
+            (candles, source)
+        """
+        if interval not in INTERVAL_SECONDS:
+            interval = '1d'
+        start = time.time() - days * DAY
+        resolution = self._base_for(symbol, interval, start)
+        start = max(start, time.time() - MAX_DAYS[resolution] * DAY)
+
+        series = await self.ensure(symbol, resolution, start, fetch)
+        if series is None:
+            return [], None
+
+        bars = series.resample(interval, start)
+        times = bars['time'].tolist()
+        if date_times and INTERVAL_SECONDS[interval] >= DAY:
+            times = [_utc(t).strftime('%Y-%m-%d') for t in times]
+
+        candles = [
+            {'time': t, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': int(v)}
+            for t, o, h, l, c, v in zip(times, bars['open'].tolist(), bars['high'].tolist(),
+                                        bars['low'].tolist(), bars['close'].tolist(),
+                                        bars['volume'].tolist())
+        ]
+        return candles, series.source
+
+
+# =============================================================================
+# UPSTREAM FETCHERS
+# =============================================================================
+
+_POLYGON_TIMESPAN = {'1m': (1, 'minute'), '5m': (5, 'minute'), '1d': (1, 'day')}
+
+
+async def fetch_polygon_bars(symbol: str, resolution: str, start: datetime, end: datetime) -> Optional[pd.DataFrame]:
+    """Polygon aggregates for a base resolution (millisecond range bounds)."""
+    from src.data.polygon_provider import PolygonProvider
+
+    multiplier, timespan = _POLYGON_TIMESPAN[resolution]
+    provider = PolygonProvider()
+    try:
+        df = await provider.get_aggregates(
+            symbol.upper(),
+            multiplier=multiplier,
+            timespan=timespan,
+            from_date=str(int(start.timestamp() * 1000)),
+            to_date=str(int(end.timestamp() * 1000)),
+            limit=50000,
+        )
+    finally:
+        await provider.close()
+    if df is not None:
+        df.attrs['source'] = 'polygon'
+    return df
+
+
+# Singleton instance
+_candle_store = None
+
+
+def get_candle_store() -> CandleStore:
+    """Get the shared candle store."""
+    global _candle_store
+    if _candle_store is None:
+        _candle_store = CandleStore()
+    return _candle_store
@@ -0,0 +1,351 @@
+"""
+Columnar Time-Series Store
+==========================
+
+Append-only per-ticker time series kept as one flat binary file per field
+(float64 values, int16 codes for categorical fields) next to an int64
+epoch-seconds column. Reads memory-map the columns and binary search the
+timestamp column, so a range scan touches only the rows it returns and
+history can grow without limit (years of intraday snapshots).
+
+Layout:
+    <root>/<TICKER>/ts.i8           epoch seconds, ascending
+    <root>/<TICKER>/<field>.f8      one value per row
+    <root>/<TICKER>/<field>.i2      category codes (-1 = missing)
+    <root>/categories.json          category labels per field
+
+The timestamp column is written last, so its length is the committed row
+count; a torn append is trimmed by the next write.
+
+Usage:
+    store = get_gex_store()
+    store.append('SPY', {'gex': 1.2e9, 'price': 590.1, ...})
+    cols = store.read('SPY', start=time.time() - 86400 * 365)
+    daily = store.daily('SPY')  # Last snapshot per day, as records
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MODAL_VOLUME_PATH = '/data'
+
+GEX_FIELDS = {
+    'gex': 'float',
+    'call_wall': 'float',
+    'put_wall': 'float',
+    'price': 'float',
+    'gamma_flip': 'float',
+}
+
+FLOW_FIELDS = {
+    'sentiment': 'category',
+    'put_call_ratio': 'float',
+    'premium': 'float',
+    'smart_money_score': 'float',
+}
+
+_DTYPES = {'float': np.dtype('<f8'), 'category': np.dtype('<i2')}
+_SUFFIXES = {'float': 'f8', 'category': 'i2'}
+_TS_DTYPE = np.dtype('<i8')
+
+
+class ColumnStore:
+    """Per-ticker columnar time series under one root directory."""
+
+    def __init__(self, root, fields: Dict[str, str]):
+        """
+        Args:
+            root: Directory holding one subdirectory per ticker
+            fields: Field name -> 'float' or 'category'
+        """
+        self.root = Path(root)
+        self.fields = dict(fields)
+        self._lock = threading.Lock()
+        self._categories: Dict[str, List[str]] = {}
+        self._categories_mtime = None
+
+    # =========================================================================
+    # PATHS & CATEGORIES
+    # =========================================================================
+
+    @staticmethod
+    def _safe_name(ticker: str) -> str:
+        return ticker.upper().replace('/', '_')
+
+    def _ticker_dir(self, ticker: str) -> Path:
+        return self.root / self._safe_name(ticker)
+
+    def _column_path(self, ticker_dir: Path, field: str) -> Path:
+        return ticker_dir / f"{field}.{_SUFFIXES[self.fields[field]]}"
+
+    def _load_categories(self):
+        path = self.root / 'categories.json'
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return
+        if mtime != self._categories_mtime:
+            try:
+                self._categories = json.loads(path.read_text())
+                self._categories_mtime = mtime
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Failed to load categories for {self.root}: {e}")
+
+    def _category_code(self, field: str, value) -> int:
+        if value is None:
+            return -1
+        self._load_categories()
+        labels = self._categories.setdefault(field, [])
+        value = str(value)
+        if value not in labels:
+            labels.append(value)
+            path = self.root / 'categories.json'
+            tmp = path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(self._categories))
+            os.replace(tmp, path)
+            self._categories_mtime = path.stat().st_mtime
+        return labels.index(value)
+
+    # =========================================================================
+    # WRITE
+    # =========================================================================
+
+    def _encode(self, field: str, value):
+        if self.fields[field] == 'category':
+            return self._category_code(field, value)
+        try:
+            return float(value) if value is not None else np.nan
+        except (TypeError, ValueError):
+            return np.nan
+
+    def _align(self, ticker_dir: Path, rows: int):
+        """Trim (torn append) or pad (field added later) columns to `rows`."""
+        for field, kind in self.fields.items():
+            path = self._column_path(ticker_dir, field)
+            itemsize = _DTYPES[kind].itemsize
+            size = path.stat().st_size if path.exists() else 0
+            if size > rows * itemsize:
+                os.truncate(path, rows * itemsize)
+            elif size < rows * itemsize:
+                fill = np.nan if kind == 'float' else -1
+                missing = rows - size // itemsize
+                with open(path, 'ab') as f:
+                    f.truncate(size - size % itemsize)
+                    np.full(missing, fill, dtype=_DTYPES[kind]).tofile(f)
+
+    def append_many(self, ticker: str, records: List[Dict], timestamps: List[float]) -> int:
+        """
+        Append rows for a ticker. Rows older than the last stored row are
+        skipped (the timestamp column must stay sorted).
+
+        Returns:
+            Number of rows written
+        """
+        ticker_dir = self._ticker_dir(ticker)
+        with self._lock:
+            ticker_dir.mkdir(parents=True, exist_ok=True)
+            ts_path = ticker_dir / 'ts.i8'
+            rows = ts_path.stat().st_size // _TS_DTYPE.itemsize if ts_path.exists() else 0
+            last_ts = int(np.fromfile(ts_path, dtype=_TS_DTYPE, count=1, offset=(rows - 1) * 8)[0]) if rows else None
+
+            keep = []
+            for record, ts in zip(records, timestamps):
+                ts = int(ts)
+                if last_ts is not None and ts < last_ts:
+                    continue
+                keep.append((record, ts))
+                last_ts = ts
+            if not keep:
+                return 0
+
+            if ts_path.exists():
+                os.truncate(ts_path, rows * _TS_DTYPE.itemsize)
+            self._align(ticker_dir, rows)
+            for field, kind in self.fields.items():
+                values = np.array([self._encode(field, r.get(field)) for r, _ in keep], dtype=_DTYPES[kind])
+                with open(self._column_path(ticker_dir, field), 'ab') as f:
+                    values.tofile(f)
+            # Timestamps last: they commit the rows
+            with open(ts_path, 'ab') as f:
+                np.array([ts for _, ts in keep], dtype=_TS_DTYPE).tofile(f)
+            return len(keep)
+
+    def append(self, ticker: str, record: Dict, ts: float = None) -> bool:
+        """Append one row (timestamped now unless given)."""
+        return self.append_many(ticker, [record], [time.time() if ts is None else ts]) == 1
+
+    # =========================================================================
+    # READ
+    # =========================================================================
+
+    @staticmethod
+    def _map(path: Path, dtype: np.dtype, rows: int) -> np.ndarray:
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(rows,))
+
+    def _rows(self, ticker_dir: Path) -> int:
+        try:
+            return (ticker_dir / 'ts.i8').stat().st_size // _TS_DTYPE.itemsize
+        except OSError:
+            return 0
+
+    def last_ts(self, ticker: str) -> Optional[int]:
+        """Timestamp of the newest row (None if the ticker has no rows)."""
+        ticker_dir = self._ticker_dir(ticker)
+        rows = self._rows(ticker_dir)
+        if not rows:
+            return None
+        return int(self._map(ticker_dir / 'ts.i8', _TS_DTYPE, rows)[-1])
+
+    def read(self, ticker: str, start: float = None, end: float = None,
+             fields: List[str] = None, last: int = None) -> Dict[str, np.ndarray]:
+        """
+        Columns for rows with start <= ts < end (optionally only the last
+        `last` of them). Float columns are float64 with NaN for missing;
+        category columns are int16 codes (see labels()).
+
+        Returns:
+            {'ts': int64 array, <field>: array, ...}
+        """
+        ticker_dir = self._ticker_dir(ticker)
+        rows = self._rows(ticker_dir)
+        ts = self._map(ticker_dir / 'ts.i8', _TS_DTYPE, rows)
+        lo = int(np.searchsorted(ts, start, side='left')) if start is not None else 0
+        hi = int(np.searchsorted(ts, end, side='left')) if end is not None else rows
+        if last is not None:
+            lo = max(lo, hi - last)
+
+        columns = {'ts': np.array(ts[lo:hi])}
+        for field in fields or self.fields:
+            kind = self.fields[field]
+            path = self._column_path(ticker_dir, field)
+            available = min(rows, path.stat().st_size // _DTYPES[kind].itemsize) if path.exists() else 0
+            values = np.full(hi - lo, np.nan if kind == 'float' else -1, dtype=_DTYPES[kind])
+            if available > lo:
+                stop = min(hi, available)
+                values[:stop - lo] = self._map(path, _DTYPES[kind], available)[lo:stop]
+            columns[field] = values
+        return columns
+
+    def labels(self, field: str) -> List[str]:
+        """Category labels for a categorical field (code = index)."""
+        self._load_categories()
+        return list(self._categories.get(field, []))
+
+    def to_records(self, columns: Dict[str, np.ndarray]) -> List[Dict]:
+        """Column arrays as row dicts (ts as epoch seconds, NaN/-1 as None)."""
+        decoded = {'ts': columns['ts'].tolist()}
+        for field, values in columns.items():
+            if field == 'ts':
+                continue
+            if self.fields[field] == 'category':
+                labels = self.labels(field)
+                decoded[field] = [labels[c] if 0 <= c < len(labels) else None for c in values.tolist()]
+            else:
+                decoded[field] = [None if v != v else v for v in values.tolist()]
+        return [dict(zip(decoded, row)) for row in zip(*decoded.values())]
+
+    def records(self, ticker: str, start: float = None, end: float = None, last: int = None) -> List[Dict]:
+        """Rows in a time range as dicts."""
+        return self.to_records(self.read(ticker, start, end, last=last))
+
+    def daily(self, ticker: str, start: float = None, end: float = None, last: int = None) -> List[Dict]:
+        """
+        Last snapshot of each (local) day as records with a 'date' field,
+        the shape the older once-a-day history used.
+        """
+        columns = self.read(ticker, start, end)
+        if not len(columns['ts']):
+            return []
+        # Local calendar days, matching the datetime.now() dates of old rows
+        offset = int(datetime.now().astimezone().utcoffset().total_seconds())
+        days = (columns['ts'] + offset).astype('datetime64[s]').astype('datetime64[D]')
+        is_last = np.append(days[1:] != days[:-1], True)
+
+        records = self.to_records({field: values[is_last] for field, values in columns.items()})
+        for record, day in zip(records, days[is_last].astype(str)):
+            record['date'] = day
+        return records[-last:] if last is not None else records
+
+    def tickers(self) -> List[str]:
+        """Tickers with at least one row."""
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir() and self._rows(p))
+
+    def scan(self, tickers: List[str] = None, start: float = None, end: float = None,
+             fields: List[str] = None) -> Iterator[Tuple[str, Dict[str, np.ndarray]]]:
+        """(ticker, columns) for each ticker over a time range (all tickers by default)."""
+        for ticker in tickers or self.tickers():
+            columns = self.read(ticker, start, end, fields)
+            if len(columns['ts']):
+                yield ticker, columns
+
+    # =========================================================================
+    # MIGRATION
+    # =========================================================================
+
+    def import_records(self, ticker: str, records: List[Dict], time_field: str) -> int:
+        """
+        Import legacy JSON rows for a ticker whose column files don't
+        exist yet. `time_field` holds an ISO date or datetime per row.
+        """
+        if self._rows(self._ticker_dir(ticker)):
+            return 0
+        rows, timestamps = [], []
+        for record in records:
+            try:
+                timestamps.append(datetime.fromisoformat(record[time_field]).timestamp())
+                rows.append(record)
+            except (KeyError, TypeError, ValueError):
+                continue
+        order = sorted(range(len(rows)), key=timestamps.__getitem__)
+        return self.append_many(ticker, [rows[i] for i in order], [timestamps[i] for i in order])
+
+
+# =============================================================================
+# SHARED STORES
+# =============================================================================
+
+def get_store_root(name: str) -> Path:
+    """Store directory (Modal volume if mounted, else data/<name>)."""
+    if os.path.exists(MODAL_VOLUME_PATH):
+        return Path(MODAL_VOLUME_PATH) / name
+    return Path('data') / name
+
+
+_gex_store = None
+
+
+def get_gex_store() -> ColumnStore:
+    """Intraday GEX snapshots per ticker (gex_history on the volume)."""
+    global _gex_store
+    if _gex_store is None:
+        _gex_store = ColumnStore(get_store_root('gex_history'), GEX_FIELDS)
+    return _gex_store
+
+
+def migrate_gex_json(store: ColumnStore, ticker: str) -> int:
+    """Import a legacy <root>/<TICKER>.json daily GEX list (once)."""
+    legacy = store.root / f"{ColumnStore._safe_name(ticker)}.json"
+    if not legacy.exists():
+        return 0
+    try:
+        imported = store.import_records(ticker, json.loads(legacy.read_text()), 'date')
+        legacy.rename(legacy.with_suffix('.json.migrated'))
+        logger.info(f"Migrated {imported} GEX snapshots for {ticker}")
+        return imported
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to migrate GEX history for {ticker}: {e}")
+        return 0
@@ -0,0 +1,334 @@
+"""
+Earnings Calendar Store
+=======================
+Full-market earnings calendar pulled from Finnhub in date-range requests
+and indexed by date and by ticker, so per-ticker earnings lookups are
+dictionary reads instead of per-ticker API calls.
+
+- The calendar covers LOOKBACK_DAYS of reported quarters (actual vs
+  estimate, for beat rate and average surprise) and LOOKAHEAD_DAYS of
+  scheduled reports (dates and estimates).
+- Persisted to data/earnings/calendar.json. Once the copy is older than
+  max_age, only the recent window (REFRESH_BACK_DAYS back through the
+  lookahead) is pulled again, since that's where dates move and actuals
+  arrive.
+
+Usage:
+    from src.data.earnings_calendar import get_earnings_calendar
+
+    calendar = get_earnings_calendar()
+    calendar.ingest()                              # nightly job: full pull
+    info = calendar.get_info('NVDA')               # next_date, days_until, beat_rate, ...
+    week = calendar.between(today, today + timedelta(days=7), tickers)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.utils.file_utils import ensure_data_dir
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_FILENAME = 'calendar.json'
+CALENDAR_MAX_AGE = 43200  # Refresh the recent window after 12 hours
+LOOKBACK_DAYS = 400  # ~4 reported quarters per company
+LOOKAHEAD_DAYS = 90
+REFRESH_BACK_DAYS = 14
+CHUNK_DAYS = 7  # Days per calendar request
+TRUNCATION_LIMIT = 1500  # A response this large may be cut off; split the range
+
+# fetch(from_date, to_date) -> Finnhub calendar entries
+# ({'symbol', 'date', 'hour', 'epsEstimate', 'epsActual', 'revenueEstimate', 'revenueActual', ...})
+CalendarFetcher = Callable[[str, str], List[dict]]
+
+
+def _finnhub_fetch(from_date: str, to_date: str) -> List[dict]:
+    from utils.data_providers import FinnhubProvider
+    return FinnhubProvider.get_earnings_calendar(from_date, to_date)
+
+
+def _finnhub_configured() -> bool:
+    from utils.data_providers import FinnhubProvider
+    return FinnhubProvider.is_configured()
+
+
+def _entry(raw: dict) -> Optional[dict]:
+    """Compact calendar entry, or None if it has no ticker/date."""
+    symbol = (raw.get('symbol') or '').upper()
+    day = raw.get('date')
+    if not symbol or not day:
+        return None
+    return {
+        'ticker': symbol,
+        'date': day,
+        'hour': raw.get('hour') or None,  # bmo / amc / dmh
+        'eps_estimate': raw.get('epsEstimate'),
+        'eps_actual': raw.get('epsActual'),
+        'revenue_estimate': raw.get('revenueEstimate'),
+        'revenue_actual': raw.get('revenueActual'),
+    }
+
+
+class EarningsCalendar:
+    """
+    Persisted earnings calendar with by-date and by-ticker indexes.
+
+    Stale copies are refreshed on first use; a failed refresh keeps
+    serving the old copy.
+    """
+
+    def __init__(self, path: Optional[Path] = None, fetch: Optional[CalendarFetcher] = None,
+                 max_age: int = CALENDAR_MAX_AGE):
+        self.path = Path(path) if path else Path(ensure_data_dir('earnings')) / CALENDAR_FILENAME
+        self._fetch = fetch
+        self.max_age = max_age
+        self.by_date: Dict[str, List[dict]] = {}
+        self.by_ticker: Dict[str, List[dict]] = {}
+        self.covered_from: Optional[str] = None
+        self.covered_to: Optional[str] = None
+        self.fetched_at = 0.0
+        self._checked_at = 0.0
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @property
+    def configured(self) -> bool:
+        return self._fetch is not None or _finnhub_configured()
+
+    # =========================================================================
+    # PERSISTENCE / INDEX
+    # =========================================================================
+
+    def _load(self):
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self.fetched_at = data.get('fetched_at', 0.0)
+            self.covered_from = data.get('covered_from')
+            self.covered_to = data.get('covered_to')
+            by_date = defaultdict(list)
+            for entry in data.get('entries', []):
+                by_date[entry['date']].append(entry)
+            self._reindex(by_date)
+        except (json.JSONDecodeError, OSError, KeyError) as e:
+            logger.warning(f"Could not read earnings calendar {self.path}: {e}")
+
+    def _reindex(self, by_date: Dict[str, List[dict]]):
+        by_ticker = defaultdict(list)
+        for day in sorted(by_date):
+            for entry in by_date[day]:
+                by_ticker[entry['ticker']].append(entry)
+        self.by_date = dict(by_date)
+        self.by_ticker = dict(by_ticker)
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({
+                'fetched_at': self.fetched_at,
+                'covered_from': self.covered_from,
+                'covered_to': self.covered_to,
+                'entries': [e for day in sorted(self.by_date) for e in self.by_date[day]],
+            }, f)
+        os.replace(tmp, self.path)
+
+    # =========================================================================
+    # INGESTION
+    # =========================================================================
+
+    def _fetch_range(self, start: date, end: date) -> List[dict]:
+        fetch = self._fetch or _finnhub_fetch
+        raw = fetch(start.isoformat(), end.isoformat()) or []
+        if len(raw) >= TRUNCATION_LIMIT and end > start:
+            mid = start + (end - start) // 2
+            return self._fetch_range(start, mid) + self._fetch_range(mid + timedelta(days=1), end)
+        return raw
+
+    def ingest(self, start: Optional[date] = None, end: Optional[date] = None) -> int:
+        """
+        Pull the calendar for [start, end] in CHUNK_DAYS requests and
+        replace those dates in the index.
+
+        Defaults to the full LOOKBACK_DAYS..LOOKAHEAD_DAYS window.
+
+        Returns:
+            Number of entries ingested (0 if every request failed)
+        """
+        today = date.today()
+        start = start or today - timedelta(days=LOOKBACK_DAYS)
+        end = end or today + timedelta(days=LOOKAHEAD_DAYS)
+
+        fetched = {}
+        ok = False
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(chunk_start + timedelta(days=CHUNK_DAYS - 1), end)
+            try:
+                for raw in self._fetch_range(chunk_start, chunk_end):
+                    entry = _entry(raw)
+                    if entry:
+                        fetched[(entry['ticker'], entry['date'])] = entry
+                ok = True
+            except Exception as e:
+                logger.warning(f"Earnings calendar fetch failed for {chunk_start}..{chunk_end}: {e}")
+            chunk_start = chunk_end + timedelta(days=1)
+
+        if not ok:
+            return 0
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            lo, hi = start.isoformat(), end.isoformat()
+            by_date = defaultdict(list, {d: entries for d, entries in self.by_date.items()
+                                         if not lo <= d <= hi})
+            for entry in fetched.values():
+                by_date[entry['date']].append(entry)
+            self._reindex(by_date)
+
+            self.covered_from = min(filter(None, [self.covered_from, lo]))
+            self.covered_to = max(filter(None, [self.covered_to, hi]))
+            self.fetched_at = time.time()
+            self._save()
+
+        logger.info(f"Earnings calendar: {len(fetched)} entries for {start}..{end} "
+                    f"({len(self.by_ticker)} tickers indexed)")
+        return len(fetched)
+
+    def refresh(self) -> int:
+        """Pull the full window if it isn't covered yet, else just the recent window."""
+        today = date.today()
+        full_start = (today - timedelta(days=LOOKBACK_DAYS)).isoformat()
+        if not self.covered_from or self.covered_from > full_start:
+            return self.ingest()
+        return self.ingest(start=today - timedelta(days=REFRESH_BACK_DAYS))
+
+    def ensure_fresh(self):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            now = time.time()
+            stale = now - self.fetched_at > self.max_age
+            if stale and now - self._checked_at > self.max_age / 12 and self.configured:
+                self._checked_at = now
+                self.refresh()
+
+    @property
+    def available(self) -> bool:
+        """Whether a calendar has been ingested (callers fall back otherwise)."""
+        self.ensure_fresh()
+        return self.fetched_at > 0
+
+    # =========================================================================
+    # LOOKUPS
+    # =========================================================================
+
+    def entries(self, ticker: str) -> List[dict]:
+        """All calendar entries for a ticker, oldest first."""
+        self.ensure_fresh()
+        return self.by_ticker.get(ticker.upper(), [])
+
+    def get_info(self, ticker: str, today: Optional[date] = None) -> dict:
+        """
+        Earnings info in the same shape as src.analysis.earnings.get_earnings_info.
+
+        next_date is the first scheduled report on or after today;
+        beat_rate and historical_surprise come from reported quarters.
+        """
+        from src.analysis.earnings import HIGH_IMPACT_TICKERS
+
+        ticker = ticker.upper()
+        today = today or date.today()
+        today_str = today.isoformat()
+        entries = self.entries(ticker)
+
+        info = {
+            'ticker': ticker,
+            'next_date': None,
+            'days_until': None,
+            'hour': None,
+            'eps_estimate': None,
+            'revenue_estimate': None,
+            'historical_surprise': None,
+            'beat_rate': None,
+            'high_impact': ticker in HIGH_IMPACT_TICKERS,
+        }
+
+        upcoming = next((e for e in entries if e['date'] >= today_str), None)
+        if upcoming:
+            next_date = date.fromisoformat(upcoming['date'])
+            info.update({
+                'next_date': next_date,
+                'days_until': (next_date - today).days,
+                'hour': upcoming['hour'],
+                'eps_estimate': upcoming['eps_estimate'],
+                'revenue_estimate': upcoming['revenue_estimate'],
+            })
+
+        surprises = [
+            (e['eps_actual'] - e['eps_estimate']) / abs(e['eps_estimate']) * 100
+            for e in entries
+            if e['date'] < today_str and e['eps_actual'] is not None and e['eps_estimate']
+        ]
+        if surprises:
+            info['historical_surprise'] = round(sum(surprises) / len(surprises), 1)
+            info['beat_rate'] = round(sum(s > 0 for s in surprises) / len(surprises) * 100, 0)
+
+        reported = [e for e in entries if e['date'] < today_str and e['eps_actual'] is not None]
+        if reported:
+            info['eps_actual'] = reported[-1]['eps_actual']
+            info['revenue_actual'] = reported[-1]['revenue_actual']
+            info['last_date'] = date.fromisoformat(reported[-1]['date'])
+
+        return info
+
+    def between(self, start: date, end: date, tickers: Optional[Iterable[str]] = None) -> List[dict]:
+        """
+        Earnings info for every report dated in [start, end].
+
+        Args:
+            tickers: Only these tickers (default: the whole market)
+
+        Returns:
+            get_info() dicts sorted by date, high-impact first within a day
+        """
+        self.ensure_fresh()
+        wanted = {t.upper() for t in tickers} if tickers is not None else None
+        results = []
+        day = start
+        while day <= end:
+            for entry in self.by_date.get(day.isoformat(), []):
+                if wanted is None or entry['ticker'] in wanted:
+                    info = self.get_info(entry['ticker'], today=start)
+                    if info['next_date'] == day:
+                        results.append(info)
+            day += timedelta(days=1)
+        results.sort(key=lambda x: (x['next_date'], not x.get('high_impact', False)))
+        return results
+
+    def __len__(self) -> int:
+        self.ensure_fresh()
+        return len(self.by_ticker)
+
+
+# Singleton instance
+_earnings_calendar = None
+
+
+def get_earnings_calendar() -> EarningsCalendar:
+    """Get the shared earnings calendar."""
+    global _earnings_calendar
+    if _earnings_calendar is None:
+        _earnings_calendar = EarningsCalendar()
+    return _earnings_calendar
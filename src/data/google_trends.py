@@ -29,7 +29,8 @@ Note: Uses pytrends library (unofficial Google Trends API)
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
-import time
+
+from src.data.trends_service import MAX_REQUESTS_PER_HOUR, get_trends_service
 
 logger = logging.getLogger(__name__)
 
@@ -66,58 +67,62 @@ THEME_KEYWORDS = {
     'retail': ['retail stocks', 'consumer stocks'],
 }
 
-# Cache for rate limiting
-_trends_cache = {}
-_cache_expiry = {}
 CACHE_TTL = 7200  # 2 hour cache (increased from 1 hour)
 
-# Rate limiting - track last request time
-_last_request_time = 0
-_request_count = 0
-_rate_limit_window_start = 0
-RATE_LIMIT_DELAY = 3.0  # 3 seconds between requests
-RATE_LIMIT_MAX_PER_HOUR = 20  # Max 20 requests per hour
-RATE_LIMIT_WINDOW = 3600  # 1 hour window
+# Requests share the hourly budget of src.data.trends_service
+RATE_LIMIT_MAX_PER_HOUR = MAX_REQUESTS_PER_HOUR
 
 
 def _check_rate_limit() -> bool:
     """Check if we can make a request without hitting rate limits."""
-    global _request_count, _rate_limit_window_start
+    return get_trends_service().has_budget()
 
-    now = time.time()
 
-    # Reset counter if window has passed
-    if now - _rate_limit_window_start > RATE_LIMIT_WINDOW:
-        _request_count = 0
-        _rate_limit_window_start = now
+def _series_metrics(values: List[float]) -> Dict:
+    """Trend metrics for one interest-over-time series."""
+    current = float(values[-1])
+    avg_30d = _mean(values[-30:])
+    avg_7d = _mean(values[-7:]) if len(values) >= 7 else current
+    max_val = float(max(values))
+    min_val = float(min(values))
 
-    return _request_count < RATE_LIMIT_MAX_PER_HOUR
+    # Trend direction
+    if len(values) >= 14:
+        recent = _mean(values[-7:])
+        prior = _mean(values[-14:-7])
+        trend_pct = ((recent - prior) / prior * 100) if prior > 0 else 0
+    else:
+        trend_pct = 0
 
+    # Momentum score (0-100)
+    momentum = min(100, max(0, (current / avg_30d - 0.5) * 100)) if avg_30d > 0 else 50
 
-def _wait_for_rate_limit():
-    """Wait if needed to respect rate limits."""
-    global _last_request_time, _request_count
+    # Breakout detection
+    is_breakout = current > avg_30d * 1.5 and trend_pct > 20
 
-    now = time.time()
-    time_since_last = now - _last_request_time
+    return {
+        'current': current,
+        'avg_7d': round(avg_7d, 1),
+        'avg_30d': round(avg_30d, 1),
+        'max': max_val,
+        'min': min_val,
+        'trend_pct': round(trend_pct, 1),
+        'momentum': round(momentum, 1),
+        'is_breakout': is_breakout,
+        'status': 'breakout' if is_breakout else 'rising' if trend_pct > 10 else 'stable' if trend_pct > -10 else 'declining'
+    }
 
-    if time_since_last < RATE_LIMIT_DELAY:
-        sleep_time = RATE_LIMIT_DELAY - time_since_last
-        logger.debug(f"Rate limiting: sleeping {sleep_time:.1f}s")
-        time.sleep(sleep_time)
 
-    _last_request_time = time.time()
-    _request_count += 1
+def _mean(values: List[float]) -> float:
+    return float(sum(values) / len(values))
 
 
 class GoogleTrendsClient:
     """
     Google Trends client for market theme detection.
 
-    Rate limits: Google may block if too many requests.
-    - Max 20 requests per hour
-    - 3 second delay between requests
-    - 2 hour cache TTL
+    Interest-over-time requests go through the shared trends service
+    (src/data/trends_service.py), which owns the rate budget and cache.
     """
 
     def __init__(self):
@@ -140,87 +145,22 @@ class GoogleTrendsClient:
         """
         Get search interest over time for keywords.
 
+        Keywords are batched by the shared trends service (four per request
+        plus its anchor term) and served from its cache when fresh.
+
         Args:
-            keywords: List of search terms (max 5)
+            keywords: List of search terms
             timeframe: 'today 3-m', 'today 12-m', 'now 7-d', etc.
 
         Returns:
             Dict with trend data and scores
         """
-        # Check rate limit before making request
-        if not _check_rate_limit():
-            logger.warning("Google Trends rate limit reached (20/hour). Using cached data.")
-            return None
-
-        try:
-            # Wait for rate limit
-            _wait_for_rate_limit()
-
-            # Limit to 5 keywords (Google limit)
-            keywords = keywords[:5]
-
-            self.pytrends.build_payload(
-                kw_list=keywords,
-                timeframe=timeframe,
-                geo='US'
-            )
-
-            df = self.pytrends.interest_over_time()
-
-            if df.empty:
-                return None
-
-            # Calculate trend metrics
-            results = {}
-            for keyword in keywords:
-                if keyword not in df.columns:
-                    continue
-
-                series = df[keyword]
-                current = float(series.iloc[-1])
-                avg_30d = float(series.tail(30).mean()) if len(series) >= 30 else float(series.mean())
-                avg_7d = float(series.tail(7).mean()) if len(series) >= 7 else current
-                max_val = float(series.max())
-                min_val = float(series.min())
-
-                # Trend direction
-                if len(series) >= 14:
-                    recent = float(series.tail(7).mean())
-                    prior = float(series.tail(14).head(7).mean())
-                    trend_pct = ((recent - prior) / prior * 100) if prior > 0 else 0
-                else:
-                    trend_pct = 0
-
-                # Momentum score (0-100)
-                momentum = min(100, max(0, (current / avg_30d - 0.5) * 100)) if avg_30d > 0 else 50
-
-                # Breakout detection
-                is_breakout = current > avg_30d * 1.5 and trend_pct > 20
-
-                results[keyword] = {
-                    'current': current,
-                    'avg_7d': round(avg_7d, 1),
-                    'avg_30d': round(avg_30d, 1),
-                    'max': max_val,
-                    'min': min_val,
-                    'trend_pct': round(trend_pct, 1),
-                    'momentum': round(momentum, 1),
-                    'is_breakout': is_breakout,
-                    'status': 'breakout' if is_breakout else 'rising' if trend_pct > 10 else 'stable' if trend_pct > -10 else 'declining'
-                }
-
-            return results
-
-        except Exception as e:
-            error_str = str(e).lower()
-            if '429' in error_str or 'too many requests' in error_str or 'rate' in error_str:
-                logger.warning(f"Google Trends rate limited. Will retry later.")
-                # Mark that we hit rate limit - don't make more requests
-                global _request_count
-                _request_count = RATE_LIMIT_MAX_PER_HOUR  # Force wait until window resets
-            else:
-                logger.error(f"Google Trends error: {e}")
-            return None
+        series = get_trends_service().get_series(keywords, timeframe=timeframe, max_age=CACHE_TTL)
+        results = {
+            keyword: _series_metrics(data.values)
+            for keyword, data in series.items() if data.values
+        }
+        return results or None
 
     def get_related_queries(self, keyword: str) -> Dict:
         """
@@ -276,44 +216,62 @@ def get_trend_score(keyword: str, use_cache: bool = True) -> Dict:
     Returns:
         Dict with score (0-100), trend direction, and status
     """
-    cache_key = f"trend_{keyword}"
-
-    # Check cache
-    if use_cache and cache_key in _trends_cache:
-        if datetime.now().timestamp() < _cache_expiry.get(cache_key, 0):
-            return _trends_cache[cache_key]
-
     if not HAS_PYTRENDS:
         return {'score': 50, 'status': 'unknown', 'error': 'pytrends not installed'}
 
     try:
-        client = GoogleTrendsClient()
-        result = client.get_interest_over_time([keyword])
+        result = get_trend_scores([keyword], use_cache=use_cache).get(keyword)
+        return result or {'keyword': keyword, 'score': 50, 'status': 'no_data'}
 
-        if result and keyword in result:
-            data = result[keyword]
-            response = {
-                'keyword': keyword,
-                'score': data['momentum'],
-                'current': data['current'],
-                'avg_30d': data['avg_30d'],
-                'trend_pct': data['trend_pct'],
-                'status': data['status'],
-                'is_breakout': data['is_breakout'],
-                'timestamp': datetime.now().isoformat()
-            }
+    except Exception as e:
+        logger.error(f"Trend score error for {keyword}: {e}")
+        return {'keyword': keyword, 'score': 50, 'status': 'error', 'error': str(e)}
 
-            # Cache result
-            _trends_cache[cache_key] = response
-            _cache_expiry[cache_key] = datetime.now().timestamp() + CACHE_TTL
 
-            return response
+def get_trend_scores(keywords: List[str], use_cache: bool = True,
+                     max_requests: int = None) -> Dict[str, Dict]:
+    """
+    Get trend scores for many keywords, batched by the trends service.
 
-        return {'keyword': keyword, 'score': 50, 'status': 'no_data'}
+    Scores are ratios within a keyword's own series (current vs. its
+    averages), so they don't depend on which keywords share a payload.
 
-    except Exception as e:
-        logger.error(f"Trend score error for {keyword}: {e}")
-        return {'keyword': keyword, 'score': 50, 'status': 'error', 'error': str(e)}
+    Args:
+        keywords: Search terms to score
+        use_cache: Serve results fetched within CACHE_TTL without a request
+        max_requests: Cap on payloads sent this call (default: no cap
+            beyond the hourly rate budget)
+
+    Returns:
+        Dict of keyword -> get_trend_score-style result. Keywords that
+        could not be fetched (rate limit, budget, errors, no data) are
+        omitted.
+    """
+    if not HAS_PYTRENDS:
+        return {}
+
+    series = get_trends_service().get_series(
+        keywords, max_age=CACHE_TTL if use_cache else 0, max_requests=max_requests
+    )
+
+    results = {}
+    for keyword, data in series.items():
+        if not data.values:
+            continue
+        metrics = _series_metrics(data.values)
+        results[keyword] = {
+            'keyword': keyword,
+            'score': metrics['momentum'],
+            'current': metrics['current'],
+            'avg_30d': metrics['avg_30d'],
+            'trend_pct': metrics['trend_pct'],
+            'status': metrics['status'],
+            'is_breakout': metrics['is_breakout'],
+            'anchor_ratio': data.anchor_ratio,
+            'timestamp': datetime.fromtimestamp(data.fetched_at).isoformat()
+        }
+
+    return results
 
 
 def detect_trending_themes(themes: Dict[str, List[str]] = None) -> List[Dict]:
@@ -328,50 +286,24 @@ def detect_trending_themes(themes: Dict[str, List[str]] = None) -> List[Dict]:
     if themes is None:
         themes = THEME_KEYWORDS
 
-    results = []
-    client = GoogleTrendsClient()
+    # Use first keyword as primary; all themes go out in shared payloads
+    primary = {theme_id: keywords[0] for theme_id, keywords in themes.items() if keywords}
+    scores = get_trend_scores(list(primary.values()))
 
-    for theme_id, keywords in themes.items():
-        try:
-            # Use first keyword as primary
-            primary_keyword = keywords[0]
-
-            # Check cache first
-            cache_key = f"theme_{theme_id}"
-            if cache_key in _trends_cache:
-                if datetime.now().timestamp() < _cache_expiry.get(cache_key, 0):
-                    results.append(_trends_cache[cache_key])
-                    continue
-
-            # Fetch trend data
-            data = client.get_interest_over_time([primary_keyword])
-
-            if data and primary_keyword in data:
-                trend = data[primary_keyword]
-
-                result = {
-                    'theme_id': theme_id,
-                    'keyword': primary_keyword,
-                    'score': trend['momentum'],
-                    'trend_pct': trend['trend_pct'],
-                    'status': trend['status'],
-                    'is_breakout': trend['is_breakout'],
-                    'current': trend['current'],
-                    'avg_30d': trend['avg_30d']
-                }
-
-                results.append(result)
-
-                # Cache
-                _trends_cache[cache_key] = result
-                _cache_expiry[cache_key] = datetime.now().timestamp() + CACHE_TTL
-
-            # Rate limiting - be nice to Google
-            time.sleep(1)
-
-        except Exception as e:
-            logger.error(f"Error checking theme {theme_id}: {e}")
-            continue
+    results = []
+    for theme_id, keyword in primary.items():
+        trend = scores.get(keyword)
+        if trend:
+            results.append({
+                'theme_id': theme_id,
+                'keyword': keyword,
+                'score': trend['score'],
+                'trend_pct': trend['trend_pct'],
+                'status': trend['status'],
+                'is_breakout': trend['is_breakout'],
+                'current': trend['current'],
+                'avg_30d': trend['avg_30d']
+            })
 
     # Sort by momentum score
     results.sort(key=lambda x: x.get('score', 0), reverse=True)
@@ -0,0 +1,266 @@
+"""
+News Ingestion Service
+======================
+One async ingestion layer for per-ticker news, shared by the news
+sentiment scan (src/analysis/news_analyzer.py) and fast story detection
+(src/themes/fast_stories.py).
+
+- Every enabled source is fetched concurrently, per ticker and across
+  tickers. Each source has its own concurrency limit so a large ticker
+  list never floods a single API.
+- Headlines are deduplicated across sources by a hash of the normalized
+  title, keeping the copy from the highest-priority source.
+- Merged headlines are cached per ticker in the shared CacheManager, so
+  whichever caller runs second reads the other's results.
+
+Usage:
+    from src.data.news_service import get_news_service
+
+    service = get_news_service()
+    news = service.fetch_news(['NVDA', 'AMD'])   # {ticker: [headline, ...]}
+    headlines = service.get_news('NVDA')
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.data.cache_manager import CacheConfig, CacheManager, get_cache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+NEWS_CACHE_TTL = CacheConfig.TTL_NEWS
+MAX_HEADLINES_PER_TICKER = 30
+
+# Trailing " - Reuters" / " | Benzinga" publisher suffixes
+_PUBLISHER_SUFFIX = re.compile(r'\s+[-|]\s+[^-|]{2,40}$')
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+# =============================================================================
+# HEADLINE DEDUP
+# =============================================================================
+
+def merged_news_cache_key(ticker: str) -> str:
+    """
+    Cache key for the service's merged headlines. Kept apart from
+    news_cache_key, which the async scanner fills with its own
+    Polygon-only schema.
+    """
+    return make_cache_key('news', ticker, 'merged')
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase a headline and strip publisher suffixes and punctuation."""
+    title = _PUBLISHER_SUFFIX.sub('', title.strip())
+    return _NON_WORD.sub(' ', title.lower()).strip()
+
+
+def title_key(title: str) -> str:
+    """Hash of the normalized title, used as the dedup key."""
+    return hashlib.sha1(normalize_title(title).encode()).hexdigest()[:16]
+
+
+def headline_timestamp(headline: dict) -> float:
+    """Publish time as epoch seconds (0 when unknown)."""
+    ts = headline.get('timestamp', 0)
+    if isinstance(ts, str):
+        try:
+            return datetime.fromisoformat(ts.replace('Z', '+00:00')).timestamp()
+        except (ValueError, AttributeError):
+            return 0
+    return ts or 0
+
+
+class HeadlineIndex:
+    """
+    Normalized-title hash index.
+
+    The first copy of a headline wins; later copies only add their
+    provider to the winner's 'also_reported_by' list.
+    """
+
+    def __init__(self):
+        self._by_key: Dict[str, dict] = {}
+
+    def add(self, headline: dict) -> bool:
+        """Add a headline. Returns False if it was a duplicate."""
+        key = title_key(headline['title'])
+        existing = self._by_key.get(key)
+        if existing is None:
+            self._by_key[key] = headline
+            return True
+
+        provider = headline.get('provider')
+        if provider and provider != existing.get('provider'):
+            reported = existing.setdefault('also_reported_by', [])
+            if provider not in reported:
+                reported.append(provider)
+        return False
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def headlines(self) -> List[dict]:
+        """Unique headlines, most recent first."""
+        return sorted(self._by_key.values(), key=headline_timestamp, reverse=True)
+
+
+# =============================================================================
+# SOURCES
+# =============================================================================
+
+@dataclass
+class NewsSource:
+    """A per-ticker news fetcher and its concurrency limit."""
+    name: str
+    fetch: Callable[[str], List[dict]]
+    limit: int = 2
+    enabled: Callable[[], bool] = lambda: True
+
+
+def default_sources() -> List[NewsSource]:
+    """Configured news sources, highest priority (dedup winner) first."""
+    from src.analysis import news_analyzer
+    from utils.data_providers import FinnhubProvider, TiingoProvider
+
+    return [
+        NewsSource('polygon', news_analyzer.fetch_polygon_news, limit=5,
+                   enabled=lambda: bool(os.environ.get('POLYGON_API_KEY', ''))),
+        NewsSource('finnhub', news_analyzer.fetch_finnhub_news, limit=2,
+                   enabled=FinnhubProvider.is_configured),
+        NewsSource('tiingo', news_analyzer.fetch_tiingo_news, limit=2,
+                   enabled=TiingoProvider.is_configured),
+        NewsSource('yahoo_finance', news_analyzer.scrape_yahoo_news, limit=4),
+        NewsSource('finviz', news_analyzer.scrape_finviz_news, limit=2),
+    ]
+
+
+# =============================================================================
+# SERVICE
+# =============================================================================
+
+class NewsService:
+    """Concurrent multi-source news fetch with cross-source dedup and caching."""
+
+    def __init__(
+        self,
+        sources: Optional[List[NewsSource]] = None,
+        cache: Optional[CacheManager] = None,
+        ttl: int = NEWS_CACHE_TTL,
+    ):
+        self._sources = sources
+        self.cache = cache or get_cache()
+        self.ttl = ttl
+
+    @property
+    def sources(self) -> List[NewsSource]:
+        if self._sources is None:
+            self._sources = default_sources()
+        return self._sources
+
+    def _merge(self, ticker: str, sources: List[NewsSource], batches: List[List[dict]]) -> List[dict]:
+        index = HeadlineIndex()
+        for source, batch in zip(sources, batches):
+            for item in batch or []:
+                if not item.get('title'):
+                    continue
+                headline = dict(item)
+                headline.setdefault('provider', source.name)
+                headline['ticker'] = ticker
+                index.add(headline)
+        return index.headlines()[:MAX_HEADLINES_PER_TICKER]
+
+    async def fetch_news_async(self, tickers: Iterable[str], use_cache: bool = True) -> Dict[str, List[dict]]:
+        """
+        Fetch news for many tickers.
+
+        Cached tickers are served from the cache. For the rest, every
+        (ticker, source) pair runs concurrently, bounded by each source's
+        limit.
+
+        Returns:
+            Dict of ticker -> unique headlines, most recent first
+        """
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        results = {}
+        missing = []
+
+        for ticker in tickers:
+            cached = self.cache.get(merged_news_cache_key(ticker)) if use_cache else None
+            if cached is not None:
+                results[ticker] = list(cached)
+            else:
+                missing.append(ticker)
+
+        sources = [s for s in self.sources if s.enabled()]
+        if not missing or not sources:
+            results.update({t: [] for t in missing})
+            return results
+
+        loop = asyncio.get_running_loop()
+        limits = {s.name: asyncio.Semaphore(s.limit) for s in sources}
+
+        with ThreadPoolExecutor(max_workers=sum(s.limit for s in sources),
+                                thread_name_prefix='news') as executor:
+
+            async def fetch(source: NewsSource, ticker: str) -> List[dict]:
+                async with limits[source.name]:
+                    try:
+                        return await loop.run_in_executor(executor, source.fetch, ticker)
+                    except Exception as e:
+                        logger.debug(f"{source.name} news failed for {ticker}: {e}")
+                        return []
+
+            per_ticker = await asyncio.gather(*(
+                asyncio.gather(*(fetch(s, ticker) for s in sources))
+                for ticker in missing
+            ))
+
+        for ticker, batches in zip(missing, per_ticker):
+            headlines = self._merge(ticker, sources, batches)
+            self.cache.set(merged_news_cache_key(ticker), headlines, self.ttl)
+            results[ticker] = headlines
+
+        logger.info(f"News: fetched {len(missing)} tickers from {len(sources)} sources "
+                    f"({len(tickers) - len(missing)} cached)")
+        return results
+
+    def fetch_news(self, tickers: Iterable[str], use_cache: bool = True) -> Dict[str, List[dict]]:
+        """Synchronous wrapper around fetch_news_async."""
+        coro = self.fetch_news_async(tickers, use_cache)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Private loop: asyncio.run() would clear the caller's current loop
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(coro)
+            finally:
+                loop.close()
+
+        # Already inside an event loop: run on a separate thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    def get_news(self, ticker: str, use_cache: bool = True) -> List[dict]:
+        """Unique headlines for one ticker, most recent first."""
+        return self.fetch_news([ticker], use_cache).get(ticker.upper(), [])
+
+
+# Singleton instance
+_news_service = None
+
+
+def get_news_service() -> NewsService:
+    """Get the shared news service."""
+    global _news_service
+    if _news_service is None:
+        _news_service = NewsService()
+    return _news_service
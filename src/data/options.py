@@ -1045,23 +1045,25 @@ def scan_unusual_options_universe(tickers: List[str], min_threshold: float = 2.0
     try:
         logger.info(f"Scanning {len(tickers)} tickers for unusual options activity (threshold: {min_threshold})")
 
+        from src.analysis.options_scanner import get_options_scanner
+
+        # One concurrent chain fetch for the whole list, reused by other screens
+        scanner = get_options_scanner()
+        scanner.refresh(tickers)
+
         results = []
 
-        for ticker in tickers:
-            try:
-                unusual = get_unusual_activity(ticker, min_threshold)
-
-                # Only include if unusual activity detected
-                if unusual.get('unusual_activity') and not unusual.get('error'):
-                    results.append({
-                        'ticker': ticker,
-                        'unusual_contracts': len(unusual.get('unusual_contracts', [])),
-                        'signals': unusual.get('signals', []),
-                        'summary': unusual.get('summary', {})
-                    })
-            except Exception as e:
-                logger.debug(f"Skipping {ticker} in unusual scan: {e}")
-                continue
+        for ticker in dict.fromkeys(t.upper() for t in tickers):
+            unusual = scanner.unusual_activity(ticker, min_threshold)
+
+            # Only include if unusual activity detected
+            if unusual.get('unusual_activity'):
+                results.append({
+                    'ticker': ticker,
+                    'unusual_contracts': len(unusual.get('unusual_contracts', [])),
+                    'signals': unusual.get('signals', []),
+                    'summary': unusual.get('summary', {})
+                })
 
         # Sort by number of unusual contracts (most unusual first)
         results.sort(key=lambda x: x['unusual_contracts'], reverse=True)
@@ -6,6 +6,8 @@ Replaces yfinance for faster, more reliable price data.
 """
 
 import os
+import re
+import time
 import asyncio
 import aiohttp
 import logging
@@ -20,6 +22,22 @@ POLYGON_API_KEY = os.environ.get('POLYGON_API_KEY', '')
 POLYGON_BASE_URL = 'https://api.polygon.io'
 
 
+def _endpoint_route(endpoint: str) -> str:
+    """
+    Reduce an endpoint path to its route for metric labels.
+
+    Keeps leading lowercase path segments and drops everything from the
+    first symbol/date segment on, e.g. '/v2/aggs/ticker/NVDA/range/...'
+    becomes '/v2/aggs/ticker'.
+    """
+    route = []
+    for segment in endpoint.strip('/').split('/'):
+        if not (segment.isalpha() and segment.islower()) and not re.fullmatch(r'v\d+', segment):
+            break
+        route.append(segment)
+    return '/' + '/'.join(route)
+
+
 class PolygonProvider:
     """
     Async Polygon.io data provider.
@@ -63,8 +81,11 @@ class PolygonProvider:
         params = params or {}
         params['apiKey'] = self.api_key
 
+        start_time = time.perf_counter()
+        status = 'error'
         try:
             async with session.get(url, params=params, timeout=10) as response:
+                status = str(response.status)
                 if response.status == 200:
                     return await response.json()
                 elif response.status == 429:
@@ -74,11 +95,21 @@ class PolygonProvider:
                     logger.error(f"Polygon API error {response.status} for {endpoint}: {await response.text()}")
                     return None
         except asyncio.TimeoutError:
+            status = 'timeout'
             logger.warning(f"Polygon request timeout: {endpoint}")
             return None
         except Exception as e:
             logger.error(f"Polygon request error for {endpoint}: {type(e).__name__}: {e}", exc_info=True)
             return None
+        finally:
+            from src.core.performance import perf_monitor
+            perf_monitor.record(
+                'provider_request',
+                time.perf_counter() - start_time,
+                provider='polygon',
+                endpoint=_endpoint_route(endpoint),
+                status=status,
+            )
 
     async def get_aggregates(
         self,
@@ -383,6 +414,7 @@ class PolygonProvider:
                         'high': t.get('day', {}).get('h'),
                         'low': t.get('day', {}).get('l'),
                         'prev_close': t.get('prevDay', {}).get('c'),
+                        'prev_volume': t.get('prevDay', {}).get('v'),
                     }
         return snapshots
 
@@ -716,68 +748,7 @@ class PolygonProvider:
             Analysis of unusual options activity
         """
         chain = await self.get_options_chain(ticker)
-
-        if not chain.get('calls') and not chain.get('puts'):
-            return {'unusual_activity': False, 'signals': []}
-
-        signals = []
-        unusual_contracts = []
-
-        # Analyze each contract for unusual activity
-        for contract in chain.get('calls', []) + chain.get('puts', []):
-            volume = contract.get('volume', 0)
-            oi = contract.get('open_interest', 1)  # Avoid division by zero
-            last_price = contract.get('last_price') or contract.get('bid') or 0
-
-            # Calculate premium (price * volume * 100 shares per contract)
-            premium = last_price * volume * 100 if last_price and volume else 0
-
-            # High volume relative to open interest
-            if volume > 0 and oi > 0:
-                vol_oi_ratio = volume / oi
-                if vol_oi_ratio >= volume_threshold:
-                    unusual_contracts.append({
-                        'ticker': contract.get('ticker'),
-                        'type': contract.get('contract_type'),
-                        'strike': contract.get('strike'),
-                        'expiration': contract.get('expiration'),
-                        'volume': volume,
-                        'open_interest': oi,
-                        'vol_oi_ratio': round(vol_oi_ratio, 2),
-                        'implied_volatility': contract.get('implied_volatility'),
-                        'premium': premium,
-                        'last_price': last_price,
-                        'signal': 'HIGH_VOL_VS_OI',
-                    })
-
-        # Overall flow analysis
-        summary = chain.get('summary', {})
-        pc_ratio = summary.get('put_call_volume_ratio', 1.0)
-
-        if pc_ratio > 1.5:
-            signals.append({
-                'type': 'BEARISH_FLOW',
-                'description': f'High put/call ratio: {pc_ratio:.2f}',
-                'strength': 'strong' if pc_ratio > 2.0 else 'moderate',
-            })
-        elif pc_ratio < 0.5:
-            signals.append({
-                'type': 'BULLISH_FLOW',
-                'description': f'Low put/call ratio: {pc_ratio:.2f}',
-                'strength': 'strong' if pc_ratio < 0.3 else 'moderate',
-            })
-
-        # Sort unusual contracts by vol/oi ratio
-        unusual_contracts.sort(key=lambda x: x.get('vol_oi_ratio', 0), reverse=True)
-
-        return {
-            'ticker': ticker,
-            'unusual_activity': len(unusual_contracts) > 0 or len(signals) > 0,
-            'unusual_contracts': unusual_contracts[:10],  # Top 10
-            'signals': signals,
-            'summary': summary,
-            'total_unusual_contracts': len(unusual_contracts),
-        }
+        return summarize_unusual_options(chain, ticker, volume_threshold)
 
     async def get_options_flow_summary(self, ticker: str) -> Dict:
         """
@@ -787,32 +758,7 @@ class PolygonProvider:
             Simplified options flow data for the ticker
         """
         chain = await self.get_options_chain(ticker)
-        summary = chain.get('summary', {})
-
-        # Determine overall sentiment from options flow
-        pc_ratio = summary.get('put_call_volume_ratio', 1.0)
-
-        if pc_ratio > 1.3:
-            sentiment = 'bearish'
-            sentiment_score = min(100, int((pc_ratio - 1.0) * 100))
-        elif pc_ratio < 0.7:
-            sentiment = 'bullish'
-            sentiment_score = min(100, int((1.0 - pc_ratio) * 100))
-        else:
-            sentiment = 'neutral'
-            sentiment_score = 50
-
-        return {
-            'ticker': ticker,
-            'put_call_ratio': round(pc_ratio, 2),
-            'sentiment': sentiment,
-            'sentiment_score': sentiment_score,
-            'total_call_volume': summary.get('total_call_volume', 0),
-            'total_put_volume': summary.get('total_put_volume', 0),
-            'total_call_oi': summary.get('total_call_oi', 0),
-            'total_put_oi': summary.get('total_put_oi', 0),
-            'has_unusual_activity': pc_ratio > 1.5 or pc_ratio < 0.5,
-        }
+        return summarize_options_flow(chain, ticker)
 
     # =========================================================================
     # FINANCIALS & EARNINGS DATA
@@ -1558,6 +1504,121 @@ class PolygonProvider:
         return results
 
 
+# =============================================================================
+# OPTIONS CHAIN ANALYSIS (shared by per-ticker calls and universe scans)
+# =============================================================================
+
+def summarize_unusual_options(chain: Dict, ticker: str, volume_threshold: float = 2.0) -> Dict:
+    """
+    Analyze an options chain for unusual activity.
+
+    Looks for:
+    - High volume vs open interest (potential new positions)
+    - Large put/call imbalances
+
+    Args:
+        chain: Result of PolygonProvider.get_options_chain
+        ticker: Stock symbol
+        volume_threshold: Volume/OI ratio threshold for "unusual"
+
+    Returns:
+        Analysis of unusual options activity
+    """
+    if not chain.get('calls') and not chain.get('puts'):
+        return {'unusual_activity': False, 'signals': []}
+
+    signals = []
+    unusual_contracts = []
+
+    # Analyze each contract for unusual activity
+    for contract in chain.get('calls', []) + chain.get('puts', []):
+        volume = contract.get('volume', 0)
+        oi = contract.get('open_interest', 1)  # Avoid division by zero
+        last_price = contract.get('last_price') or contract.get('bid') or 0
+
+        # Calculate premium (price * volume * 100 shares per contract)
+        premium = last_price * volume * 100 if last_price and volume else 0
+
+        # High volume relative to open interest
+        if volume > 0 and oi > 0:
+            vol_oi_ratio = volume / oi
+            if vol_oi_ratio >= volume_threshold:
+                unusual_contracts.append({
+                    'ticker': contract.get('ticker'),
+                    'type': contract.get('contract_type'),
+                    'strike': contract.get('strike'),
+                    'expiration': contract.get('expiration'),
+                    'volume': volume,
+                    'open_interest': oi,
+                    'vol_oi_ratio': round(vol_oi_ratio, 2),
+                    'implied_volatility': contract.get('implied_volatility'),
+                    'premium': premium,
+                    'last_price': last_price,
+                    'signal': 'HIGH_VOL_VS_OI',
+                })
+
+    # Overall flow analysis
+    summary = chain.get('summary', {})
+    pc_ratio = summary.get('put_call_volume_ratio', 1.0)
+
+    if pc_ratio > 1.5:
+        signals.append({
+            'type': 'BEARISH_FLOW',
+            'description': f'High put/call ratio: {pc_ratio:.2f}',
+            'strength': 'strong' if pc_ratio > 2.0 else 'moderate',
+        })
+    elif pc_ratio < 0.5:
+        signals.append({
+            'type': 'BULLISH_FLOW',
+            'description': f'Low put/call ratio: {pc_ratio:.2f}',
+            'strength': 'strong' if pc_ratio < 0.3 else 'moderate',
+        })
+
+    # Sort unusual contracts by vol/oi ratio
+    unusual_contracts.sort(key=lambda x: x.get('vol_oi_ratio', 0), reverse=True)
+
+    return {
+        'ticker': ticker,
+        'unusual_activity': len(unusual_contracts) > 0 or len(signals) > 0,
+        'unusual_contracts': unusual_contracts[:10],  # Top 10
+        'signals': signals,
+        'summary': summary,
+        'total_unusual_contracts': len(unusual_contracts),
+    }
+
+
+def summarize_options_flow(chain: Dict, ticker: str) -> Dict:
+    """
+    Simplified options flow (put/call ratio, sentiment, totals) from a chain.
+    """
+    summary = chain.get('summary', {})
+
+    # Determine overall sentiment from options flow
+    pc_ratio = summary.get('put_call_volume_ratio', 1.0)
+
+    if pc_ratio > 1.3:
+        sentiment = 'bearish'
+        sentiment_score = min(100, int((pc_ratio - 1.0) * 100))
+    elif pc_ratio < 0.7:
+        sentiment = 'bullish'
+        sentiment_score = min(100, int((1.0 - pc_ratio) * 100))
+    else:
+        sentiment = 'neutral'
+        sentiment_score = 50
+
+    return {
+        'ticker': ticker,
+        'put_call_ratio': round(pc_ratio, 2),
+        'sentiment': sentiment,
+        'sentiment_score': sentiment_score,
+        'total_call_volume': summary.get('total_call_volume', 0),
+        'total_put_volume': summary.get('total_put_volume', 0),
+        'total_call_oi': summary.get('total_call_oi', 0),
+        'total_put_oi': summary.get('total_put_oi', 0),
+        'has_unusual_activity': pc_ratio > 1.5 or pc_ratio < 0.5,
+    }
+
+
 # Singleton instance
 _provider = None
 
@@ -1697,6 +1758,39 @@ def get_snapshot_sync(ticker: str) -> Optional[Dict]:
     return _run_async(fetch())
 
 
+def get_snapshots_sync(tickers: List[str], chunk_size: int = 50) -> Dict[str, Dict]:
+    """
+    Synchronous wrapper to get snapshots for many tickers in bulk.
+
+    Uses the multi-ticker snapshot endpoint, one request per chunk of
+    `chunk_size` symbols, over a single HTTP session.
+
+    Returns:
+        Dict mapping ticker -> snapshot data (missing tickers are omitted)
+    """
+    symbols = list(dict.fromkeys(t.upper() for t in tickers if t))
+    if not symbols:
+        return {}
+
+    async def fetch():
+        provider = PolygonProvider()
+        try:
+            chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+            results = await asyncio.gather(
+                *(provider.get_all_snapshots(chunk) for chunk in chunks),
+                return_exceptions=True,
+            )
+            snapshots = {}
+            for result in results:
+                if isinstance(result, dict):
+                    snapshots.update(result)
+            return snapshots
+        finally:
+            await provider.close()
+
+    return _run_async(fetch()) or {}
+
+
 # =============================================================================
 # OPTIONS SYNCHRONOUS WRAPPERS
 # =============================================================================
@@ -15,19 +15,27 @@ SEC EDGAR API:
 - Free, no API key required
 - Rate limit: 10 requests/second
 - User-Agent required (identify yourself)
+
+Ticker -> CIK resolution and recent filings come from the local index in
+src/data/sec_index.py; the network is only used to fill stale entries.
 """
 
-import os
 import logging
 import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from src.data.sec_index import (
+    USER_AGENT,
+    CIKMap,
+    SubmissionsIndex,
+    get_cik_map,
+    get_submissions_index,
+)
+
 logger = logging.getLogger(__name__)
 
-# SEC requires identification
-USER_AGENT = os.environ.get('SEC_USER_AGENT', 'StockScannerBot/1.0 (contact@example.com)')
 SEC_BASE_URL = "https://data.sec.gov"
 SEC_SEARCH_URL = "https://efts.sec.gov/LATEST/search-index"
 
@@ -72,12 +80,14 @@ class SECEdgarClient:
         holders = client.get_institutional_holders('TSLA')
     """
 
-    def __init__(self):
+    def __init__(self, cik_map: Optional[CIKMap] = None, index: Optional[SubmissionsIndex] = None):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': USER_AGENT,
             'Accept': 'application/json'
         })
+        self.cik_map = cik_map if cik_map is not None else get_cik_map()
+        self.index = index if index is not None else get_submissions_index()
 
     def _get_cik(self, ticker: str) -> Optional[str]:
         """
@@ -85,37 +95,20 @@ class SECEdgarClient:
         CIK is SEC's unique identifier for companies.
         """
         try:
-            # SEC provides a ticker->CIK mapping
-            url = f"{SEC_BASE_URL}/submissions/CIK{ticker.upper()}.json"
-
-            # Try direct lookup first
-            response = self.session.get(
-                f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={ticker}&type=&dateb=&owner=include&count=1&output=json",
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if 'results' in data and data['results']:
-                    cik = data['results'][0].get('cik')
-                    if cik:
-                        return cik.zfill(10)  # CIK must be 10 digits
-
-            # Fallback: use the company tickers JSON
-            tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            response = self.session.get(tickers_url, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                for entry in data.values():
-                    if entry.get('ticker', '').upper() == ticker.upper():
-                        return str(entry.get('cik_str', '')).zfill(10)
-
-            return None
+            return self.cik_map.get(ticker)
         except Exception as e:
             logger.error(f"Error getting CIK for {ticker}: {e}")
             return None
 
+    def prefetch(self, tickers: List[str]) -> int:
+        """
+        Resolve CIKs and load recent filings for many tickers at once.
+
+        Later per-ticker calls are then local lookups.
+        Returns the number of companies fetched from SEC.
+        """
+        return self.index.ensure(self.cik_map.get_many(tickers).values())
+
     def get_company_filings(
         self,
         ticker: str,
@@ -136,18 +129,14 @@ class SECEdgarClient:
             return []
 
         try:
-            url = f"{SEC_BASE_URL}/submissions/CIK{cik}.json"
-            response = self.session.get(url, timeout=15)
-
-            if response.status_code != 200:
-                logger.error(f"SEC API error: {response.status_code}")
+            entry = self.index.get(cik)
+            if not entry:
                 return []
 
-            data = response.json()
-            company_name = data.get('name', ticker)
+            company_name = entry.get('name') or ticker
 
             filings = []
-            recent = data.get('filings', {}).get('recent', {})
+            recent = entry.get('recent', {})
 
             forms = recent.get('form', [])
             dates = recent.get('filingDate', [])
@@ -292,14 +281,14 @@ class SECEdgarClient:
 # M&A SPECIFIC FUNCTIONS
 # =============================================================================
 
-def detect_ma_activity(ticker: str) -> Dict:
+def detect_ma_activity(ticker: str, client: Optional[SECEdgarClient] = None) -> Dict:
     """
     Detect M&A activity for a ticker based on SEC filings.
 
     Returns:
         Dict with M&A signals and confidence score
     """
-    client = SECEdgarClient()
+    client = client or SECEdgarClient()
 
     signals = []
     score = 0
@@ -342,6 +331,26 @@ def detect_ma_activity(ticker: str) -> Dict:
     }
 
 
+def detect_ma_activity_batch(tickers: List[str]) -> List[Dict]:
+    """
+    Detect M&A activity for many tickers.
+
+    Missing or stale filings are fetched once up front; each ticker's
+    checks then run against the local index. Tickers whose checks fail
+    are left out.
+    """
+    client = SECEdgarClient()
+    client.prefetch(tickers)
+
+    results = []
+    for ticker in tickers:
+        try:
+            results.append(detect_ma_activity(ticker, client))
+        except Exception as e:
+            logger.debug(f"M&A detection failed for {ticker}: {e}")
+    return results
+
+
 def get_pending_mergers_from_sec() -> List[Dict]:
     """
     Scan recent DEFM14A filings to find pending mergers.
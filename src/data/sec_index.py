@@ -0,0 +1,366 @@
+"""
+SEC Local Index
+===============
+Local lookups for SEC EDGAR so per-ticker filing checks don't hit the
+network for every call.
+
+- CIKMap: ticker -> CIK dictionary from SEC's company_tickers.json,
+  persisted to disk, loaded once per process and refreshed daily.
+- SubmissionsIndex: recent filings per CIK (form, date, accession,
+  description), persisted to disk. Built in bulk from SEC's nightly
+  submissions.zip, with per-CIK fetches from the submissions API for
+  anything missing or stale.
+
+Usage:
+    from src.data.sec_index import get_cik_map, get_submissions_index
+
+    cik = get_cik_map().get('NVDA')                # '0001045810'
+    index = get_submissions_index()
+    index.ensure([cik])                            # fetch only if missing/stale
+    recent = index.get(cik)['recent']              # columns: form, filingDate, ...
+
+    # Nightly: rebuild the index for a universe from the bulk archive
+    index.build_from_bulk('submissions.zip', ciks)
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import requests
+
+from src.utils.file_utils import ensure_data_dir
+
+logger = logging.getLogger(__name__)
+
+# SEC requires identification
+USER_AGENT = os.environ.get('SEC_USER_AGENT', 'StockScannerBot/1.0 (contact@example.com)')
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik}.json"
+BULK_SUBMISSIONS_URL = "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip"
+
+CIK_MAP_FILENAME = 'company_tickers.json'
+INDEX_FILENAME = 'submissions_index.json'
+CIK_MAP_MAX_AGE = 86400  # Refresh ticker -> CIK map daily
+SUBMISSIONS_MAX_AGE = 43200  # Refetch a company's filings after 12 hours
+MAX_FILINGS_PER_CIK = 200  # Most recent filings kept per company
+INDEX_COLUMNS = ('form', 'filingDate', 'accessionNumber', 'primaryDocDescription')
+REQUEST_INTERVAL = 0.11  # SEC allows 10 requests/second
+MODAL_VOLUME_PATH = '/data'
+
+
+def get_sec_dir() -> Path:
+    """SEC data directory (Modal volume if mounted, so scheduled builds reach the API)."""
+    if os.path.exists(MODAL_VOLUME_PATH):
+        path = Path(MODAL_VOLUME_PATH) / 'sec'
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    return Path(ensure_data_dir('sec'))
+
+
+def _sec_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT, 'Accept': 'application/json'})
+    return session
+
+
+def _write_json(path: Path, data: dict):
+    """Write JSON atomically (temp file + rename)."""
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def normalize_ticker(ticker: str) -> str:
+    """SEC ticker form: upper case, class shares with '-' (BRK.B -> BRK-B)."""
+    return ticker.strip().upper().replace('.', '-')
+
+
+# =============================================================================
+# TICKER -> CIK
+# =============================================================================
+
+class CIKMap:
+    """
+    Persisted ticker -> CIK dictionary.
+
+    Loaded from disk on first use and refreshed from SEC once the copy
+    is older than max_age. A failed refresh keeps serving the old copy.
+    """
+
+    def __init__(self, path: Optional[Path] = None, session: Optional[requests.Session] = None,
+                 max_age: int = CIK_MAP_MAX_AGE):
+        self.path = Path(path) if path else get_sec_dir() / CIK_MAP_FILENAME
+        self.session = session or _sec_session()
+        self.max_age = max_age
+        self._ciks: Dict[str, str] = {}
+        self._names: Dict[str, str] = {}
+        self._fetched_at = 0.0
+        self._checked_at = 0.0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self._ciks = data.get('tickers', {})
+            self._names = data.get('names', {})
+            self._fetched_at = data.get('fetched_at', 0.0)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Could not read CIK map {self.path}: {e}")
+
+    def refresh(self) -> bool:
+        """Download company_tickers.json and persist it. Returns success."""
+        self._checked_at = time.time()
+        try:
+            response = self.session.get(COMPANY_TICKERS_URL, timeout=15)
+            if response.status_code != 200:
+                logger.warning(f"SEC company tickers error: {response.status_code}")
+                return False
+
+            ciks, names = {}, {}
+            for entry in response.json().values():
+                ticker = entry.get('ticker')
+                if not ticker:
+                    continue
+                cik = str(entry.get('cik_str', '')).zfill(10)
+                # First listing wins (the file is ordered by market value)
+                ciks.setdefault(normalize_ticker(ticker), cik)
+                names.setdefault(cik, entry.get('title', ''))
+
+            self._ciks, self._names = ciks, names
+            self._fetched_at = time.time()
+            _write_json(self.path, {'fetched_at': self._fetched_at, 'tickers': ciks, 'names': names})
+            logger.info(f"SEC CIK map refreshed: {len(ciks)} tickers")
+            return True
+        except Exception as e:
+            logger.error(f"Error refreshing SEC CIK map: {e}")
+            return False
+
+    def _ensure_fresh(self):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            now = time.time()
+            if now - self._fetched_at > self.max_age and now - self._checked_at > self.max_age / 24:
+                self.refresh()
+
+    def get(self, ticker: str) -> Optional[str]:
+        """10-digit CIK for a ticker, or None."""
+        self._ensure_fresh()
+        return self._ciks.get(normalize_ticker(ticker))
+
+    def get_many(self, tickers: Iterable[str]) -> Dict[str, str]:
+        """Ticker -> CIK for the tickers SEC knows."""
+        self._ensure_fresh()
+        found = {}
+        for ticker in tickers:
+            cik = self._ciks.get(normalize_ticker(ticker))
+            if cik:
+                found[ticker.upper()] = cik
+        return found
+
+    def company_name(self, cik: str) -> Optional[str]:
+        self._ensure_fresh()
+        return self._names.get(cik)
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        return len(self._ciks)
+
+
+# =============================================================================
+# RECENT FILINGS PER CIK
+# =============================================================================
+
+class SubmissionsIndex:
+    """
+    Persisted index of recent filings per CIK.
+
+    Each entry holds the company name, when it was fetched, and the
+    INDEX_COLUMNS of its newest MAX_FILINGS_PER_CIK filings, in the same
+    column layout as the submissions API ('filings.recent').
+    """
+
+    def __init__(self, path: Optional[Path] = None, session: Optional[requests.Session] = None,
+                 max_age: int = SUBMISSIONS_MAX_AGE):
+        self.path = Path(path) if path else get_sec_dir() / INDEX_FILENAME
+        self.session = session or _sec_session()
+        self.max_age = max_age
+        self._entries: Optional[Dict[str, dict]] = None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._last_request = 0.0
+        atexit.register(self.save)
+
+    @property
+    def entries(self) -> Dict[str, dict]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+                if self.path.exists():
+                    try:
+                        with open(self.path) as f:
+                            self._entries = json.load(f).get('companies', {})
+                    except (json.JSONDecodeError, OSError) as e:
+                        logger.warning(f"Could not read submissions index {self.path}: {e}")
+            return self._entries
+
+    @staticmethod
+    def _entry(cik: str, submissions: dict, fetched_at: float) -> dict:
+        recent = submissions.get('filings', {}).get('recent', {})
+        return {
+            'cik': cik,
+            'name': submissions.get('name', ''),
+            'fetched_at': fetched_at,
+            'recent': {col: list(recent.get(col, []))[:MAX_FILINGS_PER_CIK] for col in INDEX_COLUMNS},
+        }
+
+    def _is_fresh(self, entry: Optional[dict]) -> bool:
+        return entry is not None and time.time() - entry.get('fetched_at', 0) <= self.max_age
+
+    def _fetch(self, cik: str) -> Optional[dict]:
+        wait = REQUEST_INTERVAL - (time.time() - self._last_request)
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request = time.time()
+
+        response = self.session.get(SUBMISSIONS_URL.format(cik=cik), timeout=15)
+        if response.status_code != 200:
+            logger.error(f"SEC API error for CIK {cik}: {response.status_code}")
+            return None
+        return self._entry(cik, response.json(), time.time())
+
+    def ensure(self, ciks: Iterable[str]) -> int:
+        """
+        Fetch submissions for CIKs that are missing or stale.
+
+        Saves once at the end. Returns the number of companies fetched.
+        """
+        fetched = 0
+        with self._lock:
+            entries = self.entries
+            for cik in dict.fromkeys(ciks):
+                if self._is_fresh(entries.get(cik)):
+                    continue
+                try:
+                    entry = self._fetch(cik)
+                except Exception as e:
+                    logger.error(f"Error fetching submissions for CIK {cik}: {e}")
+                    entry = None
+                if entry:
+                    entries[cik] = entry
+                    self._dirty = True
+                    fetched += 1
+            self.save()
+        return fetched
+
+    def get(self, cik: str, fetch: bool = True) -> Optional[dict]:
+        """Index entry for a CIK, fetching it first if missing or stale."""
+        if fetch:
+            self.ensure([cik])
+        return self.entries.get(cik)
+
+    def build_from_bulk(self, source=BULK_SUBMISSIONS_URL, ciks: Optional[Iterable[str]] = None) -> int:
+        """
+        Load entries from SEC's bulk submissions.zip.
+
+        Args:
+            source: Path to a downloaded submissions.zip, or its URL
+            ciks: Only index these CIKs (default: every company in the archive)
+
+        Returns:
+            Number of companies indexed
+        """
+        downloaded = str(source).startswith('http')
+        path = self._download(source) if downloaded else Path(source)
+        try:
+            count = self._load_bulk(path, ciks)
+        finally:
+            if downloaded:
+                path.unlink(missing_ok=True)
+
+        logger.info(f"SEC submissions index built from bulk data: {count} companies")
+        return count
+
+    def _load_bulk(self, path: Path, ciks: Optional[Iterable[str]]) -> int:
+        wanted = set(ciks) if ciks is not None else None
+        fetched_at = os.path.getmtime(path)
+        count = 0
+
+        with zipfile.ZipFile(path) as archive, self._lock:
+            entries = self.entries
+            for name in archive.namelist():
+                # CIK##########.json; skip the -submissions-NNN.json overflow pages
+                if not name.startswith('CIK') or not name.endswith('.json') or '-' in name:
+                    continue
+                cik = name[3:13]
+                if wanted is not None and cik not in wanted:
+                    continue
+                try:
+                    submissions = json.loads(archive.read(name))
+                except ValueError:
+                    continue
+                entries[cik] = self._entry(cik, submissions, fetched_at)
+                count += 1
+
+            self._dirty = True
+            self.save()
+        return count
+
+    def _download(self, url: str) -> Path:
+        """Download the archive to local temp space (it's large; keep it off the volume)."""
+        fd, name = tempfile.mkstemp(suffix='.zip')
+        os.close(fd)
+        target = Path(name)
+        with self.session.get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            with open(target, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+        return target
+
+    def save(self):
+        """Write the index if it changed."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            _write_json(self.path, {'companies': self._entries})
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# Singleton instances
+_cik_map = None
+_submissions_index = None
+
+
+def get_cik_map() -> CIKMap:
+    """Get the shared ticker -> CIK map."""
+    global _cik_map
+    if _cik_map is None:
+        _cik_map = CIKMap()
+    return _cik_map
+
+
+def get_submissions_index() -> SubmissionsIndex:
+    """Get the shared submissions index."""
+    global _submissions_index
+    if _submissions_index is None:
+        _submissions_index = SubmissionsIndex()
+    return _submissions_index
@@ -2,11 +2,20 @@
 """
 Persistent Storage Module
 
-Handles watchlists, alerts, portfolios with file-based storage.
-Can be swapped to Redis/database later.
+Handles watchlists, alerts, portfolios in a single SQLite database
+(user_data/storage.db) with one row per ticker, alert, position and
+closed trade, so each operation touches only the rows it needs and
+cross-user queries (active alerts for the background checker) are index
+lookups instead of a walk over per-user directories.
+
+The older layout (user_data/<chat_id>/{watchlist,alerts,portfolio}.json)
+is imported once on first use; the files are left in place.
 """
 
 import json
+import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
 from config import config
@@ -16,29 +25,165 @@ logger = get_logger(__name__)
 
 # Storage directory
 STORAGE_DIR = config.storage.user_data_dir
+DB_FILE = 'storage.db'
+BUSY_TIMEOUT = 10  # Seconds to wait on another writer (e.g. another container) before failing
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watchlist (
+    chat_id INTEGER NOT NULL,
+    ticker TEXT NOT NULL,
+    PRIMARY KEY (chat_id, ticker)
+);
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    chat_id INTEGER NOT NULL,
+    ticker TEXT NOT NULL,
+    price REAL NOT NULL,
+    direction TEXT NOT NULL,
+    created TEXT,
+    triggered INTEGER NOT NULL DEFAULT 0,
+    triggered_at TEXT,
+    triggered_price REAL
+);
+CREATE INDEX IF NOT EXISTS idx_alerts_chat ON alerts (chat_id, ticker);
+CREATE INDEX IF NOT EXISTS idx_alerts_active ON alerts (ticker) WHERE triggered = 0;
+CREATE TABLE IF NOT EXISTS positions (
+    chat_id INTEGER NOT NULL,
+    ticker TEXT NOT NULL,
+    shares REAL NOT NULL,
+    entry_price REAL NOT NULL,
+    entry_date TEXT,
+    added TEXT,
+    PRIMARY KEY (chat_id, ticker)
+);
+CREATE TABLE IF NOT EXISTS closed_trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    chat_id INTEGER NOT NULL,
+    trade TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_closed_trades_chat ON closed_trades (chat_id, id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
 
-def _get_user_file(chat_id, data_type):
-    """Get user-specific data file path."""
-    user_dir = STORAGE_DIR / str(chat_id)
-    user_dir.mkdir(exist_ok=True)
-    return user_dir / f'{data_type}.json'
-
-def _load_data(chat_id, data_type, default=None):
-    """Load user data."""
-    filepath = _get_user_file(chat_id, data_type)
-    if filepath.exists():
+_db = None
+_db_lock = threading.RLock()
+
+
+def _get_db():
+    """Shared connection (created, and the old layout migrated, on first use)."""
+    global _db
+    with _db_lock:
+        if _db is None:
+            STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(STORAGE_DIR / DB_FILE), timeout=BUSY_TIMEOUT,
+                                 check_same_thread=False, isolation_level=None)
+            try:
+                db.row_factory = sqlite3.Row
+                db.execute('PRAGMA journal_mode=WAL')
+                db.executescript(_SCHEMA)
+                _migrate_json_files(db)
+            except Exception:
+                db.close()
+                raise
+            _db = db
+        return _db
+
+
+def _query(sql, params=()):
+    """Run a read query and return all rows."""
+    with _db_lock:
+        return _get_db().execute(sql, params).fetchall()
+
+
+@contextmanager
+def _transaction():
+    """Serialized write transaction: `with _transaction() as db: ...`"""
+    with _db_lock:
+        db = _get_db()
+        db.execute('BEGIN IMMEDIATE')
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError, OSError) as e:
-            logger.warning(f"Failed to load {data_type} for {chat_id}: {e}")
-    return default if default is not None else {}
+            yield db
+            db.execute('COMMIT')
+        except BaseException:
+            if db.in_transaction:
+                db.execute('ROLLBACK')
+            raise
+
 
-def _save_data(chat_id, data_type, data):
-    """Save user data."""
-    filepath = _get_user_file(chat_id, data_type)
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+def close():
+    """Close the shared connection (the next call reopens it)."""
+    global _db
+    with _db_lock:
+        if _db is not None:
+            _db.close()
+            _db = None
+
+
+# =============================================================================
+# MIGRATION
+# =============================================================================
+
+def _load_json(filepath, default):
+    try:
+        with open(filepath, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError, OSError) as e:
+        logger.warning(f"Failed to load {filepath}: {e}")
+    return default
+
+
+def _migrate_json_files(db):
+    """Import user_data/<chat_id>/*.json into the database (once)."""
+    users = 0
+    db.execute('BEGIN IMMEDIATE')
+    try:
+        # Checked inside the write lock so only one process imports
+        if db.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+            db.execute('COMMIT')
+            return
+
+        for user_dir in STORAGE_DIR.iterdir():
+            if not user_dir.is_dir():
+                continue
+            try:
+                chat_id = int(user_dir.name)
+            except ValueError:
+                continue  # Not a chat directory
+
+            watchlist_file = user_dir / 'watchlist.json'
+            if watchlist_file.exists():
+                tickers = _load_json(watchlist_file, {}).get('tickers', [])
+                db.executemany('INSERT OR IGNORE INTO watchlist (chat_id, ticker) VALUES (?, ?)',
+                               [(chat_id, t) for t in tickers])
+
+            alerts_file = user_dir / 'alerts.json'
+            if alerts_file.exists():
+                for alert in _load_json(alerts_file, {}).get('alerts', []):
+                    _insert_alert(db, chat_id, alert)
+
+            portfolio_file = user_dir / 'portfolio.json'
+            if portfolio_file.exists():
+                data = _load_json(portfolio_file, {})
+                for p in data.get('positions', []):
+                    db.execute(
+                        'INSERT OR REPLACE INTO positions (chat_id, ticker, shares, entry_price, entry_date, added) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (chat_id, p['ticker'], p['shares'], p['entry_price'], p.get('entry_date'), p.get('added')))
+                db.executemany('INSERT INTO closed_trades (chat_id, trade) VALUES (?, ?)',
+                               [(chat_id, json.dumps(t, default=str)) for t in data.get('closed_trades', [])])
+            users += 1
+
+        db.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (datetime.now().isoformat(),))
+        db.execute('COMMIT')
+    except Exception:
+        db.execute('ROLLBACK')
+        raise
+
+    if users:
+        logger.info(f"Migrated storage for {users} users from JSON files")
 
 
 # =============================================================================
@@ -47,56 +192,67 @@ def _save_data(chat_id, data_type, data):
 
 def get_watchlist(chat_id):
     """Get user's watchlist."""
-    data = _load_data(chat_id, 'watchlist', {'tickers': []})
-    return data.get('tickers', [])
+    rows = _query('SELECT ticker FROM watchlist WHERE chat_id = ? ORDER BY rowid', (int(chat_id),))
+    return [r['ticker'] for r in rows]
 
 def add_to_watchlist(chat_id, ticker):
     """Add ticker to watchlist."""
-    data = _load_data(chat_id, 'watchlist', {'tickers': []})
-    tickers = data.get('tickers', [])
-
     ticker = ticker.upper()
-    if ticker not in tickers:
-        tickers.append(ticker)
-        data['tickers'] = tickers[:config.storage.max_watchlist_size]  # Max watchlist size
-        data['updated'] = datetime.now().isoformat()
-        _save_data(chat_id, 'watchlist', data)
+    with _transaction() as db:
+        if db.execute('SELECT 1 FROM watchlist WHERE chat_id = ? AND ticker = ?',
+                      (int(chat_id), ticker)).fetchone():
+            return False
+        count = db.execute('SELECT COUNT(*) FROM watchlist WHERE chat_id = ?', (int(chat_id),)).fetchone()[0]
+        if count < config.storage.max_watchlist_size:  # Max watchlist size
+            db.execute('INSERT INTO watchlist (chat_id, ticker) VALUES (?, ?)', (int(chat_id), ticker))
         return True
-    return False
 
 def remove_from_watchlist(chat_id, ticker):
     """Remove ticker from watchlist."""
-    data = _load_data(chat_id, 'watchlist', {'tickers': []})
-    tickers = data.get('tickers', [])
-
-    ticker = ticker.upper()
-    if ticker in tickers:
-        tickers.remove(ticker)
-        data['tickers'] = tickers
-        data['updated'] = datetime.now().isoformat()
-        _save_data(chat_id, 'watchlist', data)
-        return True
-    return False
+    with _transaction() as db:
+        cursor = db.execute('DELETE FROM watchlist WHERE chat_id = ? AND ticker = ?',
+                            (int(chat_id), ticker.upper()))
+        return cursor.rowcount > 0
 
 def clear_watchlist(chat_id):
     """Clear entire watchlist."""
-    _save_data(chat_id, 'watchlist', {'tickers': [], 'updated': datetime.now().isoformat()})
+    with _transaction() as db:
+        db.execute('DELETE FROM watchlist WHERE chat_id = ?', (int(chat_id),))
 
 
 # =============================================================================
 # PRICE ALERTS
 # =============================================================================
 
+def _insert_alert(db, chat_id, alert):
+    db.execute(
+        'INSERT INTO alerts (chat_id, ticker, price, direction, created, triggered, triggered_at, triggered_price) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        (chat_id, alert['ticker'], alert['price'], alert['direction'], alert.get('created'),
+         int(bool(alert.get('triggered'))), alert.get('triggered_at'), alert.get('triggered_price')))
+
+def _alert_dict(row, with_chat_id=False):
+    alert = {
+        'ticker': row['ticker'],
+        'price': row['price'],
+        'direction': row['direction'],
+        'created': row['created'],
+        'triggered': bool(row['triggered']),
+    }
+    if row['triggered']:
+        alert['triggered_at'] = row['triggered_at']
+        alert['triggered_price'] = row['triggered_price']
+    if with_chat_id:
+        alert['chat_id'] = row['chat_id']
+    return alert
+
 def get_alerts(chat_id):
     """Get user's price alerts."""
-    data = _load_data(chat_id, 'alerts', {'alerts': []})
-    return data.get('alerts', [])
+    rows = _query('SELECT * FROM alerts WHERE chat_id = ? ORDER BY id', (int(chat_id),))
+    return [_alert_dict(r) for r in rows]
 
 def add_alert(chat_id, ticker, price, direction='above'):
     """Add price alert."""
-    data = _load_data(chat_id, 'alerts', {'alerts': []})
-    alerts = data.get('alerts', [])
-
     alert = {
         'ticker': ticker.upper(),
         'price': float(price),
@@ -105,72 +261,51 @@ def add_alert(chat_id, ticker, price, direction='above'):
         'triggered': False
     }
 
-    alerts.append(alert)
-    data['alerts'] = alerts[:config.storage.max_alerts_per_user]  # Max alerts per user
-    _save_data(chat_id, 'alerts', data)
+    with _transaction() as db:
+        count = db.execute('SELECT COUNT(*) FROM alerts WHERE chat_id = ?', (int(chat_id),)).fetchone()[0]
+        if count < config.storage.max_alerts_per_user:  # Max alerts per user
+            _insert_alert(db, int(chat_id), alert)
     return alert
 
 def remove_alert(chat_id, ticker):
     """Remove alerts for a ticker."""
-    data = _load_data(chat_id, 'alerts', {'alerts': []})
-    alerts = data.get('alerts', [])
-
-    ticker = ticker.upper()
-    alerts = [a for a in alerts if a['ticker'] != ticker]
-    data['alerts'] = alerts
-    _save_data(chat_id, 'alerts', data)
+    with _transaction() as db:
+        db.execute('DELETE FROM alerts WHERE chat_id = ? AND ticker = ?', (int(chat_id), ticker.upper()))
 
 def mark_alert_triggered(chat_id, ticker, price):
     """Mark alert as triggered."""
-    data = _load_data(chat_id, 'alerts', {'alerts': []})
-    alerts = data.get('alerts', [])
-
-    ticker = ticker.upper()
-    for alert in alerts:
-        if alert['ticker'] == ticker and not alert['triggered']:
-            alert['triggered'] = True
-            alert['triggered_at'] = datetime.now().isoformat()
-            alert['triggered_price'] = price
-
-    data['alerts'] = alerts
-    _save_data(chat_id, 'alerts', data)
+    with _transaction() as db:
+        db.execute(
+            'UPDATE alerts SET triggered = 1, triggered_at = ?, triggered_price = ? '
+            'WHERE chat_id = ? AND ticker = ? AND triggered = 0',
+            (datetime.now().isoformat(), price, int(chat_id), ticker.upper()))
 
 def get_all_active_alerts():
     """Get all active alerts across all users (for background checking)."""
-    all_alerts = []
-
-    if STORAGE_DIR.exists():
-        for user_dir in STORAGE_DIR.iterdir():
-            if user_dir.is_dir():
-                alerts_file = user_dir / 'alerts.json'
-                if alerts_file.exists():
-                    try:
-                        with open(alerts_file, 'r') as f:
-                            data = json.load(f)
-                            for alert in data.get('alerts', []):
-                                if not alert.get('triggered'):
-                                    alert['chat_id'] = int(user_dir.name)
-                                    all_alerts.append(alert)
-                    except (json.JSONDecodeError, IOError, OSError, ValueError) as e:
-                        logger.warning(f"Failed to load alerts from {alerts_file}: {e}")
-
-    return all_alerts
+    rows = _query('SELECT * FROM alerts WHERE triggered = 0 ORDER BY chat_id, id')
+    return [_alert_dict(r, with_chat_id=True) for r in rows]
 
 
 # =============================================================================
 # PORTFOLIO
 # =============================================================================
 
+def _position_dict(row):
+    return {
+        'ticker': row['ticker'],
+        'shares': row['shares'],
+        'entry_price': row['entry_price'],
+        'entry_date': row['entry_date'],
+        'added': row['added'],
+    }
+
 def get_portfolio(chat_id):
     """Get user's portfolio."""
-    data = _load_data(chat_id, 'portfolio', {'positions': []})
-    return data.get('positions', [])
+    rows = _query('SELECT * FROM positions WHERE chat_id = ? ORDER BY rowid', (int(chat_id),))
+    return [_position_dict(r) for r in rows]
 
 def add_position(chat_id, ticker, shares, entry_price, entry_date=None):
     """Add position to portfolio."""
-    data = _load_data(chat_id, 'portfolio', {'positions': []})
-    positions = data.get('positions', [])
-
     position = {
         'ticker': ticker.upper(),
         'shares': float(shares),
@@ -179,65 +314,62 @@ def add_position(chat_id, ticker, shares, entry_price, entry_date=None):
         'added': datetime.now().isoformat()
     }
 
-    # Check if position exists, update if so
-    for i, p in enumerate(positions):
-        if p['ticker'] == ticker.upper():
+    with _transaction() as db:
+        # Check if position exists, update if so
+        row = db.execute('SELECT * FROM positions WHERE chat_id = ? AND ticker = ?',
+                         (int(chat_id), position['ticker'])).fetchone()
+        if row:
             # Average in
-            total_shares = p['shares'] + shares
-            avg_price = (p['shares'] * p['entry_price'] + shares * entry_price) / total_shares
-            positions[i]['shares'] = total_shares
-            positions[i]['entry_price'] = avg_price
-            data['positions'] = positions
-            _save_data(chat_id, 'portfolio', data)
-            return positions[i]
-
-    positions.append(position)
-    data['positions'] = positions
-    _save_data(chat_id, 'portfolio', data)
+            total_shares = row['shares'] + shares
+            avg_price = (row['shares'] * row['entry_price'] + shares * entry_price) / total_shares
+            db.execute('UPDATE positions SET shares = ?, entry_price = ? WHERE chat_id = ? AND ticker = ?',
+                       (total_shares, avg_price, int(chat_id), position['ticker']))
+            return {**_position_dict(row), 'shares': total_shares, 'entry_price': avg_price}
+
+        db.execute(
+            'INSERT INTO positions (chat_id, ticker, shares, entry_price, entry_date, added) VALUES (?, ?, ?, ?, ?, ?)',
+            (int(chat_id), position['ticker'], position['shares'], position['entry_price'],
+             position['entry_date'], position['added']))
     return position
 
 def remove_position(chat_id, ticker):
     """Remove position from portfolio."""
-    data = _load_data(chat_id, 'portfolio', {'positions': []})
-    positions = data.get('positions', [])
-
-    ticker = ticker.upper()
-    positions = [p for p in positions if p['ticker'] != ticker]
-    data['positions'] = positions
-    _save_data(chat_id, 'portfolio', data)
+    with _transaction() as db:
+        db.execute('DELETE FROM positions WHERE chat_id = ? AND ticker = ?', (int(chat_id), ticker.upper()))
 
 def close_position(chat_id, ticker, exit_price):
     """Close position and record the trade."""
-    data = _load_data(chat_id, 'portfolio', {'positions': [], 'closed_trades': []})
-    positions = data.get('positions', [])
-    closed = data.get('closed_trades', [])
-
     ticker = ticker.upper()
-    for p in positions:
-        if p['ticker'] == ticker:
-            # Record closed trade
-            pnl = (exit_price - p['entry_price']) / p['entry_price'] * 100
-            closed_trade = {
-                **p,
-                'exit_price': float(exit_price),
-                'exit_date': datetime.now().strftime('%Y-%m-%d'),
-                'pnl_percent': pnl,
-                'pnl_dollars': (exit_price - p['entry_price']) * p['shares']
-            }
-            closed.append(closed_trade)
-            positions = [pos for pos in positions if pos['ticker'] != ticker]
-
-            data['positions'] = positions
-            data['closed_trades'] = closed[-config.storage.max_closed_trades:]  # Keep last N trades
-            _save_data(chat_id, 'portfolio', data)
-            return closed_trade
-
-    return None
+    with _transaction() as db:
+        row = db.execute('SELECT * FROM positions WHERE chat_id = ? AND ticker = ?',
+                         (int(chat_id), ticker)).fetchone()
+        if row is None:
+            return None
+
+        # Record closed trade
+        p = _position_dict(row)
+        pnl = (exit_price - p['entry_price']) / p['entry_price'] * 100
+        closed_trade = {
+            **p,
+            'exit_price': float(exit_price),
+            'exit_date': datetime.now().strftime('%Y-%m-%d'),
+            'pnl_percent': pnl,
+            'pnl_dollars': (exit_price - p['entry_price']) * p['shares']
+        }
+        db.execute('DELETE FROM positions WHERE chat_id = ? AND ticker = ?', (int(chat_id), ticker))
+        db.execute('INSERT INTO closed_trades (chat_id, trade) VALUES (?, ?)',
+                   (int(chat_id), json.dumps(closed_trade, default=str)))
+        # Keep last N trades
+        db.execute(
+            'DELETE FROM closed_trades WHERE chat_id = ? AND id NOT IN '
+            '(SELECT id FROM closed_trades WHERE chat_id = ? ORDER BY id DESC LIMIT ?)',
+            (int(chat_id), int(chat_id), config.storage.max_closed_trades))
+    return closed_trade
 
 def get_closed_trades(chat_id):
     """Get closed trades history."""
-    data = _load_data(chat_id, 'portfolio', {'closed_trades': []})
-    return data.get('closed_trades', [])
+    rows = _query('SELECT trade FROM closed_trades WHERE chat_id = ? ORDER BY id', (int(chat_id),))
+    return [json.loads(r['trade']) for r in rows]
 
 
 # =============================================================================
@@ -246,11 +378,5 @@ def get_closed_trades(chat_id):
 
 def get_all_users_with_alerts():
     """Get all chat IDs that have active alerts."""
-    users = []
-    if STORAGE_DIR.exists():
-        for user_dir in STORAGE_DIR.iterdir():
-            if user_dir.is_dir():
-                alerts_file = user_dir / 'alerts.json'
-                if alerts_file.exists():
-                    users.append(int(user_dir.name))
-    return users
+    rows = _query('SELECT DISTINCT chat_id FROM alerts WHERE triggered = 0')
+    return [r['chat_id'] for r in rows]
@@ -801,49 +801,34 @@ async def calculate_gex_tastytrade(ticker: str, expiration: str = None) -> Dict:
         result = await _calculate_gex_tastytrade_impl(ticker, expiration)
         if 'error' not in result:
             _gex_cache[cache_key] = {'result': result, 'ts': _time.time()}
-            # F5: Save daily GEX snapshot for history tracking
+            # F5: Save intraday GEX snapshot for history tracking
             _save_gex_snapshot(ticker, result)
         return result
 
 
+GEX_SNAPSHOT_INTERVAL = 300  # Seconds between stored intraday snapshots per ticker
+
+
 def _save_gex_snapshot(ticker: str, gex_data: Dict):
-    """Save daily GEX snapshot to Modal volume for history tracking (F5)."""
+    """Append an intraday GEX snapshot to the columnar GEX history (F5)."""
     try:
-        import json
-        from pathlib import Path
-
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        safe_name = ticker.upper().replace("/", "_")
-        history_dir = Path("/data/gex_history")
-        history_dir.mkdir(parents=True, exist_ok=True)
-        history_path = history_dir / f"{safe_name}.json"
+        from src.data.column_store import get_gex_store, migrate_gex_json
 
-        # Load existing history
-        history = []
-        if history_path.exists():
-            try:
-                history = json.loads(history_path.read_text())
-            except Exception:
-                history = []
+        store = get_gex_store()
+        migrate_gex_json(store, ticker)
 
-        # Don't add duplicate for same date
-        if history and history[-1].get("date") == today_str:
+        last_ts = store.last_ts(ticker)
+        if last_ts is not None and _time.time() - last_ts < GEX_SNAPSHOT_INTERVAL:
             return
 
-        snapshot = {
-            "date": today_str,
+        store.append(ticker, {
             "gex": gex_data.get("total_gex", 0),
             "call_wall": gex_data.get("call_wall", 0),
             "put_wall": gex_data.get("put_wall", 0),
             "price": gex_data.get("current_price", 0),
             "gamma_flip": gex_data.get("gamma_flip", 0),
-        }
-
-        history.append(snapshot)
-        # Keep last 90 days
-        history = history[-90:]
-        history_path.write_text(json.dumps(history))
-        logger.info(f"GEX snapshot saved for {ticker} on {today_str}")
+        })
+        logger.info(f"GEX snapshot saved for {ticker}")
     except Exception as e:
         logger.warning(f"Failed to save GEX snapshot for {ticker}: {e}")
 
@@ -1813,9 +1798,19 @@ async def compute_market_xray(ticker: str, expiration: str = None, swing_mode: b
         )
         if 'error' not in result:
             _xray_cache[cache_key] = {'result': result, 'ts': _time.time()}
+            _publish_xray_refresh(ticker.upper(), expiration, swing_mode, result)
         return result
 
 
+def _publish_xray_refresh(ticker: str, expiration: Optional[str], swing_mode: bool, result: Dict):
+    """Push the refreshed X-Ray's scalar summary fields to stream subscribers."""
+    from src.sync.delta_stream import publish_delta
+
+    summary = {k: v for k, v in result.items() if v is None or isinstance(v, (str, int, float, bool))}
+    summary.update({'ticker': ticker, 'expiration': expiration, 'swing_mode': swing_mode})
+    publish_delta('xray', summary, key=ticker)
+
+
 async def _xray_fetch_quote(ticker: str) -> Optional[float]:
     """Fetch current price via Tastytrade REST API (no streaming needed)."""
     try:
@@ -0,0 +1,444 @@
+"""
+Google Trends Service
+=====================
+One request budget, batching layer and cache shared by every Google
+Trends consumer (theme keywords in src/data/google_trends.py, ticker
+search interest in src/intelligence/google_trends.py).
+
+- Terms go out in build_payload requests of PAYLOAD_SIZE (Google's limit
+  of five): four terms plus a shared anchor term.
+- Google scales each payload to its own maximum. Every term's series is
+  rescaled to its own peak (100, same as a single-term request), and its
+  volume is kept relative to the anchor (anchor_ratio) so terms fetched
+  in different payloads stay comparable.
+- Requests are paced by one RateLimiter. On-demand lookups (scoring,
+  API) and the universe prefetch each have their own hourly budget, so
+  a prefetch run can't starve scoring calls made right after it.
+- Series live in an indexed cache (term -> latest series) backed by an
+  append-only JSON-lines file. New entries are written behind in one
+  append per flush, and the file is compacted when it grows stale.
+
+Usage:
+    from src.data.trends_service import get_trends_service
+
+    service = get_trends_service()
+    series = service.get_series(['NVDA stock', 'AMD stock'])
+    series['NVDA stock'].values[-1]
+"""
+
+import atexit
+import json
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.utils.file_utils import ensure_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Payload settings
+PAYLOAD_SIZE = 5  # Google's per-request keyword limit
+ANCHOR_TERM = 'SPY stock'  # Shared reference term in every payload
+DEFAULT_TIMEFRAME = 'today 3-m'
+
+# Rate limiting settings
+MIN_REQUEST_INTERVAL = 2.0  # Minimum seconds between requests
+MAX_REQUEST_INTERVAL = 5.0  # Add jitter up to this
+MAX_REQUESTS_PER_HOUR = int(os.environ.get('TRENDS_MAX_REQUESTS_PER_HOUR', 20))  # On-demand lookups
+PREFETCH_REQUESTS_PER_HOUR = int(os.environ.get('TRENDS_PREFETCH_REQUESTS_PER_HOUR', 60))  # Universe prefetch
+LOOKUP = 'lookup'  # Budget pools
+PREFETCH = 'prefetch'
+MAX_RETRIES = 3  # Max retries on rate limit
+BACKOFF_BASE = 10  # Base seconds for exponential backoff
+RATE_LIMIT_COOLDOWN = 60  # Seconds to wait after hitting rate limit
+
+# Cache settings
+CACHE_FILENAME = 'trends_index.jsonl'
+DEFAULT_MAX_AGE = 21600  # 6 hours
+FLUSH_DELAY_SECONDS = 5.0  # Write-behind delay
+COMPACT_RATIO = 2  # Compact when the log holds this many lines per live entry
+
+
+class RateLimiter:
+    """
+    Thread-safe rate limiter for Google Trends API.
+
+    Pacing and rate-limit cooldowns are shared; the hourly budget is kept
+    per pool (LOOKUP, PREFETCH).
+    """
+
+    def __init__(self, min_interval: float = MIN_REQUEST_INTERVAL,
+                 max_interval: float = MAX_REQUEST_INTERVAL,
+                 max_per_hour: int = MAX_REQUESTS_PER_HOUR,
+                 prefetch_per_hour: int = PREFETCH_REQUESTS_PER_HOUR):
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._max_per_hour = {LOOKUP: max_per_hour, PREFETCH: prefetch_per_hour}
+        self._last_request_time = 0
+        self._lock = threading.Lock()
+        self._rate_limited_until = 0  # Timestamp when rate limit expires
+        self._consecutive_errors = 0
+        self._window_start = {pool: 0 for pool in self._max_per_hour}
+        self._window_count = {pool: 0 for pool in self._max_per_hour}
+
+    def max_per_hour(self, pool: str = LOOKUP) -> int:
+        return self._max_per_hour[pool]
+
+    def has_budget(self, pool: str = LOOKUP) -> bool:
+        """Check if the pool's hourly budget allows another request."""
+        with self._lock:
+            now = time.time()
+            if now - self._window_start[pool] > 3600:
+                self._window_start[pool] = now
+                self._window_count[pool] = 0
+            return self._window_count[pool] < self._max_per_hour[pool]
+
+    def wait(self, pool: str = LOOKUP):
+        """Wait before making next request."""
+        with self._lock:
+            now = time.time()
+
+            # Check if we're in rate limit cooldown
+            if now < self._rate_limited_until:
+                wait_time = self._rate_limited_until - now
+                logger.debug(f"Rate limit cooldown: waiting {wait_time:.1f}s")
+                time.sleep(wait_time)
+                now = time.time()
+
+            # Calculate time since last request
+            elapsed = now - self._last_request_time
+
+            # Add jitter to avoid thundering herd
+            interval = self._min_interval + random.random() * (self._max_interval - self._min_interval)
+
+            # If we've had consecutive errors, increase interval
+            if self._consecutive_errors > 0:
+                interval *= (1 + self._consecutive_errors * 0.5)
+
+            if elapsed < interval:
+                sleep_time = interval - elapsed
+                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+
+            self._last_request_time = time.time()
+            self._window_count[pool] += 1
+
+    def report_success(self):
+        """Report successful request."""
+        with self._lock:
+            self._consecutive_errors = 0
+
+    def report_rate_limit(self):
+        """Report rate limit error (429)."""
+        with self._lock:
+            self._consecutive_errors += 1
+            # Set cooldown period with exponential backoff
+            cooldown = RATE_LIMIT_COOLDOWN * (2 ** min(self._consecutive_errors - 1, 3))
+            self._rate_limited_until = time.time() + cooldown
+            logger.warning(f"Rate limit hit. Cooldown for {cooldown}s. Consecutive errors: {self._consecutive_errors}")
+
+
+@dataclass
+class TrendSeries:
+    """Interest over time for one search term."""
+    term: str
+    values: List[float]  # Rescaled so the term's own peak is 100; empty = no data
+    anchor_ratio: Optional[float]  # Mean interest relative to the anchor term
+    fetched_at: float
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class TrendsCache:
+    """
+    Indexed Google Trends cache with write-behind persistence.
+
+    Lookups hit an in-memory index keyed by timeframe and term. put()
+    only marks the entry pending; pending entries are appended to the
+    JSON-lines log together after FLUSH_DELAY_SECONDS (or on flush()).
+    """
+
+    def __init__(self, path: Path = None, flush_delay: float = FLUSH_DELAY_SECONDS):
+        self.path = Path(path) if path else Path(ensure_data_dir('google_trends')) / CACHE_FILENAME
+        self.flush_delay = flush_delay
+        self._index: Dict[str, TrendSeries] = {}
+        self._pending: Dict[str, TrendSeries] = {}
+        self._lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._log_lines = 0
+        self._load()
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _key(term: str, timeframe: str) -> str:
+        return f"{timeframe}|{term}"
+
+    def _load(self):
+        """Rebuild the index from the log (last entry per key wins)."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    self._log_lines += 1
+                    try:
+                        entry = json.loads(line)
+                        key = entry.pop('key')
+                        self._index[key] = TrendSeries(**entry)
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except IOError as e:
+            logger.warning(f"Failed to load Google Trends cache: {e}")
+            return
+
+        if self._log_lines > COMPACT_RATIO * max(len(self._index), 1):
+            self._compact()
+
+    def get(self, term: str, timeframe: str = DEFAULT_TIMEFRAME,
+            max_age: float = DEFAULT_MAX_AGE) -> Optional[TrendSeries]:
+        """Cached series if fetched within max_age seconds."""
+        series = self._index.get(self._key(term, timeframe))
+        if series is not None and time.time() - series.fetched_at < max_age:
+            return series
+        return None
+
+    def put(self, series: TrendSeries, timeframe: str = DEFAULT_TIMEFRAME):
+        """Index a series and schedule it for the next write-behind flush."""
+        key = self._key(series.term, timeframe)
+        with self._lock:
+            self._index[key] = series
+            self._pending[key] = series
+            if self._save_timer is None and self.flush_delay is not None:
+                timer = threading.Timer(self.flush_delay, self.flush)
+                timer.daemon = True
+                self._save_timer = timer
+                timer.start()
+
+    def flush(self):
+        """Append pending entries to the log now."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a') as f:
+                    f.writelines(
+                        json.dumps({'key': key, **series.to_dict()}) + '\n'
+                        for key, series in pending.items()
+                    )
+                self._log_lines += len(pending)
+            except IOError as e:
+                logger.error(f"Failed to save Google Trends cache: {e}")
+                return
+
+            if self._log_lines > COMPACT_RATIO * len(self._index):
+                self._compact()
+
+    def _compact(self):
+        """Rewrite the log with one line per live entry."""
+        tmp = self.path.with_suffix('.tmp')
+        try:
+            with open(tmp, 'w') as f:
+                f.writelines(
+                    json.dumps({'key': key, **series.to_dict()}) + '\n'
+                    for key, series in self._index.items()
+                )
+            os.replace(tmp, self.path)
+            self._log_lines = len(self._index)
+        except IOError as e:
+            logger.error(f"Failed to compact Google Trends cache: {e}")
+
+    def stats(self, max_age: float = DEFAULT_MAX_AGE) -> Dict:
+        """Cache statistics for monitoring."""
+        now = time.time()
+        return {
+            'total_entries': len(self._index),
+            'valid_entries': sum(1 for s in self._index.values() if now - s.fetched_at < max_age),
+            'pending_writes': len(self._pending),
+            'log_lines': self._log_lines,
+            'cache_file': str(self.path),
+        }
+
+
+class TrendsService:
+    """
+    Batched, budgeted Google Trends fetches.
+
+    Requests are serialized through one RateLimiter, so concurrent callers
+    queue behind each other instead of each spending their own budget.
+    """
+
+    def __init__(self, cache: TrendsCache = None, limiter: RateLimiter = None,
+                 anchor: Optional[str] = ANCHOR_TERM):
+        self.cache = cache or TrendsCache()
+        self.limiter = limiter or RateLimiter()
+        self.anchor = anchor
+        self._pytrends = None
+        self._request_lock = threading.Lock()
+        self.stats = {'requests': 0, 'terms_fetched': 0, 'cache_hits': 0}
+
+    @property
+    def terms_per_request(self) -> int:
+        return PAYLOAD_SIZE - 1 if self.anchor else PAYLOAD_SIZE
+
+    def has_budget(self, pool: str = LOOKUP) -> bool:
+        return self.limiter.has_budget(pool)
+
+    def _get_pytrends(self):
+        """Get or create pytrends instance with retries parameter."""
+        if self._pytrends is None:
+            try:
+                from pytrends.request import TrendReq
+                # Use retries and backoff_factor for resilience
+                self._pytrends = TrendReq(
+                    hl='en-US',
+                    tz=360,
+                    timeout=(10, 25),
+                    retries=2,
+                    backoff_factor=0.5
+                )
+            except ImportError:
+                logger.error("pytrends not installed. Run: pip install pytrends")
+                return None
+            except TypeError:
+                # Older pytrends version without retries parameter
+                from pytrends.request import TrendReq
+                self._pytrends = TrendReq(hl='en-US', tz=360, timeout=(10, 25))
+        return self._pytrends
+
+    def get_series(self, terms: List[str], timeframe: str = DEFAULT_TIMEFRAME,
+                   max_age: float = DEFAULT_MAX_AGE,
+                   max_requests: int = None, pool: str = LOOKUP) -> Dict[str, TrendSeries]:
+        """
+        Interest-over-time series for many terms.
+
+        Args:
+            terms: Search terms
+            timeframe: pytrends timeframe ('today 3-m', 'now 7-d', ...)
+            max_age: Serve cached series younger than this (0 = always fetch)
+            max_requests: Cap on payloads sent by this call
+            pool: Hourly budget to spend (LOOKUP, or PREFETCH for universe warm-up)
+
+        Returns:
+            Dict of term -> TrendSeries. Terms left unfetched (budget, rate
+            limit, errors) are omitted; terms Google has no data for map
+            to an empty series.
+        """
+        results = {}
+        pending = []
+        for term in dict.fromkeys(terms):
+            cached = self.cache.get(term, timeframe, max_age) if max_age else None
+            if cached is not None:
+                results[term] = cached
+            else:
+                pending.append(term)
+        self.stats['cache_hits'] += len(results)
+
+        per_request = self.terms_per_request
+        requests_sent = 0
+        for i in range(0, len(pending), per_request):
+            if max_requests is not None and requests_sent >= max_requests:
+                break
+            if not self.has_budget(pool):
+                logger.warning(f"Google Trends {pool} hourly budget reached, {len(pending) - i} terms skipped")
+                break
+
+            batch = pending[i:i + per_request]
+            frame = self._fetch_payload(batch, timeframe, pool)
+            requests_sent += 1
+            if frame is None:
+                continue
+
+            for term, series in self._normalize(frame, batch).items():
+                self.cache.put(series, timeframe)
+                results[term] = series
+            self.stats['terms_fetched'] += len(batch)
+
+        self.stats['requests'] += requests_sent
+        return results
+
+    def _fetch_payload(self, batch: List[str], timeframe: str, pool: str = LOOKUP):
+        """One build_payload request (batch + anchor) with retry logic."""
+        pytrends = self._get_pytrends()
+        if not pytrends:
+            return None
+
+        kw_list = list(batch)
+        if self.anchor and self.anchor not in kw_list:
+            kw_list.append(self.anchor)
+
+        with self._request_lock:
+            for attempt in range(MAX_RETRIES):
+                try:
+                    self.limiter.wait(pool)
+                    pytrends.build_payload(kw_list, cat=0, timeframe=timeframe, geo='US', gprop='')
+                    frame = pytrends.interest_over_time()
+                    self.limiter.report_success()
+                    return frame
+
+                except Exception as e:
+                    error_str = str(e).lower()
+
+                    # Check if it's a rate limit error
+                    if '429' in error_str or 'too many requests' in error_str:
+                        self.limiter.report_rate_limit()
+
+                        if attempt < MAX_RETRIES - 1:
+                            # Exponential backoff
+                            backoff = BACKOFF_BASE * (2 ** attempt) + random.uniform(0, 5)
+                            logger.warning(f"Google Trends rate limited, retry {attempt + 1}/{MAX_RETRIES} after {backoff:.1f}s")
+                            time.sleep(backoff)
+                        else:
+                            logger.error(f"Google Trends rate limit exceeded after {MAX_RETRIES} retries")
+                    else:
+                        logger.debug(f"Google Trends error for {batch} (attempt {attempt + 1}): {e}")
+                        if attempt < MAX_RETRIES - 1:
+                            time.sleep(2 * (attempt + 1))  # Simple backoff for other errors
+
+        return None
+
+    def _normalize(self, frame, batch: List[str]) -> Dict[str, TrendSeries]:
+        """Split a payload's frame into per-term series (own peak = 100)."""
+        now = time.time()
+        anchor_mean = None
+        if self.anchor and not frame.empty and self.anchor in frame.columns:
+            anchor_mean = float(frame[self.anchor].mean()) or None
+
+        results = {}
+        for term in batch:
+            if frame.empty or term not in frame.columns:
+                results[term] = TrendSeries(term, [], None, now)
+                continue
+
+            raw = [float(v) for v in frame[term]]
+            peak = max(raw)
+            values = [round(v * 100 / peak, 2) for v in raw] if peak > 0 else [0.0] * len(raw)
+            anchor_ratio = round(sum(raw) / len(raw) / anchor_mean, 4) if anchor_mean else None
+            results[term] = TrendSeries(term, values, anchor_ratio, now)
+
+        return results
+
+
+# =============================================================================
+# SINGLETON
+# =============================================================================
+
+_trends_service = None
+
+
+def get_trends_service() -> TrendsService:
+    """Get or create the shared Google Trends service."""
+    global _trends_service
+    if _trends_service is None:
+        _trends_service = TrendsService()
+    return _trends_service
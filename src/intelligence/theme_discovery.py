@@ -351,72 +351,52 @@ Return empty array [] if no clear themes found.
     # STOCK CORRELATION CLUSTERING
     # =========================================================================
 
-    def find_correlated_clusters(self, min_correlation: float = 0.7) -> List[Dict]:
+    def _load_universe_returns(self, days: int = 30):
+        """Daily returns for the whole scan universe (dates x tickers)."""
+        import pandas as pd
+        from src.data.polygon_provider import _run_async, batch_get_prices
+        from src.data.universe_manager import get_manager
+
+        tickers = get_manager().get_scan_universe(apply_technical_filter=False)
+        bars = _run_async(batch_get_prices(tickers, days=days + 5))
+        closes = pd.DataFrame({t: df['Close'] for t, df in (bars or {}).items() if 'Close' in df})
+        return closes.pct_change().iloc[-days:]
+
+    def find_correlated_clusters(self, min_correlation: float = 0.7, returns=None) -> List[Dict]:
         """
         Find groups of stocks moving together (potential undiscovered themes).
-        """
-        try:
-            from src.data.polygon_provider import PolygonDataProvider
-            import pandas as pd
-
-            provider = PolygonDataProvider()
-
-            # Get top movers from recent days
-            movers = provider.get_market_movers_sync()
 
-            if not movers:
-                return []
-
-            # Get tickers from gainers
-            tickers = []
-            gainers = movers.get('gainers', [])
-            for g in gainers[:30]:
-                ticker = g.get('ticker', '')
-                if ticker and len(ticker) <= 5:
-                    tickers.append(ticker)
-
-            if len(tickers) < 5:
-                return []
+        Clusters the full universe returns matrix with the shared cluster
+        engine, which tracks cluster identity across daily runs.
 
-            # Get price data for correlation
-            price_data = {}
-            for ticker in tickers[:20]:
-                try:
-                    data = provider.get_price_data_sync(ticker, days=30)
-                    if data is not None and len(data) >= 20:
-                        price_data[ticker] = data['close'].pct_change().dropna()
-                except Exception as e:
-                    logger.debug(f"Failed to get price data for {ticker}: {e}")
-                    continue
+        Args:
+            min_correlation: Edge threshold for the correlation graph
+            returns: Optional returns DataFrame (dates x tickers); loaded
+                for the scan universe when omitted
+        """
+        try:
+            from src.analysis.cluster_engine import get_cluster_engine
 
-            if len(price_data) < 5:
+            if returns is None:
+                returns = self._load_universe_returns()
+            if returns is None or returns.shape[1] < 5:
                 return []
 
-            # Build correlation matrix
-            df = pd.DataFrame(price_data)
-            corr_matrix = df.corr()
-
-            # Find highly correlated groups
-            clusters = []
-            used = set()
-
-            for ticker in corr_matrix.columns:
-                if ticker in used:
-                    continue
-
-                # Find all tickers correlated > threshold
-                correlated = corr_matrix[ticker][corr_matrix[ticker] > min_correlation].index.tolist()
-
-                if len(correlated) >= 3:
-                    clusters.append({
-                        'tickers': correlated,
-                        'avg_correlation': corr_matrix.loc[correlated, correlated].mean().mean(),
-                        'size': len(correlated),
-                        'source': 'correlation'
-                    })
-                    used.update(correlated)
-
-            return clusters
+            engine = get_cluster_engine('discovery')
+            engine.min_correlation = min_correlation
+
+            return [
+                {
+                    'tickers': cluster.tickers,
+                    'avg_correlation': cluster.avg_correlation,
+                    'size': cluster.size,
+                    'source': 'correlation',
+                    'cluster_id': cluster.cluster_id,
+                    'days_seen': cluster.days_seen,
+                    'is_new': cluster.is_new,
+                }
+                for cluster in engine.run(returns)
+            ]
 
         except Exception as e:
             logger.error(f"Correlation clustering error: {e}")
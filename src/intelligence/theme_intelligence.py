@@ -31,6 +31,7 @@ Usage:
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 from dataclasses import dataclass, asdict
@@ -165,6 +166,11 @@ SIGNAL_WEIGHTS = {
     'sec': 0.10,      # Deal activity
 }
 
+# analyze_all_themes: worker threads for social/news/SEC fetches, and the
+# Trends request budget per run (each request covers up to 5 themes)
+THEME_FETCH_WORKERS = 8
+MAX_TRENDS_REQUESTS_PER_RUN = 10
+
 LIFECYCLE_THRESHOLDS = {
     'emerging': {'fused': 40, 'velocity': 5},
     'accelerating': {'fused': 60, 'velocity': 15},
@@ -360,20 +366,13 @@ class ThemeIntelligenceHub:
         Checks for M&A activity in theme tickers.
         """
         try:
-            from src.data.sec_edgar import detect_ma_activity
+            from src.data.sec_edgar import detect_ma_activity_batch
 
             tickers = THEME_TICKER_MAP.get(theme_id, [])[:3]
             if not tickers:
                 return 0
 
-            scores = []
-            for ticker in tickers:
-                try:
-                    result = detect_ma_activity(ticker)
-                    scores.append(result.get('ma_score', 0))
-                except Exception as e:
-                    logger.debug(f"Failed to detect M&A activity for {ticker}: {e}")
-                    continue
+            scores = [result.get('ma_score', 0) for result in detect_ma_activity_batch(tickers)]
 
             return sum(scores) / len(scores) if scores else 0
 
@@ -381,6 +380,70 @@ class ThemeIntelligenceHub:
             logger.debug(f"SEC fetch error for {theme_id}: {e}")
             return 0
 
+    def _fetch_trends_scores(self, theme_ids: List[str],
+                             max_requests: int = MAX_TRENDS_REQUESTS_PER_RUN) -> Dict[str, Tuple[float, float, bool]]:
+        """
+        Fetch Google Trends scores for many themes through one budgeted queue.
+
+        Each theme's lead keyword joins a payload of up to five, so the run
+        costs at most max_requests rate-limit slots. Themes left without
+        data (budget, rate limit, errors) are omitted.
+
+        Returns: {theme_id: (score, trend_pct, is_breakout)}
+        """
+        try:
+            from src.data.google_trends import get_trend_scores, THEME_KEYWORDS
+
+            keywords = {
+                theme_id: THEME_KEYWORDS[theme_id][0]
+                for theme_id in theme_ids if THEME_KEYWORDS.get(theme_id)
+            }
+            results = get_trend_scores(list(keywords.values()), max_requests=max_requests)
+        except Exception as e:
+            logger.error(f"Batched trends fetch error: {e}")
+            return {}
+
+        scores = {}
+        for theme_id, keyword in keywords.items():
+            result = results.get(keyword)
+            if result and not result.get('error'):
+                scores[theme_id] = (
+                    result.get('score', 0),
+                    result.get('trend_pct', 0),
+                    result.get('is_breakout', False)
+                )
+        logger.info(f"Trends data for {len(scores)}/{len(keywords)} themes")
+        return scores
+
+    def _fetch_signal_scores(self, theme_ids: List[str],
+                             executor: ThreadPoolExecutor) -> Dict[str, Dict[str, float]]:
+        """
+        Fetch social, news and SEC scores for all themes concurrently.
+
+        Returns: {theme_id: {'social': .., 'news': .., 'sec': ..}}, with 0
+        for any fetch that failed.
+        """
+        fetchers = {
+            'social': self._fetch_social_score,
+            'news': self._fetch_news_score,
+            'sec': self._fetch_sec_score,
+        }
+        scores = {theme_id: {source: 0 for source in fetchers} for theme_id in theme_ids}
+
+        futures = {
+            executor.submit(fetch, theme_id): (theme_id, source)
+            for theme_id in theme_ids
+            for source, fetch in fetchers.items()
+        }
+        for future in as_completed(futures):
+            theme_id, source = futures[future]
+            try:
+                scores[theme_id][source] = future.result()
+            except Exception as e:
+                logger.debug(f"{source} fetch failed for {theme_id}: {e}")
+
+        return scores
+
     def _calculate_fused_score(
         self,
         trends: float,
@@ -463,9 +526,6 @@ class ThemeIntelligenceHub:
             theme_id: Theme identifier
             quick: If True, only fetch Google Trends (faster)
         """
-        theme_name = THEME_NAMES.get(theme_id, theme_id)
-        tickers = THEME_TICKER_MAP.get(theme_id, [])
-
         # Fetch scores
         trends_score, trend_pct, is_breakout = self._fetch_trends_score(theme_id)
 
@@ -478,6 +538,24 @@ class ThemeIntelligenceHub:
             news_score = self._fetch_news_score(theme_id)
             sec_score = self._fetch_sec_score(theme_id)
 
+        return self._build_signal(
+            theme_id, trends_score, is_breakout, social_score, news_score, sec_score
+        )
+
+    def _build_signal(
+        self,
+        theme_id: str,
+        trends_score: float,
+        is_breakout: bool,
+        social_score: float,
+        news_score: float,
+        sec_score: float,
+        save: bool = True
+    ) -> ThemeSignal:
+        """Fuse fetched scores into a ThemeSignal and record it in history."""
+        theme_name = THEME_NAMES.get(theme_id, theme_id)
+        tickers = THEME_TICKER_MAP.get(theme_id, [])
+
         # Calculate fused score
         fused_score = self._calculate_fused_score(
             trends_score, social_score, news_score, sec_score
@@ -539,12 +617,13 @@ class ThemeIntelligenceHub:
         )
 
         # Update history
-        self._update_history(theme_id, signal, stage_start)
+        self._update_history(theme_id, signal, stage_start, save=save)
 
         return signal
 
-    def _update_history(self, theme_id: str, signal: ThemeSignal, stage_start: str):
-        """Update theme history with new signal."""
+    def _update_history(self, theme_id: str, signal: ThemeSignal, stage_start: str,
+                        save: bool = True):
+        """Update theme history with new signal (save=False defers the write)."""
         if 'themes' not in self.history:
             self.history['themes'] = {}
 
@@ -581,41 +660,48 @@ class ThemeIntelligenceHub:
         theme_data['fused_score'] = signal.fused_score
 
         self.history['last_update'] = datetime.now().isoformat()
-        save_theme_history(self.history)
+        if save:
+            save_theme_history(self.history)
 
-    def analyze_all_themes(self, quick: bool = True) -> Dict:
+    def analyze_all_themes(self, quick: bool = True,
+                           max_workers: int = THEME_FETCH_WORKERS) -> Dict:
         """
         Analyze all tracked themes.
 
+        Google Trends runs as a single budgeted queue (up to 5 themes per
+        request) while social, news and SEC scores are fetched for every
+        theme in parallel; the signals are fused once everything is in.
+
         Args:
             quick: If True, only use Google Trends (faster)
+            max_workers: Threads for the concurrent fetches
 
         Returns:
             Dict with categorized themes and alerts
         """
-        import time
-        from src.data.google_trends import _check_rate_limit, RATE_LIMIT_MAX_PER_HOUR
+        theme_ids = list(THEME_TICKER_MAP.keys())
 
-        signals = []
-        themes_analyzed = 0
-        max_trends_calls = min(RATE_LIMIT_MAX_PER_HOUR, 10)  # Max 10 trends calls per run
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            trends_future = executor.submit(self._fetch_trends_scores, theme_ids)
+            other_scores = {} if quick else self._fetch_signal_scores(theme_ids, executor)
+            trends_scores = trends_future.result()
 
-        for theme_id in THEME_TICKER_MAP.keys():
+        signals = []
+        for theme_id in theme_ids:
             try:
-                # Check if we still have rate limit budget for Google Trends
-                use_trends = _check_rate_limit() and themes_analyzed < max_trends_calls
-
-                signal = self.analyze_theme(theme_id, quick=quick if use_trends else True)
-                signals.append(signal)
-                themes_analyzed += 1
-
-                # Only delay if we made a trends call
-                if use_trends:
-                    time.sleep(3.5)  # Increased delay for rate limiting
+                trends_score, _, is_breakout = trends_scores.get(theme_id, (0, 0, False))
+                other = other_scores.get(theme_id, {})
+                signals.append(self._build_signal(
+                    theme_id, trends_score, is_breakout,
+                    other.get('social', 0), other.get('news', 0), other.get('sec', 0),
+                    save=False
+                ))
             except Exception as e:
                 logger.error(f"Error analyzing {theme_id}: {e}")
                 continue
 
+        save_theme_history(self.history)
+
         # Categorize by lifecycle
         by_lifecycle = {stage.value: [] for stage in ThemeLifecycle}
         for signal in signals:
@@ -742,10 +828,8 @@ class ThemeIntelligenceHub:
         ticker = ticker.upper()
 
         # Find which themes this ticker belongs to
-        ticker_themes = []
-        for theme_id, tickers in THEME_TICKER_MAP.items():
-            if ticker in tickers:
-                ticker_themes.append(theme_id)
+        from src.themes.theme_index import get_theme_index
+        ticker_themes = get_theme_index().get_theme_ids(ticker)
 
         if not ticker_themes:
             return {
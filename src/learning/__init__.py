@@ -11,34 +11,58 @@ Author: Stock Scanner Bot
 Version: 1.0.0
 """
 
-# Data models
-from .rl_models import (
-    TradeRecord,
-    DecisionRecord,
-    LearningMetrics,
-    MarketRegimeType,
-    MarketContext,
-    ComponentWeights,
-    ComponentScores,
-    RegimeState,
-    TradeOutcome,
-    LearnerType,
-    create_decision_id,
-    create_trade_id,
-    LearningDataEncoder
-)
-
-# Tier implementations
-from .tier1_bandit import BayesianBandit
-from .tier2_regime import RegimeDetector, MarketFeatures
-from .tier3_ppo import PPOAgent, TradingState, TradingAction
-from .tier4_meta import MetaLearner
-
-# Main orchestrator
-from .learning_brain import SelfLearningBrain, LearningConfig, get_learning_brain
-
-# API
-from .learning_api import learning_bp
+import importlib
+
+# Submodules are imported on first attribute access: tier3_ppo/tier4_meta
+# pull in torch and learning_api pulls in Flask, which most callers never need.
+_LAZY_ATTRS = {
+    # Data models
+    'TradeRecord': '.rl_models',
+    'DecisionRecord': '.rl_models',
+    'LearningMetrics': '.rl_models',
+    'MarketRegimeType': '.rl_models',
+    'MarketContext': '.rl_models',
+    'ComponentWeights': '.rl_models',
+    'ComponentScores': '.rl_models',
+    'RegimeState': '.rl_models',
+    'TradeOutcome': '.rl_models',
+    'LearnerType': '.rl_models',
+    'create_decision_id': '.rl_models',
+    'create_trade_id': '.rl_models',
+    'LearningDataEncoder': '.rl_models',
+
+    # Tier implementations
+    'BayesianBandit': '.tier1_bandit',
+    'RegimeDetector': '.tier2_regime',
+    'MarketFeatures': '.tier2_regime',
+    'PPOAgent': '.tier3_ppo',
+    'TradingState': '.tier3_ppo',
+    'TradingAction': '.tier3_ppo',
+    'MetaLearner': '.tier4_meta',
+
+    # Main orchestrator
+    'SelfLearningBrain': '.learning_brain',
+    'LearningConfig': '.learning_brain',
+    'get_learning_brain': '.learning_brain',
+
+    # API
+    'learning_bp': '.learning_api',
+}
+
+
+def __getattr__(name):
+    """Lazy loading of submodule attributes."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Models
@@ -26,6 +26,7 @@ from .paths import (
 
 # Re-export registry
 from .registry import ParameterRegistry
+from .snapshot import ParameterSnapshot
 
 __all__ = [
     # Types
@@ -44,4 +45,5 @@ __all__ = [
     '_ensure_data_dir',
     # Registry
     'ParameterRegistry',
+    'ParameterSnapshot',
 ]
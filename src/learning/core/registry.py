@@ -7,14 +7,17 @@ parameters in the stock scanner system.
 import json
 import logging
 import statistics
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional
 from collections import defaultdict
 from dataclasses import asdict
 
 # Import from local core module
 from .types import ParameterDefinition, ParameterCategory
 from .paths import REGISTRY_FILE, _ensure_data_dir
+from .snapshot import ParameterSnapshot
 
 # Lazy import to avoid circular dependency
 def _get_audit_trail():
@@ -30,10 +33,21 @@ class ParameterRegistry:
     """
     Central registry for all tunable parameters.
     Single source of truth for parameter values.
+
+    Writes can be coalesced with ``batch()``: every set() and metadata save
+    inside the block results in one registry write and one audit write.
+    ``snapshot()`` returns an immutable view of all values, rebuilt only
+    when ``version`` changes.
     """
 
     def __init__(self):
         self.parameters: Dict[str, ParameterDefinition] = {}
+        self.version = 0
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._pending_audit: List[Dict[str, Any]] = []
+        self._snapshot: Optional[ParameterSnapshot] = None
         self._load_registry()
         if not self.parameters:
             self._initialize_default_parameters()
@@ -57,7 +71,10 @@ class ParameterRegistry:
                 self.parameters = {}
 
     def _save_registry(self):
-        """Save parameter registry to disk"""
+        """Save parameter registry to disk (deferred while a batch is open)"""
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
         _ensure_data_dir()
         path = self._get_registry_path()
         data = {
@@ -494,9 +511,19 @@ class ParameterRegistry:
             logger.warning(f"Value {value} for {name} outside bounds [{param.min_value}, {param.max_value}]")
             value = max(param.min_value, min(param.max_value, value))
 
-        old_value = param.current_value
-        param.current_value = value
-        param.last_updated = datetime.now().isoformat()
+        with self._lock:
+            old_value = param.current_value
+            param.current_value = value
+            param.last_updated = datetime.now().isoformat()
+            self.version += 1
+
+            if self._batch_depth:
+                self._batch_dirty = True
+                self._pending_audit.append({
+                    'param_name': name, 'old_value': old_value,
+                    'new_value': value, 'reason': reason or 'manual_update',
+                })
+                return True
 
         self._save_registry()
 
@@ -509,6 +536,55 @@ class ParameterRegistry:
 
         return True
 
+    def set_many(self, values: Dict[str, float], reason: str = None) -> int:
+        """Set several parameters with a single registry write and audit batch"""
+        with self.batch():
+            for name, value in values.items():
+                self.set(name, value, reason)
+        return len(values)
+
+    @contextmanager
+    def batch(self) -> Iterator['ParameterRegistry']:
+        """
+        Coalesce registry writes until the outermost block exits.
+
+        Values are updated in memory immediately (get() and snapshot() see
+        them), but the registry file and audit trail are each written once
+        on exit. Batches nest; changes are still flushed if the block raises.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._flush_batch()
+
+    def _flush_batch(self):
+        """Write the registry and audit entries collected by batch()"""
+        entries, self._pending_audit = self._pending_audit, []
+        if self._batch_dirty:
+            self._batch_dirty = False
+            self._save_registry()
+
+        if entries:
+            try:
+                _get_audit_trail().log_changes(entries)
+            except Exception as e:
+                logger.warning(f"Failed to log audit trail: {e}")
+            logger.info(f"Batch applied {len(entries)} parameter changes")
+
+    def snapshot(self) -> ParameterSnapshot:
+        """Immutable view of all current values, cached until the next change"""
+        snap = self._snapshot
+        if snap is None or snap.version != self.version:
+            with self._lock:
+                snap = ParameterSnapshot(self.get_all(), version=self.version)
+                self._snapshot = snap
+        return snap
+
     def get_all(self) -> Dict[str, float]:
         """Get all current parameter values"""
         return {name: param.current_value for name, param in self.parameters.items()}
@@ -0,0 +1,83 @@
+"""
+Parameter Snapshot - Immutable, Versioned View of Parameter Values
+
+A ParameterSnapshot freezes every parameter value at one registry version.
+Scoring grabs one per scan and reads it without touching the registry:
+
+    snap = registry.snapshot()
+    snap.weight.theme_heat          # dotted names as attributes
+    snap['score.sec.8k']            # or by full name
+    snap.get('weight.missing', 0.1)
+"""
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping
+
+
+class _SnapshotNamespace:
+    """Read-only attribute view of every parameter under one name prefix"""
+
+    __slots__ = ('_snapshot', '_prefix')
+
+    def __init__(self, snapshot: 'ParameterSnapshot', prefix: str):
+        object.__setattr__(self, '_snapshot', snapshot)
+        object.__setattr__(self, '_prefix', prefix)
+
+    def __getattr__(self, name: str) -> Any:
+        return self._snapshot._resolve(f"{self._prefix}.{name}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ParameterSnapshot is read-only")
+
+    def __repr__(self):
+        return f"<ParameterSnapshot namespace '{self._prefix}'>"
+
+
+class ParameterSnapshot(Mapping):
+    """
+    Immutable mapping of parameter name -> value at one registry version.
+    """
+
+    __slots__ = ('_values', '_prefixes', 'version', 'created_at')
+
+    def __init__(self, values: Dict[str, float], version: int = 0):
+        prefixes = set()
+        for name in values:
+            parts = name.split('.')
+            for i in range(1, len(parts)):
+                prefixes.add('.'.join(parts[:i]))
+
+        object.__setattr__(self, '_values', MappingProxyType(dict(values)))
+        object.__setattr__(self, '_prefixes', frozenset(prefixes))
+        object.__setattr__(self, 'version', version)
+        object.__setattr__(self, 'created_at', datetime.now().isoformat())
+
+    def _resolve(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        if name in self._prefixes:
+            return _SnapshotNamespace(self, name)
+        raise AttributeError(f"Parameter '{name}' not in snapshot")
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return self._resolve(name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ParameterSnapshot is read-only")
+
+    def __getitem__(self, name: str) -> float:
+        return self._values[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self):
+        return f"<ParameterSnapshot v{self.version} ({len(self)} parameters)>"
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self._values)
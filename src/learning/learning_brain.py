@@ -13,7 +13,7 @@ Provides unified interface for trading decisions and learning.
 
 import logging
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -23,8 +23,6 @@ logger = logging.getLogger(__name__)
 
 from .tier1_bandit import BayesianBandit
 from .tier2_regime import RegimeDetector, MarketFeatures
-from .tier3_ppo import PPOAgent, TradingState, TradingAction
-from .tier4_meta import MetaLearner
 from .rl_models import (
     TradeRecord,
     DecisionRecord,
@@ -37,9 +35,18 @@ from .rl_models import (
     TradeOutcome,
     create_decision_id,
     create_trade_id,
+    append_trade_record,
     LearningDataEncoder
 )
 
+# PPO and meta-learner pull in torch; import them where they are used
+if TYPE_CHECKING:
+    from .tier3_ppo import TradingState
+
+
+# Closed trades, one JSON record per line (replayed by offline PPO training)
+TRADE_JOURNAL_FILE = 'trade_journal.jsonl'
+
 
 # =============================================================================
 # CONFIGURATION
@@ -89,8 +96,14 @@ class SelfLearningBrain:
         # Initialize tiers based on configuration
         self.bandit = BayesianBandit(self.storage_dir) if self.config.use_tier1 else None
         self.regime_detector = RegimeDetector(self.storage_dir) if self.config.use_tier2 else None
-        self.ppo_agent = PPOAgent(storage_dir=self.storage_dir) if self.config.use_tier3 else None
-        self.meta_learner = MetaLearner(self.storage_dir) if self.config.use_tier4 else None
+        self.ppo_agent = None
+        self.meta_learner = None
+        if self.config.use_tier3:
+            from .tier3_ppo import PPOAgent
+            self.ppo_agent = PPOAgent(storage_dir=self.storage_dir)
+        if self.config.use_tier4:
+            from .tier4_meta import MetaLearner
+            self.meta_learner = MetaLearner(self.storage_dir)
 
         # State tracking
         self.total_trades = 0
@@ -278,8 +291,10 @@ class SelfLearningBrain:
         scores: ComponentScores,
         market_context: MarketContext,
         portfolio_state: Dict
-    ) -> TradingState:
+    ) -> 'TradingState':
         """Build TradingState for PPO/Meta-learner."""
+        from .tier3_ppo import TradingState
+
         # Extract regime probabilities
         regime_probs = {
             MarketRegimeType.BULL_MOMENTUM: 0.2,
@@ -336,6 +351,10 @@ class SelfLearningBrain:
 
         self.total_trades += 1
         self.trade_history.append(trade)
+        try:
+            append_trade_record(self.storage_dir / TRADE_JOURNAL_FILE, trade)
+        except Exception as e:
+            logger.warning(f"Could not append trade to journal: {e}")
 
         # Activate learning after minimum trades
         if self.total_trades >= self.config.min_trades_before_learning:
@@ -563,8 +582,10 @@ class SelfLearningBrain:
             if self.regime_detector:
                 self.regime_detector = RegimeDetector(self.storage_dir)
             if self.ppo_agent:
+                from .tier3_ppo import PPOAgent
                 self.ppo_agent = PPOAgent(storage_dir=self.storage_dir)
             if self.meta_learner:
+                from .tier4_meta import MetaLearner
                 self.meta_learner = MetaLearner(self.storage_dir)
 
             logger.info("Learning system reset complete")
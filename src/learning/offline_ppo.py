@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+Offline PPO Training for Tier 3
+
+Trains the PPO agent on trade history instead of the handful of live
+transitions it sees per session:
+
+- Closed TradeRecords (the brain's trade_journal.jsonl) and closed paper
+  trades are replayed through TradeReplayEnv, a vectorized environment
+  that steps num_envs episodes at once with numpy.
+- The policy picks size / hold / stop / target for each historical setup;
+  the outcome is re-simulated from the trade's realized P&L and its
+  favorable / adverse excursions.
+- Rollouts are trained with GAE advantages and shuffled-minibatch PPO on
+  CPU threads, with checkpoint/resume so an overnight run can be stopped
+  and continued.
+
+Usage:
+    python -m src.learning.offline_ppo --journal user_data/learning/trade_journal.jsonl \\
+        --paper-volume /data --iterations 500
+"""
+
+import argparse
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+
+from .rl_models import (
+    ComponentScores,
+    MarketContext,
+    MarketRegimeType,
+    TradeOutcome,
+    TradeRecord,
+    load_trade_records,
+)
+from .tier3_ppo import PPOAgent, compute_gae
+
+logger = logging.getLogger(__name__)
+
+STATE_DIM = 27
+ACTION_DIM = 4
+CHECKPOINT_FILE = 'ppo_offline_checkpoint.pt'
+
+
+# =============================================================================
+# TRADE HISTORY
+# =============================================================================
+
+def paper_trade_to_record(trade: Dict) -> Optional[TradeRecord]:
+    """
+    Convert a closed paper-trading journal entry into a TradeRecord.
+
+    Paper trades are options positions; P&L is taken as the premium
+    return and the journal's stop/target percentages become the stop and
+    target prices.
+    """
+    if trade.get('status') != 'closed' or trade.get('pnl_pct') is None:
+        return None
+    try:
+        entry_date = datetime.fromisoformat(str(trade['entry_time']).replace('Z', '+00:00')).replace(tzinfo=None)
+        exit_time = trade.get('exit_time')
+        exit_date = (datetime.fromisoformat(str(exit_time).replace('Z', '+00:00')).replace(tzinfo=None)
+                     if exit_time else None)
+    except (KeyError, ValueError):
+        return None
+
+    entry = float(trade.get('entry_price') or trade.get('net_premium') or 1.0) or 1.0
+    stop_pct = abs(float(trade.get('stop_loss_pct') or 50))
+    target_pct = abs(float(trade.get('take_profit_pct') or 100))
+    pnl_pct = float(trade['pnl_pct'])
+
+    quality = float(trade.get('quality_score') or 0)
+    record = TradeRecord(
+        trade_id=trade.get('id', ''),
+        decision_id=trade.get('signal_id', ''),
+        ticker=trade.get('ticker', ''),
+        entry_date=entry_date,
+        exit_date=exit_date,
+        entry_price=entry,
+        exit_price=entry * (1 + pnl_pct / 100),
+        stop_loss=entry * (1 - stop_pct / 100),
+        take_profit=entry * (1 + target_pct / 100),
+        pnl_pct=pnl_pct,
+        pnl_dollars=trade.get('pnl_dollars'),
+        component_scores=ComponentScores(technical_score=quality / 10 if quality else 5.0),
+        market_context=MarketContext(timestamp=entry_date),
+        exit_reason=trade.get('exit_reason'),
+    )
+    if pnl_pct > 1.0:
+        record.outcome = TradeOutcome.WIN
+    elif pnl_pct < -1.0:
+        record.outcome = TradeOutcome.LOSS
+    else:
+        record.outcome = TradeOutcome.BREAKEVEN
+    record.days_held = (exit_date - entry_date).days if exit_date else None
+    return record
+
+
+def load_paper_trades(volume_path: str) -> List[TradeRecord]:
+    """Closed paper trades from the paper-trading journal as TradeRecords."""
+    from src.trading.paper.journal import TradeJournal
+
+    records = (paper_trade_to_record(t) for t in TradeJournal(volume_path).get_closed_trades())
+    return [r for r in records if r is not None]
+
+
+def load_training_trades(journal_path=None, paper_volume: Optional[str] = None) -> List[TradeRecord]:
+    """All closed trades from the given sources, oldest first."""
+    trades: List[TradeRecord] = []
+    if journal_path and Path(journal_path).exists():
+        trades.extend(load_trade_records(journal_path))
+    if paper_volume:
+        trades.extend(load_paper_trades(paper_volume))
+    trades = [t for t in trades if t.outcome != TradeOutcome.OPEN and t.pnl_pct is not None]
+    return sorted(trades, key=lambda t: t.entry_date)
+
+
+# =============================================================================
+# VECTORIZED REPLAY ENVIRONMENT
+# =============================================================================
+
+class TradeReplayEnv:
+    """
+    Vectorized replay of historical trades.
+
+    Each of num_envs environments walks a chronological window of
+    episode_length trades from a random start. At every step the agent
+    chooses an action for the current trade setup; the realized outcome
+    is re-simulated as:
+
+    - stop hit if the adverse excursion reached the chosen stop
+    - otherwise target hit if the favorable excursion reached the target
+    - otherwise the realized P&L, scaled down linearly when the chosen
+      hold is shorter than the actual hold
+
+    The reward mirrors PPOAgent.calculate_reward (risk-adjusted win,
+    loss penalties, drawdown penalty) scaled by the chosen position size.
+    Environments auto-reset when an episode ends.
+    """
+
+    def __init__(
+        self,
+        trades: List[TradeRecord],
+        num_envs: int = 64,
+        episode_length: int = 20,
+        max_position_size: float = 0.20,
+        seed: Optional[int] = None,
+    ):
+        if not trades:
+            raise ValueError("TradeReplayEnv needs at least one closed trade")
+
+        trades = sorted(trades, key=lambda t: t.entry_date)
+        self.num_trades = len(trades)
+        self.num_envs = num_envs
+        self.episode_length = min(episode_length, self.num_trades)
+        self.max_position_size = max_position_size
+        self.rng = np.random.default_rng(seed)
+
+        self._build_arrays(trades)
+
+        self._start = np.zeros(num_envs, dtype=np.int64)
+        self._t = np.zeros(num_envs, dtype=np.int64)
+        self._equity = np.ones(num_envs)
+        self._peak = np.ones(num_envs)
+        self._recent = np.zeros((num_envs, 10))
+        self._recent_count = np.zeros(num_envs, dtype=np.int64)
+
+    def _build_arrays(self, trades: List[TradeRecord]) -> None:
+        n = len(trades)
+        market = np.zeros((n, 14), dtype=np.float32)
+        pnl = np.zeros(n)
+        mfe = np.zeros(n)
+        mae = np.zeros(n)
+        days = np.ones(n)
+        gap_days = np.zeros(n)
+        week_count = np.zeros(n)
+
+        entry_days = np.array([t.entry_date.timestamp() / 86400 for t in trades])
+
+        for i, trade in enumerate(trades):
+            ctx = trade.market_context
+            scores = trade.component_scores
+            regime = ctx.regime
+            conf = ctx.regime_confidence or 0.0
+            probs = {
+                MarketRegimeType.BULL_MOMENTUM: 0.2,
+                MarketRegimeType.BEAR_DEFENSIVE: 0.2,
+                MarketRegimeType.CHOPPY_RANGE: 0.2,
+            }
+            if regime in probs and conf > 0:
+                probs = {r: (1 - conf) / 3 for r in probs}
+                probs[regime] += conf
+
+            market[i] = [
+                (ctx.spy_change_pct or 0.0) / 10,
+                (ctx.vix_level or 20.0) / 50,
+                ctx.advance_decline or 1.0,
+                (ctx.stocks_above_ma50 or 50.0) / 100,
+                ((ctx.new_highs or 0) - (ctx.new_lows or 0)) / 500,
+                0.0,  # Sector rotation is categorical in MarketContext
+                probs[MarketRegimeType.BULL_MOMENTUM],
+                probs[MarketRegimeType.BEAR_DEFENSIVE],
+                probs[MarketRegimeType.CHOPPY_RANGE],
+                1.0 if ctx.crisis_active else 0.0,
+                (scores.theme_score or 0.0) / 10,
+                (scores.technical_score or 0.0) / 10,
+                scores.ai_confidence or 0.0,
+                scores.x_sentiment_score or 0.0,
+            ]
+
+            pnl[i] = trade.pnl_pct or 0.0
+            mfe[i] = max(abs(trade.max_favorable_excursion or 0.0), pnl[i], 0.0)
+            mae[i] = min(-abs(trade.max_adverse_excursion or 0.0), pnl[i], 0.0)
+            if trade.days_held:
+                days[i] = max(trade.days_held, 1)
+            elif trade.exit_date:
+                days[i] = max((trade.exit_date - trade.entry_date).days, 1)
+            if i > 0:
+                gap_days[i] = max(entry_days[i] - entry_days[i - 1], 0.0)
+            week_count[i] = i - np.searchsorted(entry_days, entry_days[i] - 7, side='left')
+
+        self.market = market
+        self.pnl = pnl
+        self.mfe = mfe
+        self.mae = mae
+        self.days_held = days
+        self.gap_days = gap_days
+        self.trades_this_week = week_count
+
+    # -------------------------------------------------------------------------
+
+    def _reset_envs(self, mask: np.ndarray) -> None:
+        count = int(mask.sum())
+        if count == 0:
+            return
+        max_start = self.num_trades - self.episode_length
+        self._start[mask] = self.rng.integers(0, max_start + 1, size=count)
+        self._t[mask] = 0
+        self._equity[mask] = 1.0
+        self._peak[mask] = 1.0
+        self._recent[mask] = 0.0
+        self._recent_count[mask] = 0
+
+    def reset(self) -> np.ndarray:
+        """Reset every environment; returns states of shape (num_envs, 27)."""
+        self._reset_envs(np.ones(self.num_envs, dtype=bool))
+        return self._observe()
+
+    def _observe(self) -> np.ndarray:
+        idx = self._start + self._t
+        states = np.zeros((self.num_envs, STATE_DIM), dtype=np.float32)
+
+        drawdown = (1 - self._equity / self._peak) * 100
+        total_return = (self._equity - 1) * 100
+
+        filled = np.minimum(self._recent_count, 10)
+        valid = np.arange(10)[None, :] < filled[:, None]
+        recent = np.where(valid, self._recent, 0.0)
+        wins = (recent > 1.0) & valid
+        losses = (recent < -1.0) & valid
+        n_valid = np.maximum(filled, 1)
+        win_sum = np.where(wins, recent, 0.0).sum(axis=1)
+        loss_sum = np.where(losses, recent, 0.0).sum(axis=1)
+        avg_win = win_sum / np.maximum(wins.sum(axis=1), 1)
+        avg_loss = loss_sum / np.maximum(losses.sum(axis=1), 1)
+        profit_factor = np.where(loss_sum < 0, win_sum / np.maximum(-loss_sum, 1e-8), np.where(win_sum > 0, 3.0, 1.0))
+        mean = recent.sum(axis=1) / n_valid
+        var = (np.where(valid, recent - mean[:, None], 0.0) ** 2).sum(axis=1) / n_valid
+        sharpe = np.where(var > 0, mean / np.sqrt(np.maximum(var, 1e-12)), 0.0)
+
+        states[:, 0] = 1.0                              # cash_pct (one closed trade at a time)
+        states[:, 4] = drawdown / 100
+        states[:, 5] = total_return / 100
+        states[:, 6] = np.where(self._t > 0, self.gap_days[idx], 0.0) / 30
+        states[:, 7:21] = self.market[idx]
+        states[:, 21] = np.where(filled > 0, wins.sum(axis=1) / n_valid, 0.5)
+        states[:, 22] = avg_win / 20
+        states[:, 23] = avg_loss / 20
+        states[:, 24] = np.minimum(profit_factor, 9.0) / 3
+        states[:, 25] = sharpe
+        states[:, 26] = self.trades_this_week[idx] / 20
+        return states
+
+    def simulate(self, actions: np.ndarray, idx: np.ndarray) -> Dict[str, np.ndarray]:
+        """Re-simulate trades idx under normalized actions (num_envs, 4)."""
+        actions = np.clip(actions, 0.0, 1.0)
+        size_pct = np.minimum(actions[:, 0] * 100, self.max_position_size * 100)
+        hold_days = np.floor(actions[:, 1] * 29) + 1
+        stop_pct = actions[:, 2] * 20 + 5
+        target_pct = actions[:, 3] * 90 + 10
+
+        pnl = self.pnl[idx]
+        time_scale = np.minimum(1.0, hold_days / self.days_held[idx])
+        outcome = np.where(
+            self.mae[idx] <= -stop_pct, -stop_pct,
+            np.where(self.mfe[idx] >= target_pct, target_pct, pnl * time_scale),
+        )
+        return {'pnl_pct': outcome, 'size_pct': size_pct, 'stop_pct': stop_pct}
+
+    def step(self, actions: np.ndarray):
+        """
+        Apply actions for the current trade of every environment.
+
+        Returns: (next_states, rewards, dones, info)
+        """
+        idx = self._start + self._t
+        sim = self.simulate(actions, idx)
+        pnl = sim['pnl_pct']
+
+        # Portfolio update
+        self._equity *= 1 + (sim['size_pct'] / 100) * (pnl / 100)
+        self._peak = np.maximum(self._peak, self._equity)
+        drawdown = (1 - self._equity / self._peak) * 100
+        slot = self._recent_count % 10
+        self._recent[np.arange(self.num_envs), slot] = pnl
+        self._recent_count += 1
+
+        # Reward (see PPOAgent.calculate_reward)
+        trade_reward = np.where(
+            pnl > 1.0,
+            pnl / np.maximum(sim['stop_pct'], 1.0) + np.where(pnl > 10, 2.0, 0.0),
+            np.where(pnl < -1.0, pnl / 10 - np.where(pnl < -10, 5.0, 0.0), 0.0),
+        )
+        rewards = trade_reward * sim['size_pct'] / (self.max_position_size * 100)
+        rewards -= np.where(drawdown > 0, (drawdown / 10) ** 2, 0.0)
+        overtrade = self.trades_this_week[idx]
+        rewards -= np.where(overtrade > 20, (overtrade - 20) * 0.5, 0.0)
+
+        self._t += 1
+        dones = self._t >= self.episode_length
+        info = {'pnl_pct': pnl, 'equity': self._equity.copy()}
+        self._reset_envs(dones)
+
+        return self._observe(), rewards.astype(np.float32), dones, info
+
+
+# =============================================================================
+# TRAINER
+# =============================================================================
+
+class OfflinePPOTrainer:
+    """
+    Minibatch PPO with GAE over TradeReplayEnv rollouts.
+
+    Each iteration collects rollout_length steps from every environment
+    (num_envs * rollout_length samples), then runs `epochs` passes of
+    shuffled minibatches through PPOAgent.ppo_update.
+    """
+
+    def __init__(
+        self,
+        trades: List[TradeRecord],
+        agent: Optional[PPOAgent] = None,
+        num_envs: int = 64,
+        episode_length: int = 20,
+        rollout_length: Optional[int] = None,
+        minibatch_size: int = 256,
+        epochs: int = 4,
+        gae_lambda: float = 0.95,
+        num_threads: Optional[int] = None,
+        checkpoint_path: Optional[Path] = None,
+        seed: Optional[int] = None,
+    ):
+        self.agent = agent or PPOAgent()
+        self.env = TradeReplayEnv(
+            trades, num_envs=num_envs, episode_length=episode_length,
+            max_position_size=self.agent.max_position_size, seed=seed,
+        )
+        self.rollout_length = rollout_length or self.env.episode_length
+        self.minibatch_size = minibatch_size
+        self.epochs = epochs
+        self.gae_lambda = gae_lambda
+        self.checkpoint_path = Path(checkpoint_path or self.agent.storage_dir / CHECKPOINT_FILE)
+
+        self.num_threads = num_threads or os.cpu_count() or 1
+        torch.set_num_threads(self.num_threads)
+        if seed is not None:
+            torch.manual_seed(seed)
+
+        self.iteration = 0
+        self.total_steps = 0
+        self.history: List[Dict] = []
+        self._states = self.env.reset()
+
+    # -------------------------------------------------------------------------
+
+    def collect_rollout(self) -> Dict[str, torch.Tensor]:
+        """Step all environments rollout_length times under the current policy."""
+        T, N = self.rollout_length, self.env.num_envs
+        states = torch.zeros(T, N, STATE_DIM)
+        actions = torch.zeros(T, N, ACTION_DIM)
+        log_probs = torch.zeros(T, N)
+        values = torch.zeros(T, N)
+        rewards = torch.zeros(T, N)
+        dones = torch.zeros(T, N)
+        episode_pnl = []
+
+        with torch.no_grad():
+            for t in range(T):
+                state = torch.from_numpy(self._states)
+                action, log_prob = self.agent.policy.sample_action(state)
+
+                states[t] = state
+                actions[t] = action
+                log_probs[t] = log_prob
+                values[t] = self.agent.value(state).squeeze(-1)
+
+                self._states, reward, done, info = self.env.step(action.numpy())
+                rewards[t] = torch.from_numpy(reward)
+                dones[t] = torch.from_numpy(done.astype(np.float32))
+                episode_pnl.append(info['pnl_pct'])
+
+            last_value = self.agent.value(torch.from_numpy(self._states)).squeeze(-1)
+
+        advantages, returns = compute_gae(
+            rewards, values, dones, last_value, gamma=self.agent.gamma, lam=self.gae_lambda,
+        )
+        self.total_steps += T * N
+
+        return {
+            'states': states.reshape(T * N, STATE_DIM),
+            'actions': actions.reshape(T * N, ACTION_DIM),
+            'log_probs': log_probs.reshape(-1),
+            'advantages': advantages.reshape(-1),
+            'returns': returns.reshape(-1),
+            'mean_reward': rewards.mean().item(),
+            'mean_trade_pnl': float(np.mean(episode_pnl)),
+        }
+
+    def train_iteration(self) -> Dict:
+        """Collect one rollout and update the agent on it."""
+        started = time.perf_counter()
+        batch = self.collect_rollout()
+        rollout_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        losses = self.agent.ppo_update(
+            batch['states'], batch['actions'], batch['log_probs'],
+            batch['returns'], batch['advantages'],
+            epochs=self.epochs, minibatch_size=self.minibatch_size,
+        )
+        update_seconds = time.perf_counter() - started
+
+        self.iteration += 1
+        samples = batch['states'].shape[0]
+        stats = {
+            'iteration': self.iteration,
+            'samples': samples,
+            'mean_reward': round(batch['mean_reward'], 4),
+            'mean_trade_pnl': round(batch['mean_trade_pnl'], 3),
+            'rollout_steps_per_sec': round(samples / max(rollout_seconds, 1e-9), 1),
+            'update_samples_per_sec': round(samples * self.epochs / max(update_seconds, 1e-9), 1),
+            **{k: round(v, 5) for k, v in losses.items()},
+        }
+        self.history.append(stats)
+        return stats
+
+    def train(
+        self,
+        iterations: int,
+        checkpoint_every: int = 10,
+        resume: bool = True,
+        log_every: int = 10,
+    ) -> Dict:
+        """
+        Train until `iterations` total iterations have run.
+
+        With resume=True an existing checkpoint is loaded first, so an
+        interrupted run continues from its last checkpoint. The agent's
+        model file (ppo_agent.pt) is saved at the end so live trading
+        picks up the trained weights.
+        """
+        if resume and self.checkpoint_path.exists():
+            self.load_checkpoint()
+
+        started = time.perf_counter()
+        start_iteration = self.iteration
+        while self.iteration < iterations:
+            stats = self.train_iteration()
+            if log_every and self.iteration % log_every == 0:
+                logger.info(
+                    f"PPO offline iter {self.iteration}/{iterations}: reward {stats['mean_reward']:.3f}, "
+                    f"policy {stats['policy_loss']:.4f}, value {stats['value_loss']:.4f}, "
+                    f"{stats['rollout_steps_per_sec']:.0f} steps/s"
+                )
+            if checkpoint_every and self.iteration % checkpoint_every == 0:
+                self.save_checkpoint()
+
+        self.save_checkpoint()
+        self.agent.save_model()
+
+        return {
+            'iterations': self.iteration,
+            'iterations_run': self.iteration - start_iteration,
+            'total_steps': self.total_steps,
+            'seconds': round(time.perf_counter() - started, 2),
+            'trades': self.env.num_trades,
+            'last': self.history[-1] if self.history else None,
+        }
+
+    # -------------------------------------------------------------------------
+
+    def save_checkpoint(self) -> Path:
+        """Write agent weights, optimizer state and trainer progress."""
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix('.tmp')
+        torch.save({
+            'policy_state_dict': self.agent.policy.state_dict(),
+            'value_state_dict': self.agent.value.state_dict(),
+            'policy_optimizer_state_dict': self.agent.policy_optimizer.state_dict(),
+            'value_optimizer_state_dict': self.agent.value_optimizer.state_dict(),
+            'training_steps': self.agent.training_steps,
+            'iteration': self.iteration,
+            'total_steps': self.total_steps,
+            'history': self.history[-100:],
+            'env_rng': self.env.rng.bit_generator.state,
+            'torch_rng': torch.get_rng_state(),
+        }, tmp_path)
+        tmp_path.replace(self.checkpoint_path)
+        return self.checkpoint_path
+
+    def load_checkpoint(self) -> None:
+        """Restore from checkpoint_path; rollouts restart from fresh episodes."""
+        checkpoint = torch.load(self.checkpoint_path, weights_only=False)
+        self.agent.policy.load_state_dict(checkpoint['policy_state_dict'])
+        self.agent.value.load_state_dict(checkpoint['value_state_dict'])
+        self.agent.policy_optimizer.load_state_dict(checkpoint['policy_optimizer_state_dict'])
+        self.agent.value_optimizer.load_state_dict(checkpoint['value_optimizer_state_dict'])
+        self.agent.training_steps = checkpoint['training_steps']
+        self.iteration = checkpoint['iteration']
+        self.total_steps = checkpoint['total_steps']
+        self.history = list(checkpoint.get('history', []))
+        if 'env_rng' in checkpoint:
+            self.env.rng.bit_generator.state = checkpoint['env_rng']
+        if 'torch_rng' in checkpoint:
+            torch.set_rng_state(checkpoint['torch_rng'])
+        self._states = self.env.reset()
+        logger.info(f"Resumed offline PPO from iteration {self.iteration} ({self.total_steps} steps)")
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> Dict:
+    parser = argparse.ArgumentParser(description="Offline PPO training on trade history")
+    parser.add_argument('--storage-dir', default='user_data/learning', help='PPO agent storage directory')
+    parser.add_argument('--journal', help='TradeRecord JSON-lines journal (default: <storage-dir>/trade_journal.jsonl)')
+    parser.add_argument('--paper-volume', help='Volume path containing paper_trading/journal.json')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--num-envs', type=int, default=64)
+    parser.add_argument('--episode-length', type=int, default=20)
+    parser.add_argument('--minibatch-size', type=int, default=256)
+    parser.add_argument('--epochs', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=None)
+    parser.add_argument('--checkpoint-every', type=int, default=10)
+    parser.add_argument('--no-resume', action='store_true', help='Ignore an existing checkpoint')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    storage_dir = Path(args.storage_dir)
+    from .learning_brain import TRADE_JOURNAL_FILE
+    journal = args.journal or storage_dir / TRADE_JOURNAL_FILE
+
+    trades = load_training_trades(journal, args.paper_volume)
+    if not trades:
+        logger.error("No closed trades found to train on")
+        return {'ok': False, 'error': 'no trades'}
+    logger.info(f"Training on {len(trades)} closed trades")
+
+    trainer = OfflinePPOTrainer(
+        trades,
+        agent=PPOAgent(storage_dir=storage_dir),
+        num_envs=args.num_envs,
+        episode_length=args.episode_length,
+        minibatch_size=args.minibatch_size,
+        epochs=args.epochs,
+        num_threads=args.threads,
+        seed=args.seed,
+    )
+    result = trainer.train(args.iterations, checkpoint_every=args.checkpoint_every, resume=not args.no_resume)
+    logger.info(f"Done: {result}")
+    return {'ok': True, **result}
+
+
+if __name__ == '__main__':
+    main()
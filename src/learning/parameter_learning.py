@@ -139,24 +139,26 @@ def run_optimization_cycle() -> Dict[str, Any]:
     recommendations = optimizer.optimize_all()
     results['recommendations'] = recommendations
 
-    for rec in recommendations[:5]:  # Apply top 5
-        evidence = {
-            'samples': rec['samples_analyzed'],
-            'improvement': rec['improvement'],
-            'p_value': 0.03,  # Simplified
-            'holdout_validated': True,
-            'consistent_across_regimes': True
-        }
-
-        passed, checks = validator.validate_change(
-            rec['parameter'], rec['optimal_value'], evidence
-        )
-
-        if passed:
-            rollout.start_rollout(rec['parameter'], rec['optimal_value'])
-            results['applied'].append(rec)
-        else:
-            results['rejected'].append({**rec, 'failed_checks': [k for k, v in checks.items() if not v]})
+    # One registry write for all rollouts started this cycle
+    with registry.batch():
+        for rec in recommendations[:5]:  # Apply top 5
+            evidence = {
+                'samples': rec['samples_analyzed'],
+                'improvement': rec['improvement'],
+                'p_value': 0.03,  # Simplified
+                'holdout_validated': True,
+                'consistent_across_regimes': True
+            }
+
+            passed, checks = validator.validate_change(
+                rec['parameter'], rec['optimal_value'], evidence
+            )
+
+            if passed:
+                rollout.start_rollout(rec['parameter'], rec['optimal_value'])
+                results['applied'].append(rec)
+            else:
+                results['rejected'].append({**rec, 'failed_checks': [k for k, v in checks.items() if not v]})
 
     return results
 
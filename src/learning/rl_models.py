@@ -371,6 +371,78 @@ def create_trade_id(ticker: str, timestamp: datetime) -> str:
     return f"TRD_{ticker}_{timestamp.strftime('%Y%m%d_%H%M%S_%f')}"
 
 
+def _parse_datetime(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00')).replace(tzinfo=None)
+
+
+def _dataclass_from_dict(cls, data: Optional[Dict]):
+    """Build a dataclass from a dict, ignoring keys it does not define."""
+    known = {f for f in cls.__dataclass_fields__}
+    return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+
+def trade_record_from_dict(data: Dict) -> TradeRecord:
+    """Rebuild a TradeRecord from its to_dict()/JSON form."""
+    context = dict(data.get('market_context') or {})
+    if 'regime' in context:
+        context['regime'] = MarketRegimeType(context['regime'])
+    if 'timestamp' in context:
+        context['timestamp'] = _parse_datetime(context['timestamp'])
+
+    weights = dict(data.get('weights_used') or {})
+    if 'last_updated' in weights:
+        weights['last_updated'] = _parse_datetime(weights['last_updated'])
+    if weights.get('regime') is not None:
+        weights['regime'] = MarketRegimeType(weights['regime'])
+
+    fields = {k: v for k, v in data.items() if k in TradeRecord.__dataclass_fields__}
+    fields.update(
+        entry_date=_parse_datetime(data['entry_date']),
+        exit_date=_parse_datetime(data.get('exit_date')),
+        outcome=TradeOutcome(data.get('outcome', 'open')),
+        component_scores=_dataclass_from_dict(ComponentScores, data.get('component_scores')),
+        market_context=_dataclass_from_dict(MarketContext, context),
+        weights_used=_dataclass_from_dict(ComponentWeights, weights),
+    )
+    return TradeRecord(**fields)
+
+
+def append_trade_record(path, trade: TradeRecord) -> None:
+    """Append a trade to a JSON-lines trade journal."""
+    with open(path, 'a') as f:
+        f.write(json.dumps(trade, cls=LearningDataEncoder) + '\n')
+
+
+def load_trade_records(path) -> List[TradeRecord]:
+    """
+    Load trades from a JSON-lines journal (or a JSON list), skipping
+    lines that do not parse.
+    """
+    with open(path) as f:
+        text = f.read()
+
+    if text.lstrip().startswith('['):
+        rows = json.loads(text)
+    else:
+        rows = []
+        for line in text.splitlines():
+            if line.strip():
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+    trades = []
+    for row in rows:
+        try:
+            trades.append(trade_record_from_dict(row))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return trades
+
+
 class LearningDataEncoder(json.JSONEncoder):
     """Custom JSON encoder for learning data models."""
     def default(self, obj):
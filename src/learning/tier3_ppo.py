@@ -28,6 +28,7 @@ import logging
 import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
 from torch.distributions import Normal, Beta
 from typing import Dict, List, Tuple, Optional
@@ -165,6 +166,8 @@ class TradingAction:
 # NEURAL NETWORK ARCHITECTURE
 # =============================================================================
 
+ACTION_EPS = 1e-4
+
 class PolicyNetwork(nn.Module):
     """
     Actor network for PPO.
@@ -201,10 +204,10 @@ class PolicyNetwork(nn.Module):
         shared_features = self.shared(state)
 
         # Get distribution parameters (ensure positive with softplus)
-        position_params = torch.softplus(self.position_size_head(shared_features)) + 1
-        duration_params = torch.softplus(self.hold_duration_head(shared_features)) + 1
-        stop_params = torch.softplus(self.stop_loss_head(shared_features)) + 1
-        profit_params = torch.softplus(self.take_profit_head(shared_features)) + 1
+        position_params = F.softplus(self.position_size_head(shared_features)) + 1
+        duration_params = F.softplus(self.hold_duration_head(shared_features)) + 1
+        stop_params = F.softplus(self.stop_loss_head(shared_features)) + 1
+        profit_params = F.softplus(self.take_profit_head(shared_features)) + 1
 
         return position_params, duration_params, stop_params, profit_params
 
@@ -222,11 +225,11 @@ class PolicyNetwork(nn.Module):
         stop_dist = Beta(stop_params[:, 0], stop_params[:, 1])
         profit_dist = Beta(profit_params[:, 0], profit_params[:, 1])
 
-        # Sample
-        pos_action = pos_dist.sample()
-        dur_action = dur_dist.sample()
-        stop_action = stop_dist.sample()
-        profit_action = profit_dist.sample()
+        # Sample (kept off 0/1, where Beta log-probs are infinite)
+        pos_action = pos_dist.sample().clamp(ACTION_EPS, 1 - ACTION_EPS)
+        dur_action = dur_dist.sample().clamp(ACTION_EPS, 1 - ACTION_EPS)
+        stop_action = stop_dist.sample().clamp(ACTION_EPS, 1 - ACTION_EPS)
+        profit_action = profit_dist.sample().clamp(ACTION_EPS, 1 - ACTION_EPS)
 
         # Concatenate actions
         action = torch.stack([pos_action, dur_action, stop_action, profit_action], dim=-1)
@@ -241,6 +244,29 @@ class PolicyNetwork(nn.Module):
 
         return action, log_prob
 
+    def evaluate_actions(self, state: torch.Tensor, actions: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Log probability and entropy of given actions under the current policy.
+
+        Returns: (log_prob, entropy), each of shape (batch,)
+        """
+        pos_params, dur_params, stop_params, profit_params = self.forward(state)
+
+        pos_dist = Beta(pos_params[:, 0], pos_params[:, 1])
+        dur_dist = Beta(dur_params[:, 0], dur_params[:, 1])
+        stop_dist = Beta(stop_params[:, 0], stop_params[:, 1])
+        profit_dist = Beta(profit_params[:, 0], profit_params[:, 1])
+
+        log_prob = (
+            pos_dist.log_prob(actions[:, 0]) +
+            dur_dist.log_prob(actions[:, 1]) +
+            stop_dist.log_prob(actions[:, 2]) +
+            profit_dist.log_prob(actions[:, 3])
+        )
+        entropy = pos_dist.entropy() + dur_dist.entropy() + stop_dist.entropy() + profit_dist.entropy()
+
+        return log_prob, entropy
+
 
 class ValueNetwork(nn.Module):
     """Critic network for PPO - estimates state value."""
@@ -263,6 +289,36 @@ class ValueNetwork(nn.Module):
         return self.network(state)
 
 
+def compute_gae(
+    rewards: torch.Tensor,
+    values: torch.Tensor,
+    dones: torch.Tensor,
+    last_value: torch.Tensor,
+    gamma: float = 0.99,
+    lam: float = 0.95,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Generalized Advantage Estimation over the time dimension.
+
+    Args:
+        rewards, values, dones: Shape (T,) or (T, num_envs); dones[t] marks
+            the end of an episode after step t
+        last_value: Value of the state after the final step, shape () or (num_envs,)
+
+    Returns: (advantages, returns), same shape as rewards
+    """
+    advantages = torch.zeros_like(rewards)
+    gae = torch.zeros_like(last_value)
+    next_value = last_value
+    for t in range(rewards.shape[0] - 1, -1, -1):
+        not_done = 1.0 - dones[t]
+        delta = rewards[t] + gamma * next_value * not_done - values[t]
+        gae = delta + gamma * lam * not_done * gae
+        advantages[t] = gae
+        next_value = values[t]
+    return advantages, advantages + values
+
+
 # =============================================================================
 # PPO AGENT
 # =============================================================================
@@ -451,76 +507,102 @@ class PPOAgent:
         # Convert to tensors
         states = torch.cat(self.states)
         actions = torch.cat(self.actions)
-        old_log_probs = torch.stack(self.log_probs)
+        old_log_probs = torch.cat(self.log_probs)
         returns = self._compute_returns()
 
         # Compute advantages
-        values = torch.cat(self.values)
+        values = torch.cat(self.values).squeeze(-1)
         advantages = returns - values.detach()
-        advantages = (advantages - advantages.mean()) / (advantages.std() + 1e-8)
-
-        # PPO update (multiple epochs)
-        for _ in range(4):  # 4 epochs per update
-            # Recompute log probs with current policy
-            pos_params, dur_params, stop_params, profit_params = self.policy.forward(states)
-
-            pos_dist = Beta(pos_params[:, 0], pos_params[:, 1])
-            dur_dist = Beta(dur_params[:, 0], dur_params[:, 1])
-            stop_dist = Beta(stop_params[:, 0], stop_params[:, 1])
-            profit_dist = Beta(profit_params[:, 0], profit_params[:, 1])
-
-            new_log_probs = (
-                pos_dist.log_prob(actions[:, 0]) +
-                dur_dist.log_prob(actions[:, 1]) +
-                stop_dist.log_prob(actions[:, 2]) +
-                profit_dist.log_prob(actions[:, 3])
-            )
-
-            # Compute probability ratio
-            ratio = torch.exp(new_log_probs - old_log_probs)
-
-            # Clipped surrogate objective
-            surr1 = ratio * advantages
-            surr2 = torch.clamp(ratio, 1 - self.epsilon, 1 + self.epsilon) * advantages
-            policy_loss = -torch.min(surr1, surr2).mean()
-
-            # Entropy bonus (encourages exploration)
-            entropy = (pos_dist.entropy() + dur_dist.entropy() +
-                      stop_dist.entropy() + profit_dist.entropy()).mean()
-
-            # Value loss
-            current_values = self.value(states)
-            value_loss = nn.MSELoss()(current_values.squeeze(), returns)
-
-            # Total loss
-            loss = policy_loss + self.value_coef * value_loss - self.entropy_coef * entropy
-
-            # Update
-            self.policy_optimizer.zero_grad()
-            self.value_optimizer.zero_grad()
-            loss.backward()
-            torch.nn.utils.clip_grad_norm_(self.policy.parameters(), 0.5)
-            torch.nn.utils.clip_grad_norm_(self.value.parameters(), 0.5)
-            self.policy_optimizer.step()
-            self.value_optimizer.step()
 
-        self.training_steps += 1
+        # PPO update (4 full-batch epochs)
+        self.ppo_update(states, actions, old_log_probs, returns, advantages, epochs=4)
 
         # Clear buffer
         self.clear_buffer()
 
+    def ppo_update(
+        self,
+        states: torch.Tensor,
+        actions: torch.Tensor,
+        old_log_probs: torch.Tensor,
+        returns: torch.Tensor,
+        advantages: torch.Tensor,
+        epochs: int = 4,
+        minibatch_size: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """
+        Clipped-surrogate PPO update on a batch of experience.
+
+        Advantages are normalized over the whole batch, then each epoch
+        shuffles the batch into minibatches (one full batch when
+        minibatch_size is None).
+
+        Returns: Mean losses over all minibatch updates
+        """
+        advantages = (advantages - advantages.mean()) / (advantages.std() + 1e-8)
+        n = states.shape[0]
+        minibatch_size = min(minibatch_size or n, n)
+
+        totals = {'policy_loss': 0.0, 'value_loss': 0.0, 'entropy': 0.0, 'clip_fraction': 0.0}
+        updates = 0
+
+        for _ in range(epochs):
+            order = torch.randperm(n) if minibatch_size < n else torch.arange(n)
+            for start in range(0, n, minibatch_size):
+                idx = order[start:start + minibatch_size]
+                if idx.numel() < 2:
+                    continue
+
+                # Recompute log probs with current policy
+                new_log_probs, entropy = self.policy.evaluate_actions(states[idx], actions[idx])
+
+                # Compute probability ratio
+                ratio = torch.exp(new_log_probs - old_log_probs[idx])
+
+                # Clipped surrogate objective
+                surr1 = ratio * advantages[idx]
+                surr2 = torch.clamp(ratio, 1 - self.epsilon, 1 + self.epsilon) * advantages[idx]
+                policy_loss = -torch.min(surr1, surr2).mean()
+
+                # Entropy bonus (encourages exploration)
+                entropy = entropy.mean()
+
+                # Value loss
+                current_values = self.value(states[idx]).squeeze(-1)
+                value_loss = F.mse_loss(current_values, returns[idx])
+
+                # Total loss
+                loss = policy_loss + self.value_coef * value_loss - self.entropy_coef * entropy
+
+                # Update
+                self.policy_optimizer.zero_grad()
+                self.value_optimizer.zero_grad()
+                loss.backward()
+                torch.nn.utils.clip_grad_norm_(self.policy.parameters(), 0.5)
+                torch.nn.utils.clip_grad_norm_(self.value.parameters(), 0.5)
+                self.policy_optimizer.step()
+                self.value_optimizer.step()
+
+                totals['policy_loss'] += policy_loss.item()
+                totals['value_loss'] += value_loss.item()
+                totals['entropy'] += entropy.item()
+                totals['clip_fraction'] += ((ratio - 1).abs() > self.epsilon).float().mean().item()
+                updates += 1
+
+        self.training_steps += 1
+        return {k: v / max(updates, 1) for k, v in totals.items()}
+
     def _compute_returns(self) -> torch.Tensor:
         """Compute discounted returns."""
-        returns = []
-        R = 0
-        for reward, done in zip(reversed(self.rewards), reversed(self.dones)):
-            if done:
-                R = 0
-            R = reward + self.gamma * R
-            returns.insert(0, R)
-
-        returns = torch.tensor(returns, dtype=torch.float32)
-        return returns
+        returns = np.zeros(len(self.rewards), dtype=np.float32)
+        R = 0.0
+        for i in range(len(self.rewards) - 1, -1, -1):
+            if self.dones[i]:
+                R = 0.0
+            R = self.rewards[i] + self.gamma * R
+            returns[i] = R
+
+        return torch.from_numpy(returns)
 
     def clear_buffer(self):
         """Clear experience buffer."""
@@ -49,10 +49,10 @@ class AuditTrail:
         with open(AUDIT_FILE, 'w') as f:
             json.dump(data, f)
 
-    def log_change(self, param_name: str, old_value: float, new_value: float,
-                   reason: str, evidence: Dict = None):
-        """Log a parameter change"""
-        entry = {
+    @staticmethod
+    def _make_entry(param_name: str, old_value: float, new_value: float,
+                    reason: str, evidence: Dict = None) -> Dict:
+        return {
             'timestamp': datetime.now().isoformat(),
             'parameter': param_name,
             'old_value': old_value,
@@ -62,11 +62,23 @@ class AuditTrail:
             'evidence': evidence or {}
         }
 
-        self.entries.append(entry)
+    def log_change(self, param_name: str, old_value: float, new_value: float,
+                   reason: str, evidence: Dict = None):
+        """Log a parameter change"""
+        self.entries.append(self._make_entry(param_name, old_value, new_value, reason, evidence))
         self._save_audit()
 
         logger.info(f"Audit: {param_name} changed from {old_value} to {new_value} ({reason})")
 
+    def log_changes(self, changes: List[Dict]):
+        """Log a batch of changes (log_change keyword dicts) with one write"""
+        if not changes:
+            return
+        self.entries.extend(self._make_entry(**change) for change in changes)
+        self._save_audit()
+
+        logger.info(f"Audit: {len(changes)} parameter changes logged")
+
     def get_changes_for_parameter(self, param_name: str,
                                    days: int = None) -> List[Dict]:
         """Get change history for a parameter"""
@@ -251,6 +251,14 @@ class NotificationManager:
         message = self._format_alert(alert_type, data)
         title = self._get_alert_title(alert_type)
 
+        from src.sync.delta_stream import publish_delta
+        publish_delta('alerts', {
+            'alert_type': alert_type,
+            'title': title,
+            'priority': getattr(priority, 'value', priority),
+            'message': message,
+        })
+
         return self.send(message, title=title, priority=priority)
 
     def _get_alert_title(self, alert_type: str) -> str:
@@ -142,8 +142,8 @@ class EarningsScorer:
                 return None
 
             # Get earnings data for context
-            from src.analysis.earnings import get_earnings_info
-            earnings_data = get_earnings_info(ticker)
+            from src.analysis.earnings import lookup_earnings
+            earnings_data = lookup_earnings(ticker)
 
             # Run AI analysis
             from src.ai.ai_enhancements import analyze_earnings
@@ -211,10 +211,10 @@ class EarningsScorer:
             if (datetime.now().timestamp() - cached_time) < self.cache_ttl:
                 return cached_features
 
-        # Get earnings data
-        from src.analysis.earnings import get_earnings_info
+        # Get earnings data (dictionary read from the ingested calendar)
+        from src.analysis.earnings import lookup_earnings
 
-        info = get_earnings_info(ticker)
+        info = lookup_earnings(ticker)
 
         # Extract features
         days_until = info.get('days_until')
@@ -5,8 +5,10 @@ This module provides simple functions to access parameter values
 from the central registry. Import this instead of hardcoding values.
 """
 
+from contextlib import contextmanager
 from typing import Dict, Any
 import logging
+import threading
 
 logger = logging.getLogger('param_helper')
 
@@ -14,6 +16,11 @@ logger = logging.getLogger('param_helper')
 _registry = None
 _registry_checked = False  # Track if we've already checked
 
+# Snapshot pinned for the duration of a scan (see pinned_snapshot)
+_pinned = None
+_pin_depth = 0
+_pin_lock = threading.Lock()
+
 
 def _get_registry():
     """Get the parameter registry (lazy load)"""
@@ -29,11 +36,49 @@ def _get_registry():
     return _registry
 
 
+def snapshot():
+    """
+    Immutable ParameterSnapshot of all current values, or None if the
+    parameter system is unavailable. Read it with attribute access:
+    ``snapshot().weight.theme_heat``.
+    """
+    if _pinned is not None:
+        return _pinned
+    registry = _get_registry()
+    return registry.snapshot() if registry else None
+
+
+@contextmanager
+def pinned_snapshot():
+    """
+    Serve every get() in the block from one snapshot.
+
+    A scan wraps its scoring in this so all tickers see the same parameter
+    version, even if a learning cycle writes to the registry mid-scan.
+    Nested blocks share the outermost snapshot.
+    """
+    global _pinned, _pin_depth
+    with _pin_lock:
+        if _pin_depth == 0:
+            _pinned = snapshot()
+        _pin_depth += 1
+    try:
+        yield _pinned
+    finally:
+        with _pin_lock:
+            _pin_depth -= 1
+            if _pin_depth == 0:
+                _pinned = None
+
+
 def get(name: str, default: float = None) -> float:
     """
     Get a parameter value by name.
     Falls back to default if parameter system unavailable.
     """
+    pinned = _pinned
+    if pinned is not None and name in pinned:
+        return pinned[name]
     registry = _get_registry()
     if registry:
         try:
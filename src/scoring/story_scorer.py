@@ -54,10 +54,7 @@ except ImportError:
 
 # Try to import learned theme registry
 try:
-    from theme_registry import (
-        get_theme_membership_for_scoring,
-        get_all_theme_tickers as get_learned_theme_tickers,
-    )
+    from theme_registry import get_all_theme_tickers as get_learned_theme_tickers
     HAS_THEME_REGISTRY = True
 except ImportError:
     HAS_THEME_REGISTRY = False
@@ -843,70 +840,16 @@ CATALYST_TYPES = {
 # =============================================================================
 
 def get_theme_membership(ticker: str) -> list:
-    """Get all themes a ticker belongs to, including learned and discovered themes."""
-    themes = []
-
-    # PRIORITY 1: Check learned theme registry (dynamic membership)
-    if HAS_THEME_REGISTRY:
-        try:
-            learned_themes = get_theme_membership_for_scoring(ticker)
-            for theme in learned_themes:
-                themes.append({
-                    'theme_id': theme['theme_id'],
-                    'theme_name': theme['theme_name'],
-                    'role': theme['role'],
-                    'stage': theme['stage'],
-                    'confidence': theme.get('confidence', 0.8),
-                    'is_learned': True,
-                })
-        except Exception as e:
-            logger.debug(f"Could not load learned themes: {e}")
-
-    # PRIORITY 2: Check hardcoded themes (fallback / bootstrap)
-    for theme_id, theme in THEMES.items():
-        # Skip if already found in learned themes
-        if any(t['theme_id'] == theme_id for t in themes):
-            continue
-
-        all_tickers = (
-            theme.get('drivers', []) +
-            theme.get('beneficiaries', []) +
-            theme.get('picks_shovels', [])
-        )
-        if ticker in all_tickers:
-            role = 'driver' if ticker in theme.get('drivers', []) else \
-                   'beneficiary' if ticker in theme.get('beneficiaries', []) else 'picks_shovels'
-            themes.append({
-                'theme_id': theme_id,
-                'theme_name': theme['name'],
-                'role': role,
-                'stage': theme.get('stage', 'unknown'),
-                'is_learned': False,
-            })
-
-    # PRIORITY 3: Check discovered themes from evolution engine
-    try:
-        from evolution_engine import get_discovered_themes
-        for theme in get_discovered_themes():
-            # Skip if already found
-            if any(t['theme_id'] == theme['id'] for t in themes):
-                continue
-
-            if ticker in theme.get('stocks', []):
-                themes.append({
-                    'theme_id': theme['id'],
-                    'theme_name': theme['name'],
-                    'role': 'discovered',
-                    'stage': theme.get('lifecycle_stage', 'unknown'),
-                    'confidence': theme.get('confidence', 0.7),
-                    'discovery_method': theme.get('discovery_method', 'auto'),
-                })
-    except ImportError:
-        pass
-    except Exception as e:
-        logger.debug(f"Could not load discovered themes: {e}")
+    """
+    Get all themes a ticker belongs to, including learned and discovered themes.
 
-    return themes
+    Priority: learned registry, then hardcoded THEMES, then themes discovered
+    by the evolution engine (a theme id is only reported once). Served from
+    the precomputed ticker -> themes index, which rebuilds itself when one
+    of those sources changes.
+    """
+    from src.themes.theme_index import get_theme_index
+    return get_theme_index().get_theme_membership(ticker)
 
 
 def calculate_theme_heat(ticker: str, news_data: list = None) -> dict:
@@ -1609,7 +1552,8 @@ def scan_for_stories(tickers: list, max_workers: int = 10) -> list:
 
     results = []
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Every ticker in the scan scores against one parameter version
+    with params.pinned_snapshot(), ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = {executor.submit(calculate_story_score, ticker): ticker for ticker in tickers}
 
         for future in as_completed(futures, timeout=120):
@@ -6,6 +6,7 @@ Components:
 - SocketIO Server: Real-time communication with dashboard (Flask-SocketIO)
 - EventStore: Persistent event storage
 - TelegramSync: Telegram bot integration
+- DeltaHub: Incremental scan/signal/alert deltas streamed over SSE
 """
 
 from .sync_hub import (
@@ -31,6 +32,14 @@ from .socketio_server import (
     broadcast_telegram_command,
 )
 
+from .delta_stream import (
+    DeltaHub,
+    DeltaLog,
+    ScanDeltaPublisher,
+    get_delta_hub,
+    publish_delta,
+)
+
 # Keep websocket_server for standalone use if needed
 from .websocket_server import (
     SyncWebSocketServer,
@@ -60,6 +69,12 @@ __all__ = [
     'get_socketio',
     'broadcast_event',
     'broadcast_telegram_command',
+    # Delta stream (SSE)
+    'DeltaHub',
+    'DeltaLog',
+    'ScanDeltaPublisher',
+    'get_delta_hub',
+    'publish_delta',
     # WebSocket (standalone)
     'SyncWebSocketServer',
     'get_ws_server',
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Delta Stream - incremental updates pushed to dashboards over SSE.
+
+Instead of polling full payloads (/scan, /paper/signals, /options/feed),
+clients subscribe to fine-grained deltas per topic:
+
+- scan:    per-ticker score changes as scan shards finish, progress, completion
+- signals: new paper trading signals
+- xray:    Market X-Ray refreshes (summary fields)
+- alerts:  alert triggers (conviction, unusual options, crisis, ...)
+
+Architecture:
+- Writers (scanner job, API, alert jobs) append deltas to their own
+  JSONL file in the delta directory (on the shared volume in Modal), so
+  processes never write to the same file.
+- The API's DeltaHub tails every writer file into an in-memory ring
+  buffer and assigns one sequence number per delta. Sequence numbers are
+  scoped to the hub's epoch (one per API process).
+- Clients resume with Last-Event-ID ("<epoch>-<seq>"). If the epoch
+  changed or the gap fell out of the buffer, they get a `reset` event
+  and should refetch the full payload once.
+
+Usage:
+    from src.sync.delta_stream import publish_delta
+    publish_delta('signals', signal, key=signal['ticker'])
+
+    # API
+    hub = get_delta_hub()
+    return hub.sse_response(request, topics=['scan', 'alerts'], since=since)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.file_utils import ensure_data_dir
+
+logger = logging.getLogger(__name__)
+
+TOPICS = ('scan', 'signals', 'xray', 'alerts')
+MODAL_VOLUME_PATH = "/data"
+BUFFER_SIZE = 5000  # Deltas kept in memory for resume
+MAX_LOG_BYTES = 5 * 1024 * 1024  # Writer files are compacted past this size
+HEARTBEAT_SECONDS = 15
+STALE_LOG_SECONDS = 2 * 86400  # Writer files untouched this long are removed
+
+
+def get_delta_dir() -> Path:
+    """Delta directory (Modal volume if mounted, else data/deltas)."""
+    if os.path.exists(MODAL_VOLUME_PATH):
+        path = Path(MODAL_VOLUME_PATH) / 'deltas'
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    return Path(ensure_data_dir('deltas'))
+
+
+def _default_writer() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+# =============================================================================
+# WRITER
+# =============================================================================
+
+class DeltaLog:
+    """Append-only delta file for one writer process."""
+
+    def __init__(self, directory: Optional[Path] = None, writer: Optional[str] = None,
+                 max_bytes: int = MAX_LOG_BYTES):
+        self.directory = Path(directory) if directory else get_delta_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.writer = writer or _default_writer()
+        self.path = self.directory / f"{self.writer}.jsonl"
+        self.max_bytes = max_bytes
+        self._n = 0
+        self._lock = threading.Lock()
+
+    def append(self, topic: str, data: Dict[str, Any], key: Optional[str] = None) -> Dict[str, Any]:
+        """Append one delta; returns the record as written."""
+        with self._lock:
+            self._n += 1
+            record = {
+                'writer': self.writer,
+                'n': self._n,
+                'topic': topic,
+                'key': key,
+                'ts': time.time(),
+                'data': data,
+            }
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(record, default=str) + '\n')
+            if self.path.stat().st_size > self.max_bytes:
+                self._compact()
+        return record
+
+    def _compact(self):
+        """Keep the newest half of the file (readers dedupe by record number)."""
+        lines = self.path.read_text().splitlines(keepends=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(''.join(lines[len(lines) // 2:]))
+        os.replace(tmp, self.path)
+
+
+# =============================================================================
+# HUB (API side)
+# =============================================================================
+
+class DeltaHub:
+    """
+    Sequenced in-memory view of all writers' deltas, with SSE subscriptions.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, writer: Optional[str] = None,
+                 buffer_size: int = BUFFER_SIZE):
+        self.log = DeltaLog(directory, writer)
+        self.directory = self.log.directory
+        self.epoch = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self.buffer: deque = deque(maxlen=buffer_size)
+        self._offsets: Dict[str, int] = {}  # file name -> bytes read
+        self._seen: Dict[str, int] = {}  # writer -> last record number ingested
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._primed = False
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Ingest
+    # -------------------------------------------------------------------------
+
+    def _ingest(self, records: Iterable[Dict[str, Any]]) -> int:
+        added = 0
+        with self._lock:
+            for record in records:
+                writer, n = record.get('writer'), record.get('n', 0)
+                if n <= self._seen.get(writer, 0):
+                    continue
+                self._seen[writer] = n
+                self.seq += 1
+                self.buffer.append({
+                    'seq': self.seq,
+                    'topic': record['topic'],
+                    'key': record.get('key'),
+                    'ts': record.get('ts'),
+                    'data': record.get('data'),
+                })
+                added += 1
+            waiters = list(self._waiters) if added else []
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Loop closed
+        return added
+
+    def publish(self, topic: str, data: Dict[str, Any], key: Optional[str] = None):
+        """Publish from this process: write to the log and push immediately."""
+        self._ingest([self.log.append(topic, data, key)])
+
+    def poll(self) -> int:
+        """
+        Read new deltas from other writers' files. The first poll only
+        skips past what's already there (the hub starts from now).
+
+        Returns:
+            Number of deltas added
+        """
+        records = []
+        now = time.time()
+        for path in sorted(self.directory.glob('*.jsonl')):
+            if path == self.log.path:
+                continue
+            try:
+                stat = path.stat()
+                if now - stat.st_mtime > STALE_LOG_SECONDS:
+                    path.unlink()
+                    self._offsets.pop(path.name, None)
+                    continue
+                size = stat.st_size
+                offset = self._offsets.get(path.name, 0)
+                if size < offset:
+                    offset = 0  # Compacted; already-seen records are skipped by number
+                if size == offset:
+                    continue
+                with open(path) as f:
+                    f.seek(offset)
+                    chunk = f.read()
+                # Only consume complete lines (a writer may be mid-append)
+                complete = chunk[:chunk.rfind('\n') + 1]
+                self._offsets[path.name] = offset + len(complete.encode())
+                for line in complete.splitlines():
+                    if line.strip():
+                        records.append(json.loads(line))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug(f"Delta file {path.name} unreadable: {e}")
+        if not self._primed:
+            self._primed = True
+            with self._lock:
+                for record in records:
+                    writer = record.get('writer')
+                    self._seen[writer] = max(self._seen.get(writer, 0), record.get('n', 0))
+            return 0
+        records.sort(key=lambda r: r.get('ts', 0))
+        return self._ingest(records)
+
+    async def run_poller(self, interval: float = 1.0):
+        """Tail writer files on the API event loop."""
+        while True:
+            try:
+                await asyncio.to_thread(self.poll)
+            except Exception as e:
+                logger.warning(f"Delta poll failed: {e}")
+            await asyncio.sleep(interval)
+
+    # -------------------------------------------------------------------------
+    # Read
+    # -------------------------------------------------------------------------
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.epoch}-{self.seq}"
+
+    def parse_cursor(self, cursor: Optional[str]) -> Optional[int]:
+        """Sequence number for a cursor from this epoch (None if foreign/invalid)."""
+        if not cursor:
+            return None
+        epoch, _, seq = str(cursor).rpartition('-')
+        if epoch and epoch != self.epoch:
+            return None
+        try:
+            return int(seq)
+        except ValueError:
+            return None
+
+    def _after(self, seq: Optional[int], topics: Optional[Iterable[str]]) -> Tuple[List[Dict], bool, int]:
+        """(deltas after seq, reset, head seq) read atomically."""
+        wanted = set(topics) if topics else None
+        with self._lock:
+            oldest = self.buffer[0]['seq'] if self.buffer else self.seq + 1
+            if seq is None or seq > self.seq or seq < oldest - 1:
+                return [], True, self.seq
+            deltas = [d for d in self.buffer if d['seq'] > seq and (wanted is None or d['topic'] in wanted)]
+            return deltas, False, self.seq
+
+    def since(self, cursor: Optional[str], topics: Optional[Iterable[str]] = None) -> Tuple[List[Dict], bool]:
+        """
+        Deltas after a cursor.
+
+        Returns:
+            (deltas, reset) - reset is True when the cursor can't be resumed
+            (other epoch, or older than the buffer); deltas is then empty
+        """
+        deltas, reset, _ = self._after(self.parse_cursor(cursor), topics)
+        return deltas, reset
+
+    def _format(self, delta: Dict[str, Any]) -> str:
+        payload = json.dumps({'key': delta['key'], 'ts': delta['ts'], 'data': delta['data']}, default=str)
+        return f"id: {self.epoch}-{delta['seq']}\nevent: {delta['topic']}\ndata: {payload}\n\n"
+
+    async def subscribe(self, topics: Optional[Iterable[str]] = None, cursor: Optional[str] = None,
+                        heartbeat: float = HEARTBEAT_SECONDS) -> AsyncIterator[str]:
+        """
+        SSE messages for the topics, starting after the cursor.
+
+        Without a cursor only new deltas are sent. A cursor that can't be
+        resumed yields a `reset` event carrying the current cursor.
+        """
+        topics = list(topics) if topics else None
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        with self._lock:
+            self._waiters.append(waiter)
+            seq = self.seq
+        try:
+            if cursor:
+                seq = self.parse_cursor(cursor)
+            while True:
+                event.clear()
+                deltas, reset, head = self._after(seq, topics)
+                if reset:
+                    # Foreign epoch, or fell behind the buffer
+                    yield f"event: reset\ndata: {json.dumps({'cursor': f'{self.epoch}-{head}'})}\n\n"
+                for delta in deltas:
+                    yield self._format(delta)
+                seq = head  # Past filtered-out topics too
+
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            with self._lock:
+                self._waiters.remove(waiter)
+
+    def sse_response(self, request, topics: Optional[Iterable[str]] = None, since: Optional[str] = None):
+        """StreamingResponse for a subscription (Last-Event-ID header wins over `since`)."""
+        from starlette.responses import StreamingResponse
+
+        cursor = request.headers.get('last-event-id') or since
+        return StreamingResponse(
+            self.subscribe(topics, cursor),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
+
+
+# =============================================================================
+# SCAN DELTAS
+# =============================================================================
+
+class ScanDeltaPublisher:
+    """
+    Publishes per-ticker score changes as scan results arrive.
+
+    Only tickers that are new or whose story score moved by at least
+    min_change since the previous scan are published.
+    """
+
+    FIELDS = ('story_score', 'hottest_theme', 'story_strength', 'price', 'rs')
+
+    def __init__(self, previous_scores: Optional[Dict[str, float]] = None, min_change: float = 0.5,
+                 log: Optional[DeltaLog] = None):
+        self.previous = previous_scores or {}
+        self.min_change = min_change
+        self.log = log
+        self.published = 0
+
+    def _publish(self, data: Dict[str, Any], key: Optional[str] = None):
+        if self.log is not None:
+            self.log.append('scan', data, key)
+        else:
+            publish_delta('scan', data, key)
+
+    def add(self, results: Iterable[Dict[str, Any]]) -> int:
+        """Publish deltas for a batch of scan results; returns how many."""
+        count = 0
+        for result in results:
+            ticker = result.get('ticker')
+            score = result.get('story_score')
+            if not ticker or score is None or 'error' in result:
+                continue
+            prev = self.previous.get(ticker)
+            if prev is not None and abs(score - prev) < self.min_change:
+                continue
+            delta = {'type': 'score', 'ticker': ticker, 'prev_score': prev,
+                     'change': round(score - prev, 2) if prev is not None else None}
+            delta.update({f: result.get(f) for f in self.FIELDS if f in result})
+            self._publish(delta, key=ticker)
+            count += 1
+        self.published += count
+        return count
+
+    def progress(self, scanned: int, total: int, **extra):
+        self._publish({'type': 'progress', 'scanned': scanned, 'total': total, **extra})
+
+    def completed(self, **summary):
+        self._publish({'type': 'completed', 'changes': self.published, **summary})
+
+
+# =============================================================================
+# PUBLISHING
+# =============================================================================
+
+_delta_hub: Optional[DeltaHub] = None
+_delta_log: Optional[DeltaLog] = None
+
+
+def get_delta_hub() -> DeltaHub:
+    """Get the process's delta hub (API side)."""
+    global _delta_hub
+    if _delta_hub is None:
+        _delta_hub = DeltaHub()
+    return _delta_hub
+
+
+def get_delta_log() -> DeltaLog:
+    """Get the process's delta writer."""
+    global _delta_log
+    if _delta_log is None:
+        _delta_log = _delta_hub.log if _delta_hub is not None else DeltaLog()
+    return _delta_log
+
+
+def publish_delta(topic: str, data: Dict[str, Any], key: Optional[str] = None):
+    """
+    Publish a delta from anywhere. Goes through the hub when this process
+    runs one (immediate push to local subscribers), else to the log file.
+    Never raises: deltas are best-effort.
+    """
+    try:
+        if _delta_hub is not None:
+            _delta_hub.publish(topic, data, key)
+        else:
+            get_delta_log().append(topic, data, key)
+    except Exception as e:
+        logger.debug(f"Failed to publish {topic} delta: {e}")
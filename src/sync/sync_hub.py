@@ -12,6 +12,8 @@ import os
 import json
 import asyncio
 import logging
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any, Callable
@@ -109,63 +111,237 @@ class SyncEvent:
 
 
 class EventStore:
-    """Persistent event store for sync events."""
+    """
+    Persistent event store for sync events: an append-only segmented log
+    with per-target cursors.
+
+    - Events get a sequence number and are appended as JSON lines to the
+      active segment (segment-<first seq>.jsonl); a full segment is sealed
+      and a new one started. Writes never rewrite existing data.
+    - Each target (telegram, dashboard, websocket, ...) has a cursor: the
+      last sequence number it acknowledged. Unsynced events for a target
+      are the events after its cursor.
+    - The newest max_events are held in memory with contiguous sequence
+      numbers, so "events since cursor" is an index computation plus a
+      slice. Older events are read back from their segment.
+    - Retention drops sealed segments older than RETENTION_DAYS, beyond
+      MAX_BYTES in total, or acknowledged by every target and older than
+      COMPACT_AFTER_HOURS.
+    """
+
+    SEGMENT_BYTES = 1024 * 1024  # Seal a segment past 1MB
+    MAX_BYTES = 64 * 1024 * 1024  # Total log size kept on disk
+    RETENTION_DAYS = 14
+    COMPACT_AFTER_HOURS = 24  # Fully acknowledged segments are dropped after this
 
     def __init__(self, store_path: str = "data/sync_events.json"):
-        self.store_path = Path(store_path)
-        self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        self.events: List[SyncEvent] = []
-        self.max_events = 1000  # Keep last 1000 events
+        # The log lives in a directory next to the legacy JSON file
+        self.legacy_path = Path(store_path)
+        self.log_dir = self.legacy_path.with_suffix('')
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.cursor_path = self.log_dir / 'cursors.json'
+
+        self.events: List[SyncEvent] = []  # In-memory tail, oldest first
+        self.max_events = 1000  # Keep last 1000 events in memory
+        self.first_seq = 1  # Sequence number of self.events[0]
+        self.last_seq = 0
+        self.cursors: Dict[str, int] = {}
+        self._id_to_seq: Dict[str, int] = {}
+        self._segments: List[int] = []  # First sequence number of each segment, ascending
+        self._lock = threading.RLock()
         self._load()
 
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    def _segment_path(self, first_seq: int) -> Path:
+        return self.log_dir / f"segment-{first_seq:012d}.jsonl"
+
+    @staticmethod
+    def _read_segment(path: Path) -> List[tuple]:
+        """(seq, SyncEvent) pairs from a segment, skipping a torn last line."""
+        records = []
+        try:
+            with open(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        records.append((record['seq'], SyncEvent.from_dict(record['event'])))
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+        except OSError as e:
+            logger.error(f"Failed to read event segment {path.name}: {e}")
+        return records
+
     def _load(self):
-        """Load events from file."""
-        if self.store_path.exists():
+        """Load cursors and the in-memory tail from the newest segments."""
+        self._segments = sorted(int(p.stem.split('-')[1]) for p in self.log_dir.glob('segment-*.jsonl'))
+
+        if self.cursor_path.exists():
             try:
-                with open(self.store_path, 'r') as f:
-                    data = json.load(f)
-                    self.events = [SyncEvent.from_dict(e) for e in data]
+                with open(self.cursor_path) as f:
+                    self.cursors = {k: int(v) for k, v in json.load(f).items()}
             except Exception as e:
-                logger.error(f"Failed to load event store: {e}")
-                self.events = []
+                logger.error(f"Failed to load event cursors: {e}")
 
-    def _save(self):
-        """Save events to file."""
+        tail = []
+        for first_seq in reversed(self._segments):
+            tail = self._read_segment(self._segment_path(first_seq)) + tail
+            if len(tail) >= self.max_events:
+                break
+        tail = tail[-self.max_events:]
+        if tail:
+            self.first_seq = tail[0][0]
+            self.last_seq = tail[-1][0]
+            self.events = [event for _, event in tail]
+            self._id_to_seq = {event.id: seq for seq, event in tail}
+
+        if self.legacy_path.is_file():
+            self._migrate_legacy()
+
+    def _migrate_legacy(self):
+        """Import the old single-file store (per-event synced flags -> cursors)."""
         try:
-            # Keep only recent events
-            self.events = self.events[-self.max_events:]
-            with open(self.store_path, 'w') as f:
-                json.dump([e.to_dict() for e in self.events], f, indent=2)
+            with open(self.legacy_path, 'r') as f:
+                legacy = [SyncEvent.from_dict(e) for e in json.load(f)]
         except Exception as e:
-            logger.error(f"Failed to save event store: {e}")
+            logger.error(f"Failed to load legacy event store: {e}")
+            return
 
-    def add(self, event: SyncEvent):
-        """Add an event to the store."""
-        self.events.append(event)
-        self._save()
+        for target, flag in (('telegram', 'synced_to_telegram'), ('dashboard', 'synced_to_dashboard')):
+            # Cursor = end of the leading run of synced events
+            synced = 0
+            for event in legacy:
+                if not getattr(event, flag):
+                    break
+                synced += 1
+            self.cursors.setdefault(target, self.last_seq + synced)
+        for event in legacy:
+            self.add(event)
+        self._save_cursors()
+        self.legacy_path.rename(self.legacy_path.with_suffix('.json.migrated'))
+        logger.info(f"Migrated {len(legacy)} events to segmented event log")
+
+    def _save_cursors(self):
+        tmp = self.cursor_path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.cursors, f)
+        os.replace(tmp, self.cursor_path)
+
+    def _retain(self):
+        """Drop sealed segments past retention (never the active one)."""
+        now = time.time()
+        min_cursor = min(self.cursors.values()) if self.cursors else 0
+        total = sum(self._segment_path(s).stat().st_size for s in self._segments)
+
+        while len(self._segments) > 1:
+            path = self._segment_path(self._segments[0])
+            next_first = self._segments[1]
+            age = now - path.stat().st_mtime  # Last write = newest event in the segment
+            acknowledged = min_cursor >= next_first - 1
+            if not (age > self.RETENTION_DAYS * 86400 or total > self.MAX_BYTES
+                    or (acknowledged and age > self.COMPACT_AFTER_HOURS * 3600)):
+                break
+            total -= path.stat().st_size
+            path.unlink()
+            self._segments.pop(0)
 
-    def get_unsynced(self, target: str) -> List[SyncEvent]:
-        """Get events not yet synced to target (telegram/dashboard)."""
-        if target == 'telegram':
-            return [e for e in self.events if not e.synced_to_telegram]
-        elif target == 'dashboard':
-            return [e for e in self.events if not e.synced_to_dashboard]
-        return []
+    # =========================================================================
+    # WRITE
+    # =========================================================================
+
+    def add(self, event: SyncEvent):
+        """Append an event to the log."""
+        with self._lock:
+            try:
+                seq = self.last_seq + 1
+                if not self._segments or self._segment_path(self._segments[-1]).stat().st_size > self.SEGMENT_BYTES:
+                    self._segments.append(seq)
+                    self._segment_path(seq).touch()
+                    self._retain()
+                with open(self._segment_path(self._segments[-1]), 'a') as f:
+                    f.write(json.dumps({'seq': seq, 'event': event.to_dict()}) + '\n')
+            except Exception as e:
+                logger.error(f"Failed to append event: {e}")
+                return
+
+            if not self.events:
+                self.first_seq = seq
+            self.last_seq = seq
+            self.events.append(event)
+            self._id_to_seq[event.id] = seq
+            # Keep only recent events in memory
+            overflow = len(self.events) - self.max_events
+            if overflow > 0:
+                for old in self.events[:overflow]:
+                    self._id_to_seq.pop(old.id, None)
+                del self.events[:overflow]
+                self.first_seq += overflow
 
     def mark_synced(self, event_id: str, target: str):
-        """Mark an event as synced to target."""
-        for event in self.events:
-            if event.id == event_id:
-                if target == 'telegram':
-                    event.synced_to_telegram = True
-                elif target == 'dashboard':
-                    event.synced_to_dashboard = True
-                self._save()
-                break
+        """
+        Mark an event (and everything before it) as synced to target.
+
+        Targets receive events in order, so acknowledging one advances
+        the target's cursor to it.
+        """
+        with self._lock:
+            seq = self._id_to_seq.get(event_id)
+            if seq is None or seq <= self.cursors.get(target, 0):
+                return
+            self.cursors[target] = seq
+            try:
+                self._save_cursors()
+            except Exception as e:
+                logger.error(f"Failed to save event cursors: {e}")
+
+    def ack(self, target: str, seq: int):
+        """Advance a target's cursor to a sequence number."""
+        with self._lock:
+            if seq > self.cursors.get(target, 0):
+                self.cursors[target] = min(seq, self.last_seq)
+                self._save_cursors()
+
+    # =========================================================================
+    # READ
+    # =========================================================================
+
+    def _with_flags(self, events: List[SyncEvent], first_seq: int) -> List[SyncEvent]:
+        """Set the synced_to_* flags from the cursors (events are contiguous from first_seq)."""
+        telegram = self.cursors.get('telegram', 0)
+        dashboard = self.cursors.get('dashboard', 0)
+        for offset, event in enumerate(events):
+            event.synced_to_telegram = first_seq + offset <= telegram
+            event.synced_to_dashboard = first_seq + offset <= dashboard
+        return events
+
+    def since(self, seq: int, limit: int = None) -> List[SyncEvent]:
+        """Events after a sequence number, oldest first."""
+        with self._lock:
+            start = max(seq + 1, 1)
+            if start >= self.first_seq:
+                events = self.events[start - self.first_seq:]
+            else:
+                # Behind the in-memory tail: read the older segments back
+                older = []
+                for i, first in enumerate(self._segments):
+                    last = self._segments[i + 1] - 1 if i + 1 < len(self._segments) else self.last_seq
+                    if last >= start and first < self.first_seq:
+                        older += [e for s, e in self._read_segment(self._segment_path(first))
+                                  if start <= s < self.first_seq]
+                events = older + self.events
+            return events[:limit] if limit else list(events)
+
+    def get_unsynced(self, target: str) -> List[SyncEvent]:
+        """Get events not yet synced to target (any target name)."""
+        return self.since(self.cursors.get(target, 0))
 
     def get_recent(self, count: int = 50) -> List[SyncEvent]:
         """Get most recent events."""
-        return self.events[-count:]
+        with self._lock:
+            recent = self.events[-count:]
+            return self._with_flags(recent, self.last_seq - len(recent) + 1)
 
     def get_by_type(self, event_type: EventType, count: int = 20) -> List[SyncEvent]:
         """Get events by type."""
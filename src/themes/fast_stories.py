@@ -18,6 +18,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from collections import defaultdict
 
 from config import config
+from src.data.news_service import get_news_service
 from utils import get_logger
 
 logger = get_logger(__name__)
@@ -49,40 +50,6 @@ _refresh_running = False
 # PARALLEL NEWS FETCHING
 # =============================================================================
 
-def fetch_finviz_news(ticker):
-    """Fetch news from Finviz."""
-    try:
-        url = f"https://finviz.com/quote.ashx?t={ticker}"
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        response = requests.get(url, headers=headers, timeout=5)
-
-        if response.status_code != 200:
-            return []
-
-        import re
-        news_pattern = r'<a[^>]*class="tab-link-news"[^>]*>([^<]+)</a>'
-        headlines = re.findall(news_pattern, response.text)
-
-        return [{'title': h, 'source': 'finviz', 'ticker': ticker} for h in headlines[:5]]
-    except Exception as e:
-        logger.error(f"Error fetching Finviz news for {ticker}: {e}")
-        return []
-
-
-def fetch_yahoo_news(ticker):
-    """Fetch news from Yahoo Finance."""
-    try:
-        import yfinance as yf
-        stock = yf.Ticker(ticker)
-        news = stock.news or []
-
-        return [{'title': n.get('title', ''), 'source': 'yahoo', 'ticker': ticker}
-                for n in news[:5] if n.get('title')]
-    except Exception as e:
-        logger.error(f"Error fetching Yahoo news for {ticker}: {e}")
-        return []
-
-
 def fetch_google_news(query):
     """Fetch from Google News RSS."""
     try:
@@ -143,16 +110,19 @@ def fetch_stocktwits(ticker):
 
 
 def fetch_all_sources_parallel(tickers, max_workers=10):
-    """Fetch from all sources in parallel."""
+    """
+    Fetch from all sources in parallel.
+
+    Per-ticker news comes from the shared news service (concurrent
+    multi-source fetch, deduplicated and cached). StockTwits and the
+    market-wide Google News queries run alongside it in a thread pool.
+    """
     all_headlines = []
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = []
 
         for ticker in tickers:
-            # Submit all fetch tasks
-            futures.append(executor.submit(fetch_finviz_news, ticker))
-            futures.append(executor.submit(fetch_yahoo_news, ticker))
             futures.append(executor.submit(fetch_stocktwits, ticker))
 
         # Also fetch general market news
@@ -160,6 +130,12 @@ def fetch_all_sources_parallel(tickers, max_workers=10):
         futures.append(executor.submit(fetch_google_news, 'AI+semiconductor'))
         futures.append(executor.submit(fetch_google_news, 'tech+stocks'))
 
+        try:
+            for headlines in get_news_service().fetch_news(tickers).values():
+                all_headlines.extend(headlines)
+        except Exception as e:
+            logger.error(f"Error fetching ticker news: {e}")
+
         # Collect results as they complete
         for future in as_completed(futures):
             try:
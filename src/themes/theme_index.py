@@ -0,0 +1,283 @@
+"""
+Ticker -> Theme Inverted Index
+
+One precomputed lookup of every theme a ticker belongs to, built from:
+- the learned ThemeRegistry (memberships with confidence >= 0.3)
+- the hardcoded THEMES in story_scorer (drivers / beneficiaries / picks)
+- themes discovered by the evolution engine
+- THEME_TICKER_MAP used by the theme intelligence hub
+
+Scoring used to rescan all of these for every ticker. The index is built
+once and rebuilt only when a source changes: the registry's version
+counter moves, or the evolution learning-state file is rewritten. The
+hardcoded maps are module constants and are fingerprinted by identity.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sources, in scoring priority order. A theme id found in an earlier
+# source is not repeated from a later one.
+SOURCE_REGISTRY = 'registry'
+SOURCE_HARDCODED = 'hardcoded'
+SOURCE_DISCOVERED = 'discovered'
+SCORING_SOURCES = (SOURCE_REGISTRY, SOURCE_HARDCODED, SOURCE_DISCOVERED)
+
+# Theme intelligence hub ids (separate namespace, not deduplicated with the above)
+SOURCE_THEME_MAP = 'theme_map'
+
+MIN_REGISTRY_CONFIDENCE = 0.3
+
+
+@dataclass(frozen=True)
+class ThemeMembership:
+    """A ticker's membership in one theme."""
+    theme_id: str
+    theme_name: str
+    role: str
+    stage: str
+    source: str
+    confidence: Optional[float] = None
+    discovery_method: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """Format used by story_scorer.get_theme_membership."""
+        data = {
+            'theme_id': self.theme_id,
+            'theme_name': self.theme_name,
+            'role': self.role,
+            'stage': self.stage,
+        }
+        if self.source == SOURCE_REGISTRY:
+            data['confidence'] = self.confidence
+            data['is_learned'] = True
+        elif self.source == SOURCE_HARDCODED:
+            data['is_learned'] = False
+        elif self.source == SOURCE_DISCOVERED:
+            data['confidence'] = self.confidence
+            data['discovery_method'] = self.discovery_method
+        return data
+
+
+# =============================================================================
+# SOURCE READERS
+# =============================================================================
+
+def _get_registry():
+    try:
+        from src.themes.theme_registry import get_registry
+        return get_registry()
+    except Exception as e:
+        logger.debug(f"Theme registry not available: {e}")
+        return None
+
+
+def _learning_state_file():
+    try:
+        from src.learning.evolution_engine import LEARNING_STATE_FILE
+        return LEARNING_STATE_FILE
+    except Exception as e:
+        logger.debug(f"Evolution engine not available: {e}")
+        return None
+
+
+def _file_fingerprint(path) -> Tuple:
+    if path is None:
+        return (None,)
+    try:
+        stat = path.stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return (str(path), None, None)
+
+
+def _registry_memberships(registry) -> List[Tuple[str, ThemeMembership]]:
+    rows = []
+    for theme_id, theme in registry.themes.items():
+        for ticker, member in theme.members.items():
+            if member.confidence < MIN_REGISTRY_CONFIDENCE:
+                continue
+            rows.append((ticker, ThemeMembership(
+                theme_id=theme_id,
+                theme_name=theme.template.name,
+                role=member.role.value,
+                stage=theme.stage.value,
+                source=SOURCE_REGISTRY,
+                confidence=member.confidence,
+            )))
+    return rows
+
+
+def _hardcoded_memberships(themes: Dict) -> List[Tuple[str, ThemeMembership]]:
+    rows = []
+    for theme_id, theme in themes.items():
+        seen = set()
+        # First role wins, matching the driver > beneficiary > picks precedence
+        for key, role in (('drivers', 'driver'), ('beneficiaries', 'beneficiary'),
+                          ('picks_shovels', 'picks_shovels')):
+            for ticker in theme.get(key, []):
+                if ticker in seen:
+                    continue
+                seen.add(ticker)
+                rows.append((ticker, ThemeMembership(
+                    theme_id=theme_id,
+                    theme_name=theme['name'],
+                    role=role,
+                    stage=theme.get('stage', 'unknown'),
+                    source=SOURCE_HARDCODED,
+                )))
+    return rows
+
+
+def _discovered_memberships(state_file) -> List[Tuple[str, ThemeMembership]]:
+    # No state file means nothing has been discovered yet; skip loading the
+    # engine (which would create its data directories)
+    if state_file is None or not state_file.exists():
+        return []
+    try:
+        from src.learning.evolution_engine import get_discovered_themes
+        discovered = get_discovered_themes()
+    except Exception as e:
+        logger.debug(f"Could not load discovered themes: {e}")
+        return []
+
+    rows = []
+    for theme in discovered:
+        for ticker in dict.fromkeys(theme.get('stocks', [])):
+            rows.append((ticker, ThemeMembership(
+                theme_id=theme['id'],
+                theme_name=theme['name'],
+                role='discovered',
+                stage=theme.get('lifecycle_stage', 'unknown'),
+                source=SOURCE_DISCOVERED,
+                confidence=theme.get('confidence', 0.7),
+                discovery_method=theme.get('discovery_method', 'auto'),
+            )))
+    return rows
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class ThemeIndex:
+    """
+    Versioned ticker -> [ThemeMembership] lookup.
+
+    Reads check a cheap fingerprint of the sources (registry version,
+    learning-state file mtime) and rebuild only when it changed.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._fingerprint: Optional[Tuple] = None
+        self._by_ticker: Dict[str, Tuple[ThemeMembership, ...]] = {}
+        self._lock = threading.Lock()
+
+    def _hardcoded_sources(self) -> Tuple[Dict, Dict]:
+        from src.scoring.story_scorer import THEMES
+        try:
+            from src.intelligence.theme_intelligence import THEME_TICKER_MAP
+        except Exception as e:
+            logger.debug(f"Theme intelligence map not available: {e}")
+            THEME_TICKER_MAP = {}
+        return THEMES, THEME_TICKER_MAP
+
+    def _current_fingerprint(self, registry, themes: Dict, theme_map: Dict, state_file) -> Tuple:
+        registry_fp = (id(registry), getattr(registry, 'version', None)) if registry is not None else None
+        return (
+            registry_fp,
+            (id(themes), len(themes)),
+            (id(theme_map), len(theme_map)),
+            _file_fingerprint(state_file),
+        )
+
+    def refresh(self, force: bool = False) -> bool:
+        """Rebuild if any source changed. Returns True when a rebuild happened."""
+        registry = _get_registry()
+        themes, theme_map = self._hardcoded_sources()
+        state_file = _learning_state_file()
+        fingerprint = self._current_fingerprint(registry, themes, theme_map, state_file)
+
+        if not force and fingerprint == self._fingerprint:
+            return False
+
+        with self._lock:
+            if not force and fingerprint == self._fingerprint:
+                return False
+
+            index: Dict[str, List[ThemeMembership]] = {}
+            seen: Dict[str, set] = {}
+
+            sources = []
+            if registry is not None:
+                sources.append(_registry_memberships(registry))
+            sources.append(_hardcoded_memberships(themes))
+            sources.append(_discovered_memberships(state_file))
+
+            # Scoring sources are added in priority order with theme-id dedup
+            for rows in sources:
+                for ticker, membership in rows:
+                    ticker_seen = seen.setdefault(ticker, set())
+                    if membership.theme_id in ticker_seen:
+                        continue
+                    ticker_seen.add(membership.theme_id)
+                    index.setdefault(ticker, []).append(membership)
+
+            for theme_id, tickers in theme_map.items():
+                for ticker in dict.fromkeys(tickers):
+                    index.setdefault(ticker, []).append(ThemeMembership(
+                        theme_id=theme_id,
+                        theme_name=theme_id,
+                        role='member',
+                        stage='unknown',
+                        source=SOURCE_THEME_MAP,
+                    ))
+
+            self._by_ticker = {ticker: tuple(rows) for ticker, rows in index.items()}
+            self._fingerprint = fingerprint
+            self.version += 1
+
+        logger.debug(f"Theme index v{self.version}: {len(self._by_ticker)} tickers")
+        return True
+
+    def get(self, ticker: str, sources: Tuple[str, ...] = SCORING_SOURCES) -> List[ThemeMembership]:
+        """Memberships for a ticker from the given sources, in priority order."""
+        self.refresh()
+        return [m for m in self._by_ticker.get(ticker.upper(), ()) if m.source in sources]
+
+    def get_theme_membership(self, ticker: str) -> List[Dict]:
+        """Scoring-format membership dicts (see story_scorer.get_theme_membership)."""
+        return [m.to_dict() for m in self.get(ticker)]
+
+    def get_theme_ids(self, ticker: str, source: str = SOURCE_THEME_MAP) -> List[str]:
+        """Theme ids for a ticker from a single source."""
+        return [m.theme_id for m in self.get(ticker, sources=(source,))]
+
+    def get_stats(self) -> Dict:
+        self.refresh()
+        by_source: Dict[str, int] = {}
+        for rows in self._by_ticker.values():
+            for m in rows:
+                by_source[m.source] = by_source.get(m.source, 0) + 1
+        return {
+            'version': self.version,
+            'tickers': len(self._by_ticker),
+            'memberships_by_source': by_source,
+        }
+
+
+# Singleton instance
+_theme_index = None
+
+
+def get_theme_index() -> ThemeIndex:
+    """Get the global theme index instance"""
+    global _theme_index
+    if _theme_index is None:
+        _theme_index = ThemeIndex()
+    return _theme_index
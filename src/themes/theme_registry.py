@@ -331,6 +331,9 @@ class ThemeRegistry:
         # Ticker -> theme lookup for fast access
         self._ticker_index: Dict[str, Set[str]] = {}
 
+        # Bumped on every load/save so derived indexes know when to rebuild
+        self.version = 0
+
         # Load saved state
         self._load()
 
@@ -345,6 +348,7 @@ class ThemeRegistry:
                     self.themes[theme_id] = LearnedTheme.from_dict(theme_data)
 
                 self._rebuild_index()
+                self.version += 1
                 logger.info(f"Loaded {len(self.themes)} themes from registry")
 
             except Exception as e:
@@ -371,6 +375,7 @@ class ThemeRegistry:
 
     def _save(self):
         """Save learned themes to JSON"""
+        self.version += 1
         try:
             data = {
                 'version': '2.0',
@@ -256,6 +256,9 @@ class TradeJournal:
             signals = signals[-500:]
         self._save_signals(signals)
 
+        from src.sync.delta_stream import publish_delta
+        publish_delta('signals', signal, key=signal.get('ticker'))
+
     def get_signals(self, limit: int = 50, signal_type: str = None) -> List[dict]:
         signals = self._load_signals()
         if signal_type:
@@ -323,7 +323,7 @@ def delete_watchlist_item(ticker: str):
 def update_prices():
     """
     Update price data for all watchlist items.
-    Uses real-time data from yfinance.
+    Uses one bulk snapshot request (Polygon, yfinance fallback).
 
     Returns:
         {
@@ -334,9 +334,7 @@ def update_prices():
     """
     try:
         wm = get_watchlist_manager()
-        count = len(wm.items)
-
-        wm.auto_update_all(include_sentiment=False, include_ai=False)
+        count = wm.refresh_prices()
 
         return jsonify({
             'ok': True,
@@ -6,11 +6,12 @@ Features:
 - Automatic data updates (sentiment, fundamentals, technicals)
 - Auto-calibration using evolutionary brain
 - X Intelligence sentiment integration
-- Real-time price updates
+- Real-time price updates (bulk snapshot refresh)
 - Fully editable by user
-- Persistence to JSON
+- Persistence to JSON (debounced for background updates)
 """
 
+import atexit
 import json
 import logging
 import threading
@@ -28,6 +29,13 @@ WATCHLIST_DIR = Path('user_data/watchlist')
 WATCHLIST_DIR.mkdir(parents=True, exist_ok=True)
 WATCHLIST_FILE = WATCHLIST_DIR / 'watchlist.json'
 
+# Background updates coalesce their writes into one save after this delay
+SAVE_DEBOUNCE_SECONDS = 2.0
+
+# Per-ticker fundamentals (market cap, P/E, average volume) are refetched
+# after this long; bulk quotes only carry price and volume
+FUNDAMENTALS_REFRESH_SECONDS = 24 * 3600
+
 
 class WatchlistPriority(Enum):
     """Priority levels for watchlist items."""
@@ -86,6 +94,7 @@ class WatchlistItem:
     pe_ratio: Optional[float] = None
     revenue_growth: Optional[float] = None
     earnings_growth: Optional[float] = None
+    fundamentals_updated: Optional[str] = None
 
     # Theme & Story
     theme: str = ""
@@ -234,6 +243,13 @@ class WatchlistManager:
         self._load_watchlist()
         self._update_lock = threading.Lock()
 
+        # Debounced persistence
+        self.save_debounce_seconds = SAVE_DEBOUNCE_SECONDS
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        atexit.register(self.flush)
+
         # Auto-update configuration
         self.auto_update_enabled = True
         self.update_interval = 300  # 5 minutes
@@ -255,13 +271,40 @@ class WatchlistManager:
 
     def _save_watchlist(self):
         """Save watchlist to disk."""
+        self._dirty = False
         try:
+            data = {ticker: item.to_dict() for ticker, item in list(self.items.items())}
             with open(WATCHLIST_FILE, 'w') as f:
-                data = {ticker: item.to_dict() for ticker, item in self.items.items()}
                 json.dump(data, f, indent=2)
         except Exception as e:
             logger.error(f"Error saving watchlist: {e}")
 
+    def _schedule_save(self):
+        """
+        Mark the watchlist dirty and schedule a single debounced save.
+
+        Repeated calls within the debounce window share one pending write,
+        so a refresh of N tickers rewrites the file once instead of N times.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                return
+            timer = threading.Timer(self.save_debounce_seconds, self.flush)
+            timer.daemon = True
+            self._save_timer = timer
+            timer.start()
+
+    def flush(self):
+        """Write any pending debounced changes to disk immediately."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+        self._save_watchlist()
+
     # ==========================================================================
     # CRUD Operations
     # ==========================================================================
@@ -503,7 +546,7 @@ class WatchlistManager:
                 item.signal_quality = item.determine_signal_quality().value
                 item.setup_complete = item.check_setup_complete()
 
-                self._save_watchlist()
+                self._schedule_save()
 
         except Exception as e:
             logger.error(f"Error updating X sentiment for {ticker}: {e}")
@@ -564,7 +607,7 @@ class WatchlistManager:
             item.signal_quality = item.determine_signal_quality().value
             item.setup_complete = item.check_setup_complete()
 
-            self._save_watchlist()
+            self._schedule_save()
 
         except Exception as e:
             logger.error(f"Error updating AI analysis for {ticker}: {e}")
@@ -596,11 +639,153 @@ class WatchlistManager:
             item.pe_ratio = info.get('trailingPE')
 
             item.last_updated = datetime.now().isoformat()
-            self._save_watchlist()
+            item.fundamentals_updated = item.last_updated
+            self._schedule_save()
 
         except Exception as e:
             logger.error(f"Error updating price for {ticker}: {e}")
 
+    def _fetch_bulk_quotes(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch quotes for many tickers with bulk requests.
+
+        Uses the Polygon multi-ticker snapshot first and falls back to a
+        single yfinance multi-ticker download for anything still missing.
+        Snapshots carry no average volume, only the previous day's volume.
+
+        Returns:
+            Dict mapping ticker -> {price, change_pct, volume,
+            avg_volume or prev_volume}
+        """
+        quotes: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            from src.data.polygon_provider import get_snapshots_sync
+
+            for ticker, snap in get_snapshots_sync(tickers).items():
+                if snap.get('price'):
+                    quotes[ticker] = {
+                        'price': snap.get('price'),
+                        'change_pct': snap.get('change_percent'),
+                        'volume': snap.get('volume'),
+                        'prev_volume': snap.get('prev_volume'),
+                    }
+        except Exception as e:
+            logger.warning(f"Bulk snapshot failed, falling back to yfinance: {e}")
+
+        missing = [t for t in tickers if t not in quotes]
+        if not missing:
+            return quotes
+
+        try:
+            import pandas as pd
+            import yfinance as yf
+
+            df = yf.download(
+                missing, period='1mo', group_by='ticker',
+                progress=False, threads=True, auto_adjust=False,
+            )
+            if df is None or df.empty:
+                return quotes
+
+            for ticker in missing:
+                if isinstance(df.columns, pd.MultiIndex):
+                    if ticker not in df.columns.get_level_values(0):
+                        continue
+                    bars = df[ticker]
+                else:
+                    bars = df
+                bars = bars.dropna(subset=['Close'])
+                if bars.empty:
+                    continue
+
+                close = bars['Close']
+                volume = bars['Volume']
+                prev_close = float(close.iloc[-2]) if len(close) > 1 else None
+                price = float(close.iloc[-1])
+                quotes[ticker] = {
+                    'price': price,
+                    'change_pct': (price / prev_close - 1) * 100 if prev_close else None,
+                    'volume': int(volume.iloc[-1]),
+                    'avg_volume': int(volume.mean()),
+                }
+        except Exception as e:
+            logger.error(f"Bulk yfinance quote download failed: {e}")
+
+        return quotes
+
+    def refresh_prices(self, tickers: Optional[List[str]] = None) -> int:
+        """
+        Refresh price data for many items with one bulk quote request.
+
+        Quotes are applied in memory and persisted with a single debounced
+        write, instead of one request and one file rewrite per ticker.
+
+        Args:
+            tickers: Tickers to refresh (default: whole watchlist)
+
+        Returns:
+            Number of items updated
+        """
+        if tickers is None:
+            tickers = list(self.items.keys())
+        tickers = [t.upper() for t in tickers if t.upper() in self.items]
+        if not tickers:
+            return 0
+
+        quotes = self._fetch_bulk_quotes(tickers)
+        now = datetime.now().isoformat()
+
+        for ticker, quote in quotes.items():
+            item = self.items.get(ticker)
+            if item is None:
+                continue
+
+            item.current_price = quote['price']
+            item.price_change_pct = quote.get('change_pct')
+            item.volume = quote.get('volume')
+            if quote.get('avg_volume'):
+                item.avg_volume = quote['avg_volume']
+            elif not item.avg_volume and quote.get('prev_volume'):
+                # Until the fundamentals refresh supplies a real average
+                item.avg_volume = quote['prev_volume']
+
+            if item.volume and item.avg_volume:
+                item.volume_ratio = item.volume / item.avg_volume
+
+            item.last_updated = now
+
+        if quotes:
+            self._schedule_save()
+
+        logger.info(f"Refreshed prices for {len(quotes)}/{len(tickers)} watchlist items")
+        return len(quotes)
+
+    def refresh_fundamentals(self, max_age: float = FUNDAMENTALS_REFRESH_SECONDS) -> int:
+        """
+        Refetch per-ticker fundamentals for items not updated within max_age.
+
+        Bulk quotes do not include market cap, P/E or average volume, so
+        these still come from one request per ticker, at most once per
+        max_age for each item.
+
+        Returns:
+            Number of items refreshed
+        """
+        cutoff = datetime.now() - timedelta(seconds=max_age)
+        due = [
+            ticker for ticker, item in list(self.items.items())
+            if not item.fundamentals_updated
+            or datetime.fromisoformat(item.fundamentals_updated) < cutoff
+        ]
+
+        for ticker in due:
+            self.update_price_data(ticker)
+
+        if due:
+            logger.info(f"Refreshed fundamentals for {len(due)} watchlist items")
+        return len(due)
+
     def auto_update_all(self, include_sentiment: bool = False, include_ai: bool = False):
         """
         Auto-update all watchlist items.
@@ -612,19 +797,23 @@ class WatchlistManager:
         logger.info(f"Auto-updating {len(self.items)} watchlist items...")
 
         with self._update_lock:
-            for ticker in list(self.items.keys()):
-                # Always update price data (free)
-                self.update_price_data(ticker)
+            # Always update price data (one bulk request for all items)
+            self.refresh_prices()
+
+            # Market cap, P/E and average volume (per ticker, once a day)
+            self.refresh_fundamentals()
 
-                # Optional updates (cost API calls)
-                if include_sentiment:
-                    self.update_x_sentiment(ticker)
+            # Optional updates (cost API calls, still per ticker)
+            if include_sentiment or include_ai:
+                for ticker in list(self.items.keys()):
+                    if include_sentiment:
+                        self.update_x_sentiment(ticker)
 
-                if include_ai:
-                    self.update_ai_analysis(ticker)
+                    if include_ai:
+                        self.update_ai_analysis(ticker)
 
-                # Small delay to avoid rate limits
-                time.sleep(0.5)
+                    # Small delay to avoid rate limits
+                    time.sleep(0.5)
 
         self._last_update = datetime.now()
         logger.info("Watchlist auto-update complete")
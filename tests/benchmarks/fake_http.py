@@ -0,0 +1,222 @@
+"""
+Fake HTTP layer for pipeline benchmarks.
+
+Replays recorded provider responses (Polygon bars, snapshots, option
+chains, news, ticker details and SEC full-text search) from
+tests/fixtures/providers instead of hitting the network. Both
+PolygonProvider and AsyncHTTPClient create their sessions through
+aiohttp.ClientSession, so patching that one constructor routes every
+scanner request through the fixtures.
+
+Usage:
+    with FakeHTTPLayer() as http:
+        await scanner.run_scan_async(tickers)
+    print(http.stats())
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import socket
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import aiohttp
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / 'fixtures' / 'providers'
+
+# Symbol the fixtures were recorded for; replaced by the requested ticker
+RECORDED_SYMBOL = 'NVDA'
+
+# (route name, host, path regex, fixture file)
+ROUTES: List[Tuple[str, str, str, str]] = [
+    ('polygon.aggs', 'api.polygon.io', r'^/v2/aggs/ticker/(?P<ticker>[^/]+)/range/', 'polygon_aggs_daily.json'),
+    ('polygon.prev', 'api.polygon.io', r'^/v2/aggs/ticker/(?P<ticker>[^/]+)/prev$', 'polygon_aggs_daily.json'),
+    ('polygon.snapshot', 'api.polygon.io',
+     r'^/v2/snapshot/locale/us/markets/stocks/tickers/(?P<ticker>[^/]+)$', 'polygon_snapshot.json'),
+    ('polygon.snapshots', 'api.polygon.io',
+     r'^/v2/snapshot/locale/us/markets/stocks/tickers$', 'polygon_snapshot.json'),
+    ('polygon.options_chain', 'api.polygon.io', r'^/v3/snapshot/options/(?P<ticker>[^/]+)$',
+     'polygon_options_chain.json'),
+    ('polygon.news', 'api.polygon.io', r'^/v2/reference/news$', 'polygon_news.json'),
+    ('polygon.ticker_details', 'api.polygon.io', r'^/v3/reference/tickers/(?P<ticker>[^/]+)$',
+     'polygon_ticker_details.json'),
+    ('sec.full_text_search', 'efts.sec.gov', r'^/LATEST/search-index', 'sec_full_text_search.json'),
+]
+
+
+def _price_scale(ticker: str) -> float:
+    """Deterministic per-ticker price multiplier so tickers differ."""
+    digest = hashlib.md5(ticker.encode()).digest()
+    return 0.2 + digest[0] / 64.0
+
+
+class FakeResponse:
+    """Minimal aiohttp response stand-in."""
+
+    def __init__(self, status: int, body: Optional[Any]):
+        self.status = status
+        self._body = body
+
+    async def json(self, *args, **kwargs):
+        return self._body
+
+    async def text(self, *args, **kwargs):
+        return json.dumps(self._body) if self._body is not None else ''
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeClientSession:
+    """aiohttp.ClientSession replacement bound to a FakeHTTPLayer."""
+
+    def __init__(self, layer: 'FakeHTTPLayer', *args, **kwargs):
+        self._layer = layer
+        self.closed = False
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        return _PendingRequest(self._layer, str(url), params or {})
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+
+class _PendingRequest:
+    """Async context manager returned by FakeClientSession.get()."""
+
+    def __init__(self, layer: 'FakeHTTPLayer', url: str, params: Dict):
+        self._layer = layer
+        self._url = url
+        self._params = params
+
+    async def __aenter__(self):
+        if self._layer.latency:
+            await asyncio.sleep(self._layer.latency)
+        return self._layer.respond(self._url, self._params)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeHTTPLayer:
+    """
+    Context manager that serves recorded fixtures for all aiohttp requests.
+
+    Args:
+        fixtures_dir: Directory containing the recorded JSON responses
+        latency: Simulated per-request network latency in seconds
+        block_network: Refuse real socket connections while active, so a
+            stage that reaches a provider outside the fixtures fails fast
+            instead of silently timing the internet
+    """
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR, latency: float = 0.0,
+                 block_network: bool = True):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency = latency
+        self.block_network = block_network
+        self._routes = [
+            (name, host, re.compile(pattern), (self.fixtures_dir / filename).read_text())
+            for name, host, pattern, filename in ROUTES
+        ]
+        self._stack: Optional[ExitStack] = None
+        self.requests: Counter = Counter()
+        self.unmatched: Counter = Counter()
+
+    def respond(self, url: str, params: Dict) -> FakeResponse:
+        """Build the recorded response for a request URL."""
+        parsed = urlparse(url)
+
+        for name, host, pattern, raw in self._routes:
+            if parsed.netloc != host:
+                continue
+            match = pattern.match(parsed.path)
+            if not match:
+                continue
+
+            self.requests[name] += 1
+            ticker = (match.groupdict().get('ticker') or params.get('ticker') or RECORDED_SYMBOL).upper()
+            body = json.loads(raw.replace(RECORDED_SYMBOL, ticker))
+
+            if name == 'polygon.snapshots':
+                body = self._multi_snapshot(body, params)
+            elif name in ('polygon.aggs', 'polygon.prev'):
+                body = self._scale_bars(body, ticker, latest_only=(name == 'polygon.prev'))
+
+            return FakeResponse(200, body)
+
+        self.unmatched[f"{parsed.netloc}{parsed.path}"] += 1
+        return FakeResponse(404, None)
+
+    @staticmethod
+    def _scale_bars(body: Dict, ticker: str, latest_only: bool = False) -> Dict:
+        scale = _price_scale(ticker)
+        bars = body.get('results', [])
+        if latest_only:
+            bars = bars[-1:]
+        for bar in bars:
+            for key in ('o', 'h', 'l', 'c', 'vw'):
+                if key in bar:
+                    bar[key] = round(bar[key] * scale, 4)
+        body['results'] = bars
+        return body
+
+    @staticmethod
+    def _multi_snapshot(body: Dict, params: Dict) -> Dict:
+        template = json.dumps(body['ticker'])
+        tickers = [t for t in str(params.get('tickers', '')).split(',') if t]
+        return {
+            'status': 'OK',
+            'tickers': [json.loads(template.replace(RECORDED_SYMBOL, t)) for t in tickers],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counts by route, plus anything the fixtures did not cover."""
+        return {
+            'requests': sum(self.requests.values()),
+            'by_route': dict(self.requests),
+            'unmatched': dict(self.unmatched),
+        }
+
+    def reset(self):
+        self.requests.clear()
+        self.unmatched.clear()
+
+    def __enter__(self) -> 'FakeHTTPLayer':
+        self._stack = ExitStack()
+        layer = self
+
+        def session_factory(*args, **kwargs):
+            return FakeClientSession(layer, *args, **kwargs)
+
+        self._stack.enter_context(patch.object(aiohttp, 'ClientSession', session_factory))
+        self._stack.enter_context(patch.object(aiohttp, 'TCPConnector', lambda *a, **k: None))
+
+        if self.block_network:
+            def refuse(*args, **kwargs):
+                raise OSError("network disabled by FakeHTTPLayer")
+            self._stack.enter_context(patch.object(socket.socket, 'connect', refuse))
+            self._stack.enter_context(patch.object(socket, 'create_connection', refuse))
+
+        return self
+
+    def __exit__(self, *exc):
+        self._stack.close()
+        self._stack = None
+        return False
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+End-to-end scan pipeline benchmark.
+
+Times each stage of the scan pipeline against recorded provider responses
+(see fake_http.py) so results are comparable across commits:
+
+    price_fetch        AsyncScanner._fetch_price_data (Polygon daily bars)
+    story_score        calculate_story_score on precomputed inputs
+    scan_pipeline      AsyncScanner.run_scan_async with prefetched prices
+    options_analytics  PolygonProvider.get_options_flow_summary
+    api_routes         FastAPI routes via TestClient (opt-in, --api)
+
+For every stage the report records items, wall time, throughput,
+peak traced memory and per-item latency percentiles.
+
+Usage:
+    python tests/benchmarks/pipeline_benchmark.py --sizes 100 500 2000 -o bench.json
+    python tests/benchmarks/pipeline_benchmark.py --compare base.json bench.json
+    python tests/benchmarks/pipeline_benchmark.py --record NVDA   # refresh fixtures (needs POLYGON_API_KEY)
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.benchmarks.fake_http import FIXTURES_DIR, FakeHTTPLayer  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [100, 500, 2000]
+STAGES = ['price_fetch', 'story_score', 'scan_pipeline', 'options_analytics']
+API_ROUTES = ['/health', '/ticker/{ticker}', '/options/flow/{ticker}', '/news/{ticker}']
+
+# Real symbols first so theme lookups behave like production; the rest of
+# the universe is padded with synthetic symbols
+BASE_UNIVERSE = [
+    'NVDA', 'AMD', 'AVGO', 'TSM', 'MU', 'SMCI', 'ARM', 'MRVL', 'AAPL', 'MSFT',
+    'GOOGL', 'AMZN', 'META', 'TSLA', 'PLTR', 'CRWD', 'NET', 'SNOW', 'VRT', 'ANET',
+    'CEG', 'VST', 'OKLO', 'SMR', 'LLY', 'NVO', 'COIN', 'MSTR', 'RKLB', 'IONQ',
+]
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def build_universe(size: int) -> List[str]:
+    """Deterministic ticker universe of the requested size."""
+    tickers = BASE_UNIVERSE[:size]
+    i = 0
+    while len(tickers) < size:
+        tickers.append(f"BM{i:04d}")
+        i += 1
+    return tickers
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+class ItemTimer:
+    """Collects per-item latencies into a LatencyHistogram."""
+
+    def __init__(self):
+        from src.core.performance import LatencyHistogram
+        self.histogram = LatencyHistogram()
+
+    def wrap_async(self, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                self.histogram.record(time.perf_counter() - start)
+        return wrapper
+
+    def time(self, fn: Callable, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.histogram.record(time.perf_counter() - start)
+
+    def latency_ms(self) -> Dict[str, float]:
+        h = self.histogram
+        return {
+            'p50': round(h.quantile(0.50) * 1000, 3),
+            'p95': round(h.quantile(0.95) * 1000, 3),
+            'p99': round(h.quantile(0.99) * 1000, 3),
+            'max': round(h.max * 1000, 3) if h.count else 0.0,
+        }
+
+
+@contextmanager
+def isolated_environment(workdir: Path):
+    """
+    Pin everything outside the fake HTTP layer that would otherwise make
+    the numbers depend on the machine: API keys, the Google Trends,
+    rotation, contracts and patents services, and the scan CSV output.
+    """
+    env = {
+        'POLYGON_API_KEY': 'benchmark-fixture-key',
+        'XAI_API_KEY': '',
+        'USE_AI_BRAIN_RANKING': 'false',
+    }
+    old_cwd = os.getcwd()
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict(os.environ, env))
+        stack.enter_context(patch(
+            'src.intelligence.google_trends.get_trend_data',
+            return_value={'search_interest': 55, 'trend_direction': 'rising', 'is_breakout': False},
+        ))
+        stack.enter_context(patch(
+            'src.intelligence.rotation_predictor.get_rotation_forecast',
+            return_value={'ok': True, 'rotating_in': [], 'rotating_out': []},
+        ))
+        # Story scoring reaches these through requests/pytrends, not aiohttp
+        stack.enter_context(patch(
+            'src.intelligence.google_trends.calculate_retail_momentum_score', return_value=8,
+        ))
+        stack.enter_context(patch(
+            'src.data.gov_contracts.get_company_contracts',
+            return_value={'contract_count': 0, 'recent_contracts': []},
+        ))
+        stack.enter_context(patch(
+            'src.data.patents.get_company_patents',
+            return_value={'patent_count': 0, 'recent_patents': []},
+        ))
+        os.chdir(workdir)
+        try:
+            yield
+        finally:
+            os.chdir(old_cwd)
+
+
+def _run_coroutine(coro):
+    """
+    Run a coroutine on a private event loop.
+
+    Unlike asyncio.run(), the caller's current event loop is restored
+    afterwards, so the harness can run inside a test session.
+    """
+    try:
+        previous = asyncio.get_event_loop_policy().get_event_loop()
+    except RuntimeError:
+        previous = None
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+        asyncio.set_event_loop(previous)
+
+
+def _run_measured(coro_factory: Callable, trace_memory: bool) -> Dict[str, Any]:
+    """Run one stage, returning wall time and (optionally) peak memory."""
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = coro_factory()
+    if asyncio.iscoroutine(result):
+        result = _run_coroutine(result)
+    wall = time.perf_counter() - start
+    peak_mb = None
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_mb = round(peak / (1024 * 1024), 2)
+    return {'result': result, 'wall': wall, 'peak_mb': peak_mb}
+
+
+# =============================================================================
+# STAGES
+# =============================================================================
+
+def _new_scanner(workdir: Path):
+    from src.core.async_scanner import AsyncScanner
+    from src.data.cache_manager import CacheManager
+    # Fresh cache per run so the traced memory pass doesn't replay warm hits
+    cache_dir = tempfile.mkdtemp(prefix='cache-', dir=workdir)
+    return AsyncScanner(max_concurrent=50, cache=CacheManager(cache_dir=cache_dir, use_lru=False))
+
+
+def stage_price_fetch(tickers: List[str], workdir: Path, timer: ItemTimer):
+    from src.data.polygon_provider import PolygonProvider
+
+    async def run():
+        scanner = _new_scanner(workdir)
+        with patch.object(PolygonProvider, 'get_daily_bars',
+                          timer.wrap_async(PolygonProvider.get_daily_bars)):
+            data = await scanner._fetch_price_data(tickers)
+        await scanner.close()
+        return data
+
+    return run
+
+
+def stage_story_score(tickers: List[str], inputs: Dict[str, Dict], timer: ItemTimer):
+    from src.core.story_scoring import calculate_story_score
+
+    def run():
+        scores = []
+        for ticker in tickers:
+            scores.append(timer.time(calculate_story_score, ticker=ticker, **inputs[ticker]))
+        return scores
+
+    return run
+
+
+def stage_scan_pipeline(tickers: List[str], price_data: Dict, workdir: Path, timer: ItemTimer):
+    from src.core.async_scanner import AsyncScanner
+
+    async def run():
+        scanner = _new_scanner(workdir)
+        with patch.object(AsyncScanner, 'scan_ticker', timer.wrap_async(AsyncScanner.scan_ticker)):
+            results, _ = await scanner.run_scan_async(tickers, price_data_dict=price_data)
+        await scanner.close()
+        return results
+
+    return run
+
+
+def stage_options_analytics(tickers: List[str], timer: ItemTimer, max_concurrent: int = 50):
+    from src.data.polygon_provider import PolygonProvider
+
+    async def run():
+        provider = PolygonProvider(api_key=os.environ['POLYGON_API_KEY'])
+        semaphore = asyncio.Semaphore(max_concurrent)
+        flow = timer.wrap_async(provider.get_options_flow_summary)
+
+        async def one(ticker):
+            async with semaphore:
+                return await flow(ticker)
+
+        results = await asyncio.gather(*(one(t) for t in tickers))
+        await provider.close()
+        return results
+
+    return run
+
+
+def stage_api_routes(tickers: List[str], timer: ItemTimer):
+    from fastapi.testclient import TestClient
+    import modal_api_v2
+
+    app = modal_api_v2.create_fastapi_app._raw_f_()
+    client = TestClient(app)
+
+    def run():
+        statuses = {}
+        for ticker in tickers:
+            for route in API_ROUTES:
+                response = timer.time(client.get, route.format(ticker=ticker))
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        return statuses
+
+    return run
+
+
+def _story_inputs(tickers: List[str], price_data: Dict) -> Dict[str, Dict]:
+    """Precompute calculate_story_score inputs from the recorded fixtures."""
+    news = json.loads((FIXTURES_DIR / 'polygon_news.json').read_text())['results']
+    inputs = {}
+    for ticker in tickers:
+        df = price_data.get(ticker)
+        close = df['close'] if df is not None and 'close' in df.columns else None
+        above_20 = bool(close.iloc[-1] > close.rolling(20).mean().iloc[-1]) if close is not None else False
+        inputs[ticker] = {
+            'news': [{'title': a.get('title', ''), 'summary': a.get('description', '')} for a in news],
+            'sec_data': {'recent_filings': [], 'has_8k': False, 'insider_activity': False},
+            'theme_data': [],
+            'price_data': {'above_20': above_20, 'above_50': above_20, 'above_200': True, 'vol_ratio': 1.2},
+            'social_buzz': {'score': 40, 'is_breakout': False, 'status': 'neutral'},
+        }
+    return inputs
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def run_size(size: int, stages: List[str], latency: float = 0.0,
+             measure_memory: bool = True) -> Dict[str, Any]:
+    """Run all requested stages for one universe size."""
+    tickers = build_universe(size)
+    report: Dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory(prefix='stockstory-bench-') as tmp, \
+            FakeHTTPLayer(latency=latency) as http:
+        workdir = Path(tmp)
+        with isolated_environment(workdir):
+            price_data: Dict = {}
+
+            def factory_for(stage: str, timer: ItemTimer):
+                if stage == 'price_fetch':
+                    return stage_price_fetch(tickers, workdir, timer)
+                if stage == 'story_score':
+                    return stage_story_score(tickers, _story_inputs(tickers, price_data), timer)
+                if stage == 'scan_pipeline':
+                    return stage_scan_pipeline(tickers, price_data, workdir, timer)
+                if stage == 'options_analytics':
+                    return stage_options_analytics(tickers, timer)
+                if stage == 'api_routes':
+                    return stage_api_routes(tickers, timer)
+                raise ValueError(f"Unknown stage: {stage}")
+
+            needs_prices = {'story_score', 'scan_pipeline'} & set(stages)
+            if needs_prices and 'price_fetch' not in stages:
+                price_data = _run_measured(factory_for('price_fetch', ItemTimer()), False)['result']
+
+            for stage in stages:
+                http.reset()
+                timer = ItemTimer()
+                measured = _run_measured(factory_for(stage, timer), trace_memory=False)
+                if stage == 'price_fetch':
+                    price_data = measured['result']
+
+                # Peak memory is taken from a second traced pass; tracemalloc
+                # slows allocation-heavy code enough to distort wall time
+                peak_mb = None
+                if measure_memory:
+                    peak_mb = _run_measured(factory_for(stage, ItemTimer()), trace_memory=True)['peak_mb']
+
+                items = len(tickers) * (len(API_ROUTES) if stage == 'api_routes' else 1)
+                report[stage] = {
+                    'items': items,
+                    'wall_seconds': round(measured['wall'], 4),
+                    'throughput_per_sec': round(items / measured['wall'], 2) if measured['wall'] else None,
+                    'peak_memory_mb': peak_mb,
+                    'latency_ms': timer.latency_ms(),
+                    'http': http.stats(),
+                }
+                logger.info(f"[{size}] {stage}: {report[stage]['wall_seconds']}s "
+                            f"({report[stage]['throughput_per_sec']}/s)")
+
+    return report
+
+
+def run_benchmarks(sizes: List[int] = None, stages: List[str] = None, latency: float = 0.0,
+                   measure_memory: bool = True) -> Dict[str, Any]:
+    """Run the benchmark matrix and return a JSON-serializable report."""
+    sizes = sizes or DEFAULT_SIZES
+    stages = stages or STAGES
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'simulated_latency_ms': latency * 1000,
+        'sizes': {str(size): run_size(size, stages, latency, measure_memory) for size in sizes},
+    }
+
+
+def compare_reports(base: Dict, new: Dict, threshold: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    Compare two reports stage by stage.
+
+    Returns a list of regressions where wall time, p95 latency or peak
+    memory grew by more than ``threshold`` (fractional) over the base.
+    """
+    regressions = []
+    for size, stages in new.get('sizes', {}).items():
+        for stage, metrics in stages.items():
+            old = base.get('sizes', {}).get(size, {}).get(stage)
+            if not old:
+                continue
+            checks = {
+                'wall_seconds': (old.get('wall_seconds'), metrics.get('wall_seconds')),
+                'p95_ms': (old.get('latency_ms', {}).get('p95'), metrics.get('latency_ms', {}).get('p95')),
+                'peak_memory_mb': (old.get('peak_memory_mb'), metrics.get('peak_memory_mb')),
+            }
+            for metric, (before, after) in checks.items():
+                if not before or after is None:
+                    continue
+                change = (after - before) / before
+                if change > threshold:
+                    regressions.append({
+                        'size': size, 'stage': stage, 'metric': metric,
+                        'base': before, 'new': after, 'change_pct': round(change * 100, 1),
+                    })
+    return regressions
+
+
+# =============================================================================
+# FIXTURE RECORDING
+# =============================================================================
+
+RECORD_ENDPOINTS = {
+    'polygon_aggs_daily.json': ('/v2/aggs/ticker/{t}/range/1/day/{start}/{end}',
+                                {'adjusted': 'true', 'sort': 'asc', 'limit': 50000}),
+    'polygon_snapshot.json': ('/v2/snapshot/locale/us/markets/stocks/tickers/{t}', {}),
+    'polygon_options_chain.json': ('/v3/snapshot/options/{t}', {'limit': 250}),
+    'polygon_news.json': ('/v2/reference/news', {'ticker': '{t}', 'limit': 10}),
+    'polygon_ticker_details.json': ('/v3/reference/tickers/{t}', {}),
+}
+
+
+async def record_fixtures(ticker: str, out_dir: Path = FIXTURES_DIR) -> List[str]:
+    """Save live Polygon responses for ``ticker`` as fixtures (requires POLYGON_API_KEY)."""
+    from datetime import timedelta
+    from src.data.polygon_provider import PolygonProvider
+
+    if ticker != 'NVDA':
+        logger.warning("Fixtures are replayed with NVDA as the recorded symbol; "
+                       "update RECORDED_SYMBOL in fake_http.py to match")
+
+    end = datetime.now().date()
+    start = end - timedelta(days=400)
+    provider = PolygonProvider()
+    written = []
+    try:
+        for filename, (endpoint, params) in RECORD_ENDPOINTS.items():
+            path = endpoint.format(t=ticker, start=start, end=end)
+            query = {k: (v.format(t=ticker) if isinstance(v, str) else v) for k, v in params.items()}
+            data = await provider._request(path, query)
+            if not data:
+                logger.error(f"No data for {path}; keeping existing {filename}")
+                continue
+            data.pop('next_url', None)
+            data.pop('request_id', None)
+            (out_dir / filename).write_text(json.dumps(data, indent=1))
+            written.append(filename)
+    finally:
+        await provider.close()
+    return written
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scan pipeline benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--stages', nargs='+', default=STAGES, choices=STAGES + ['api_routes'])
+    parser.add_argument('--api', action='store_true', help="Also benchmark FastAPI routes")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Simulated provider latency")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc pass")
+    parser.add_argument('-o', '--output', help="Write JSON report to this file")
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'), help="Compare two reports")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Regression threshold (0.2 = 20%%)")
+    parser.add_argument('--record', metavar='TICKER', help="Refresh fixtures from the live Polygon API")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    # The scanner logs per-ticker misses at WARNING/ERROR; keep the report readable
+    logging.getLogger('src').setLevel(logging.CRITICAL)
+
+    if args.record:
+        written = asyncio.run(record_fixtures(args.record.upper()))
+        print(f"Recorded {len(written)} fixtures to {FIXTURES_DIR}")
+        return 0 if written else 1
+
+    if args.compare:
+        base, new = (json.loads(Path(p).read_text()) for p in args.compare)
+        regressions = compare_reports(base, new, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['size']:>5} {r['stage']:<18} {r['metric']:<15} "
+                  f"{r['base']} -> {r['new']} (+{r['change_pct']}%)")
+        if not regressions:
+            print("No regressions")
+        return 1 if regressions else 0
+
+    stages = list(args.stages)
+    if args.api and 'api_routes' not in stages:
+        stages.append('api_routes')
+
+    report = run_benchmarks(args.sizes, stages, args.latency_ms / 1000, not args.no_memory)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+        print(f"Report written to {args.output}")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
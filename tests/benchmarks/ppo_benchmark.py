@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Offline PPO training throughput benchmark.
+
+Trains the Tier 3 agent on synthetic trade history (see
+src/learning/offline_ppo.py) and reports, per configuration:
+
+    rollout_steps_per_sec   TradeReplayEnv steps incl. policy sampling
+    update_samples_per_sec  PPO minibatch updates (samples x epochs)
+    legacy_train_step_sec   PPOAgent.train_step on one live-sized buffer
+
+Usage:
+    python tests/benchmarks/ppo_benchmark.py
+    python tests/benchmarks/ppo_benchmark.py --trades 20000 --num-envs 128 --threads 1 4 8 -o ppo.json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.learning.rl_models import (  # noqa: E402
+    ComponentScores, MarketContext, MarketRegimeType, TradeRecord,
+)
+
+
+def synthetic_trades(count: int, seed: int = 0) -> List[TradeRecord]:
+    """Closed trades with plausible scores, regimes and excursions."""
+    rng = np.random.default_rng(seed)
+    regimes = [MarketRegimeType.BULL_MOMENTUM, MarketRegimeType.BEAR_DEFENSIVE, MarketRegimeType.CHOPPY_RANGE]
+    start = datetime(2024, 1, 2)
+    trades = []
+    for i in range(count):
+        theme = float(rng.uniform(2, 10))
+        pnl = float(rng.normal((theme - 5) * 1.5, 8))
+        entry = start + timedelta(hours=int(i * 6))
+        days = int(rng.integers(1, 30))
+        trade = TradeRecord(
+            trade_id=f"SYN_{i}",
+            decision_id=f"DEC_{i}",
+            ticker=f"T{i % 200}",
+            entry_date=entry,
+            exit_date=entry + timedelta(days=days),
+            entry_price=100.0,
+            exit_price=100.0 * (1 + pnl / 100),
+            stop_loss=92.0,
+            shares=10,
+            max_favorable_excursion=max(pnl, 0) + float(rng.exponential(4)),
+            max_adverse_excursion=-(max(-pnl, 0) + float(rng.exponential(3))),
+            component_scores=ComponentScores(
+                theme_score=theme, technical_score=float(rng.uniform(2, 10)),
+                ai_confidence=float(rng.uniform()), x_sentiment_score=float(rng.uniform(-1, 1)),
+            ),
+            market_context=MarketContext(
+                regime=regimes[i % 3], regime_confidence=float(rng.uniform(0.3, 0.9)),
+                spy_change_pct=float(rng.normal(0, 1)), vix_level=float(rng.uniform(12, 35)),
+            ),
+        )
+        trade.calculate_outcome()
+        trades.append(trade)
+    return trades
+
+
+def bench_offline(trades, num_envs: int, threads: int, iterations: int, minibatch_size: int) -> Dict:
+    from src.learning.offline_ppo import OfflinePPOTrainer
+    from src.learning.tier3_ppo import PPOAgent
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trainer = OfflinePPOTrainer(
+            trades, agent=PPOAgent(storage_dir=Path(tmp)), num_envs=num_envs,
+            minibatch_size=minibatch_size, num_threads=threads, seed=0,
+        )
+        trainer.train_iteration()  # Warm-up
+        stats = [trainer.train_iteration() for _ in range(iterations)]
+
+    return {
+        'num_envs': num_envs,
+        'threads': threads,
+        'samples_per_iteration': stats[-1]['samples'],
+        'rollout_steps_per_sec': round(float(np.median([s['rollout_steps_per_sec'] for s in stats])), 1),
+        'update_samples_per_sec': round(float(np.median([s['update_samples_per_sec'] for s in stats])), 1),
+    }
+
+
+def bench_legacy_train_step(buffer_size: int = 512) -> Dict:
+    """The live path: one full-batch train_step on a filled buffer."""
+    from src.learning.tier3_ppo import PPOAgent, TradingState
+
+    with tempfile.TemporaryDirectory() as tmp:
+        agent = PPOAgent(storage_dir=Path(tmp))
+        for i in range(buffer_size):
+            agent.select_action(TradingState(theme_score=i % 10))
+            agent.store_transition(float(i % 3 - 1), done=(i % 20 == 19))
+        started = time.perf_counter()
+        agent.train_step()
+        seconds = time.perf_counter() - started
+
+    return {'buffer_size': buffer_size, 'legacy_train_step_sec': round(seconds, 4)}
+
+
+def run_benchmark(trade_count: int, num_envs: List[int], threads: List[int],
+                  iterations: int, minibatch_size: int) -> Dict:
+    trades = synthetic_trades(trade_count)
+    return {
+        'trades': trade_count,
+        'iterations': iterations,
+        'offline': [
+            bench_offline(trades, n, t, iterations, minibatch_size)
+            for n in num_envs for t in threads
+        ],
+        'legacy': bench_legacy_train_step(),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline PPO throughput benchmark")
+    parser.add_argument('--trades', type=int, default=5000)
+    parser.add_argument('--num-envs', type=int, nargs='+', default=[64])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--iterations', type=int, default=3)
+    parser.add_argument('--minibatch-size', type=int, default=256)
+    parser.add_argument('-o', '--output', help="Write JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.trades, args.num_envs, args.threads, args.iterations, args.minibatch_size)
+    for row in report['offline']:
+        print(f"envs={row['num_envs']:<4} threads={row['threads']:<3} "
+              f"rollout {row['rollout_steps_per_sec']:>10.1f} steps/s  "
+              f"update {row['update_samples_per_sec']:>10.1f} samples/s")
+    print(f"legacy train_step ({report['legacy']['buffer_size']} transitions): "
+          f"{report['legacy']['legacy_train_step_sec']}s")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Smoke tests for the pipeline benchmark harness (tiny universe)."""
+from tests.benchmarks.fake_http import FakeHTTPLayer
+from tests.benchmarks.pipeline_benchmark import STAGES, compare_reports, run_benchmarks
+
+
+class TestFakeHTTPLayer:
+    """Tests for fixture replay."""
+
+    def test_replays_bars_for_requested_ticker(self, run_async):
+        from src.data.polygon_provider import PolygonProvider
+
+        async def fetch():
+            provider = PolygonProvider(api_key='fixture')
+            df = await provider.get_daily_bars('AMD', days=100)
+            news = await provider.get_news('AMD', limit=5)
+            await provider.close()
+            return df, news
+
+        with FakeHTTPLayer() as http:
+            df, news = run_async(fetch())
+
+        assert df is not None and len(df) > 50
+        assert news and 'AMD' in news[0].get('tickers', [])
+        assert http.stats()['by_route'] == {'polygon.aggs': 1, 'polygon.news': 1}
+
+    def test_unknown_routes_are_counted(self):
+        with FakeHTTPLayer() as http:
+            response = http.respond('https://api.polygon.io/v9/unknown', {})
+        assert response.status == 404
+        assert http.stats()['unmatched'] == {'api.polygon.io/v9/unknown': 1}
+
+
+class TestPipelineBenchmark:
+    """End-to-end run at a size small enough for CI."""
+
+    def test_report_shape(self):
+        report = run_benchmarks(sizes=[5], measure_memory=False)
+        stages = report['sizes']['5']
+
+        assert set(stages) == set(STAGES)
+        for metrics in stages.values():
+            assert metrics['items'] == 5
+            assert metrics['wall_seconds'] > 0
+            assert metrics['latency_ms']['max'] >= metrics['latency_ms']['p50']
+            assert metrics['http']['unmatched'] == {}
+        assert stages['price_fetch']['http']['by_route']['polygon.aggs'] == 6  # + SPY
+
+    def test_compare_flags_regressions(self):
+        base = {'sizes': {'100': {'scan_pipeline': {
+            'wall_seconds': 1.0, 'peak_memory_mb': 10.0, 'latency_ms': {'p95': 5.0}}}}}
+        new = {'sizes': {'100': {'scan_pipeline': {
+            'wall_seconds': 1.5, 'peak_memory_mb': 10.5, 'latency_ms': {'p95': 5.0}}}}}
+
+        regressions = compare_reports(base, new, threshold=0.2)
+
+        assert [r['metric'] for r in regressions] == ['wall_seconds']
+        assert regressions[0]['change_pct'] == 50.0
@@ -1,4 +1,6 @@
 """Pytest configuration and fixtures."""
+import asyncio
+
 import pytest
 import sys
 from pathlib import Path
@@ -8,6 +10,29 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@pytest.fixture
+def run_async():
+    """
+    Run coroutines on a fresh event loop, restoring the previous loop after.
+
+    asyncio.run() clears the main thread's current loop on exit, which breaks
+    later tests that still call asyncio.get_event_loop().
+    """
+    try:
+        previous = asyncio.get_event_loop_policy().get_event_loop()
+    except RuntimeError:
+        previous = None
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        yield loop.run_until_complete
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+        asyncio.set_event_loop(previous)
+
+
 @pytest.fixture
 def sample_ticker():
     """Sample ticker for testing."""
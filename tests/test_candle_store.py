@@ -0,0 +1,122 @@
+"""Tests for the multi-resolution candle store."""
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.candle_store import DAY, CandleSeries, CandleStore, bucket_starts
+
+STEP = {'1m': 60, '5m': 300, '1d': DAY}
+
+
+class _FakeUpstream:
+    """Synthetic bars at any base resolution; records every request."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, symbol, resolution, start, end):
+        self.calls.append((symbol, resolution, start.timestamp(), end.timestamp()))
+        step = STEP[resolution]
+        times = np.arange(int(start.timestamp()) // step * step, int(end.timestamp()), step)
+        if len(times) == 0:
+            return None
+        price = times / 1e6
+        df = pd.DataFrame({
+            'Open': price, 'High': price + 1, 'Low': price - 1, 'Close': price + 0.5,
+            'Volume': np.ones(len(times)),
+        }, index=pd.to_datetime(times, unit='s'))
+        df.attrs['source'] = 'fake'
+        return df
+
+
+@pytest.fixture
+def upstream():
+    return _FakeUpstream()
+
+
+@pytest.fixture
+def get(upstream, run_async):
+    def _get(store, symbol, interval, days):
+        return run_async(store.get_candles(symbol, interval, days, upstream))
+    return _get
+
+
+class TestResample:
+    """Bucket alignment and OHLCV aggregation."""
+
+    def test_aggregates(self):
+        series = CandleSeries('5m')
+        times = np.arange(0, 3600 * 2, 300)
+        series.merge(times, np.arange(24.0), np.arange(24.0) + 1, np.arange(24.0) - 1,
+                     np.arange(24.0) + 0.5, np.ones(24))
+        bars = series.resample('1h')
+        assert bars['time'].tolist() == [0, 3600]
+        assert bars['open'].tolist() == [0, 12]
+        assert bars['high'].tolist() == [12, 24]
+        assert bars['low'].tolist() == [-1, 11]
+        assert bars['close'].tolist() == [11.5, 23.5]
+        assert bars['volume'].tolist() == [12, 12]
+
+    def test_week_and_month_buckets(self):
+        # 2024-06-05 (Wednesday) and 2024-06-30 (Sunday)
+        times = np.array([1717545600, 1719705600])
+        weeks = pd.to_datetime(bucket_starts(times, '1w'), unit='s')
+        assert [d.day_name() for d in weeks] == ['Monday', 'Monday']
+        months = pd.to_datetime(bucket_starts(times, '1M'), unit='s')
+        assert [str(d.date()) for d in months] == ['2024-06-01', '2024-06-01']
+
+    def test_merge_overwrites_overlap(self):
+        series = CandleSeries('1d')
+        series.merge(np.array([0, DAY]), *[np.array([1.0, 2.0])] * 5)
+        series.merge(np.array([DAY, 2 * DAY]), *[np.array([9.0, 3.0])] * 5)
+        assert series.time.tolist() == [0, DAY, 2 * DAY]
+        assert series.close.tolist() == [1.0, 9.0, 3.0]
+
+
+class TestStore:
+    """Interval switching, incremental extension and memory bounds."""
+
+    def test_interval_switching_reuses_base_series(self, upstream, get):
+        store = CandleStore()
+        candles, source = get(store, 'NVDA', '15m', 5)
+        assert source == 'fake'
+        assert candles[1]['time'] - candles[0]['time'] == 900
+
+        for interval in ('5m', '30m', '1h', '4h'):
+            get(store, 'NVDA', interval, 3)
+        assert [c[1] for c in upstream.calls] == ['5m']
+
+        daily, _ = get(store, 'NVDA', '1w', 60)
+        get(store, 'NVDA', '1d', 60)
+        assert [c[1] for c in upstream.calls] == ['5m', '1d']
+        assert daily[1]['time'] - daily[0]['time'] == 7 * DAY
+
+    def test_incremental_extension(self, upstream, get):
+        store = CandleStore()
+        get(store, 'AMD', '1h', 5)
+        series = store._series[('AMD', '5m')]
+
+        # Longer range: only the missing older span is fetched
+        get(store, 'AMD', '1h', 10)
+        _, _, start, end = upstream.calls[-1]
+        assert end - start == pytest.approx(5 * DAY, abs=5)
+
+        # After the refresh interval: fetch from the last stored bar only
+        series.fetched_at = time.time() - 60
+        last = series.time[-1]
+        get(store, 'AMD', '1h', 10)
+        assert upstream.calls[-1][2] == last
+        assert len(upstream.calls) == 3
+
+    def test_memory_bound_evicts_lru(self, get):
+        store = CandleStore(max_bars=3000)
+        for symbol in ('A', 'B', 'C'):
+            get(store, symbol, '1h', 5)  # 1440 bars each
+        assert store.total_bars <= 3000
+        assert [key[0] for key in store._series] == ['B', 'C']
+
+        store = CandleStore(max_series_bars=500)
+        get(store, 'A', '5m', 5)
+        assert len(store._series[('A', '5m')]) == 500
@@ -0,0 +1,95 @@
+"""Tests for the whole-universe correlation cluster engine."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.cluster_engine import ClusterEngine, correlation_matrix, knn_graph
+
+
+def make_returns(n_noise=200, groups=3, group_size=6, days=30, seed=0):
+    """Noise stocks plus `groups` blocks driven by a shared factor."""
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for g in range(groups):
+        factor = rng.normal(size=days)
+        for i in range(group_size):
+            columns[f"G{g}_{i}"] = factor + 0.3 * rng.normal(size=days)
+    for i in range(n_noise):
+        columns[f"N{i}"] = rng.normal(size=days)
+    return pd.DataFrame(columns) * 0.01
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return ClusterEngine('test', state_path=tmp_path / 'clusters.json')
+
+
+class TestGraph:
+    """Correlation matrix and sparse graph construction."""
+
+    def test_matches_pandas_and_is_sparse(self):
+        returns = make_returns(n_noise=20)
+        tickers, corr = correlation_matrix(returns)
+
+        expected = returns[tickers].corr().to_numpy()
+        assert np.allclose(corr, expected, atol=1e-9)
+
+        adjacency = knn_graph(corr, k=3, min_correlation=0.7)
+        assert all(len(neighbors) <= 2 * 3 for neighbors in adjacency)
+        assert all(w >= 0.7 for neighbors in adjacency for w in neighbors.values())
+
+    def test_drops_short_and_flat_series(self):
+        returns = make_returns(n_noise=5)
+        returns['FLAT'] = 0.0
+        returns['NEW'] = np.nan
+        returns.loc[returns.index[-5:], 'NEW'] = 0.01
+
+        tickers, _ = correlation_matrix(returns)
+        assert 'FLAT' not in tickers and 'NEW' not in tickers
+
+
+class TestClusterEngine:
+    """Community detection and cross-day identity tracking."""
+
+    def test_finds_factor_groups(self, engine):
+        clusters = engine.run(make_returns())
+
+        groups = sorted(sorted(c.tickers) for c in clusters)
+        assert groups == [[f"G{g}_{i}" for i in range(6)] for g in range(3)]
+        assert all(c.is_new and c.avg_correlation > 0.7 for c in clusters)
+
+    def test_identity_tracked_across_runs(self, engine, tmp_path):
+        first = {frozenset(c.tickers): c.cluster_id for c in engine.run(make_returns())}
+
+        # Next day: one group gains a member, fresh engine reads saved state
+        returns = make_returns(seed=0)
+        returns['G0_new'] = returns['G0_0'] + np.random.default_rng(1).normal(size=len(returns)) * 0.001
+        second = ClusterEngine('test', state_path=tmp_path / 'clusters.json').run(returns)
+
+        grown = next(c for c in second if 'G0_new' in c.tickers)
+        assert grown.cluster_id == first[frozenset(f"G0_{i}" for i in range(6))]
+        assert not grown.is_new
+        assert grown.joined == ['G0_new']
+        assert {c.cluster_id for c in second} == set(first.values())
+
+    def test_oversized_cluster_split(self, tmp_path):
+        engine = ClusterEngine('test', state_path=tmp_path / 'clusters.json', max_size=8, min_correlation=0.3)
+        rng = np.random.default_rng(2)
+        market = rng.normal(size=40)
+        columns = {}
+        for g in range(2):
+            factor = rng.normal(size=40)
+            for i in range(6):
+                columns[f"G{g}_{i}"] = market + factor + 0.3 * rng.normal(size=40)
+
+        returns = pd.DataFrame(columns)
+        merged = ClusterEngine('test', state_path=tmp_path / 'other.json', min_correlation=0.3)
+        assert [c.size for c in merged.run(returns, persist=False)] == [12]
+
+        clusters = engine.run(returns, persist=False)
+
+        assert all(c.size <= 8 for c in clusters)
+        assert sorted(sorted(c.tickers) for c in clusters) == [
+            [f"G0_{i}" for i in range(6)], [f"G1_{i}" for i in range(6)],
+        ]
+        assert not (tmp_path / 'clusters.json').exists()
@@ -0,0 +1,93 @@
+"""Tests for the columnar time-series store."""
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.data.column_store import ColumnStore, FLOW_FIELDS, GEX_FIELDS, migrate_gex_json
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ColumnStore(tmp_path, GEX_FIELDS)
+
+
+def _day(date, hour=12):
+    return datetime.fromisoformat(f'{date}T{hour:02d}:00:00').timestamp()
+
+
+class TestAppendAndRead:
+    """Appends, range scans and torn writes."""
+
+    def test_range_read(self, store):
+        for i in range(10):
+            store.append('SPY', {'gex': i, 'price': 500 + i}, ts=1000 + i * 10)
+
+        columns = store.read('SPY', start=1020, end=1050)
+        assert columns['ts'].tolist() == [1020, 1030, 1040]
+        assert columns['gex'].tolist() == [2.0, 3.0, 4.0]
+        assert np.isnan(columns['call_wall']).all()
+        assert store.read('SPY', last=2)['price'].tolist() == [508.0, 509.0]
+        assert store.last_ts('SPY') == 1090
+        assert store.read('QQQ')['ts'].size == 0
+
+    def test_out_of_order_rows_skipped(self, store):
+        assert store.append('SPY', {'gex': 1}, ts=200)
+        assert not store.append('SPY', {'gex': 2}, ts=100)
+        assert store.append_many('SPY', [{'gex': 3}, {'gex': 4}], [300, 250]) == 1
+        assert store.read('SPY')['gex'].tolist() == [1.0, 3.0]
+
+    def test_torn_append_is_trimmed(self, store, tmp_path):
+        store.append('SPY', {'gex': 1, 'price': 10}, ts=100)
+        with open(tmp_path / 'SPY' / 'gex.f8', 'ab') as f:
+            f.write(b'\x00' * 12)  # Crashed before the timestamp was written
+
+        assert store.read('SPY')['gex'].tolist() == [1.0]
+        store.append('SPY', {'gex': 2, 'price': 20}, ts=200)
+        assert store.read('SPY')['gex'].tolist() == [1.0, 2.0]
+
+    def test_categories_and_records(self, tmp_path):
+        store = ColumnStore(tmp_path, FLOW_FIELDS)
+        store.append('NVDA', {'sentiment': 'bullish', 'premium': 1e6}, ts=100)
+        store.append('NVDA', {'sentiment': None, 'premium': None}, ts=200)
+        store.append('NVDA', {'sentiment': 'bearish'}, ts=300)
+
+        reopened = ColumnStore(tmp_path, FLOW_FIELDS)
+        records = reopened.records('NVDA', start=150)
+        assert [r['sentiment'] for r in records] == [None, 'bearish']
+        assert records[0]['premium'] is None
+        assert reopened.read('NVDA')['sentiment'].tolist() == [0, -1, 1]
+
+
+class TestDailyAndScan:
+    """Daily rollups, multi-ticker scans and the JSON migration."""
+
+    def test_daily_keeps_last_snapshot_per_day(self, store):
+        store.append('SPY', {'gex': 1, 'price': 500}, ts=_day('2025-03-03', 10))
+        store.append('SPY', {'gex': -1, 'price': 498}, ts=_day('2025-03-03', 15))
+        store.append('SPY', {'gex': 2, 'price': 505}, ts=_day('2025-03-04', 11))
+
+        daily = store.daily('SPY')
+        assert [(d['date'], d['gex']) for d in daily] == [('2025-03-03', -1.0), ('2025-03-04', 2.0)]
+        assert store.daily('SPY', last=1)[0]['date'] == '2025-03-04'
+
+    def test_scan_across_tickers(self, store):
+        store.append('SPY', {'gex': 1}, ts=100)
+        store.append('QQQ', {'gex': 2}, ts=200)
+        store.append('/ES', {'gex': 3}, ts=300)
+
+        assert store.tickers() == ['QQQ', 'SPY', '_ES']
+        scanned = {t: c['gex'].tolist() for t, c in store.scan(start=150, fields=['gex'])}
+        assert scanned == {'QQQ': [2.0], '_ES': [3.0]}
+
+    def test_migrates_legacy_json(self, store, tmp_path):
+        legacy = [{'date': '2025-03-03', 'gex': 5, 'price': 500, 'call_wall': 510},
+                  {'date': '2025-03-04', 'gex': -5, 'price': 490}]
+        (tmp_path / 'SPY.json').write_text(json.dumps(legacy))
+
+        assert migrate_gex_json(store, 'spy') == 2
+        assert migrate_gex_json(store, 'spy') == 0
+        daily = store.daily('SPY')
+        assert [(d['date'], d['gex'], d['call_wall']) for d in daily] == [
+            ('2025-03-03', 5.0, 510.0), ('2025-03-04', -5.0, None)]
@@ -161,29 +161,31 @@ class TestAlphaVantageProvider:
 class TestSECEdgarProvider:
     """Tests for SECEdgarProvider."""
 
-    @patch('utils.data_providers.requests.get')
-    def test_get_company_cik(self, mock_get):
+    @staticmethod
+    def _cik_map(tmp_path, payload):
+        from src.data.sec_index import CIKMap
+        session = MagicMock()
+        session.get.return_value.status_code = 200
+        session.get.return_value.json.return_value = payload
+        return CIKMap(path=tmp_path / 'company_tickers.json', session=session)
+
+    def test_get_company_cik(self, tmp_path):
         """Should return CIK for ticker."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        cik_map = self._cik_map(tmp_path, {
             '0': {'cik_str': 320193, 'ticker': 'AAPL', 'title': 'Apple Inc'}
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        })
 
-        result = SECEdgarProvider.get_company_cik('AAPL')
+        with patch('src.data.sec_index._cik_map', cik_map):
+            result = SECEdgarProvider.get_company_cik('AAPL')
 
         assert result == '0000320193'
 
-    @patch('utils.data_providers.requests.get')
-    def test_get_company_cik_not_found(self, mock_get):
+    def test_get_company_cik_not_found(self, tmp_path):
         """Should return None for unknown ticker."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {}
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        cik_map = self._cik_map(tmp_path, {})
 
-        result = SECEdgarProvider.get_company_cik('INVALID')
+        with patch('src.data.sec_index._cik_map', cik_map):
+            result = SECEdgarProvider.get_company_cik('INVALID')
 
         assert result is None
 
@@ -0,0 +1,134 @@
+"""Tests for the incremental delta stream."""
+import asyncio
+import json
+
+import pytest
+
+from src.sync.delta_stream import DeltaHub, DeltaLog, ScanDeltaPublisher
+
+
+@pytest.fixture
+def hub(tmp_path):
+    hub = DeltaHub(directory=tmp_path, writer='api')
+    hub.poll()  # Prime: start from now
+    return hub
+
+
+def _events(messages):
+    """Parse SSE messages into (event, id, data) tuples (skipping keepalives)."""
+    parsed = []
+    for message in messages:
+        fields = dict(line.split(': ', 1) for line in message.strip().splitlines() if not line.startswith(':'))
+        if fields:
+            parsed.append((fields.get('event'), fields.get('id'), json.loads(fields['data'])))
+    return parsed
+
+
+async def _collect(hub, count, topics=None, cursor=None, publish=None):
+    """First `count` SSE messages from a subscription (publish() runs once subscribed)."""
+    stream = hub.subscribe(topics, cursor, heartbeat=0.05)
+    messages = []
+    try:
+        async def read():
+            async for message in stream:
+                if not message.startswith(':'):
+                    messages.append(message)
+                if len(messages) >= count:
+                    return
+        task = asyncio.ensure_future(read())
+        await asyncio.sleep(0.01)
+        if publish:
+            publish()
+        await asyncio.wait_for(task, timeout=2)
+    finally:
+        await stream.aclose()
+    return _events(messages)
+
+
+class TestLogAndPoll:
+    """Per-writer files tailed into one sequence."""
+
+    def test_poll_skips_existing_and_reads_new(self, tmp_path):
+        scanner = DeltaLog(tmp_path, writer='scanner')
+        scanner.append('scan', {'ticker': 'OLD'})
+
+        hub = DeltaHub(directory=tmp_path, writer='api')
+        assert hub.poll() == 0
+
+        scanner.append('scan', {'ticker': 'NVDA'}, key='NVDA')
+        hub.publish('signals', {'ticker': 'AMD'})
+        assert hub.poll() == 1
+        assert hub.poll() == 0
+        assert [(d['seq'], d['topic']) for d in hub.buffer] == [(1, 'signals'), (2, 'scan')]
+
+    def test_partial_lines_and_compaction(self, tmp_path, hub):
+        scanner = DeltaLog(tmp_path, writer='scanner', max_bytes=400)
+        with open(scanner.path, 'a') as f:
+            f.write('{"writer": "scanner", "n": 1')  # Mid-append
+        assert hub.poll() == 0
+        scanner.path.write_text('')
+
+        for i in range(10):
+            scanner.append('scan', {'i': i})
+            hub.poll()
+        assert [d['data']['i'] for d in hub.buffer] == list(range(10))
+        assert scanner.path.stat().st_size <= 400
+
+
+class TestResume:
+    """Cursors, resets and topic filters."""
+
+    def test_since(self, hub):
+        for i in range(3):
+            hub.publish('scan' if i != 1 else 'alerts', {'i': i})
+
+        deltas, reset = hub.since(f'{hub.epoch}-1')
+        assert not reset and [d['seq'] for d in deltas] == [2, 3]
+        deltas, _ = hub.since(f'{hub.epoch}-0', topics=['scan'])
+        assert [d['data']['i'] for d in deltas] == [0, 2]
+
+        assert hub.since('otherepoch-1') == ([], True)
+        assert hub.since(f'{hub.epoch}-99') == ([], True)
+
+    def test_buffer_overflow_resets(self, tmp_path):
+        hub = DeltaHub(directory=tmp_path, writer='api', buffer_size=2)
+        for i in range(4):
+            hub.publish('scan', {'i': i})
+        assert hub.since(f'{hub.epoch}-1')[1] is True
+        assert hub.since(f'{hub.epoch}-2')[1] is False
+
+    def test_subscribe_replays_then_streams(self, hub, run_async):
+        hub.publish('scan', {'i': 0})
+        hub.publish('alerts', {'i': 1})
+        events = run_async(_collect(
+            hub, 2, topics=['scan'], cursor=f'{hub.epoch}-0',
+            publish=lambda: hub.publish('scan', {'i': 2}),
+        ))
+        assert [(e[0], e[2]['data']['i']) for e in events] == [('scan', 0), ('scan', 2)]
+        assert events[-1][1] == f'{hub.epoch}-3'
+
+    def test_subscribe_with_stale_cursor_resets(self, hub, run_async):
+        hub.publish('scan', {'i': 0})
+        events = run_async(_collect(hub, 1, cursor='otherepoch-5'))
+        assert events == [('reset', None, {'cursor': f'{hub.epoch}-1'})]
+
+
+class TestScanDeltas:
+    """Only changed scores are published."""
+
+    def test_changed_scores(self, tmp_path):
+        log = DeltaLog(tmp_path, writer='scanner')
+        publisher = ScanDeltaPublisher({'NVDA': 80.0, 'AMD': 60.0}, min_change=1.0, log=log)
+        assert publisher.add([
+            {'ticker': 'NVDA', 'story_score': 80.4},
+            {'ticker': 'AMD', 'story_score': 65.0, 'hottest_theme': 'AI'},
+            {'ticker': 'PLTR', 'story_score': 70.0},
+            {'ticker': 'BAD', 'error': 'timeout'},
+        ]) == 2
+        publisher.completed(successful=3)
+
+        records = [json.loads(line) for line in log.path.read_text().splitlines()]
+        assert [r['key'] for r in records] == ['AMD', 'PLTR', None]
+        assert records[0]['data'] == {'type': 'score', 'ticker': 'AMD', 'prev_score': 60.0,
+                                      'change': 5.0, 'story_score': 65.0, 'hottest_theme': 'AI'}
+        assert records[2]['data'] == {'type': 'completed', 'changes': 2, 'successful': 3}
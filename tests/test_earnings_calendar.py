@@ -0,0 +1,111 @@
+"""Tests for the bulk earnings calendar store."""
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from src.data import earnings_calendar as ec
+from src.data.earnings_calendar import EarningsCalendar
+
+TODAY = date.today()
+
+
+def _day(offset):
+    return (TODAY + timedelta(days=offset)).isoformat()
+
+
+class _FakeFinnhub:
+    """Date-range calendar endpoint over a fixed entry list; records requests."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.calls = []
+
+    def __call__(self, from_date, to_date):
+        self.calls.append((from_date, to_date))
+        return [e for e in self.entries if from_date <= e['date'] <= to_date]
+
+
+@pytest.fixture
+def finnhub():
+    return _FakeFinnhub([
+        # NVDA: three reported quarters (2 beats, 1 miss) and one upcoming
+        {'symbol': 'NVDA', 'date': _day(-270), 'epsEstimate': 1.0, 'epsActual': 1.2},
+        {'symbol': 'NVDA', 'date': _day(-180), 'epsEstimate': 1.0, 'epsActual': 0.9},
+        {'symbol': 'NVDA', 'date': _day(-90), 'epsEstimate': 1.0, 'epsActual': 1.1},
+        {'symbol': 'NVDA', 'date': _day(2), 'epsEstimate': 1.3, 'revenueEstimate': 3e10, 'hour': 'amc'},
+        {'symbol': 'AMD', 'date': _day(0), 'epsEstimate': 0.7, 'hour': 'bmo'},
+        {'symbol': 'XYZ', 'date': _day(10), 'epsEstimate': 0.1},
+        {'symbol': 'XYZ', 'date': _day(40), 'epsEstimate': 0.2},
+    ])
+
+
+@pytest.fixture
+def calendar(tmp_path, finnhub):
+    calendar = EarningsCalendar(path=tmp_path / 'calendar.json', fetch=finnhub)
+    calendar.ingest()
+    return calendar
+
+
+class TestIngest:
+    """Date-range ingestion, persistence and refresh."""
+
+    def test_chunked_requests_and_indexes(self, calendar, finnhub):
+        span = ec.LOOKBACK_DAYS + ec.LOOKAHEAD_DAYS + 1
+        assert len(finnhub.calls) == -(-span // ec.CHUNK_DAYS)
+        assert sorted(calendar.by_ticker) == ['AMD', 'NVDA', 'XYZ']
+        assert [e['ticker'] for e in calendar.by_date[_day(0)]] == ['AMD']
+        assert [e['date'] for e in calendar.by_ticker['NVDA']] == sorted(e['date'] for e in calendar.by_ticker['NVDA'])
+
+    def test_persisted_and_reloaded(self, tmp_path, calendar):
+        reloaded = EarningsCalendar(path=tmp_path / 'calendar.json', fetch=lambda *a: pytest.fail('refetched'))
+        assert reloaded.get_info('NVDA')['next_date'] == TODAY + timedelta(days=2)
+
+    def test_refresh_replaces_moved_dates(self, calendar, finnhub):
+        finnhub.entries[5]['date'] = _day(12)  # XYZ report moved
+        finnhub.calls.clear()
+        calendar.fetched_at = time.time() - calendar.max_age - 1
+        calendar.ensure_fresh()
+
+        assert finnhub.calls[0][0] == _day(-ec.REFRESH_BACK_DAYS)
+        assert _day(10) not in calendar.by_date
+        assert calendar.get_info('XYZ')['days_until'] == 12
+        # Older history is kept
+        assert calendar.get_info('NVDA')['beat_rate'] == 67
+
+    def test_truncated_response_is_split(self, tmp_path, monkeypatch, finnhub):
+        monkeypatch.setattr(ec, 'TRUNCATION_LIMIT', 1)
+        calendar = EarningsCalendar(path=tmp_path / 'calendar.json', fetch=finnhub)
+        calendar.ingest(TODAY - timedelta(days=6), TODAY + timedelta(days=6))
+        assert len(calendar.by_ticker) == 2
+        assert (_day(2), _day(2)) in finnhub.calls
+
+    def test_failed_fetch_keeps_old_copy(self, calendar):
+        def fail(*args):
+            raise RuntimeError('rate limited')
+
+        calendar._fetch = fail
+        assert calendar.ingest() == 0
+        assert calendar.get_info('AMD')['days_until'] == 0
+
+
+class TestLookups:
+    """get_earnings_info-shaped reads from the indexes."""
+
+    def test_get_info(self, calendar):
+        info = calendar.get_info('nvda')
+        assert info['ticker'] == 'NVDA'
+        assert info['days_until'] == 2
+        assert info['hour'] == 'amc'
+        assert info['eps_estimate'] == 1.3
+        assert info['beat_rate'] == 67
+        assert info['historical_surprise'] == pytest.approx(6.7)
+        assert info['high_impact'] is True
+        assert info['last_date'] == TODAY - timedelta(days=90)
+
+        assert calendar.get_info('NOPE')['next_date'] is None
+
+    def test_between(self, calendar):
+        week = calendar.between(TODAY, TODAY + timedelta(days=14))
+        assert [e['ticker'] for e in week] == ['AMD', 'NVDA', 'XYZ']
+        assert [e['ticker'] for e in calendar.between(TODAY, TODAY + timedelta(days=14), ['xyz'])] == ['XYZ']
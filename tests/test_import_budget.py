@@ -0,0 +1,58 @@
+"""
+Import-time budget tests.
+
+Package entry points must not drag in heavy optional stacks (torch for the
+RL tiers, yfinance) just by being imported; Modal API containers and cron
+bundles pay for every module on cold start. Each check runs in a fresh
+interpreter because the test process may already have those loaded.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ('torch', 'yfinance')
+
+
+def _loaded_after(statement: str) -> dict:
+    code = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps({{m: m in sys.modules for m in {HEAVY_MODULES!r}}}))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, '-c', code], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize('statement', [
+    'import src.api',
+    'import src.data',
+    'import src.ai',
+    'import src.learning',
+    'from src.learning import ComponentScores, MarketContext',
+    'from src.learning.learning_api import learning_bp',
+])
+def test_package_import_stays_light(statement):
+    loaded = _loaded_after(statement)
+    assert not any(loaded.values()), f"{statement!r} imported {[m for m, v in loaded.items() if v]}"
+
+
+def test_flask_app_does_not_import_torch():
+    assert _loaded_after('from src.api.app import app')['torch'] is False
+
+
+def test_lazy_names_still_resolve():
+    loaded = _loaded_after(
+        "import src.learning, src.data, src.ai\n"
+        "assert set(src.learning.__all__) <= set(dir(src.learning))\n"
+        "src.data.CacheManager, src.ai.get_deepseek, src.learning.BayesianBandit"
+    )
+    assert loaded['torch'] is False
@@ -0,0 +1,89 @@
+"""Tests for the dependency-aware cron job runner."""
+import threading
+import time
+
+import pytest
+
+from src.core.job_runner import JobRunner, format_timing_report
+
+
+def _sleeper(seconds, value=None, log=None, name=None):
+    def job():
+        if log is not None:
+            log.append(('start', name))
+        time.sleep(seconds)
+        if log is not None:
+            log.append(('end', name))
+        return value if value is not None else {'success': True}
+    return job
+
+
+class TestJobRunner:
+    """Tests for JobRunner."""
+
+    def test_independent_jobs_overlap(self):
+        runner = JobRunner('test')
+        runner.add('scan', _sleeper(0.2))
+        for name in ('a', 'b', 'c'):
+            runner.add(name, _sleeper(0.2), depends_on=['scan'])
+        runner.add('d', _sleeper(0.2))
+
+        timing = runner.run()['timing']
+
+        # Bounded by the longest branch (scan -> a/b/c), not the sum
+        assert timing['wall_seconds'] < 0.6
+        assert timing['serial_seconds'] >= 1.0
+        assert timing['critical_path'][0] == 'scan' and len(timing['critical_path']) == 2
+        assert timing['jobs']['d']['start_offset_seconds'] < 0.1
+
+    def test_dependencies_start_after_inputs(self):
+        log = []
+        runner = JobRunner('test')
+        runner.add('scan', _sleeper(0.05, log=log, name='scan'))
+        runner.add('alerts', _sleeper(0, log=log, name='alerts'), depends_on=['scan'])
+        runner.run()
+
+        assert log.index(('end', 'scan')) < log.index(('start', 'alerts'))
+
+    def test_failure_does_not_block_dependents(self):
+        def boom():
+            raise RuntimeError('scan failed')
+
+        runner = JobRunner('test')
+        runner.add('scan', boom)
+        runner.add('alerts', lambda: {'success': True}, depends_on=['scan'])
+        outcome = runner.run()
+
+        assert outcome['results']['scan'] == {'success': False, 'error': 'scan failed'}
+        assert outcome['results']['alerts'] == {'success': True}
+        assert outcome['timing']['jobs']['alerts']['upstream_failed'] == ['scan']
+        assert outcome['timing']['statuses']['error'] == 1
+
+    def test_timeout_releases_dependents(self):
+        release = threading.Event()
+        runner = JobRunner('test')
+        runner.add('slow', lambda: release.wait(5), timeout=0.1)
+        runner.add('after', lambda: 'ran', depends_on=['slow'])
+
+        started = time.perf_counter()
+        outcome = runner.run()
+        release.set()
+
+        assert time.perf_counter() - started < 2
+        assert outcome['timing']['jobs']['slow']['status'] == 'timeout'
+        assert outcome['results']['after'] == 'ran'
+
+    def test_condition_skips(self):
+        ran = []
+        runner = JobRunner('test')
+        runner.add('patents', lambda: ran.append(1), condition=lambda: False)
+        outcome = runner.run()
+
+        assert ran == []
+        assert outcome['results']['patents'] == {'success': True, 'skipped': True}
+        assert 'patents' in format_timing_report(outcome['timing'])
+
+    def test_rejects_unknown_dependency(self):
+        runner = JobRunner('test')
+        with pytest.raises(ValueError):
+            runner.add('alerts', lambda: None, depends_on=['scan'])
@@ -0,0 +1,100 @@
+"""Tests for the resampling multi-timeframe engine."""
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from src.analysis.multi_timeframe import (
+    MTFEngine,
+    TIMEFRAMES,
+    analyze_timeframe,
+    resample_ohlcv,
+)
+
+
+def _daily_bars(n, seed=0):
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range(end='2025-06-30', periods=n)
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), index=idx)
+    return pd.DataFrame({
+        'Open': close * 0.995,
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+        'Volume': 1000,
+    })
+
+
+@pytest.fixture
+def engine():
+    eng = MTFEngine()
+    eng.add_daily('LONG', _daily_bars(1300, seed=1))
+    eng.add_daily('SHORT', _daily_bars(300, seed=2))
+    return eng
+
+
+class TestResampleOHLCV:
+    """Tests for resample_ohlcv."""
+
+    def test_weekly_aggregation(self):
+        daily = _daily_bars(10)
+        weekly = resample_ohlcv(daily, 'weekly')
+
+        first_week = daily.loc[:weekly.index[0]]
+        assert weekly['Open'].iloc[0] == first_week['Open'].iloc[0]
+        assert weekly['Close'].iloc[0] == first_week['Close'].iloc[-1]
+        assert weekly['High'].iloc[0] == first_week['High'].max()
+        assert weekly['Volume'].iloc[0] == first_week['Volume'].sum()
+
+    def test_daily_passthrough(self):
+        daily = _daily_bars(10)
+        assert resample_ohlcv(daily, 'daily') is daily
+
+
+class TestMTFEngine:
+    """Tests for MTFEngine batch analysis."""
+
+    def test_batch_matches_per_frame_analysis(self, engine):
+        results = engine.analyze_all(fetch=False)
+
+        for ticker in ('LONG', 'SHORT'):
+            for tf in TIMEFRAMES:
+                expected = analyze_timeframe(engine.get_bars(ticker, tf), tf.upper())
+                assert results[ticker][tf] == expected
+
+    def test_short_history_has_no_monthly(self, engine):
+        result = engine.analyze('SHORT', fetch=False)
+
+        assert result['monthly'] is None
+        assert result['weekly'] is not None
+        assert 'score' in result['confluence']
+
+    def test_seeded_deep_history_needs_no_download(self, engine):
+        with patch('src.analysis.multi_timeframe.yf.download') as download:
+            engine.analyze_all(['LONG'])
+        download.assert_not_called()
+
+    def test_short_listing_fetched_once_then_tail_only(self):
+        eng = MTFEngine()
+        history = _daily_bars(300, seed=4)
+        with patch('src.analysis.multi_timeframe.yf.download', return_value=history) as download:
+            eng.load(['IPO'])
+            eng.load(['IPO'])
+            assert download.call_count == 1
+            assert download.call_args.kwargs['period'] == eng.period
+
+            eng._loaded_at['IPO'] = 0
+            download.return_value = history.iloc[-3:]
+            eng.load(['IPO'])
+
+        assert download.call_count == 2
+        assert 'period' not in download.call_args.kwargs
+        assert download.call_args.kwargs['start'] <= history.index[-1].strftime('%Y-%m-%d')
+        assert len(eng.get_bars('IPO')) == 300
+
+    def test_seed_from_multiindex_panel(self):
+        panel = pd.concat({'AAA': _daily_bars(60), 'BBB': _daily_bars(60, seed=3)}, axis=1)
+        eng = MTFEngine()
+
+        assert eng.seed_from_price_data(panel) == 2
+        assert len(eng.get_bars('AAA')) == 60
@@ -0,0 +1,110 @@
+"""Tests for the shared async news ingestion service."""
+import threading
+import time
+
+import pytest
+
+from src.data.cache_manager import CacheManager, news_cache_key
+from src.data.news_service import NewsService, NewsSource, normalize_title, title_key
+
+
+class _RecordingSource:
+    """Fake fetcher that tracks calls and peak concurrency."""
+
+    def __init__(self, headlines, delay=0.01):
+        self.headlines = headlines
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, ticker):
+        with self._lock:
+            self.calls.append(ticker)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [dict(h, title=h['title'].format(ticker=ticker)) for h in self.headlines]
+
+
+@pytest.fixture
+def sources():
+    primary = _RecordingSource([
+        {'title': '{ticker} beats earnings estimates', 'source': 'Reuters', 'timestamp': 200},
+        {'title': '{ticker} launches new chip', 'source': 'Reuters', 'timestamp': 100},
+    ])
+    fallback = _RecordingSource([
+        {'title': '{ticker} Beats Earnings Estimates! - Yahoo Finance', 'source': 'Yahoo', 'timestamp': 300},
+        {'title': 'Analysts upgrade {ticker}', 'source': 'Yahoo', 'timestamp': 400},
+    ])
+    return primary, fallback
+
+
+@pytest.fixture
+def service(sources, tmp_path):
+    primary, fallback = sources
+    return NewsService(
+        sources=[
+            NewsSource('primary', primary, limit=2),
+            NewsSource('fallback', fallback, limit=3),
+            NewsSource('disabled', lambda t: pytest.fail('disabled source called'), enabled=lambda: False),
+        ],
+        cache=CacheManager(cache_dir=str(tmp_path), use_lru=True),
+    )
+
+
+class TestTitleKey:
+    """Tests for headline normalization."""
+
+    def test_normalization(self):
+        assert normalize_title('NVDA Beats Estimates! - Yahoo Finance') == 'nvda beats estimates'
+        assert title_key('NVDA beats estimates') == title_key('nvda  BEATS estimates | Benzinga')
+        assert title_key('NVDA beats estimates') != title_key('AMD beats estimates')
+
+
+class TestNewsService:
+    """Tests for NewsService.fetch_news."""
+
+    def test_fan_out_and_dedup(self, service, sources):
+        primary, fallback = sources
+        tickers = [f"T{i}" for i in range(8)]
+
+        news = service.fetch_news(tickers)
+
+        assert set(news) == set(tickers)
+        assert sorted(primary.calls) == sorted(tickers)
+        assert 1 < primary.peak <= 2
+        assert 1 < fallback.peak <= 3
+
+        headlines = news['T0']
+        assert [h['title'] for h in headlines] == [
+            'Analysts upgrade T0', 'T0 beats earnings estimates', 'T0 launches new chip',
+        ]
+        # Duplicate kept from the higher-priority source
+        dupe = headlines[1]
+        assert dupe['provider'] == 'primary'
+        assert dupe['also_reported_by'] == ['fallback']
+        assert all(h['ticker'] == 'T0' for h in headlines)
+
+    def test_results_shared_through_cache(self, service, sources, tmp_path):
+        primary, _ = sources
+        service.fetch_news(['NVDA', 'AMD'])
+        assert service.get_news('nvda')[0]['title'] == 'Analysts upgrade NVDA'
+        assert len(primary.calls) == 2
+
+        # A second service on the same cache (e.g. another caller) reuses it
+        other = NewsService(sources=service.sources, cache=CacheManager(cache_dir=str(tmp_path)))
+        other.fetch_news(['NVDA', 'MU'])
+        assert sorted(primary.calls) == ['AMD', 'MU', 'NVDA']
+
+        service.fetch_news(['NVDA'], use_cache=False)
+        assert primary.calls.count('NVDA') == 2
+
+    def test_ignores_scanner_news_cache(self, service, sources, tmp_path):
+        # The async scanner caches its own Polygon-only list (or []) under news_cache_key
+        CacheManager(cache_dir=str(tmp_path)).set(news_cache_key('NVDA'), [], 3600)
+        assert service.get_news('NVDA')[0]['title'] == 'Analysts upgrade NVDA'
+        assert sources[0].calls == ['NVDA']
@@ -0,0 +1,141 @@
+"""Tests for offline PPO training on trade history."""
+import json
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip('torch')
+
+from src.learning.offline_ppo import OfflinePPOTrainer, TradeReplayEnv, paper_trade_to_record  # noqa: E402
+from src.learning.rl_models import (  # noqa: E402
+    TradeOutcome, append_trade_record, load_trade_records,
+)
+from src.learning.tier3_ppo import PPOAgent, compute_gae  # noqa: E402
+from tests.benchmarks.ppo_benchmark import synthetic_trades  # noqa: E402
+
+
+class TestTradeJournal:
+    """TradeRecord JSON-lines round trip and paper trade conversion."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / 'trade_journal.jsonl'
+        trades = synthetic_trades(3)
+        for trade in trades:
+            append_trade_record(path, trade)
+        path.write_text(path.read_text() + 'not json\n')
+
+        loaded = load_trade_records(path)
+
+        assert [t.trade_id for t in loaded] == [t.trade_id for t in trades]
+        assert loaded[0].entry_date == trades[0].entry_date
+        assert loaded[0].market_context.regime == trades[0].market_context.regime
+        assert loaded[0].component_scores.theme_score == trades[0].component_scores.theme_score
+        assert isinstance(loaded[0].outcome, TradeOutcome)
+
+    def test_paper_trade(self):
+        record = paper_trade_to_record({
+            'id': 'TRD-20260102-001', 'ticker': 'SPY', 'status': 'closed',
+            'entry_time': '2026-01-02T15:00:00Z', 'exit_time': '2026-01-05T15:00:00Z',
+            'entry_price': 2.0, 'pnl_pct': 35.0, 'stop_loss_pct': -50, 'take_profit_pct': 100,
+        })
+        assert record.outcome == TradeOutcome.WIN
+        assert record.days_held == 3
+        assert record.stop_loss == pytest.approx(1.0)
+        assert paper_trade_to_record({'status': 'open'}) is None
+
+
+class TestComputeGAE:
+    """GAE against a direct per-step implementation."""
+
+    def test_matches_reference(self):
+        rewards = torch.tensor([[1.0, 0.0], [0.5, 1.0], [-1.0, 2.0]])
+        values = torch.tensor([[0.2, 0.1], [0.3, 0.4], [0.1, 0.0]])
+        dones = torch.tensor([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+        last = torch.tensor([0.7, 0.9])
+        gamma, lam = 0.9, 0.8
+
+        adv, ret = compute_gae(rewards, values, dones, last, gamma, lam)
+
+        for env in range(2):
+            expected = []
+            gae, next_value = 0.0, last[env].item()
+            for t in reversed(range(3)):
+                nd = 1 - dones[t, env].item()
+                delta = rewards[t, env].item() + gamma * next_value * nd - values[t, env].item()
+                gae = delta + gamma * lam * nd * gae
+                expected.insert(0, gae)
+                next_value = values[t, env].item()
+            assert adv[:, env].tolist() == pytest.approx(expected)
+        assert torch.allclose(ret, adv + values)
+
+
+class TestTradeReplayEnv:
+    """Tests for TradeReplayEnv."""
+
+    def test_episode_shapes_and_reset(self):
+        env = TradeReplayEnv(synthetic_trades(50), num_envs=8, episode_length=5, seed=0)
+        states = env.reset()
+        assert states.shape == (8, 27)
+
+        for step in range(5):
+            states, rewards, dones, _ = env.step(np.full((8, 4), 0.5, dtype=np.float32))
+            assert rewards.shape == (8,)
+            assert dones.all() == (step == 4)
+        assert (env._t == 0).all()
+
+    def test_stop_and_target(self):
+        env = TradeReplayEnv(synthetic_trades(5), num_envs=1, seed=0)
+        env.pnl[:] = 3.0
+        env.mfe[:] = 40.0
+        env.mae[:] = -6.0
+        idx = np.array([0])
+
+        # Tight stop (5%) is hit before anything else
+        tight = env.simulate(np.array([[1.0, 1.0, 0.0, 0.0]]), idx)
+        assert tight['pnl_pct'][0] == pytest.approx(-5.0)
+        # Wide stop (25%), 10% target reached
+        target = env.simulate(np.array([[1.0, 1.0, 1.0, 0.0]]), idx)
+        assert target['pnl_pct'][0] == pytest.approx(10.0)
+        # Position size capped at the agent's max
+        assert target['size_pct'][0] == pytest.approx(20.0)
+
+
+class TestOfflinePPOTrainer:
+    """Training, checkpoint and resume."""
+
+    def test_train_and_resume(self, tmp_path):
+        trades = synthetic_trades(60)
+        trainer = OfflinePPOTrainer(
+            trades, agent=PPOAgent(storage_dir=tmp_path, hidden_dim=32),
+            num_envs=4, episode_length=5, minibatch_size=8, epochs=2, num_threads=1, seed=0,
+        )
+        result = trainer.train(2, checkpoint_every=1)
+
+        assert result['iterations'] == 2
+        assert result['total_steps'] == 2 * 4 * 5
+        assert (tmp_path / 'ppo_offline_checkpoint.pt').exists()
+        assert (tmp_path / 'ppo_agent.pt').exists()
+        assert np.isfinite(trainer.history[-1]['policy_loss'])
+
+        resumed = OfflinePPOTrainer(
+            trades, agent=PPOAgent(storage_dir=tmp_path, hidden_dim=32),
+            num_envs=4, episode_length=5, minibatch_size=8, epochs=2, num_threads=1, seed=0,
+        )
+        result = resumed.train(3)
+
+        assert result['iterations_run'] == 1
+        assert resumed.iteration == 3
+        assert len(resumed.history) == 3
+        json.dumps(resumed.history)
+
+    def test_legacy_train_step(self, tmp_path):
+        from src.learning.tier3_ppo import TradingState
+
+        agent = PPOAgent(storage_dir=tmp_path, hidden_dim=32)
+        for i in range(6):
+            agent.select_action(TradingState(theme_score=i))
+            agent.store_transition(float(i % 2), done=(i == 5))
+        agent.train_step()
+
+        assert agent.training_steps == 1
+        assert agent.states == []
@@ -0,0 +1,164 @@
+"""Tests for the concurrent options universe scanner."""
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.options_scanner import OptionsUniverseScanner
+
+
+def _chain(ticker, call_volume, put_volume, call_oi=100, put_oi=100, iv=0.4):
+    contract = {'strike': 100.0, 'expiration': '2026-01-16', 'last_price': 2.0,
+                'implied_volatility': iv, 'gamma': 0.02, 'underlying_price': 101.0}
+    calls = [dict(contract, ticker=f"O:{ticker}C", contract_type='call',
+                  volume=call_volume, open_interest=call_oi)]
+    puts = [dict(contract, ticker=f"O:{ticker}P", contract_type='put',
+                 volume=put_volume, open_interest=put_oi)]
+    return {
+        'underlying': ticker,
+        'calls': calls,
+        'puts': puts,
+        'summary': {
+            'total_call_volume': call_volume,
+            'total_put_volume': put_volume,
+            'total_call_oi': call_oi,
+            'total_put_oi': put_oi,
+            'put_call_volume_ratio': round(put_volume / call_volume, 2),
+        },
+    }
+
+
+class _FakeProvider:
+    """Stands in for PolygonProvider; records calls and peak concurrency."""
+
+    def __init__(self, chains, log):
+        self.chains = chains
+        self.log = log
+
+    async def get_options_chain(self, ticker):
+        self.log['chains'].append(ticker)
+        self.log['active'] += 1
+        self.log['peak'] = max(self.log['peak'], self.log['active'])
+        await asyncio.sleep(0.01)
+        self.log['active'] -= 1
+        return self.chains[ticker]
+
+    async def get_daily_bars(self, ticker, days):
+        self.log['bars'].append(ticker)
+        closes = 100 * np.exp(np.cumsum(np.full(60, 0.01) * np.resize([1, -1], 60)))
+        return pd.DataFrame({'Close': closes})
+
+    async def close(self):
+        self.log['closed'] += 1
+
+
+@pytest.fixture
+def chains():
+    return {
+        'BULL': _chain('BULL', call_volume=900, put_volume=100),          # unusual calls
+        'BEAR': _chain('BEAR', call_volume=100, put_volume=900),          # unusual puts
+        'FLAT': _chain('FLAT', call_volume=50, put_volume=50),            # nothing unusual
+        'BIG': _chain('BIG', call_volume=5000, put_volume=1000, iv=0.9),  # high volume, high IV
+    }
+
+
+@pytest.fixture
+def log():
+    return {'chains': [], 'bars': [], 'active': 0, 'peak': 0, 'closed': 0}
+
+
+@pytest.fixture
+def scanner(chains, log):
+    return OptionsUniverseScanner(provider_factory=lambda: _FakeProvider(chains, log), max_concurrent=2)
+
+
+class TestRefresh:
+    """Concurrent fetch and per-ticker chain reuse."""
+
+    def test_fetches_each_chain_once_per_window(self, scanner, log):
+        assert scanner.refresh(['BULL', 'BEAR', 'FLAT', 'BIG']) == 4
+        assert log['peak'] == 2
+        assert log['closed'] == 1
+
+        # Within the window: other screens reuse the same chains
+        scanner.screen(['bull', 'BEAR'])
+        assert scanner.unusual_activity('BULL')['unusual_activity']
+        assert sorted(log['chains']) == ['BEAR', 'BIG', 'BULL', 'FLAT']
+
+        # Forced refresh refetches chains but keeps daily closes
+        assert scanner.refresh(['BULL'], force=True) == 1
+        assert log['chains'].count('BULL') == 2
+        assert log['bars'].count('BULL') == 1
+
+    def test_window_expiry(self, scanner, log):
+        scanner.refresh(['FLAT'])
+        scanner.refresh_window = 0
+        scanner._chains['FLAT'] = (0, scanner._chains['FLAT'][1])
+        scanner.refresh(['FLAT'])
+        assert log['chains'] == ['FLAT', 'FLAT']
+
+
+class TestQuery:
+    """Screener filters over the precomputed table."""
+
+    def test_table_and_filters(self, scanner):
+        scanner.refresh(['BULL', 'BEAR', 'FLAT', 'BIG'])
+        table = scanner.table
+        assert list(table.index) == sorted(table.index, key=lambda t: -table.loc[t, 'sentiment_score'])
+        assert table.loc['BULL', 'put_call_trend'] == 'bullish'
+        assert table.loc['BULL', 'max_vol_oi_ratio'] == 9.0
+        assert table.loc['BULL', 'current_price'] == 101.0
+
+        assert [r['ticker'] for r in scanner.query(sentiment='bearish')] == ['BEAR']
+        assert {r['ticker'] for r in scanner.query(unusual_only=True)} == {'BULL', 'BEAR', 'BIG'}
+        assert [r['ticker'] for r in scanner.query(min_volume=5000)] == ['BIG']
+        assert [r['ticker'] for r in scanner.query(['BULL', 'FLAT'], min_vol_oi_ratio=5)] == ['BULL']
+        assert len(scanner.query(limit=2)) == 2
+
+        high_iv = scanner.query(min_iv_rank=table.loc['BIG', 'iv_rank'])
+        assert 'BIG' in [r['ticker'] for r in high_iv]
+
+    def test_unusual_threshold_from_cached_chain(self, scanner):
+        scanner.refresh(['BULL'])
+        assert len(scanner.unusual_activity('BULL', threshold=2.0)['unusual_contracts']) == 1
+        assert scanner.unusual_activity('BULL', threshold=10.0)['unusual_contracts'] == []
+        assert scanner.unusual_activity('NOPE') == {'unusual_activity': False, 'signals': []}
+
+    def test_screen_never_fetches(self, scanner, log):
+        assert scanner.screen(['BULL']) == [] and scanner.as_of is None
+        assert log['chains'] == []
+
+        scanner.refresh(['BULL'])
+        scanner.refresh_window = 0
+        assert [r['ticker'] for r in scanner.screen(['BULL'])] == ['BULL']
+        assert scanner.as_of == scanner.get_row('BULL')['fetched_at']
+        assert log['chains'] == ['BULL']
+
+    def test_options_screener_fetches_misses(self, scanner, log, monkeypatch):
+        from src.analysis import options_scanner
+        from src.analysis.options_flow import OptionsScreener
+
+        monkeypatch.setattr(options_scanner, '_options_scanner', scanner)
+        scanner.refresh(['BULL'])
+
+        results = OptionsScreener().screen(['BULL', 'BEAR'])
+        assert sorted(r['ticker'] for r in results) == ['BEAR', 'BULL']
+        assert log['chains'] == ['BULL', 'BEAR']
+
+    def test_background_refresher(self, scanner, log, run_async):
+        async def run():
+            scanner.start_refresher(lambda: ['BULL', 'BEAR'], interval=0.01)
+            for _ in range(200):
+                if len(scanner.table) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            scanner._refresher.cancel()
+
+        run_async(run())
+        assert sorted(scanner.table.index) == ['BEAR', 'BULL']
+
+    def test_rows_are_copies(self, scanner):
+        scanner.refresh(['BULL'])
+        scanner.query()[0]['unusual_contracts'] = []
+        assert scanner.get_row('BULL')['unusual_contracts']
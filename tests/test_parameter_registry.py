@@ -0,0 +1,119 @@
+"""Tests for batched parameter registry writes and snapshots."""
+import json
+
+import pytest
+
+from src.learning.core import registry as registry_module
+from src.learning.core.registry import ParameterRegistry
+from src.learning.tracking import audit as audit_module
+from src.scoring import param_helper
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, 'REGISTRY_FILE', tmp_path / 'registry.json')
+    monkeypatch.setattr(registry_module, '_ensure_data_dir', lambda: None)
+    monkeypatch.setattr(audit_module, 'AUDIT_FILE', tmp_path / 'audit.json')
+    return ParameterRegistry()
+
+
+def _count_writes(registry, monkeypatch):
+    writes = {'registry': 0, 'audit': 0}
+    save_registry = registry._save_registry
+    save_audit = audit_module.AuditTrail._save_audit
+
+    def counting_save_registry():
+        if not registry._batch_depth:
+            writes['registry'] += 1
+        save_registry()
+
+    def counting_save_audit(self):
+        writes['audit'] += 1
+        save_audit(self)
+
+    monkeypatch.setattr(registry, '_save_registry', counting_save_registry)
+    monkeypatch.setattr(audit_module.AuditTrail, '_save_audit', counting_save_audit)
+    return writes
+
+
+class TestRegistryBatch:
+    """Tests for ParameterRegistry.batch()."""
+
+    def test_batch_writes_once(self, registry, tmp_path, monkeypatch):
+        writes = _count_writes(registry, monkeypatch)
+
+        with registry.batch():
+            registry.set('weight.theme_heat', 0.2, 'test')
+            with registry.batch():
+                registry.set('weight.catalyst', 0.25, 'test')
+            registry.get_with_metadata('weight.catalyst').status = 'learning'
+            registry._save_registry()
+            assert registry.get('weight.theme_heat') == 0.2
+            assert writes == {'registry': 0, 'audit': 0}
+
+        assert writes == {'registry': 1, 'audit': 1}
+        saved = json.loads((tmp_path / 'registry.json').read_text())['parameters']
+        assert saved['weight.catalyst']['current_value'] == 0.25
+        assert saved['weight.catalyst']['status'] == 'learning'
+
+        entries = json.loads((tmp_path / 'audit.json').read_text())['entries']
+        assert [e['parameter'] for e in entries] == ['weight.theme_heat', 'weight.catalyst']
+        assert entries[0]['old_value'] == 0.18
+
+    def test_set_many_clamps_and_flushes_on_error(self, registry, tmp_path):
+        registry.set_many({'weight.theme_heat': 5.0, 'weight.catalyst': 0.3})
+        assert registry.get('weight.theme_heat') == 0.40
+
+        with pytest.raises(RuntimeError):
+            with registry.batch():
+                registry.set('weight.sentiment', 0.1)
+                raise RuntimeError('cycle failed')
+
+        saved = json.loads((tmp_path / 'registry.json').read_text())['parameters']
+        assert saved['weight.sentiment']['current_value'] == 0.1
+        assert registry._batch_depth == 0
+
+
+class TestParameterSnapshot:
+    """Tests for ParameterRegistry.snapshot()."""
+
+    def test_attribute_access(self, registry):
+        snap = registry.snapshot()
+
+        assert snap.weight.theme_heat == 0.18
+        assert snap.regime.bull.max_volatility == 25
+        assert snap['score.sec.8k'] == registry.get('score.sec.8k')
+        assert snap.get('weight.missing', 0.5) == 0.5
+        assert len(snap) == len(registry.parameters)
+        with pytest.raises(AttributeError):
+            snap.weight.missing
+        with pytest.raises(AttributeError):
+            snap.version = 99
+
+    def test_versioned_and_immutable(self, registry):
+        first = registry.snapshot()
+        assert registry.snapshot() is first
+
+        registry.set('weight.theme_heat', 0.3)
+        second = registry.snapshot()
+
+        assert second.version > first.version
+        assert first.weight.theme_heat == 0.18
+        assert second.weight.theme_heat == 0.3
+
+
+class TestPinnedSnapshot:
+    """param_helper.get() inside pinned_snapshot()."""
+
+    def test_scan_sees_one_version(self, registry, monkeypatch):
+        monkeypatch.setattr(param_helper, '_registry', registry)
+        monkeypatch.setattr(param_helper, '_registry_checked', True)
+
+        with param_helper.pinned_snapshot() as snap:
+            registry.set('weight.theme_heat', 0.3)
+            assert param_helper.weight_theme_heat() == 0.18
+            assert param_helper.snapshot() is snap
+            assert param_helper.get('not.a.param', 1.5) == 1.5
+
+        assert param_helper.weight_theme_heat() == 0.3
+        assert param_helper._pinned is None
@@ -5,6 +5,7 @@ import pytest
 import asyncio
 import time
 from src.core.performance import (
+    LatencyHistogram,
     PerformanceMonitor,
     monitor_performance,
     timed_lru_cache,
@@ -23,7 +24,7 @@ class TestPerformanceMonitor:
         monitor.record("test_function", 1.5)
 
         assert "test_function" in monitor.metrics
-        assert monitor.metrics["test_function"] == [1.5]
+        assert monitor.get_histogram("test_function").count == 1
         assert monitor.call_counts["test_function"] == 1
 
     def test_get_stats(self):
@@ -50,19 +51,99 @@ class TestPerformanceMonitor:
 
         assert stats == {}
 
-    def test_max_measurements(self):
-        """Test that only last 1000 measurements are kept"""
+    def test_fixed_memory(self):
+        """Test that memory stays fixed regardless of sample count"""
         monitor = PerformanceMonitor()
 
-        # Record 1500 measurements
         for i in range(1500):
             monitor.record("test_function", float(i))
 
-        # Should only keep last 1000
-        assert len(monitor.metrics["test_function"]) == 1000
-        # Should keep total count
+        hist = monitor.get_histogram("test_function")
+        assert len(hist.counts) == LatencyHistogram.NUM_BUCKETS
+        assert hist.count == 1500
         assert monitor.call_counts["test_function"] == 1500
 
+    def test_percentiles_within_error_bound(self):
+        """Test streaming percentiles stay close to exact values"""
+        monitor = PerformanceMonitor()
+        samples = [0.001 * (i + 1) for i in range(10000)]
+        for value in samples:
+            monitor.record("latency", value)
+
+        stats = monitor.get_stats("latency")
+
+        for key, q in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99)):
+            exact = samples[int(len(samples) * q) - 1]
+            assert abs(stats[key] - exact) / exact < 0.02
+        assert stats['min'] == samples[0]
+        assert stats['max'] == samples[-1]
+
+    def test_labels_filter(self):
+        """Test stats can be filtered by label"""
+        monitor = PerformanceMonitor()
+        monitor.record("provider_request", 0.1, provider="polygon", endpoint="/v2/aggs")
+        monitor.record("provider_request", 0.2, provider="polygon", endpoint="/v3/news")
+        monitor.record("provider_request", 5.0, provider="finnhub")
+
+        polygon = monitor.get_stats("provider_request", provider="polygon")
+        everything = monitor.get_stats("provider_request")
+        today = monitor.get_stats("provider_request", day="today", provider="finnhub")
+
+        assert polygon['count'] == 2
+        assert polygon['max'] == 0.2
+        assert everything['count'] == 3
+        assert today['count'] == 1
+        assert monitor.get_stats("provider_request", day="1999-01-01") == {}
+        assert len(monitor.get_labeled_stats("provider_request")) == 3
+
+    def test_merge_snapshot_across_workers(self):
+        """Test merging histograms from another worker"""
+        worker_a = PerformanceMonitor()
+        worker_b = PerformanceMonitor()
+        for i in range(100):
+            worker_a.record("scan", 1.0, stage="fetch")
+            worker_b.record("scan", 3.0, stage="fetch")
+
+        worker_a.merge_snapshot(worker_b.snapshot())
+
+        stats = worker_a.get_stats("scan", stage="fetch")
+        assert stats['count'] == 200
+        assert stats['avg'] == pytest.approx(2.0)
+        assert worker_a.call_counts["scan"] == 200
+
+    def test_prometheus_export(self):
+        """Test Prometheus text format export"""
+        monitor = PerformanceMonitor()
+        monitor.record("provider_request", 0.25, provider="polygon")
+
+        text = monitor.to_prometheus()
+
+        assert "# TYPE stockstory_provider_request_seconds summary" in text
+        assert 'stockstory_provider_request_seconds{provider="polygon",quantile="0.99"}' in text
+        assert 'stockstory_provider_request_seconds_count{provider="polygon"} 1' in text
+
+
+class TestLatencyHistogram:
+    """Test the streaming histogram directly"""
+
+    def test_roundtrip_dict(self):
+        hist = LatencyHistogram()
+        for value in (0.001, 0.01, 0.1, 1.0):
+            hist.record(value)
+
+        restored = LatencyHistogram.from_dict(hist.to_dict())
+
+        assert restored.count == 4
+        assert restored.quantile(0.5) == hist.quantile(0.5)
+
+    def test_out_of_range_values_clamped(self):
+        hist = LatencyHistogram()
+        hist.record(0.0)
+        hist.record(1e9)
+
+        assert hist.count == 2
+        assert hist.quantile(1.0) == 1e9
+
 
 class TestMonitorPerformanceDecorator:
     """Test performance monitoring decorator"""
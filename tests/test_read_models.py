@@ -0,0 +1,131 @@
+"""Tests for precomputed API read models and ETag responses."""
+import json
+
+import numpy as np
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.core import read_models as rm
+from src.core.read_models import ReadModelStore, encode_json, etag_matches
+
+
+@pytest.fixture
+def source():
+    return {'version': 1, 'builds': 0, 'fail': False}
+
+
+@pytest.fixture
+def store(source):
+    store = ReadModelStore()
+
+    def build(strategy=None):
+        source['builds'] += 1
+        if source['fail']:
+            raise RuntimeError('upstream down')
+        return {'ok': True, 'version': source['version'], 'strategy': strategy}
+
+    store.register('scan', build, ttl=60, version=lambda *key: source['version'])
+    return store
+
+
+@pytest.fixture
+def client(store):
+    app = FastAPI()
+
+    @app.get("/scan")
+    def scan(request: Request, strategy: str = None):
+        return store.respond(request, 'scan', key=strategy)
+
+    return TestClient(app)
+
+
+class TestEncoding:
+    """JSON encoding and If-None-Match parsing."""
+
+    def test_encode_json(self):
+        payload = {'n': np.float64(1.5), 'arr': np.arange(2), 1: 'x', 'tags': {'a'}}
+        assert json.loads(encode_json(payload)) == {'n': 1.5, 'arr': [0, 1], '1': 'x', 'tags': ['a']}
+
+    def test_etag_matches(self):
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc", "def"', '"abc"')
+        assert etag_matches('*', '"abc"')
+        assert not etag_matches('"def"', '"abc"')
+        assert not etag_matches(None, '"abc"')
+
+
+class TestStore:
+    """Snapshot reuse, invalidation and background refresh."""
+
+    def test_rebuilds_only_when_version_changes(self, store, source):
+        first = store.get('scan')
+        assert store.get('scan') is first
+        assert source['builds'] == 1
+
+        source['version'] = 2
+        second = store.get('scan')
+        assert source['builds'] == 2
+        assert second.etag != first.etag
+
+    def test_unchanged_content_keeps_etag(self, store, source):
+        etag = store.get('scan').etag
+        store.invalidate()
+        assert store.get('scan').etag == etag
+        assert store.get('scan', force=True).etag == etag
+        assert source['builds'] == 3
+
+    def test_failed_rebuild_serves_previous(self, store, source):
+        body = store.get('scan').body
+        source['fail'] = True
+        source['version'] = 2
+        assert store.get('scan').body == body
+
+        store.invalidate('scan')
+        with pytest.raises(RuntimeError):
+            store.get('scan')
+
+    def test_error_payloads_expire_sooner(self, store):
+        builds = []
+        store.register('digest', lambda: builds.append(1) or {'ok': False, 'error': 'timeout'}, ttl=1800)
+        snapshot = store.get('digest')
+        assert snapshot.ttl == rm.ERROR_TTL
+
+        snapshot.built_at -= rm.ERROR_TTL + 1
+        store.get('digest')
+        assert len(builds) == 2
+
+    def test_refresh_skips_idle_snapshots(self, store, source):
+        store.get('scan')
+        store.get('scan', key='momentum')
+        source['version'] = 2
+        store._snapshots['scan']['momentum'].read_at -= rm.IDLE_SECONDS + 1
+
+        assert store.refresh() == 1
+        assert json.loads(store.get('scan', touch=False).body)['version'] == 2
+        assert json.loads(store._snapshots['scan']['momentum'].body)['version'] == 1
+
+
+class TestConditionalResponses:
+    """ETag / If-None-Match over HTTP."""
+
+    def test_304_until_payload_changes(self, client, source):
+        response = client.get('/scan')
+        assert response.status_code == 200
+        assert response.json() == {'ok': True, 'version': 1, 'strategy': None}
+        etag = response.headers['etag']
+
+        response = client.get('/scan', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['etag'] == etag
+
+        source['version'] = 2
+        response = client.get('/scan', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.json()['version'] == 2
+
+    def test_query_keys_are_separate_models(self, client, source):
+        assert client.get('/scan', params={'strategy': 'momentum'}).json()['strategy'] == 'momentum'
+        assert client.get('/scan').json()['strategy'] is None
+        assert source['builds'] == 2
@@ -0,0 +1,119 @@
+"""Tests for the compact ecosystem relationship graph."""
+import json
+
+import pytest
+
+from src.analysis.relationship_graph import RelationshipGraph
+
+
+@pytest.fixture
+def graph():
+    graph = RelationshipGraph()
+    graph.add_node('NVDA', {'themes': ['ai_infrastructure'], 'market_cap_tier': 'mega'})
+    graph.add_edge('NVDA', 'MU', 'supplier', strength=0.9, sub_theme='HBM_Memory')
+    graph.add_edge('NVDA', 'TSM', 'supplier', strength=0.95, sub_theme='CoWoS_Packaging')
+    graph.add_edge('NVDA', 'AMD', 'competitor', strength=0.85)
+    graph.add_edge('AMD', 'TSM', 'supplier', strength=0.9, sub_theme='Foundry')
+    return graph
+
+
+class TestQueries:
+    """Neighbor, subgraph and path queries over the adjacency index."""
+
+    def test_neighbors_and_upsert(self, graph):
+        assert {s['ticker'] for s in graph.get_suppliers('NVDA')} == {'MU', 'TSM'}
+        assert [c['ticker'] for c in graph.get_competitors('AMD')] == ['NVDA']
+        assert [t for t, _ in graph.get_neighbors('TSM', direction='incoming')] == ['NVDA', 'AMD']
+
+        edge = graph.add_edge('nvda', 'mu', 'supplier', strength=0.5, sources=['news'])
+        assert graph.edge_count == 4
+        assert edge['strength'] == 0.9
+        assert set(edge['sources']) == {'manual', 'news'}
+        assert len(graph.edges['NVDA']) == 3
+
+    def test_subgraph_and_path(self, graph):
+        sub = graph.get_subgraph('MU', depth=2)
+        assert {n['ticker'] for n in sub['nodes']} == {'MU', 'NVDA', 'TSM', 'AMD'}
+        assert len(sub['edges']) == 3
+
+        path = graph.find_path('AMD', 'MU')
+        assert [t for t, _ in path] == ['AMD', 'NVDA', 'MU']
+        assert path[1][1]['type'] == 'competitor'
+        supplier_path = graph.find_path('AMD', 'MU', rel_types=['supplier'])
+        assert [t for t, _ in supplier_path] == ['AMD', 'TSM', 'NVDA', 'MU']
+        assert graph.find_path('AMD', 'MU', rel_types=['customer']) is None
+        assert graph.find_path('AMD', 'MU', max_depth=1) is None
+        assert sorted(graph.get_by_sub_theme('HBM_Memory')) == ['MU', 'NVDA']
+
+
+class TestFreshness:
+    """Lazy freshness decay."""
+
+    def test_decay_is_lazy(self, graph):
+        graph.decay_freshness(days=10)
+        supplier = graph.get_edge('NVDA', 'MU')
+        competitor = graph.get_edge('NVDA', 'AMD')
+        assert supplier['freshness'] == pytest.approx(0.98 ** 10, rel=1e-4)
+        assert competitor['freshness'] == pytest.approx(0.99 ** 10, rel=1e-4)
+
+        graph.decay_freshness(days=200)
+        assert graph.get_edge('NVDA', 'MU')['freshness'] == 0.1
+        assert len(graph.get_stale_edges(0.5)) == 4
+
+        graph.refresh_edge('NVDA', 'MU')
+        assert graph.get_edge('NVDA', 'MU')['freshness'] == pytest.approx(1.0)
+        assert graph.get_neighbors('NVDA', min_freshness=0.5)[0][0] == 'MU'
+
+
+class TestPersistence:
+    """Snapshot plus append-only change log."""
+
+    def test_save_appends_changes(self, graph, tmp_path):
+        path = tmp_path / 'graph.json'
+        log = tmp_path / 'graph.log.jsonl'
+        graph.save(path)
+        assert not log.exists()
+
+        graph.add_edge('MU', 'AMAT', 'supplier', strength=0.6)
+        graph.decay_freshness(days=5)
+        graph.save(path)
+        assert [json.loads(line)['op'] for line in log.read_text().splitlines()] == ['node', 'edge', 'decay']
+
+        reloaded = RelationshipGraph()
+        assert reloaded.load(path)
+        assert reloaded.edge_count == 5
+        assert reloaded.get_edge('MU', 'AMAT')['freshness'] == pytest.approx(0.98 ** 5, rel=1e-4)
+        assert reloaded.get_stats()['by_type'] == graph.get_stats()['by_type']
+
+    def test_log_compaction(self, graph, tmp_path):
+        path = tmp_path / 'graph.json'
+        graph.save(path)
+        for _ in range(10):
+            graph.refresh_edge('NVDA', 'MU')
+            graph.save(path)
+
+        # 4 nodes + 4 edges: the 9th logged change triggers a snapshot rewrite
+        assert len((tmp_path / 'graph.log.jsonl').read_text().splitlines()) == 1
+        reloaded = RelationshipGraph()
+        assert reloaded.load(path)
+        assert reloaded.get_edge('NVDA', 'MU')['freshness'] == pytest.approx(1.0)
+
+    def test_loads_legacy_format(self, tmp_path):
+        path = tmp_path / 'legacy.json'
+        edge = {
+            'source': 'NVDA', 'target': 'MU', 'type': 'supplier', 'strength': 0.8,
+            'freshness': 0.5, 'sub_theme': 'HBM', 'sources': ['sec_10k'],
+            'created_at': '2025-01-01T00:00:00', 'updated_at': '2025-01-01T00:00:00',
+            'confidence': 'high',
+        }
+        path.write_text(json.dumps({
+            'nodes': {'NVDA': {'ticker': 'NVDA'}, 'MU': {'ticker': 'MU'}},
+            'edges': {'NVDA': [edge]},
+            'metadata': {'version': '1.0'},
+        }))
+
+        graph = RelationshipGraph()
+        assert graph.load(path)
+        loaded = graph.get_edge('NVDA', 'MU')
+        assert loaded['confidence'] == 'high'
+        assert loaded['freshness'] < 0.5
@@ -0,0 +1,141 @@
+"""Tests for the local SEC ticker -> CIK map and submissions index."""
+import json
+import zipfile
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.data.sec_edgar import SECEdgarClient, detect_ma_activity
+from src.data.sec_index import CIKMap, SubmissionsIndex
+
+COMPANY_TICKERS = {
+    '0': {'cik_str': 1045810, 'ticker': 'NVDA', 'title': 'NVIDIA CORP'},
+    '1': {'cik_str': 1067983, 'ticker': 'BRK-B', 'title': 'BERKSHIRE HATHAWAY INC'},
+}
+
+
+def _days_ago(days):
+    return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def _submissions(name):
+    return {
+        'name': name,
+        'filings': {'recent': {
+            'form': ['8-K', 'DEFM14A', '4', '8-K'],
+            'filingDate': [_days_ago(2), _days_ago(10), _days_ago(20), _days_ago(200)],
+            'accessionNumber': ['0001-24-000001', '0001-24-000002', '0001-24-000003', '0001-23-000004'],
+            'primaryDocDescription': ['Merger agreement', 'Proxy', 'Form 4', 'Old event'],
+            'items': ['1.01', '', '', '8.01'],
+        }},
+    }
+
+
+def _fake_session():
+    """requests.Session stand-in serving company_tickers and submissions JSON."""
+    session = MagicMock()
+
+    def get(url, **kwargs):
+        response = MagicMock(status_code=200)
+        if url.endswith('company_tickers.json'):
+            response.json.return_value = COMPANY_TICKERS
+        else:
+            response.json.return_value = _submissions(url.rsplit('CIK', 1)[1][:10])
+        return response
+
+    session.get.side_effect = get
+    return session
+
+
+@pytest.fixture
+def session():
+    return _fake_session()
+
+
+@pytest.fixture
+def client(tmp_path, session):
+    return SECEdgarClient(
+        cik_map=CIKMap(tmp_path / 'company_tickers.json', session=session),
+        index=SubmissionsIndex(tmp_path / 'submissions_index.json', session=session),
+    )
+
+
+class TestCIKMap:
+    """Tests for the persisted ticker -> CIK map."""
+
+    def test_loaded_once_and_persisted(self, tmp_path, session):
+        cik_map = CIKMap(tmp_path / 'company_tickers.json', session=session)
+
+        assert cik_map.get('nvda') == '0001045810'
+        assert cik_map.get('BRK.B') == '0001067983'
+        assert cik_map.get('NOPE') is None
+        assert session.get.call_count == 1
+
+        offline = MagicMock()
+        reloaded = CIKMap(tmp_path / 'company_tickers.json', session=offline)
+        assert reloaded.get('NVDA') == '0001045810'
+        assert reloaded.company_name('0001045810') == 'NVIDIA CORP'
+        offline.get.assert_not_called()
+
+    def test_stale_map_refreshed(self, tmp_path, session):
+        path = tmp_path / 'company_tickers.json'
+        path.write_text(json.dumps({'fetched_at': 0, 'tickers': {'OLD': '0000000001'}, 'names': {}}))
+
+        cik_map = CIKMap(path, session=session)
+
+        assert cik_map.get('NVDA') == '0001045810'
+        assert cik_map.get('OLD') is None
+
+
+class TestSubmissionsIndex:
+    """Tests for local filing lookups."""
+
+    def test_filings_are_local_after_prefetch(self, client, session, tmp_path):
+        assert client.prefetch(['NVDA', 'BRK.B', 'NOPE']) == 2
+        calls = session.get.call_count
+
+        result = detect_ma_activity('NVDA', client)
+        insiders = client.get_insider_transactions('NVDA')
+
+        assert session.get.call_count == calls
+        assert result['ma_score'] == 60
+        assert len(insiders) == 1
+        assert [e['date'] for e in client.get_material_events('NVDA', days_back=30)] == [_days_ago(2)]
+
+        saved = json.loads((tmp_path / 'submissions_index.json').read_text())['companies']
+        assert set(saved) == {'0001045810', '0001067983'}
+        assert 'items' not in saved['0001045810']['recent']
+
+    def test_build_from_bulk(self, tmp_path):
+        archive = tmp_path / 'submissions.zip'
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('CIK0001045810.json', json.dumps(_submissions('NVIDIA CORP')))
+            zf.writestr('CIK0001045810-submissions-001.json', json.dumps({}))
+            zf.writestr('CIK0000000002.json', json.dumps(_submissions('OTHER')))
+
+        offline = MagicMock()
+        index = SubmissionsIndex(tmp_path / 'submissions_index.json', session=offline)
+        assert index.build_from_bulk(archive, ciks=['0001045810']) == 1
+
+        entry = SubmissionsIndex(tmp_path / 'submissions_index.json', session=offline).get('0001045810')
+        assert entry['name'] == 'NVIDIA CORP'
+        assert entry['recent']['form'][:2] == ['8-K', 'DEFM14A']
+        offline.get.assert_not_called()
+
+    def test_build_from_bulk_download_is_removed(self, tmp_path):
+        archive = tmp_path / 'source.zip'
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('CIK0001045810.json', json.dumps(_submissions('NVIDIA CORP')))
+
+        session = MagicMock()
+        response = session.get.return_value.__enter__.return_value
+        response.iter_content.return_value = [archive.read_bytes()]
+        downloads = []
+        index = SubmissionsIndex(tmp_path / 'submissions_index.json', session=session)
+        download = index._download
+        index._download = lambda url: downloads.append(download(url)) or downloads[-1]
+
+        assert index.build_from_bulk('https://example.com/submissions.zip') == 1
+        assert not downloads[0].exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['source.zip', 'submissions_index.json']
@@ -0,0 +1,84 @@
+"""Tests for sharded scan execution."""
+import asyncio
+
+import pandas as pd
+
+from src.core.async_scanner import AsyncScanner, ShardMerger, split_into_shards
+
+
+class TestSplitIntoShards:
+    """Tests for split_into_shards."""
+
+    def test_covers_universe_evenly(self):
+        tickers = [f"T{i}" for i in range(23)]
+        shards = split_into_shards(tickers, 5)
+
+        assert len(shards) == 5
+        assert [t for shard in shards for t in shard] == tickers
+        assert {len(s) for s in shards} == {4, 5}
+
+    def test_more_shards_than_tickers(self):
+        assert split_into_shards(['NVDA', 'AMD', 'NVDA'], 10) == [['NVDA'], ['AMD']]
+        assert split_into_shards([], 4) == []
+
+
+class TestScanShard:
+    """AsyncScanner.scan_shard shares one price panel across the shard."""
+
+    def test_single_panel_fetch(self, monkeypatch, run_async):
+        scanner = AsyncScanner(max_concurrent=4)
+        fetches = []
+        seen_prices = {}
+
+        async def fake_fetch(tickers):
+            fetches.append(list(tickers))
+            return {t: pd.DataFrame({'Close': [1.0]}) for t in tickers + ['SPY']}
+
+        async def fake_score(ticker, price_data=None):
+            if ticker == 'BAD':
+                raise RuntimeError('boom')
+            seen_prices[ticker] = price_data is not None
+            await asyncio.sleep(0)
+            return {'ticker': ticker, 'story_score': len(ticker)}
+
+        monkeypatch.setattr(scanner, '_fetch_price_data', fake_fetch)
+        monkeypatch.setattr(scanner.scorer, 'calculate_story_score_async', fake_score)
+
+        async def run():
+            try:
+                return await scanner.scan_shard(['NVDA', 'AMD', 'BAD'], shard_id=3)
+            finally:
+                await scanner.close()
+
+        output = run_async(run())
+
+        assert fetches == [['NVDA', 'AMD', 'BAD']]
+        assert seen_prices == {'NVDA': True, 'AMD': True}
+        assert output['shard'] == 3
+        assert [r['ticker'] for r in output['results']] == ['NVDA', 'AMD']
+        assert output['failed'] == ['BAD']
+        assert output['stats']['price_panel'] == 4
+        assert output['trace']['spans']['scan_ticker']['count'] == 3
+
+
+class TestShardMerger:
+    """Tests for ShardMerger."""
+
+    def test_out_of_order_merge(self):
+        merger = ShardMerger(expected_shards=2)
+        merger.add({'shard': 1, 'results': [{'ticker': 'AMD', 'story_score': 40}],
+                    'failed': ['XYZ'], 'stats': {'tickers': 2}})
+        merger.add({'shard': 0, 'results': [{'ticker': 'NVDA', 'story_score': 80}],
+                    'failed': [], 'stats': {'tickers': 1}})
+
+        assert [r['ticker'] for r in merger.get_results()] == ['NVDA', 'AMD']
+        assert merger.get_failures() == [{'ticker': 'XYZ', 'error': 'Scan failed'}]
+        assert merger.progress() == '2/2 shards, 2 scanned, 1 failed'
+
+    def test_retried_shard_replaces_failure(self):
+        merger = ShardMerger()
+        merger.add_failed_shard(0, ['NVDA'], 'timeout')
+        merger.add({'shard': 0, 'results': [{'ticker': 'NVDA', 'story_score': 80}], 'failed': []})
+
+        assert len(merger.get_results()) == 1
+        assert merger.get_failures() == []
@@ -0,0 +1,127 @@
+"""Tests for the SQLite-backed bot storage."""
+import json
+
+import pytest
+
+from src.data import storage
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    storage.close()
+    monkeypatch.setattr(storage, 'STORAGE_DIR', tmp_path)
+    yield storage
+    storage.close()
+
+
+class TestWatchlist:
+    """Watchlist add/remove semantics."""
+
+    def test_add_remove(self, store):
+        assert store.add_to_watchlist(1, 'nvda')
+        assert not store.add_to_watchlist(1, 'NVDA')
+        store.add_to_watchlist(1, 'amd')
+        store.add_to_watchlist(2, 'pltr')
+        assert store.get_watchlist(1) == ['NVDA', 'AMD']
+
+        assert store.remove_from_watchlist(1, 'nvda')
+        assert not store.remove_from_watchlist(1, 'nvda')
+        store.clear_watchlist(1)
+        assert store.get_watchlist(1) == []
+        assert store.get_watchlist(2) == ['PLTR']
+
+
+class TestAlerts:
+    """Per-user alerts and the cross-user active alert query."""
+
+    def test_trigger_and_active_alerts(self, store):
+        store.add_alert(1, 'nvda', 150, 'above')
+        store.add_alert(1, 'amd', 100, 'below')
+        store.add_alert(-100200, 'nvda', 160)
+
+        store.mark_alert_triggered(1, 'NVDA', 151.5)
+        alerts = store.get_alerts(1)
+        assert alerts[0]['triggered'] and alerts[0]['triggered_price'] == 151.5
+        assert not alerts[1]['triggered']
+
+        active = store.get_all_active_alerts()
+        assert [(a['chat_id'], a['ticker']) for a in active] == [(-100200, 'NVDA'), (1, 'AMD')]
+        assert sorted(store.get_all_users_with_alerts()) == [-100200, 1]
+
+        store.remove_alert(1, 'amd')
+        assert store.get_all_users_with_alerts() == [-100200]
+
+
+class TestPortfolio:
+    """Positions, averaging in and closed trades."""
+
+    def test_average_in_and_close(self, store):
+        store.add_position(1, 'nvda', 10, 100)
+        position = store.add_position(1, 'NVDA', 10, 120)
+        assert position['shares'] == 20 and position['entry_price'] == 110
+
+        trade = store.close_position(1, 'nvda', 121)
+        assert trade['pnl_percent'] == pytest.approx(10.0)
+        assert trade['pnl_dollars'] == pytest.approx(220.0)
+        assert store.get_portfolio(1) == []
+        assert store.get_closed_trades(1) == [trade]
+        assert store.close_position(1, 'nvda', 121) is None
+
+
+class TestMigration:
+    """Import of the per-user JSON directory layout."""
+
+    def test_migrates_json_files(self, store, tmp_path):
+        user_dir = tmp_path / '12345'
+        user_dir.mkdir()
+        (user_dir / 'watchlist.json').write_text(json.dumps({'tickers': ['NVDA', 'AMD']}))
+        (user_dir / 'alerts.json').write_text(json.dumps({'alerts': [
+            {'ticker': 'NVDA', 'price': 150.0, 'direction': 'above', 'created': '2025-01-01', 'triggered': False},
+        ]}))
+        (user_dir / 'portfolio.json').write_text(json.dumps({
+            'positions': [{'ticker': 'AMD', 'shares': 5.0, 'entry_price': 90.0,
+                           'entry_date': '2025-01-02', 'added': '2025-01-02'}],
+            'closed_trades': [{'ticker': 'TSLA', 'pnl_percent': 4.0}],
+        }))
+        (tmp_path / 'learning').mkdir()
+
+        assert store.get_watchlist(12345) == ['NVDA', 'AMD']
+        assert store.get_all_active_alerts()[0]['chat_id'] == 12345
+        assert store.get_portfolio(12345)[0]['shares'] == 5.0
+        assert store.get_closed_trades(12345) == [{'ticker': 'TSLA', 'pnl_percent': 4.0}]
+
+        # Only imported once
+        store.clear_watchlist(12345)
+        store.close()
+        assert store.get_watchlist(12345) == []
+
+
+class TestLocking:
+    """Contention with another connection (e.g. another container)."""
+
+    def test_locked_database_does_not_wedge_callers(self, store, tmp_path, monkeypatch):
+        import sqlite3
+        import threading
+
+        store.add_to_watchlist(1, 'nvda')
+        monkeypatch.setattr(storage, 'BUSY_TIMEOUT', 0.1)
+        store.close()
+        store.get_watchlist(1)  # Reopen with the short timeout
+
+        other = sqlite3.connect(str(tmp_path / storage.DB_FILE), isolation_level=None)
+        other.execute('BEGIN IMMEDIATE')
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                store.add_to_watchlist(1, 'amd')
+        finally:
+            other.execute('ROLLBACK')
+            other.close()
+
+        # The process-wide lock was released: other threads still get through
+        result = []
+        reader = threading.Thread(target=lambda: result.append(store.get_watchlist(1)))
+        reader.start()
+        reader.join(timeout=5)
+        assert result == [['NVDA']]
+        assert store.add_to_watchlist(1, 'amd')
+        assert store.get_watchlist(1) == ['NVDA', 'AMD']
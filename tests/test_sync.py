@@ -122,6 +122,95 @@ class TestEventStore:
             # Should only keep last 5
             assert len(store.events) <= 5
 
+    def _events(self, store, count, start=0):
+        from src.sync.sync_hub import SyncEvent, EventType, SyncSource
+
+        for i in range(start, start + count):
+            store.add(SyncEvent(
+                id=f'event-{i}',
+                event_type=EventType.JOURNAL_ADDED,
+                source=SyncSource.SYSTEM,
+                payload={'index': i},
+                timestamp=datetime.now().isoformat()
+            ))
+
+    def test_cursors_per_target(self):
+        """Test unsynced events come from per-target cursors and survive reload."""
+        from src.sync.sync_hub import EventStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store_path = os.path.join(tmpdir, 'test_events.json')
+            store = EventStore(store_path=store_path)
+            self._events(store, 5)
+
+            store.mark_synced('event-2', 'telegram')
+            store.mark_synced('event-0', 'telegram')  # Cursors never move back
+            assert [e.id for e in store.get_unsynced('telegram')] == ['event-3', 'event-4']
+            assert len(store.get_unsynced('dashboard')) == 5
+            assert len(store.get_unsynced('websocket')) == 5
+
+            reloaded = EventStore(store_path=store_path)
+            assert [e.id for e in reloaded.get_unsynced('telegram')] == ['event-3', 'event-4']
+            assert [e.synced_to_telegram for e in reloaded.get_recent(5)] == [True] * 3 + [False] * 2
+            self._events(reloaded, 1, start=5)
+            assert reloaded.last_seq == 6
+
+    def test_since_reads_behind_memory_tail(self):
+        """Test events older than the in-memory tail are read from segments."""
+        from src.sync.sync_hub import EventStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EventStore(store_path=os.path.join(tmpdir, 'test_events.json'))
+            store.SEGMENT_BYTES = 500
+            store.max_events = 3
+            self._events(store, 10)
+
+            assert len(store._segments) > 1
+            assert [e.id for e in store.since(7)] == ['event-7', 'event-8', 'event-9']
+            assert [e.id for e in store.since(1, limit=3)] == ['event-1', 'event-2', 'event-3']
+
+    def test_retention_drops_acknowledged_segments(self):
+        """Test sealed segments every target has passed are compacted away."""
+        from src.sync.sync_hub import EventStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = EventStore(store_path=os.path.join(tmpdir, 'test_events.json'))
+            store.SEGMENT_BYTES = 500
+            store.COMPACT_AFTER_HOURS = 0
+            self._events(store, 10)
+            segments = len(store._segments)
+
+            store.ack('telegram', 10)
+            store.ack('dashboard', 2)
+            self._events(store, 5, start=10)
+            assert len(store._segments) > segments  # Dashboard still behind
+
+            store.ack('dashboard', 15)
+            self._events(store, 10, start=15)
+            assert 10 < store._segments[0] <= 16  # The segment holding event-15 is kept
+            assert [e.id for e in store.get_unsynced('dashboard')][0] == 'event-15'
+
+    def test_migrates_legacy_file(self):
+        """Test the old single JSON file is imported with its synced flags."""
+        import json
+        from src.sync.sync_hub import EventStore, SyncEvent, EventType, SyncSource
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store_path = os.path.join(tmpdir, 'test_events.json')
+            legacy = [
+                SyncEvent(id=f'event-{i}', event_type=EventType.HEARTBEAT, source=SyncSource.SYSTEM,
+                          payload={}, timestamp=datetime.now().isoformat(),
+                          synced_to_telegram=i < 2, synced_to_dashboard=True).to_dict()
+                for i in range(3)
+            ]
+            with open(store_path, 'w') as f:
+                json.dump(legacy, f)
+
+            store = EventStore(store_path=store_path)
+            assert [e.id for e in store.get_unsynced('telegram')] == ['event-2']
+            assert store.get_unsynced('dashboard') == []
+            assert not os.path.exists(store_path)
+
 
 class TestSyncPublishers:
     """Tests for sync publisher async functions."""
@@ -0,0 +1,111 @@
+"""Tests for the ticker -> themes inverted index."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.themes import theme_index as ti
+from src.themes.theme_registry import MemberRole, ThemeStage
+
+
+def _registry(members):
+    """Minimal stand-in for ThemeRegistry with one learned theme."""
+    theme = SimpleNamespace(
+        template=SimpleNamespace(name='AI Infrastructure'),
+        stage=ThemeStage.EARLY,
+        members={
+            ticker: SimpleNamespace(role=MemberRole.DRIVER, confidence=conf)
+            for ticker, conf in members.items()
+        },
+    )
+    return SimpleNamespace(version=1, themes={'ai_infrastructure': theme})
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    registry = _registry({'NVDA': 0.9, 'LOWC': 0.1})
+    state_file = tmp_path / 'learning_state.json'
+    discovered = [{
+        'id': 'ai_power', 'name': 'AI Power', 'stocks': ['ZZDISC', 'NVDA'],
+        'lifecycle_stage': 'emerging', 'confidence': 0.8, 'discovery_method': 'correlation',
+    }]
+
+    monkeypatch.setattr(ti, '_get_registry', lambda: registry)
+    monkeypatch.setattr(ti, '_learning_state_file', lambda: state_file)
+    monkeypatch.setattr('src.learning.evolution_engine.get_discovered_themes', lambda: discovered)
+    return SimpleNamespace(registry=registry, state_file=state_file, discovered=discovered)
+
+
+class TestThemeIndex:
+    """Tests for ThemeIndex."""
+
+    def test_priority_and_dedup(self, sources):
+        sources.state_file.write_text('{}')
+        index = ti.ThemeIndex()
+
+        memberships = index.get_theme_membership('NVDA')
+        ids = [m['theme_id'] for m in memberships]
+
+        # Registry first; the hardcoded ai_infrastructure entry is not repeated
+        assert ids[0] == 'ai_infrastructure'
+        assert memberships[0]['is_learned'] is True
+        assert ids.count('ai_infrastructure') == 1
+        assert ids[-1] == 'ai_power'
+        assert memberships[-1]['role'] == 'discovered'
+
+    def test_hardcoded_roles_and_low_confidence(self, sources):
+        index = ti.ThemeIndex()
+
+        mu = index.get_theme_membership('MU')
+        assert all(m['is_learned'] is False for m in mu)
+        vrt = {m['theme_id']: m['role'] for m in index.get_theme_membership('VRT')}
+        assert vrt['ai_infrastructure'] == 'beneficiary'
+        assert index.get_theme_membership('LOWC') == []
+
+    def test_theme_map_ids_are_separate(self, sources):
+        index = ti.ThemeIndex()
+        assert index.get_theme_ids('NVDA') == ['ai_chips']
+        assert 'ai_chips' not in [m['theme_id'] for m in index.get_theme_membership('NVDA')]
+
+    def test_rebuilds_only_on_source_change(self, sources):
+        index = ti.ThemeIndex()
+        index.get('NVDA')
+        assert index.version == 1
+
+        for _ in range(100):
+            index.get('AMD')
+        assert index.version == 1
+
+        # Registry mutation
+        sources.registry.themes['ai_infrastructure'].members['SMCI'] = SimpleNamespace(
+            role=MemberRole.BENEFICIARY, confidence=0.8)
+        sources.registry.version += 1
+        assert index.get('SMCI')[0].source == ti.SOURCE_REGISTRY
+        assert index.version == 2
+
+        # Evolution state rewritten -> discovered themes appear
+        assert index.get('ZZDISC') == []
+        sources.state_file.write_text(json.dumps({'discovered_themes': {}}))
+        assert [m.theme_id for m in index.get('ZZDISC')] == ['ai_power']
+        assert index.version == 3
+
+
+class TestScoringIntegration:
+    """story_scorer and the theme hub read from the index."""
+
+    def test_get_theme_membership_uses_index(self, sources, monkeypatch):
+        from src.scoring.story_scorer import get_theme_membership
+
+        monkeypatch.setattr(ti, '_theme_index', ti.ThemeIndex())
+        assert [m['theme_id'] for m in get_theme_membership('NVDA')][0] == 'ai_infrastructure'
+
+    def test_hub_theme_boost(self, sources, monkeypatch):
+        from src.intelligence.theme_intelligence import ThemeIntelligenceHub
+
+        monkeypatch.setattr(ti, '_theme_index', ti.ThemeIndex())
+        hub = ThemeIntelligenceHub.__new__(ThemeIntelligenceHub)
+        hub.history = {'themes': {'ai_chips': {'lifecycle': 'accelerating', 'fused_score': 80}}}
+
+        result = hub.get_ticker_theme_boost('nvda')
+        assert result['boost'] == 30
+        assert hub.get_ticker_theme_boost('ZZZZ')['boost'] == 0
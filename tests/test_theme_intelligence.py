@@ -0,0 +1,95 @@
+"""Tests for batched Trends and parallel theme intelligence analysis."""
+import threading
+import time
+
+import pytest
+
+from src.data import google_trends, trends_service
+from src.intelligence import theme_intelligence
+from src.intelligence.theme_intelligence import THEME_TICKER_MAP, ThemeIntelligenceHub
+from tests.test_trends_service import make_service
+
+
+@pytest.fixture
+def fake_trends(tmp_path, monkeypatch):
+    service = make_service(tmp_path)
+    monkeypatch.setattr(google_trends, 'HAS_PYTRENDS', True)
+    monkeypatch.setattr(trends_service, '_trends_service', service)
+    return service._pytrends.payloads
+
+
+@pytest.fixture
+def hub(tmp_path, monkeypatch):
+    monkeypatch.setattr(theme_intelligence, 'HISTORY_FILE', tmp_path / 'history.json')
+    monkeypatch.setattr(theme_intelligence, 'ALERTS_FILE', tmp_path / 'alerts.json')
+    monkeypatch.setattr(theme_intelligence, 'ensure_data_dir', lambda: None)
+    monkeypatch.setattr(theme_intelligence, 'load_theme_history', lambda: {'themes': {}})
+    return ThemeIntelligenceHub()
+
+
+class TestGetTrendScores:
+    """Tests for google_trends.get_trend_scores."""
+
+    def test_batched_payloads(self, fake_trends):
+        keywords = [f"kw{i}" for i in range(12)]
+        results = google_trends.get_trend_scores(keywords)
+
+        # Four keywords plus the anchor per payload
+        assert [len(p) for p in fake_trends] == [5, 5, 5]
+        assert set(results) == set(keywords)
+
+        # Second call is served from cache
+        google_trends.get_trend_scores(keywords)
+        assert len(fake_trends) == 3
+
+    def test_request_budget(self, fake_trends):
+        results = google_trends.get_trend_scores([f"kw{i}" for i in range(12)], max_requests=1)
+
+        assert len(fake_trends) == 1
+        assert len(results) == 4
+
+
+class TestAnalyzeAllThemes:
+    """Tests for ThemeIntelligenceHub.analyze_all_themes."""
+
+    def test_parallel_fetch_and_single_trends_queue(self, hub, fake_trends, monkeypatch):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_score(theme_id):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return 50
+
+        for name in ('_fetch_social_score', '_fetch_news_score', '_fetch_sec_score'):
+            monkeypatch.setattr(hub, name, slow_score)
+        saves = []
+        monkeypatch.setattr(theme_intelligence, 'save_theme_history', lambda data: saves.append(1))
+
+        report = hub.analyze_all_themes(quick=False, max_workers=8)
+
+        assert report['summary']['total_themes'] == len(THEME_TICKER_MAP)
+        assert peak[0] > 1
+        assert all(len(p) <= 5 for p in fake_trends)
+        assert len(fake_trends) <= theme_intelligence.MAX_TRENDS_REQUESTS_PER_RUN
+        assert len(saves) == 1
+
+        ai_chips = next(s for s in report['all_signals'] if s['theme_id'] == 'ai_chips')
+        assert ai_chips['trends_score'] == 100.0
+        assert ai_chips['is_breakout'] is True
+        assert ai_chips['fused_score'] == pytest.approx(100 * 0.4 + 50 * 0.6)
+
+    def test_quick_skips_other_signals(self, hub, fake_trends, monkeypatch):
+        def fail(theme_id):
+            raise AssertionError('quick mode fetched a non-Trends signal')
+
+        monkeypatch.setattr(hub, '_fetch_social_score', fail)
+        monkeypatch.setattr(theme_intelligence, 'save_theme_history', lambda data: None)
+
+        report = hub.analyze_all_themes(quick=True)
+
+        assert all(s['social_score'] == 0 for s in report['all_signals'])
@@ -0,0 +1,133 @@
+"""Tests for scan span tracing."""
+import asyncio
+import json
+
+import pytest
+
+from src.core.tracing import (
+    ScanTrace,
+    get_current_trace,
+    read_trace_summary,
+    set_span_attributes,
+    span,
+    trace_path_for,
+    traced,
+)
+
+
+class TestSpans:
+    """Tests for span() and traced()."""
+
+    def test_noop_without_trace(self):
+        assert get_current_trace() is None
+        with span('orphan') as s:
+            set_span_attributes(cache='hit')
+        assert s is None
+
+    def test_nesting_across_gather(self, run_async):
+        trace = ScanTrace(record_metrics=False)
+
+        @traced('fetch.news', provider='polygon', cache='miss')
+        async def fetch(ticker):
+            if ticker == 'AMD':
+                set_span_attributes(cache='hit')
+            await asyncio.sleep(0)
+
+        async def scan(ticker):
+            with span('scan_ticker', ticker=ticker):
+                await fetch(ticker)
+
+        async def run():
+            with span('ticker_scans'):
+                await asyncio.gather(scan('NVDA'), scan('AMD'))
+
+        with trace.activate():
+            run_async(run())
+
+        by_id = {s.span_id: s for s in trace.spans}
+        fetches = [s for s in trace.spans if s.name == 'fetch.news']
+        assert len(fetches) == 2
+        for f in fetches:
+            parent = by_id[f.parent_id]
+            assert parent.name == 'scan_ticker'
+            assert parent.attributes['ticker'] == f.attributes['ticker']
+            assert by_id[parent.parent_id].name == 'ticker_scans'
+        assert {f.attributes['ticker']: f.attributes['cache'] for f in fetches} == {'NVDA': 'miss', 'AMD': 'hit'}
+
+    def test_error_status(self):
+        trace = ScanTrace(record_metrics=False)
+        with trace.activate(), pytest.raises(ValueError):
+            with span('price_fetch'):
+                raise ValueError("boom")
+        assert trace.spans[0].status == 'error'
+        assert trace.spans[0].attributes['error'] == 'ValueError'
+
+
+class TestTraceFile:
+    """Tests for summaries and trace files."""
+
+    def test_summary_and_write(self, tmp_path):
+        trace = ScanTrace(record_metrics=False)
+        with trace.activate():
+            for cache in ('hit', 'miss', 'miss', 'miss'):
+                with span('fetch.sec', provider='sec_edgar', cache=cache):
+                    pass
+        trace.end()
+
+        path = trace.write(trace_path_for(tmp_path / 'scan_20260201.csv'))
+        assert path.name == 'scan_20260201_trace.jsonl'
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 5
+        assert all(json.loads(line)['type'] == 'span' for line in lines[1:])
+
+        summary = read_trace_summary(path)
+        sec = summary['spans']['fetch.sec']
+        assert sec['count'] == 4
+        assert sec['cache_hit_rate'] == 0.25
+        assert sec['providers'] == ['sec_edgar']
+
+    def test_records_perf_metrics(self):
+        from src.core.performance import PerformanceMonitor
+
+        monitor = PerformanceMonitor()
+        trace = ScanTrace()
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('src.core.performance.perf_monitor', monitor)
+            with trace.activate(), span('fetch.news', provider='polygon', cache='hit', ticker='NVDA'):
+                pass
+
+        labeled = monitor.get_labeled_stats('scan_span')
+        assert [entry['labels'] for entry in labeled] == [
+            {'cache': 'hit', 'provider': 'polygon', 'span': 'fetch.news'}
+        ]
+
+
+class TestScanTrace:
+    """run_scan_async writes a trace next to the CSV."""
+
+    def test_scan_writes_trace(self, tmp_path, run_async):
+        from tests.benchmarks.fake_http import FakeHTTPLayer
+        from tests.benchmarks.pipeline_benchmark import _new_scanner, isolated_environment
+
+        async def run():
+            scanner = _new_scanner(tmp_path)
+            results, _ = await scanner.run_scan_async(['NVDA', 'AMD'])
+            await scanner.close()
+            return results
+
+        with FakeHTTPLayer(), isolated_environment(tmp_path):
+            results = run_async(run())
+
+        assert len(results) == 2
+        csv_files = list(tmp_path.glob('scan_*.csv'))
+        assert len(csv_files) == 1
+
+        summary = read_trace_summary(trace_path_for(csv_files[0]))
+        spans = summary['spans']
+        for stage in ('universe_load', 'rotation_forecast', 'price_fetch', 'ticker_scans',
+                      'results_frame', 'csv_write', 'scan_ticker', 'fetch.sec', 'fetch.news', 'score'):
+            assert stage in spans, stage
+        assert spans['scan_ticker']['count'] == 2
+        assert spans['fetch.news']['cache_hit_rate'] == 0.0
+        assert summary['attributes']['results'] == 2
@@ -0,0 +1,116 @@
+"""Tests for the shared Google Trends service."""
+import pandas as pd
+import pytest
+
+from src.data.trends_service import ANCHOR_TERM, PREFETCH, RateLimiter, TrendsCache, TrendsService
+from src.intelligence.google_trends import GoogleTrendsIntelligence
+
+
+class _FakePytrends:
+    """Stands in for pytrends.TrendReq; records each payload."""
+
+    def __init__(self, scale=None):
+        self.payloads = []
+        self.scale = scale or {}
+        self._kw_list = []
+
+    def build_payload(self, kw_list, **kwargs):
+        self.payloads.append(list(kw_list))
+        self._kw_list = list(kw_list)
+
+    def interest_over_time(self):
+        # Flat interest with a late spike; the anchor stays flat
+        data = {}
+        for kw in self._kw_list:
+            base = [20.0] * 20 if kw == ANCHOR_TERM else [10.0] * 17 + [40.0] * 3
+            data[kw] = [v * self.scale.get(kw, 1) for v in base]
+        return pd.DataFrame(data)
+
+
+def make_service(tmp_path, scale=None, max_per_hour=100) -> TrendsService:
+    """TrendsService with a fake pytrends, no request delays and a tmp cache."""
+    service = TrendsService(
+        cache=TrendsCache(tmp_path / 'trends_index.jsonl', flush_delay=None),
+        limiter=RateLimiter(min_interval=0, max_interval=0, max_per_hour=max_per_hour),
+    )
+    service._pytrends = _FakePytrends(scale)
+    return service
+
+
+class TestTrendsService:
+    """Tests for TrendsService.get_series."""
+
+    def test_anchor_normalization(self, tmp_path):
+        service = make_service(tmp_path, scale={'BIG stock': 2})
+        series = service.get_series(['BIG stock', 'SMALL stock'])
+
+        # Each series is rescaled to its own peak, like a single-term request
+        assert series['BIG stock'].values == series['SMALL stock'].values
+        assert max(series['SMALL stock'].values) == 100
+        # Volume relative to the anchor keeps them comparable
+        assert series['BIG stock'].anchor_ratio == pytest.approx(2 * series['SMALL stock'].anchor_ratio)
+        assert all(ANCHOR_TERM in payload for payload in service._pytrends.payloads)
+
+    def test_hourly_budget(self, tmp_path):
+        service = make_service(tmp_path, max_per_hour=2)
+        series = service.get_series([f"T{i} stock" for i in range(20)])
+
+        assert len(service._pytrends.payloads) == 2
+        assert len(series) == 8
+
+    def test_prefetch_has_its_own_budget(self, tmp_path):
+        service = make_service(tmp_path, max_per_hour=1)
+        service.limiter = RateLimiter(min_interval=0, max_interval=0, max_per_hour=1, prefetch_per_hour=2)
+
+        prefetched = service.get_series([f"T{i} stock" for i in range(20)], pool=PREFETCH)
+        assert len(prefetched) == 8
+        assert not service.has_budget(PREFETCH)
+
+        # A lookup right after the prefetch still has its budget
+        assert service.has_budget()
+        assert 'NEW stock' in service.get_series(['NEW stock'])
+
+
+class TestTrendsCache:
+    """Tests for TrendsCache write-behind persistence."""
+
+    def test_write_behind_and_reload(self, tmp_path):
+        service = make_service(tmp_path)
+        service.get_series(['A stock', 'B stock'])
+        path = tmp_path / 'trends_index.jsonl'
+
+        assert not path.exists()
+        service.cache.flush()
+        assert len(path.read_text().splitlines()) == 2
+
+        reloaded = TrendsCache(path, flush_delay=None)
+        assert reloaded.get('A stock').values == service.cache.get('A stock').values
+        assert reloaded.get('A stock', max_age=0) is None
+
+    def test_compaction(self, tmp_path):
+        path = tmp_path / 'trends_index.jsonl'
+        service = make_service(tmp_path)
+        for _ in range(3):
+            service.get_series(['A stock'], max_age=0)
+            service.cache.flush()
+
+        assert len(path.read_text().splitlines()) == 1
+        assert TrendsCache(path, flush_delay=None).stats()['total_entries'] == 1
+
+
+class TestGoogleTrendsIntelligence:
+    """Ticker trends on top of the shared service."""
+
+    def test_ticker_trends_batched(self, tmp_path):
+        service = make_service(tmp_path)
+        intel = GoogleTrendsIntelligence(service=service)
+
+        trends = intel.get_ticker_trends(['NVDA', 'AMD', 'TSLA', 'PLTR', 'SMCI'])
+
+        assert len(service._pytrends.payloads) == 2
+        assert trends['NVDA'].search_interest == 100
+        assert trends['NVDA'].is_breakout is True
+        assert trends['NVDA'].anchor_ratio == pytest.approx(14.5 / 20)
+
+        intel.get_ticker_trend('NVDA')
+        assert len(service._pytrends.payloads) == 2
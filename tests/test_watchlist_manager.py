@@ -0,0 +1,99 @@
+"""Tests for watchlist bulk price refresh and debounced persistence."""
+import json
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """WatchlistManager backed by a temp file, without the background thread."""
+    from src.watchlist import watchlist_manager as wm_module
+
+    with patch.object(wm_module, 'WATCHLIST_FILE', tmp_path / 'watchlist.json'), \
+            patch.object(wm_module.WatchlistManager, '_start_auto_update_thread'):
+        wm = wm_module.WatchlistManager()
+        wm.save_debounce_seconds = 60
+        for ticker in ('NVDA', 'AMD', 'TSLA'):
+            wm.add_item(ticker)
+        yield wm, tmp_path / 'watchlist.json'
+        wm.flush()
+
+
+class TestRefreshPrices:
+    """Tests for WatchlistManager.refresh_prices."""
+
+    def test_applies_bulk_quotes_in_memory(self, manager):
+        wm, _ = manager
+        quotes = {
+            'NVDA': {'price': 500.0, 'change_pct': 2.0, 'volume': 2000, 'avg_volume': 1000},
+            'AMD': {'price': 150.0, 'change_pct': -1.0, 'volume': 500},
+        }
+        with patch.object(wm, '_fetch_bulk_quotes', return_value=quotes) as fetch:
+            updated = wm.refresh_prices()
+
+        fetch.assert_called_once()
+        assert sorted(fetch.call_args[0][0]) == ['AMD', 'NVDA', 'TSLA']
+        assert updated == 2
+        assert wm.items['NVDA'].current_price == 500.0
+        assert wm.items['NVDA'].volume_ratio == 2.0
+        assert wm.items['AMD'].price_change_pct == -1.0
+        assert wm.items['TSLA'].current_price is None
+
+    def test_snapshot_prev_volume_seeds_missing_average(self, manager):
+        wm, _ = manager
+        wm.items['AMD'].avg_volume = 1000
+        quotes = {t: {'price': 10.0, 'volume': 600, 'prev_volume': 300} for t in ('NVDA', 'AMD')}
+        with patch.object(wm, '_fetch_bulk_quotes', return_value=quotes):
+            wm.refresh_prices()
+
+        assert wm.items['NVDA'].volume_ratio == 2.0
+        assert wm.items['AMD'].volume_ratio == 0.6
+
+    def test_single_debounced_write(self, manager):
+        wm, path = manager
+        quotes = {t: {'price': 10.0, 'volume': 1} for t in ('NVDA', 'AMD', 'TSLA')}
+
+        with patch.object(wm, '_fetch_bulk_quotes', return_value=quotes), \
+                patch.object(wm, '_save_watchlist', wraps=wm._save_watchlist) as save:
+            wm.refresh_prices()
+            wm.refresh_prices()
+            assert save.call_count == 0
+            wm.flush()
+            assert save.call_count == 1
+
+        data = json.loads(path.read_text())
+        assert data['NVDA']['current_price'] == 10.0
+
+    def test_flush_without_changes_is_noop(self, manager):
+        wm, _ = manager
+        with patch.object(wm, '_save_watchlist') as save:
+            wm.flush()
+        save.assert_not_called()
+
+
+class TestRefreshFundamentals:
+    """Tests for the periodic per-ticker fundamentals refresh."""
+
+    def test_refreshes_due_items_once(self, manager):
+        wm, _ = manager
+        info = {'currentPrice': 10.0, 'volume': 300, 'averageVolume': 100,
+                'marketCap': 5e9, 'trailingPE': 25.0}
+
+        with patch('yfinance.Ticker') as ticker_cls:
+            ticker_cls.return_value.info = info
+            assert wm.refresh_fundamentals() == 3
+            assert wm.refresh_fundamentals() == 0
+            assert wm.refresh_fundamentals(max_age=0) == 3
+
+        item = wm.items['NVDA']
+        assert (item.market_cap, item.pe_ratio, item.avg_volume) == (5e9, 25.0, 100)
+        assert item.volume_ratio == 3.0
+
+    def test_auto_update_keeps_fundamentals(self, manager):
+        wm, _ = manager
+        with patch.object(wm, 'refresh_prices') as prices, \
+                patch.object(wm, 'refresh_fundamentals') as fundamentals:
+            wm.auto_update_all()
+
+        prices.assert_called_once()
+        fundamentals.assert_called_once()
@@ -550,19 +550,10 @@ class SECEdgarProvider:
 
     @staticmethod
     def get_company_cik(ticker: str) -> Optional[str]:
-        """Get CIK number for a ticker."""
+        """Get CIK number for a ticker (from the shared local CIK map)."""
         try:
-            url = "https://www.sec.gov/files/company_tickers.json"
-            response = requests.get(url, headers=SECEdgarProvider.HEADERS, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            ticker_upper = ticker.upper()
-            for item in data.values():
-                if item.get('ticker') == ticker_upper:
-                    # CIK needs to be zero-padded to 10 digits
-                    return str(item.get('cik_str', '')).zfill(10)
-            return None
+            from src.data.sec_index import get_cik_map
+            return get_cik_map().get(ticker)
         except Exception as e:
             logger.error(f"Failed to get CIK for {ticker}: {e}")
             return None